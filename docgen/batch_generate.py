@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+콘텐츠 JSON 여러 개로 PPTX 덱 일괄 생성
+
+사이트/고객별 콘텐츠 JSON이 들어 있는 디렉터리나 glob 패턴을 받아 덱을 워커 프로세스에 나눠
+생성합니다. 워커는 python-pptx 임포트와 템플릿 스냅샷 로드를 프로세스당 한 번만 하고 여러 덱에
+재사용하며, 덱별 소요 시간/크기/상태를 매니페스트 JSON으로 기록합니다.
+
+사용 예:
+    python docgen/batch_generate.py sites/ -o out/ -j 8
+    python docgen/batch_generate.py "sites/*_content.json" -o out/
+"""
+
+import argparse
+import glob
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+MANIFEST_NAME = "manifest.json"
+
+
+def collect_content_files(inputs, exclude=()):
+    """디렉터리/glob/파일 경로 목록을 콘텐츠 JSON 파일 목록으로 펼침 (중복 제거, 정렬)
+
+    매니페스트(MANIFEST_NAME과 exclude의 경로)는 빼므로 출력 디렉터리를 다시 입력으로 줘도
+    이전 매니페스트를 콘텐츠로 읽지 않습니다.
+    """
+    excluded = {Path(path).resolve() for path in exclude}
+    files = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.json")))
+        elif path.is_file():
+            files.append(path)
+        else:
+            files.extend(Path(match) for match in sorted(glob.glob(item)))
+
+    seen = set()
+    unique = []
+    for path in files:
+        key = path.resolve()
+        if path.name == MANIFEST_NAME or key in excluded:
+            continue
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def output_names(content_files):
+    """콘텐츠 파일별 출력 PPTX 이름 - 기본은 파일 이름(stem)
+
+    이름이 겹치는 파일(예: sites/*/content.json)은 공통 상위 디렉터리 기준 상대 경로를 "_"로 이어
+    이름을 만듭니다 (sites/a/content.json -> a_content.pptx). 그래도 겹치면 ValueError를 냅니다.
+    대소문자만 다른 이름도 Windows/macOS에서는 같은 파일이므로 겹침으로 봅니다.
+    """
+    stems = {}
+    for path in content_files:
+        stems.setdefault(path.stem.casefold(), []).append(path)
+
+    resolved = [path.resolve() for path in content_files]
+    root = Path(os.path.commonpath([path.parent for path in resolved])) if resolved else None
+    names = []
+    for path, full_path in zip(content_files, resolved):
+        if len(stems[path.stem.casefold()]) == 1:
+            names.append(f"{path.stem}.pptx")
+        else:
+            names.append("_".join(full_path.relative_to(root).with_suffix("").parts) + ".pptx")
+
+    owners = {}
+    for path, name in zip(content_files, names):
+        owners.setdefault(name.casefold(), []).append(str(path))
+    clashes = [paths for paths in owners.values() if len(paths) > 1]
+    if clashes:
+        raise ValueError("출력 파일 이름이 겹침: " + "; ".join(", ".join(paths) for paths in clashes))
+    return names
+
+
+def _init_batch_worker():
+    """워커 초기화 - 생성기 임포트와 템플릿 스냅샷 파싱을 프로세스당 한 번만 (덱마다 복사본 사용)"""
+    import generate_pptx
+    generate_pptx.load_template()
+
+
+def _generate_deck(content_path, output_path, stream, optimize=None):
+    """워커: 덱 하나 생성 후 결과 레코드 반환 (실패해도 예외 대신 상태로 보고)
+
+    상태는 ok, invalid(콘텐츠 검증 오류 - 렌더링하지 않음), error(생성 중 예외)입니다.
+    """
+    import content_schema
+    import generate_pptx
+
+    started = time.perf_counter()
+    log = io.StringIO()
+    result = {
+        "content": str(content_path),
+        "output": str(output_path),
+        "status": "ok",
+        "slides": 0,
+        "bytes": 0,
+        "seconds": 0.0,
+        "error": None,
+    }
+    try:
+        with redirect_stdout(log):
+            result["slides"] = generate_pptx.generate_presentation(
+                content_path, output_path, stream=stream, optimize=optimize
+            )
+        result["bytes"] = os.path.getsize(output_path)
+    except content_schema.ValidationError as e:
+        result["status"] = "invalid"
+        result["error"] = str(e)
+        result["log"] = log.getvalue()
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["log"] = log.getvalue() + traceback.format_exc()
+
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_batch(content_files, output_dir, jobs, stream=False, optimize=None):
+    """덱 일괄 생성 - 입력 순서대로 정렬된 결과 레코드 리스트 반환
+
+    출력 이름이 겹치면(output_names) 덱을 만들기 전에 ValueError를 냅니다.
+    """
+    tasks = [(path, output_dir / name) for path, name in zip(content_files, output_names(content_files))]
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    results = [None] * len(tasks)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker) as pool:
+        futures = {
+            pool.submit(_generate_deck, content_path, output_path, stream, optimize): i
+            for i, (content_path, output_path) in enumerate(tasks)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results[futures[future]] = result
+            mark = "✅" if result["status"] == "ok" else "❌"
+            print(f"  [{done}/{len(tasks)}] {mark} {Path(result['content']).name} "
+                  f"({result['seconds']:.2f}s, {result['bytes']:,} bytes)")
+            if result["error"]:
+                print(f"      {result['error']}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="콘텐츠 JSON 여러 개로 PPTX 덱 일괄 생성")
+    parser.add_argument("inputs", nargs="+", help="콘텐츠 JSON 디렉터리, glob 패턴 또는 파일")
+    parser.add_argument("-o", "--output-dir", type=Path, required=True, help="출력 디렉터리")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="워커 프로세스 수 (기본값: CPU 수)"
+    )
+    parser.add_argument(
+        "--manifest", type=Path, default=None,
+        help="매니페스트 경로 (기본값: <output-dir>/manifest.json)"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="덱마다 스트리밍 저장 사용 (대용량 덱의 메모리 사용량 제한)"
+    )
+    parser.add_argument(
+        "--optimize", metavar="LEVEL", nargs="?", type=int, default=None, const=9, choices=range(0, 10),
+        help="덱마다 저장 후 템플릿 부속물 제거 및 재압축 (LEVEL: deflate 수준 0-9, 기본값 9)"
+    )
+    args = parser.parse_args(argv)
+
+    content_files = collect_content_files(args.inputs, exclude=[args.manifest] if args.manifest else ())
+    if not content_files:
+        print("Error: 콘텐츠 JSON 파일이 없습니다.")
+        return 1
+
+    jobs = max(1, min(args.jobs, len(content_files)))
+    print("=" * 50)
+    print(f"일괄 생성: 덱 {len(content_files)}개, 워커 {jobs}개")
+    print("=" * 50)
+
+    started = time.perf_counter()
+    try:
+        results = run_batch(content_files, args.output_dir, jobs, stream=args.stream, optimize=args.optimize)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    total_seconds = round(time.perf_counter() - started, 3)
+
+    failed = [r for r in results if r["status"] != "ok"]
+    manifest_path = args.manifest or args.output_dir / MANIFEST_NAME
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "jobs": jobs,
+            "total_seconds": total_seconds,
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "decks": results,
+        }, f, ensure_ascii=False, indent=2)
+
+    print("=" * 50)
+    print(f"완료: 성공 {len(results) - len(failed)}, 실패 {len(failed)}, {total_seconds:.2f}s")
+    print(f"매니페스트: {manifest_path}")
+    print("=" * 50)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+덱 생성기 확장성 벤치마크
+
+presentation_content.json 스키마를 따르는 합성 콘텐츠를 슬라이드 수(10 ~ 5,000), 요소 구성,
+이미지 수/크기별로 만들어 세 생성기를 각각 별도 프로세스로 실행하고 경과 시간, 최대 RSS,
+출력 크기를 기록합니다.
+
+- pptx: generate_pptx.py
+- html: generate_html.py
+- workspace: workspace/generate_ppt.py (슬라이드가 미리 만들어진 작업용 덱을 채우는 방식이라,
+  케이스마다 작업용 덱을 준비 단계에서 만들어 두고 측정에서는 제외)
+
+결과는 JSON으로 저장하며, --baseline과 비교해 시간/메모리가 허용 비율 이상 나빠진 항목이 있으면
+종료 코드 1을 반환합니다.
+
+사용 예:
+    python docgen/benchmark.py --quick
+    python docgen/benchmark.py --sizes 10,100,1000 --mixes mixed,gallery -o bench.json
+    python docgen/benchmark.py --quick --baseline bench_baseline.json
+    python docgen/benchmark.py --quick --save-baseline bench_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+BENCH_DIR = BASE_DIR / ".cache" / "bench"
+
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+QUICK_SIZES = [10, 100]
+DEFAULT_IMAGE_SIZES = ["800x450", "2400x1350"]
+
+# 요소 구성 프리셋: 요소 타입 -> 가중치 (content 슬라이드 하나에 요소 하나)
+MIXES = {
+    "text": {},
+    "shapes": {"icon_box_grid": 3, "pain_point_cards": 2, "process_flow": 2, "timeline": 1, "comparison_chart": 1},
+    "tables": {"table": 1},
+    "gallery": {"screen_gallery": 1},
+    "mixed": {
+        "table": 2, "icon_box_grid": 2, "pain_point_cards": 1, "process_flow": 2,
+        "timeline": 1, "comparison_chart": 1, "screen_gallery": 2, "architecture_diagram": 1,
+    },
+}
+
+GENERATORS = ("pptx", "html", "workspace")
+
+# 기준 대비 이 비율을 넘으면 회귀로 판단
+DEFAULT_TOLERANCE = 1.25
+
+
+# ==================== 합성 콘텐츠 ====================
+def _words(rng, count):
+    vocabulary = ["설비", "정비", "점검", "신고", "승인", "알림", "이력", "현황", "관리", "부품", "재고", "작업"]
+    return " ".join(rng.choice(vocabulary) for _ in range(count))
+
+
+def _element(elem_type, rng, images):
+    """요소 타입 하나의 합성 data"""
+    if elem_type == "table":
+        return {
+            "headers": ["구분", "문제점", "영향", "심각도"],
+            "rows": [
+                [_words(rng, 1), _words(rng, 4), _words(rng, 5), rng.choice(["높음", "중간", "낮음"])]
+                for _ in range(rng.randint(3, 8))
+            ],
+        }
+    if elem_type == "icon_box_grid":
+        return {
+            "columns": 4,
+            "items": [
+                {"icon": "build", "title": _words(rng, 2), "desc": f"{_words(rng, 2)}\n{_words(rng, 2)}"}
+                for _ in range(rng.randint(3, 8))
+            ],
+        }
+    if elem_type == "pain_point_cards":
+        return {
+            "columns": 4,
+            "items": [
+                {"role": _words(rng, 1), "icon": "person", "pain": "\n".join(_words(rng, 3) for _ in range(3))}
+                for _ in range(4)
+            ],
+        }
+    if elem_type == "process_flow":
+        return {
+            "steps": [
+                {"code": f"S{i + 1}", "name": _words(rng, 2), "actor": rng.choice(["내부", "승인권자", "외부"])}
+                for i in range(rng.randint(3, 6))
+            ],
+        }
+    if elem_type == "timeline":
+        return {"phases": [{"name": f"Phase {i + 1} - {_words(rng, 2)}"} for i in range(2)]}
+    if elem_type == "comparison_chart":
+        items = []
+        for _ in range(4):
+            as_is, to_be = rng.randint(5, 60), rng.randint(0, 100)
+            change = round((to_be - as_is) / as_is * 100)
+            items.append({
+                "label": _words(rng, 2), "as_is": as_is, "to_be": to_be,
+                "unit": rng.choice(["%", "시간"]), "change": f"{change:+d}%",
+            })
+        return {"items": items}
+    if elem_type == "screen_gallery":
+        count = min(3, len(images)) or 1
+        return {
+            "layout": "horizontal_3",
+            "screens": [
+                {
+                    "image_path": str(images[rng.randrange(len(images))]) if images else "",
+                    "label": _words(rng, 1),
+                    "description": _words(rng, 3),
+                }
+                for _ in range(count)
+            ],
+        }
+    if elem_type == "architecture_diagram":
+        return {"layers": [{"name": "Client Layer", "components": [{"name": "App", "tech": "Flutter"}]}]}
+    raise ValueError(f"알 수 없는 요소 타입: {elem_type}")
+
+
+def synthesize_content(slide_count, mix, images=(), seed=0):
+    """슬라이드 slide_count장짜리 합성 콘텐츠 (표지 + 목차 + 내용 슬라이드)"""
+    rng = random.Random(seed)
+    weights = MIXES[mix]
+    elem_types = list(weights)
+
+    slides = [
+        {"slide_number": 1, "layout_id": 1, "placeholders": {"title": "벤치마크 덱", "subtitle": mix}},
+        {"slide_number": 2, "layout_id": 2, "placeholders": {"toc_items": [
+            {"number": f"{i:02d}", "title": _words(rng, 2), "pages": f"{i * 3:02d}"} for i in range(1, 7)
+        ]}},
+    ]
+    for number in range(3, slide_count + 1):
+        if not elem_types or rng.random() < 0.15:
+            slides.append({
+                "slide_number": number,
+                "layout_id": 5,
+                "placeholders": {
+                    "main_title": _words(rng, 3),
+                    "body": [{"level": rng.choice([1, 2]), "text": _words(rng, 6)} for _ in range(4)],
+                },
+            })
+            continue
+        elem_type = rng.choices(elem_types, weights=[weights[t] for t in elem_types])[0]
+        slides.append({
+            "slide_number": number,
+            "layout_id": 4,
+            "placeholders": {"main_title": _words(rng, 3), "action_title": _words(rng, 8)},
+            "custom_elements": [{"type": elem_type, "data": _element(elem_type, rng, images)}],
+        })
+
+    return {"presentation": {"title": f"벤치마크 {mix} {slide_count}", "slides": slides[:slide_count]}}
+
+
+def image_paths(count, size):
+    """size("WxH") 합성 스크린샷 count장의 경로"""
+    return [BENCH_DIR / "images" / f"screen_{size}_{i}.png" for i in range(count)]
+
+
+def make_images(count, size, seed=0):
+    """size("WxH") 크기의 합성 스크린샷 count장 생성 (이미 있으면 재사용)"""
+    from PIL import Image, ImageDraw
+
+    width, height = (int(v) for v in size.split("x"))
+    (BENCH_DIR / "images").mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(seed)
+    paths = image_paths(count, size)
+    for path in paths:
+        if not path.exists():
+            img = Image.new("RGB", (width, height), (248, 249, 250))
+            draw = ImageDraw.Draw(img)
+            for _ in range(40):
+                x0, y0 = rng.randrange(width), rng.randrange(height)
+                draw.rectangle(
+                    [x0, y0, x0 + rng.randrange(width // 4 + 1), y0 + rng.randrange(height // 8 + 1)],
+                    fill=(rng.randrange(256), rng.randrange(256), rng.randrange(256)),
+                )
+            img.save(path)
+    return paths
+
+
+def build_working_deck(content_path, deck_path):
+    """workspace 생성기용 작업용 덱 - 콘텐츠 슬라이드마다 layout_id 레이아웃으로 빈 슬라이드 추가"""
+    sys.path.insert(0, str(BASE_DIR))
+    import generate_pptx
+
+    with open(content_path, "r", encoding="utf-8") as f:
+        content = json.load(f)
+    prs = generate_pptx.load_template()
+    layout_map = generate_pptx.template_index(prs).layout_map
+    for slide_data in content["presentation"]["slides"]:
+        layout_id = slide_data.get("layout_id", 4)
+        prs.slides.add_slide(prs.slide_layouts[layout_map.get(layout_id, layout_map[4])])
+    prs.save(str(deck_path))
+
+
+def prepare_case(content_path, deck_path, image_count, image_size):
+    """케이스 준비(이미지, 작업용 덱)를 별도 프로세스에서 실행
+
+    자식 프로세스는 fork 시점 부모의 최대 RSS를 물려받으므로, 벤치마크 프로세스 자체는
+    PIL/python-pptx를 임포트하지 않아야 측정값이 오염되지 않습니다.
+    """
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import benchmark\n"
+        "if sys.argv[4]: benchmark.make_images(int(sys.argv[3]), sys.argv[4])\n"
+        "if sys.argv[5]: benchmark.build_working_deck(sys.argv[2], sys.argv[5])\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script, str(BASE_DIR), str(content_path),
+         str(image_count), image_size or "", str(deck_path) if deck_path else ""],
+        check=True,
+    )
+
+
+# ==================== 측정 ====================
+def _command(generator, content_path, output_path, deck_path):
+    python = sys.executable
+    if generator == "pptx":
+        return [python, str(BASE_DIR / "generate_pptx.py"), "-c", str(content_path), "-o", str(output_path)]
+    if generator == "html":
+        return [python, str(BASE_DIR / "generate_html.py"), "-c", str(content_path), "-o", str(output_path)]
+    if generator == "workspace":
+        return [
+            python, str(BASE_DIR / "workspace" / "generate_ppt.py"),
+            "-t", str(deck_path), "-c", str(content_path), "-o", str(output_path),
+        ]
+    raise ValueError(f"알 수 없는 생성기: {generator}")
+
+
+def run_once(command, timeout):
+    """명령 실행 후 (경과 초, 최대 RSS KB, 종료 코드, stderr 끝부분) 반환 - RSS는 해당 자식 프로세스 기준"""
+    with tempfile.TemporaryFile() as stderr_file:
+        started = time.perf_counter()
+        proc = subprocess.Popen(command, cwd=BASE_DIR.parent, stdout=subprocess.DEVNULL, stderr=stderr_file)
+        killer = threading.Timer(timeout, proc.kill)
+        killer.start()
+        try:
+            # wait4로 회수해야 이 자식만의 rusage(ru_maxrss, Linux에서 KB)를 얻을 수 있음
+            _, status, rusage = os.wait4(proc.pid, 0)
+        finally:
+            killer.cancel()
+        seconds = time.perf_counter() - started
+        proc.returncode = os.waitstatus_to_exitcode(status)
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", "replace")[-2000:]
+
+    if proc.returncode < 0 and seconds >= timeout:
+        return seconds, rusage.ru_maxrss, "timeout", stderr
+    return seconds, rusage.ru_maxrss, proc.returncode, stderr
+
+
+def measure(command, repeat, timeout):
+    """repeat회 실행 중 가장 빠른 결과"""
+    best = None
+    for _ in range(repeat):
+        result = run_once(command, timeout)
+        if result[2] != 0:
+            return result
+        if best is None or result[0] < best[0]:
+            best = result
+    return best
+
+
+def benchmark_cases(sizes, mixes, image_sizes, images_per_deck):
+    """(케이스 이름, 슬라이드 수, 구성, 이미지 크기) 목록 - 이미지 크기는 screen_gallery가 있는 구성에만 적용"""
+    cases = []
+    for mix in mixes:
+        variants = image_sizes if "screen_gallery" in MIXES[mix] else [None]
+        for size in sizes:
+            for image_size in variants:
+                name = f"{mix}-{size}" + (f"-img{image_size}x{images_per_deck}" if image_size else "")
+                cases.append((name, size, mix, image_size))
+    return cases
+
+
+def run_benchmarks(args):
+    """전체 케이스 실행 - 결과 레코드 리스트 반환"""
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    results = []
+    for name, size, mix, image_size in benchmark_cases(
+        args.sizes, args.mixes, args.image_sizes, args.images
+    ):
+        images = image_paths(args.images, image_size) if image_size else []
+        content = synthesize_content(size, mix, images, seed=args.seed)
+        content_path = BENCH_DIR / f"{name}.json"
+        with open(content_path, "w", encoding="utf-8") as f:
+            json.dump(content, f, ensure_ascii=False)
+
+        deck_path = BENCH_DIR / f"{name}.working.pptx" if "workspace" in args.generators else None
+        prepare_case(content_path, deck_path, args.images, image_size)
+
+        for generator in args.generators:
+            suffix = ".html" if generator == "html" else ".pptx"
+            output_path = BENCH_DIR / f"{name}.{generator}{suffix}"
+            command = _command(generator, content_path, output_path, deck_path)
+            seconds, peak_rss_kb, returncode, stderr = measure(command, args.repeat, args.timeout)
+
+            record = {
+                "case": name,
+                "generator": generator,
+                "slides": size,
+                "mix": mix,
+                "image_size": image_size,
+                "images": args.images if image_size else 0,
+                "seconds": round(seconds, 3),
+                "peak_rss_kb": peak_rss_kb,
+                "output_bytes": output_path.stat().st_size if returncode == 0 and output_path.exists() else 0,
+                "status": "ok" if returncode == 0 else "error",
+            }
+            if returncode != 0:
+                record["error"] = stderr.strip().splitlines()[-1] if stderr.strip() else str(returncode)
+            results.append(record)
+
+            mark = "✅" if record["status"] == "ok" else "❌"
+            print(f"  {mark} {name:<32} {generator:<10} {record['seconds']:>9.2f}s "
+                  f"{record['peak_rss_kb'] / 1024:>8.1f} MB {record['output_bytes']:>14,} bytes")
+            if returncode != 0:
+                print(f"      {record['error']}")
+    return results
+
+
+# ==================== 기준 비교 ====================
+def compare_to_baseline(results, baseline, tolerance):
+    """기준 대비 회귀 목록 [(case, generator, 지표, 기준값, 현재값)]"""
+    previous = {(r["case"], r["generator"]): r for r in baseline.get("results", []) if r["status"] == "ok"}
+    regressions = []
+    for record in results:
+        base = previous.get((record["case"], record["generator"]))
+        if base is None:
+            continue
+        if record["status"] != "ok":
+            regressions.append((record["case"], record["generator"], "status", "ok", record["status"]))
+            continue
+        for metric in ("seconds", "peak_rss_kb"):
+            if base[metric] and record[metric] > base[metric] * tolerance:
+                regressions.append((record["case"], record["generator"], metric, base[metric], record[metric]))
+    return regressions
+
+
+def parse_args(argv=None):
+    def int_list(value):
+        return [int(item) for item in value.split(",") if item.strip()]
+
+    def str_list(value):
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    parser = argparse.ArgumentParser(description="덱 생성기 확장성 벤치마크")
+    parser.add_argument("--sizes", type=int_list, default=DEFAULT_SIZES,
+                        help=f"슬라이드 수 목록 (기본값: {','.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"빠른 확인용: 슬라이드 수 {','.join(map(str, QUICK_SIZES))}, 이미지 크기 하나")
+    parser.add_argument("--mixes", type=str_list, default=list(MIXES),
+                        help=f"요소 구성 목록 ({', '.join(MIXES)})")
+    parser.add_argument("--generators", type=str_list, default=list(GENERATORS),
+                        help=f"측정할 생성기 ({', '.join(GENERATORS)})")
+    parser.add_argument("--image-sizes", type=str_list, default=DEFAULT_IMAGE_SIZES,
+                        help=f"합성 스크린샷 크기 목록 WxH (기본값: {','.join(DEFAULT_IMAGE_SIZES)})")
+    parser.add_argument("--images", type=int, default=12, help="덱당 서로 다른 이미지 수 (기본값: 12)")
+    parser.add_argument("--repeat", type=int, default=1, help="케이스당 반복 횟수, 가장 빠른 값 사용")
+    parser.add_argument("--timeout", type=int, default=1800, help="실행당 제한 시간(초)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 콘텐츠 시드")
+    parser.add_argument("-o", "--output", type=Path, default=BENCH_DIR / "results.json",
+                        help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", type=Path, default=None, help="이번 결과를 기준으로 저장할 경로")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"회귀 판단 비율 (기본값: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.sizes = QUICK_SIZES
+        args.image_sizes = args.image_sizes[:1]
+    unknown = (set(args.mixes) - set(MIXES)) | (set(args.generators) - set(GENERATORS))
+    if unknown:
+        parser.error(f"알 수 없는 구성/생성기: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 50)
+    print(f"벤치마크: 슬라이드 {args.sizes}, 구성 {args.mixes}, 생성기 {args.generators}")
+    print("=" * 50)
+
+    results = run_benchmarks(args)
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과: {args.output}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"기준 저장: {args.save_baseline}")
+
+    failed = [r for r in results if r["status"] != "ok"]
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        print("=" * 50)
+        if regressions:
+            print(f"회귀 {len(regressions)}건 (허용 비율 {args.tolerance}):")
+            for case, generator, metric, base, current in regressions:
+                print(f"  ❌ {case} [{generator}] {metric}: {base} -> {current}")
+        else:
+            print(f"회귀 없음 (기준: {args.baseline})")
+        if regressions:
+            return 1
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
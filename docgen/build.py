@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+여러 출력 형식을 한 번에 만드는 빌드 (pptx, html, png)
+
+build_graph의 단계 그래프로 실행합니다. 콘텐츠 JSON은 부모 프로세스에서 한 번만 읽어 Deck(content_model)으로
+만들고, 단계마다 입력(콘텐츠 중 그 단계가 쓰는 부분, 참조 이미지, 템플릿, 코드 모듈)과 출력을 선언합니다.
+입력 내용이 이전 빌드와 같은 단계는 실행하지 않고(출력이 지워졌으면 .cache/build에서 복원), 바뀐 단계와
+그 하위 단계만 워커 프로세스에서 동시에 실행합니다. Deck은 단계를 제출할 때마다 인자로 피클되어 워커에
+전달되므로 (기본 콘텐츠로 약 20KB, 1ms 미만) 워커는 콘텐츠 JSON을 다시 읽거나 검증하지 않으며, 축소 이미지는
+기존대로 .cache/images에서 공유됩니다.
+
+단계 (괄호는 형식):
+- validate: 콘텐츠 검증 - 오류가 있으면 나머지 단계는 실행하지 않음 (항상)
+- diagrams: diagram 엔진으로 그린 generate_diagrams의 구성도 SVG/PNG (png)
+- premium: generate_premium_assets의 SVG와 svg_raster로 그린 1x/2x/4x PNG (png)
+- images: HTML용 크기별 WebP/PNG 이미지 변형 (html)
+- pptx: generate_pptx.generate_presentation() (pptx)
+- html: generate_html.write_html(), --bundle이면 html_bundle.write_bundle() (html, images 다음)
+
+출력 디렉터리가 docgen/이면 pptx/html은 premium이 그린 기본 구성도 이미지를 읽으므로 premium 다음에
+실행됩니다. 아무것도 바뀌지 않은 재빌드는 파일 stat 확인만으로 끝나고, 구성도만 바꾸면 diagrams와
+구성도를 그리는 pptx/html만 다시 실행됩니다. --force는 기록을 무시하고 모든 단계를 실행합니다.
+
+사용 예:
+    python docgen/build.py -c docgen/presentation_content.json --formats pptx,html,png -o out/
+    python docgen/cli.py build --formats pptx,html -j 4 --optimize
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from pathlib import Path
+
+import build_graph
+import content_model
+import fonts
+import generate_diagrams
+import generate_premium_assets
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_CONTENT_PATH = BASE_DIR / "presentation_content.json"
+# 기본 출력은 추적되지 않는 디렉터리 (docgen/의 system_architecture.* 등 커밋된 자산을 덮어쓰지 않도록)
+DEFAULT_OUTPUT_DIR = BASE_DIR / "out"
+FORMATS = ("pptx", "html", "png")
+
+# 형식 -> 그 형식을 만드는 단계 (validate는 항상 포함)
+FORMAT_STAGES = {
+    "pptx": ("pptx",),
+    "html": ("images", "html"),
+    "png": ("diagrams", "premium"),
+}
+
+# 단계별 출력에 영향을 주는 모듈 (바뀌면 그 단계를 다시 실행)
+# 부모 프로세스가 python-pptx/PIL을 임포트하지 않도록 generate_pptx의 경로/모듈 목록은 여기에 둠
+PPTX_TEMPLATE_PATH = BASE_DIR / "PPT기본양식.pptx"
+STAGE_SOURCES = {
+    "validate": ("content_schema.py", "content_model.py"),
+    "diagrams": ("generate_diagrams.py", "diagram.py", "content_model.py", "fonts.py"),
+    "premium": ("generate_premium_assets.py", "svg_raster.py", "fonts.py"),
+    "images": ("generate_html.py", "image_pipeline.py", "content_model.py"),
+    "pptx": (
+        "generate_pptx.py", "content_model.py", "slide_parts.py", "image_pipeline.py", "drawingml.py",
+        "diagram.py", "pptx_stream.py", "pptx_optimize.py",
+    ),
+    "html": ("generate_html.py", "html_bundle.py", "content_model.py", "diagram.py", "image_pipeline.py"),
+}
+
+
+# ==================== 단계 실행 함수 ====================
+# 모두 (deck, content_path, output_dir, options) -> 출력 경로 리스트 (워커에서 실행)
+def _check_content(deck, content_path, output_dir, options):
+    for issue in deck.issues:
+        print(f"{content_path}: {issue}")
+    if deck.errors:
+        raise ValueError(f"검증 오류 {len(deck.errors)}건 - 빌드하지 않음")
+    return []
+
+
+def _build_diagrams(deck, content_path, output_dir, options):
+    import diagram
+
+    svg_path = output_dir / os.path.basename(generate_diagrams.SVG_PATH)
+    png_path = output_dir / os.path.basename(generate_diagrams.PNG_PATH)
+    # 덱에 layers로 그리는 구성도가 있으면 그 장면, 없으면 기본 콘텐츠의 구성도
+    scene = diagram.deck_scene(deck)
+    generate_diagrams.generate_svg(str(svg_path), scene)
+    generate_diagrams.generate_png(str(png_path), scene)
+    return [svg_path, png_path]
+
+
+def _build_premium(deck, content_path, output_dir, options):
+    svg_path = output_dir / os.path.basename(generate_premium_assets.SVG_PATH)
+    png_path = output_dir / os.path.basename(generate_premium_assets.PNG_PATH)
+    return generate_premium_assets.main(str(svg_path), str(png_path))
+
+
+def _html_images(output_dir, options):
+    import generate_html
+
+    return generate_html.ResponsiveImages(str(output_dir)) if options.get("responsive_images", True) else None
+
+
+def _build_images(deck, content_path, output_dir, options):
+    import generate_html
+
+    # 슬라이드 마크업을 그리며 <picture>에 쓰일 변형만 만들고 마크업은 버림 (html 단계가 캐시에서 재사용)
+    images = _html_images(output_dir, options)
+    for _ in generate_html.iter_slides_html(deck, str(output_dir), images):
+        pass
+    return images.files
+
+
+def _build_pptx(deck, content_path, output_dir, options):
+    import generate_pptx
+
+    prefetch_assets(deck)
+    output_path = output_dir / f"{content_path.stem}.pptx"
+    generate_pptx.generate_presentation(
+        content_path, output_path, deck=deck,
+        jobs=options.get("jobs", 1), incremental=options.get("incremental", False),
+        stream=options.get("stream", False), fast_elements=options.get("fast_elements"),
+        optimize=options.get("optimize"),
+    )
+    return [output_path]
+
+
+def _build_html(deck, content_path, output_dir, options):
+    import generate_html
+
+    output_path = output_dir / f"{content_path.stem}.html"
+    images = _html_images(output_dir, options)
+    if options.get("bundle"):
+        import html_bundle
+
+        summary = html_bundle.write_bundle(deck, output_path, str(output_dir), mode=options["bundle"], images=images)
+        return [output_path] + [output_dir / name for name in summary["files"]]
+    generate_html.write_html(deck, output_path, str(output_dir), images)
+    return [output_path]
+
+
+def prefetch_assets(deck):
+    """python-pptx 임포트와 템플릿 스냅샷, 이미지 크기 조회 캐시를 미리 채움
+
+    pptx 단계의 슬라이드 렌더링 워커(-j)가 fork 시 그대로 물려받습니다.
+    """
+    import generate_pptx
+    import image_pipeline
+
+    generate_pptx.compile_template()
+    image_paths = {path for slide in deck.slides for path in slide.image_paths()}
+    if image_paths:
+        image_pipeline.prefetch_images(sorted(image_paths))
+
+
+# ==================== 단계 그래프 ====================
+def _architecture_value(deck):
+    """diagrams 단계 키 값: layers로 그리는 첫 구성도 요소 (없으면 None - 기본 콘텐츠 파일이 입력)"""
+    for slide in deck.slides:
+        for element in slide.elements:
+            if element.TYPE == "architecture_diagram" and element.declarative:
+                return element.to_plain()
+    return None
+
+
+def plan_stages(deck, content_path, formats, output_dir, options):
+    """formats를 만드는 build_graph.Stage 리스트 (validate + 형식별 단계)"""
+    content_path = Path(content_path)
+    output_dir = Path(output_dir)
+    slides = [slide.to_plain() for slide in deck.slides]
+    image_paths = sorted({path for slide in deck.slides for path in slide.image_paths()})
+    image_slides = [slide.to_plain() for slide in deck.slides if slide.image_paths()]
+    architecture = _architecture_value(deck)
+    premium_svg = output_dir / os.path.basename(generate_premium_assets.SVG_PATH)
+    premium_png = output_dir / os.path.basename(generate_premium_assets.PNG_PATH)
+
+    def output_options(*names):
+        return {name: options.get(name) for name in names}
+
+    candidates = {
+        "diagrams": build_graph.Stage(
+            "diagrams", _build_diagrams, after=("validate",), sources=STAGE_SOURCES["diagrams"],
+            inputs=[] if architecture else [generate_diagrams.CONTENT_PATH],
+            value={"architecture": architecture, "width": generate_diagrams.WIDTH, "fonts": fonts.find_faces()},
+            outputs=[output_dir / os.path.basename(generate_diagrams.SVG_PATH),
+                     output_dir / os.path.basename(generate_diagrams.PNG_PATH)],
+        ),
+        "premium": build_graph.Stage(
+            "premium", _build_premium, after=("validate",), sources=STAGE_SOURCES["premium"],
+            # numpy가 없으면 SVG만 쓰므로 설치 여부도 키에 포함
+            value={"scales": generate_premium_assets.PNG_SCALES, "fonts": fonts.find_faces(),
+                   "numpy": importlib.util.find_spec("numpy") is not None},
+            outputs=[premium_svg, premium_png],
+        ),
+        "images": build_graph.Stage(
+            "images", _build_images, after=("validate",), sources=STAGE_SOURCES["images"],
+            inputs=image_paths, value={"slides": image_slides},
+        ),
+        "pptx": build_graph.Stage(
+            "pptx", _build_pptx, after=("validate",), sources=STAGE_SOURCES["pptx"],
+            inputs=[PPTX_TEMPLATE_PATH] + image_paths,
+            value={
+                "name": content_path.stem, "title": deck.title, "author": deck.author, "date": deck.date,
+                "slides": slides, **output_options("stream", "fast_elements", "optimize"),
+            },
+            outputs=[output_dir / f"{content_path.stem}.pptx"],
+        ),
+        "html": build_graph.Stage(
+            "html", _build_html, after=("validate", "images"), sources=STAGE_SOURCES["html"],
+            inputs=image_paths,
+            value={
+                # 이미지 참조가 출력 디렉터리 기준 상대 경로이므로 위치도 키에 포함
+                "name": content_path.stem, "output_dir": str(output_dir.resolve()),
+                "title": deck.title, "slides": slides,
+                **output_options("bundle", "responsive_images"),
+            },
+            outputs=[output_dir / f"{content_path.stem}.html"],
+        ),
+    }
+    if not options.get("responsive_images", True):
+        del candidates["images"]
+
+    stages = [build_graph.Stage(
+        "validate", _check_content, sources=STAGE_SOURCES["validate"], inputs=[content_path], local=True,
+    )]
+    for fmt in formats:
+        stages.extend(candidates[name] for name in FORMAT_STAGES[fmt] if name in candidates)
+    return stages
+
+
+def build(content_path, formats, output_dir, options=None, serial=False, verbose=False, force=False):
+    """content_path를 formats 형식으로 빌드 - 단계 순서대로 정렬된 결과 레코드 리스트 반환
+
+    결과 상태는 ok(실행), cached(출력이 최신), restored(캐시에서 복원), error, skipped(선행 단계 실패)입니다.
+    serial=True이면 단계를 현재 프로세스에서 차례로 실행하고(비교/디버깅용), force=True이면 이전
+    빌드 기록을 무시하고 모든 단계를 실행합니다.
+    """
+    content_path = Path(content_path)
+    output_dir = Path(output_dir)
+    options = options or {}
+
+    deck = content_model.load_deck(content_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stages = plan_stages(deck, content_path, formats, output_dir, options)
+    results = build_graph.run_graph(
+        stages, (deck, content_path, output_dir, options), output_dir,
+        force=force, serial=serial, on_result=lambda result: _report(result, verbose),
+    )
+    return [results[stage.name] for stage in stages]
+
+
+# 결과 상태 -> 표시
+_STATUS_MARKS = {"ok": "✅", "cached": "✔️", "restored": "♻️", "error": "❌", "skipped": "⏭️"}
+_STATUS_LABELS = {"cached": "최신", "restored": "복원", "skipped": "건너뜀"}
+
+
+def _report(result, verbose):
+    mark = _STATUS_MARKS[result["status"]]
+    label = _STATUS_LABELS.get(result["status"])
+    timing = "-" if label else f"{result['seconds']:.2f}s"
+    outputs = ", ".join(Path(path).name for path in result["outputs"])
+    print(f"  {mark} {result['stage']:<8} {timing:>7}  {outputs}{f' ({label})' if label else ''}")
+    if result["error"]:
+        print(f"      {result['error']}")
+    if verbose or result["error"]:
+        print("".join(f"      | {line}\n" for line in result["log"].splitlines()), end="")
+
+
+def _parse_formats(value):
+    formats = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if item not in FORMAT_STAGES:
+            raise argparse.ArgumentTypeError(f"알 수 없는 형식: {item} (가능: {', '.join(FORMATS)})")
+        if item not in formats:
+            formats.append(item)
+    if not formats:
+        raise argparse.ArgumentTypeError("형식이 비어 있음")
+    return formats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="콘텐츠 JSON 하나로 여러 출력 형식을 동시에 빌드")
+    parser.add_argument(
+        "-c", "--content", type=Path, default=DEFAULT_CONTENT_PATH,
+        help=f"콘텐츠 JSON 경로 (기본값: {DEFAULT_CONTENT_PATH.name})"
+    )
+    parser.add_argument(
+        "--formats", type=_parse_formats, default=list(FORMATS),
+        help=f"쉼표로 구분한 출력 형식 (기본값: {','.join(FORMATS)})"
+    )
+    parser.add_argument(
+        "-o", "--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+        help="출력 디렉터리 - <콘텐츠 이름>.pptx/.html과 구성도 자산 (기본값: docgen/out/)"
+    )
+    parser.add_argument("--serial", action="store_true", help="단계를 동시에 실행하지 않고 차례로 실행")
+    parser.add_argument("--force", action="store_true", help="이전 빌드 기록을 무시하고 모든 단계 실행")
+    parser.add_argument("-v", "--verbose", action="store_true", help="단계별 로그 출력")
+    parser.add_argument(
+        "--bundle", nargs="?", const="inline", default=None, choices=("inline", "files"),
+        help="html을 CDN 없이 열리는 오프라인 번들로 (inline: 한 파일, files: 해시 붙은 형제 파일)"
+    )
+    parser.add_argument(
+        "--original-images", dest="responsive_images", action="store_false",
+        help="html에서 이미지 원본을 그대로 참조 (기본값: img/에 크기별 WebP/PNG 변형 생성)"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="pptx 슬라이드 렌더링 워커 프로세스 수")
+    parser.add_argument("-i", "--incremental", action="store_true", help="pptx 증분 빌드")
+    parser.add_argument("--stream", action="store_true", help="pptx 스트리밍 저장")
+    parser.add_argument(
+        "--fast-elements", metavar="TYPES", default=None,
+        type=lambda value: [item.strip() for item in value.split(",") if item.strip()],
+        help="pptx에서 DrawingML 백엔드로 렌더링할 요소 타입 (쉼표 구분 또는 all)"
+    )
+    parser.add_argument(
+        "--optimize", metavar="LEVEL", nargs="?", type=int, default=None, const=9, choices=range(0, 10),
+        help="pptx 저장 후 템플릿 부속물 제거 및 재압축 (LEVEL: deflate 수준 0-9, 기본값 9)"
+    )
+    args = parser.parse_args(argv)
+
+    options = {
+        "jobs": args.jobs,
+        "incremental": args.incremental,
+        "stream": args.stream,
+        "fast_elements": args.fast_elements,
+        "optimize": args.optimize,
+        "bundle": args.bundle,
+        "responsive_images": args.responsive_images,
+    }
+
+    print(f"빌드: {args.content} -> {args.output_dir} ({', '.join(args.formats)})")
+    started = time.perf_counter()
+    results = build(
+        args.content, args.formats, args.output_dir, options,
+        serial=args.serial, verbose=args.verbose, force=args.force,
+    )
+
+    total = time.perf_counter() - started
+    ran = [result for result in results if result["status"] in ("ok", "error")]
+    slowest = max((result["seconds"] for result in ran), default=0.0)
+    print(
+        f"완료: {total:.2f}s (실행 {len(ran)}/{len(results)}단계, 가장 느린 단계 {slowest:.2f}s, "
+        f"합계 {sum(r['seconds'] for r in ran):.2f}s)"
+    )
+    return 0 if all(result["status"] in ("ok", "cached", "restored") for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+내용 주소 기반 빌드 그래프
+
+빌드 단계(Stage)마다 입력과 출력을 선언하면, 입력이 바뀐 단계와 그 하위 단계만 다시 실행합니다.
+- 입력: 읽는 파일(inputs), 코드 모듈(sources), JSON으로 직렬화할 값(value), 선행 단계의 출력
+- 단계 키: 위 입력 내용의 SHA-256. 파일은 (크기, mtime)이 같으면 이전 해시를 재사용하므로(digests.json)
+  바뀌지 않은 파일을 다시 읽지 않습니다.
+- 출력: 단계가 실제로 쓴 파일. 키별 기록(stages/<키>.json)에 출력 디렉터리 기준 상대 경로와 내용
+  해시를 남기고, 내용은 objects/ 아래 해시 이름으로 보관합니다.
+
+단계를 실행하기 전에 같은 키의 기록이 있으면 출력 파일 해시만 확인해 그대로 두고(최신), 지워졌거나
+바뀐 출력은 objects/에서 복사해 되살립니다(복원). 선행 단계의 출력은 경로가 아니라 내용 해시로 키에
+들어가므로, 선행 단계가 다시 실행돼도 같은 바이트를 만들었다면 하위 단계는 실행되지 않습니다.
+
+의존 관계는 after로 명시하거나, 한 단계의 inputs에 다른 단계가 선언한 outputs 경로가 있으면 자동으로
+생깁니다. 선행 단계가 모두 끝난 단계는 워커 프로세스에서 동시에 실행합니다 (local=True이면 현재
+프로세스). 캐시 전체(.cache/build)는 언제 지워도 다음 빌드가 다시 채웁니다.
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+CACHE_DIR = BASE_DIR / ".cache" / "build"
+DIGESTS_PATH = CACHE_DIR / "digests.json"
+OBJECTS_DIR = CACHE_DIR / "objects"
+RECORDS_DIR = CACHE_DIR / "stages"
+
+# 키 계산 방식이 바뀌면 올려서 이전 기록을 모두 무효화
+GRAPH_VERSION = 1
+
+
+class Stage:
+    """빌드 단계 하나
+
+    run(*args)는 모듈 수준 함수로(워커로 넘기기 위해) 쓴 출력 경로 리스트를 반환합니다.
+    sources는 BASE_DIR 기준 모듈 파일 이름, inputs는 파일 경로, outputs는 미리 알 수 있는 출력 경로
+    (자동 의존 관계용 - 실제 기록은 run이 반환한 경로)입니다.
+    """
+
+    __slots__ = ("name", "run", "after", "sources", "inputs", "value", "outputs", "local")
+
+    def __init__(self, name, run, after=(), sources=(), inputs=(), value=None, outputs=(), local=False):
+        self.name = name
+        self.run = run
+        self.after = tuple(after)
+        self.sources = tuple(sources)
+        self.inputs = tuple(str(path) for path in inputs)
+        self.value = value
+        self.outputs = tuple(str(path) for path in outputs)
+        self.local = local
+
+    def __repr__(self):
+        return f"Stage({self.name!r})"
+
+
+# ==================== 파일 해시 ====================
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileDigests:
+    """파일 내용 SHA-256 - (크기, mtime)이 기록과 같으면 파일을 읽지 않고 기록된 해시 사용"""
+
+    def __init__(self, path=DIGESTS_PATH):
+        self.path = Path(path)
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def digest(self, path):
+        """path의 내용 해시 (없거나 읽을 수 없으면 None)"""
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        entry = self._entries.get(key)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        try:
+            value = _hash_file(key)
+        except OSError:
+            return None
+        self.remember(key, value, stat.st_size, stat.st_mtime_ns)
+        return value
+
+    def remember(self, path, digest, size, mtime_ns):
+        """다른 곳(워커)에서 계산한 해시를 기록"""
+        self._entries[os.path.abspath(path)] = [size, mtime_ns, digest]
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+# ==================== 객체 저장소 / 단계 기록 ====================
+def _object_path(digest):
+    return OBJECTS_DIR / digest[:2] / digest
+
+
+def _copy_atomically(source, target):
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+def store_outputs(paths, output_dir):
+    """출력 파일을 객체 저장소에 넣고 {상대 경로: [해시, 크기, mtime]} 반환
+
+    객체는 복사본입니다 (하드 링크면 다음 빌드가 출력을 제자리에서 덮어쓸 때 객체도 바뀜).
+    """
+    stored = {}
+    for path in paths:
+        path = Path(path)
+        digest = _hash_file(path)
+        object_path = _object_path(digest)
+        if not object_path.exists():
+            _copy_atomically(path, object_path)
+        stat = path.stat()
+        stored[os.path.relpath(path, output_dir)] = [digest, stat.st_size, stat.st_mtime_ns]
+    return stored
+
+
+def _record_path(key):
+    return RECORDS_DIR / f"{key}.json"
+
+
+def load_record(key):
+    """키의 단계 기록 {"stage", "outputs": {상대 경로: 해시}} (없으면 None)"""
+    try:
+        with open(_record_path(key), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_record(key, stage_name, outputs):
+    record_path = _record_path(key)
+    record_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = record_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"stage": stage_name, "outputs": outputs}, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, record_path)
+
+
+# ==================== 실행 ====================
+def stage_key(stage, digests, upstream):
+    """단계 키 - upstream은 {선행 단계 이름: {상대 경로: 해시}}"""
+    material = {
+        "version": GRAPH_VERSION,
+        "stage": stage.name,
+        "sources": {name: digests.digest(BASE_DIR / name) for name in stage.sources},
+        "inputs": {path: digests.digest(path) for path in stage.inputs},
+        "upstream": upstream,
+        "value": stage.value,
+    }
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def dependencies(stages):
+    """{단계 이름: 선행 단계 이름 집합} - after와, inputs가 다른 단계의 outputs인 경우"""
+    names = {stage.name for stage in stages}
+    producers = {os.path.abspath(path): stage.name for stage in stages for path in stage.outputs}
+    deps = {}
+    for stage in stages:
+        found = {name for name in stage.after if name in names}
+        found.update(
+            producers[os.path.abspath(path)] for path in stage.inputs
+            if os.path.abspath(path) in producers
+        )
+        found.discard(stage.name)
+        deps[stage.name] = found
+    return deps
+
+
+def _result(stage_name, status, outputs=(), seconds=0.0, error=None, log=""):
+    return {
+        "stage": stage_name, "status": status, "outputs": list(outputs),
+        "seconds": seconds, "error": error, "log": log, "digests": {},
+    }
+
+
+def _execute(stage_name, run, args, output_dir):
+    """워커: 단계 하나 실행 후 출력을 객체 저장소에 넣고 결과 레코드 반환 (실패해도 예외 대신 상태로 보고)"""
+    started = time.perf_counter()
+    log = io.StringIO()
+    result = _result(stage_name, "ok")
+    try:
+        with redirect_stdout(log):
+            outputs = [str(path) for path in run(*args)]
+        result["outputs"] = outputs
+        result["digests"] = store_outputs(outputs, output_dir)
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        log.write(traceback.format_exc())
+    result["log"] = log.getvalue()
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def _reuse(stage, record, output_dir, digests):
+    """기록대로 출력이 있으면 "cached", 객체에서 되살렸으면 "restored" 결과, 불가능하면 None"""
+    outputs = record.get("outputs", {})
+    missing = {
+        name: digest for name, digest in outputs.items()
+        if digests.digest(Path(output_dir) / name) != digest
+    }
+    if any(not _object_path(digest).exists() for digest in missing.values()):
+        return None
+    for name, digest in missing.items():
+        target = Path(output_dir) / name
+        _copy_atomically(_object_path(digest), target)
+        stat = target.stat()
+        digests.remember(target, digest, stat.st_size, stat.st_mtime_ns)
+    result = _result(
+        stage.name, "restored" if missing else "cached",
+        [str(Path(output_dir) / name) for name in outputs],
+    )
+    result["digests"] = dict(outputs)
+    return result
+
+
+def run_graph(stages, args, output_dir, force=False, serial=False, max_workers=None, on_result=None):
+    """stages를 의존 순서대로 실행 - {단계 이름: 결과 레코드} 반환
+
+    run(*args)의 출력은 output_dir 아래에 있어야 합니다. force=True이면 기록을 무시하고 모두 실행하며,
+    serial=True이면 모든 단계를 현재 프로세스에서 차례로 실행합니다. 실패한 단계의 하위 단계는 "skipped".
+    on_result(result)는 단계가 끝날 때마다 호출됩니다.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    deps = dependencies(stages)
+    digests = FileDigests()
+    results = {}
+    keys = {}
+    running = {}
+    pool = None
+
+    def finish(result):
+        name = result["stage"]
+        if result["status"] == "ok":
+            outputs = {}
+            for rel_path, (digest, size, mtime_ns) in result["digests"].items():
+                digests.remember(Path(output_dir) / rel_path, digest, size, mtime_ns)
+                outputs[rel_path] = digest
+            result["digests"] = outputs
+            save_record(keys[name], name, outputs)
+        results[name] = result
+        if on_result:
+            on_result(result)
+
+    try:
+        while len(results) < len(stages):
+            ready = [
+                stage for stage in stages
+                if stage.name not in results and stage.name not in keys and deps[stage.name] <= set(results)
+            ]
+            for stage in ready:
+                if any(results[dep]["status"] in ("error", "skipped") for dep in deps[stage.name]):
+                    finish(_result(stage.name, "skipped"))
+                    continue
+                upstream = {dep: results[dep]["digests"] for dep in sorted(deps[stage.name])}
+                keys[stage.name] = key = stage_key(stage, digests, upstream)
+                record = None if force else load_record(key)
+                reused = _reuse(stage, record, output_dir, digests) if record is not None else None
+                if reused is not None:
+                    finish(reused)
+                elif serial or stage.local:
+                    finish(_execute(stage.name, stage.run, args, output_dir))
+                else:
+                    if pool is None:
+                        pool = ProcessPoolExecutor(max_workers=max_workers or len(stages))
+                    future = pool.submit(_execute, stage.name, stage.run, args, output_dir)
+                    running[future] = stage.name
+
+            if len(results) == len(stages):
+                break
+            if not running:
+                if ready:
+                    continue
+                raise ValueError(f"순환 의존: {', '.join(sorted(set(by_name) - set(results)))}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                finish(future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        digests.save()
+    return results
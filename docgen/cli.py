@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+docgen 명령행 진입점
+
+하위 명령마다 필요한 모듈만 그때 임포트합니다. validate는 표준 라이브러리만 쓰므로 python-pptx/lxml/PIL을
+로드하지 않고 끝나며(커밋 전 훅용, 100ms 이내), 나머지 명령은 각 스크립트의 명령행 인자를 그대로 받습니다.
+
+사용 예:
+    python docgen/cli.py validate presentation_content.json
+    python docgen/cli.py pptx -c presentation_content.json -o out.pptx --optimize
+    python docgen/cli.py html -c presentation_content.json -o out.html
+    python docgen/cli.py build --formats pptx,html,png -o out/
+    python docgen/cli.py inventory 덱.pptx -o 덱-inventory.json
+
+커밋 전 훅 예 (.git/hooks/pre-commit):
+    git diff --cached --name-only -- '*.json' | xargs -r python docgen/cli.py validate -q
+"""
+
+import sys
+
+
+def _validate(argv):
+    import content_schema
+    return content_schema.main(argv)
+
+
+def _pptx(argv):
+    import generate_pptx
+
+    return generate_pptx.main(argv)
+
+
+def _html(argv):
+    import generate_html
+
+    args = generate_html.parse_args(argv)
+    return generate_html.main(args.content, args.output, args.bundle, args.font, args.responsive_images)
+
+
+def _build(argv):
+    import build
+    return build.main(argv)
+
+
+def _batch(argv):
+    import batch_generate
+    return batch_generate.main(argv)
+
+
+def _optimize(argv):
+    import pptx_optimize
+    return pptx_optimize.main(argv)
+
+
+def _watch(argv):
+    import watch
+    return watch.main(argv)
+
+
+def _inventory(argv):
+    import text_inventory
+    return text_inventory.main(argv)
+
+
+def _bench(argv):
+    import benchmark
+    return benchmark.main(argv)
+
+
+# 하위 명령 -> (실행 함수, 설명)
+COMMANDS = {
+    "validate": (_validate, "콘텐츠 JSON 검증 (렌더링/python-pptx 없음)"),
+    "pptx": (_pptx, "PPTX 덱 생성 (generate_pptx.py)"),
+    "html": (_html, "HTML 슬라이드 생성 (generate_html.py)"),
+    "build": (_build, "여러 출력 형식(pptx, html, png)을 한 번에 빌드 - 입력이 바뀐 단계만 동시 실행 (build.py)"),
+    "batch": (_batch, "콘텐츠 JSON 여러 개로 PPTX 일괄 생성 (batch_generate.py)"),
+    "optimize": (_optimize, "PPTX 출력 크기 최적화 (pptx_optimize.py)"),
+    "watch": (_watch, "콘텐츠 감시 - 저장 시 바뀐 슬라이드만 다시 렌더링 (watch.py)"),
+    "inventory": (_inventory, "PPTX 텍스트 인벤토리 JSON - 슬라이드 XML 스트리밍, 병렬 (text_inventory.py)"),
+    "bench": (_bench, "생성기 확장성 벤치마크 (benchmark.py)"),
+}
+
+
+def usage():
+    lines = ["사용법: cli.py <명령> [인자...]   (명령별 도움말: cli.py <명령> -h)", "", "명령:"]
+    lines.extend(f"  {name:<10} {description}" for name, (_, description) in COMMANDS.items())
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+
+    command = COMMANDS.get(argv[0])
+    if command is None:
+        print(f"알 수 없는 명령: {argv[0]}\n\n{usage()}", file=sys.stderr)
+        return 2
+    return command[0](argv[1:]) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+콘텐츠 중간 표현 (IR)
+
+presentation_content.json을 한 번 읽어 __slots__ 기반의 타입별 객체(Deck, Slide, 요소 클래스)로
+변환합니다. PPTX(generate_pptx, drawingml)와 HTML(generate_html) 백엔드는 모두 이 표현에서
+렌더링하므로, 여러 형식을 만들 때도 JSON 파싱, 검증(content_schema), 이미지 경로 수집은 한 번만
+일어납니다. 기본값(누락 키는 빈 문자열/빈 리스트, 설명 문자열의 "\\n" 줄바꿈 처리 등)도 여기서
+한 번 정해집니다.
+
+python-pptx를 임포트하지 않으므로 검증/HTML 경로에서도 가볍게 쓸 수 있습니다.
+"""
+
+import json
+import os
+
+import content_schema
+
+# architecture_diagram 요소가 image_path를 지정하지 않을 때 쓰는 다이어그램 이미지 (docgen/ 기준)
+DEFAULT_ARCHITECTURE_IMAGE = "system_architecture_premium.png"
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _text(value):
+    """텍스트 필드 정규화 (None -> "", 그 외는 문자열)"""
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _multiline(value):
+    """JSON에 이스케이프된 채 들어온 "\\n"을 실제 줄바꿈으로"""
+    return _text(value).replace("\\n", "\n")
+
+
+def _list(value):
+    return value if isinstance(value, list) else []
+
+
+def _dicts(value):
+    """리스트 중 dict 항목만 (검증 오류로 보고된 항목은 렌더링에서 건너뜀)"""
+    return [item for item in _list(value) if isinstance(item, dict)]
+
+
+def _plain(value):
+    """IR 객체를 JSON 직렬화 가능한 값으로 (지문 계산용)"""
+    if isinstance(value, Node):
+        return {"_": type(value).__name__, **{name: _plain(getattr(value, name)) for name in value.__slots__}}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+class Node:
+    """IR 객체 공통 기반 - 필드는 하위 클래스의 __slots__"""
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def replace(self, **changes):
+        """일부 필드만 바꾼 얕은 복사본"""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return type(self)(**fields)
+
+    def to_plain(self):
+        return _plain(self)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+# ==================== 요소 항목 ====================
+class IconBox(Node):
+    __slots__ = ("icon", "title", "desc")
+
+
+class PainPoint(Node):
+    __slots__ = ("role", "icon", "pain")
+
+
+class ProcessStep(Node):
+    __slots__ = ("code", "name", "actor")
+
+
+class Comparison(Node):
+    __slots__ = ("label", "as_is", "to_be", "unit", "change")
+
+
+class Phase(Node):
+    __slots__ = ("name",)
+
+
+class Screen(Node):
+    __slots__ = ("image_path", "label", "description")
+
+
+class DiagramComponent(Node):
+    __slots__ = ("name", "tech", "was", "service", "features", "icon")
+
+
+class DiagramLayer(Node):
+    __slots__ = ("name", "components")
+
+
+class DiagramConnection(Node):
+    __slots__ = ("source", "target", "protocol")
+
+
+# ==================== 요소 ====================
+class Element(Node):
+    """커스텀 요소 기반 - TYPE은 JSON의 "type" 값"""
+
+    __slots__ = ()
+    TYPE = None
+
+    @classmethod
+    def parse(cls, data):
+        raise NotImplementedError
+
+    def image_paths(self):
+        """요소가 참조하는 이미지 파일 경로"""
+        return []
+
+
+class TableElement(Element):
+    __slots__ = ("headers", "rows", "highlight_column")
+    TYPE = "table"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(
+            headers=_list(data.get("headers")),
+            rows=[row for row in _list(data.get("rows")) if isinstance(row, list)],
+            highlight_column=data.get("highlight_column"),
+        )
+
+
+class IconBoxGrid(Element):
+    __slots__ = ("columns", "items")
+    TYPE = "icon_box_grid"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(
+            columns=data.get("columns", 4),
+            items=[
+                IconBox(icon=_text(item.get("icon")), title=_text(item.get("title")), desc=_multiline(item.get("desc")))
+                for item in _dicts(data.get("items"))
+            ],
+        )
+
+
+class PainPointCards(Element):
+    __slots__ = ("columns", "items")
+    TYPE = "pain_point_cards"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(
+            columns=data.get("columns", 4),
+            items=[
+                PainPoint(role=_text(item.get("role")), icon=_text(item.get("icon")), pain=_multiline(item.get("pain")))
+                for item in _dicts(data.get("items"))
+            ],
+        )
+
+
+class ProcessFlow(Element):
+    __slots__ = ("steps",)
+    TYPE = "process_flow"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(steps=[
+            ProcessStep(code=_text(step.get("code")), name=_text(step.get("name")), actor=_text(step.get("actor")))
+            for step in _dicts(data.get("steps"))
+        ])
+
+
+class ComparisonChart(Element):
+    __slots__ = ("title", "items")
+    TYPE = "comparison_chart"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(
+            title=_text(data.get("title")),
+            items=[
+                Comparison(
+                    label=_text(item.get("label")),
+                    as_is=item.get("as_is", 0),
+                    to_be=item.get("to_be", 0),
+                    unit=item.get("unit"),
+                    change=_text(item.get("change")),
+                )
+                for item in _dicts(data.get("items"))
+            ],
+        )
+
+
+class Timeline(Element):
+    __slots__ = ("phases",)
+    TYPE = "timeline"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(phases=[Phase(name=_text(phase.get("name"))) for phase in _dicts(data.get("phases"))])
+
+
+class ScreenGallery(Element):
+    __slots__ = ("layout", "screens")
+    TYPE = "screen_gallery"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(
+            layout=_text(data.get("layout", "horizontal_3")),
+            screens=[
+                Screen(
+                    image_path=_text(screen.get("image_path")),
+                    label=_text(screen.get("label")),
+                    description=_multiline(screen.get("description")),
+                )
+                for screen in _dicts(data.get("screens"))
+            ],
+        )
+
+    def image_paths(self):
+        return [screen.image_path for screen in self.screens if screen.image_path]
+
+
+class ArchitectureDiagram(Element):
+    """시스템 구성도
+
+    layers/connections가 있으면 diagram 엔진이 자동 배치해 도형으로 그리고, 없거나 image_path를
+    지정하면 다이어그램 이미지(image_path, 기본값 DEFAULT_ARCHITECTURE_IMAGE)로 렌더링합니다.
+    """
+
+    __slots__ = ("image_path", "layers", "connections")
+    TYPE = "architecture_diagram"
+
+    @classmethod
+    def parse(cls, data):
+        return cls(
+            image_path=_text(data.get("image_path")) or None,
+            layers=[
+                DiagramLayer(
+                    name=_text(layer.get("name")),
+                    components=[
+                        DiagramComponent(
+                            name=_text(component.get("name")),
+                            tech=_text(component.get("tech")),
+                            was=_text(component.get("was")),
+                            service=_text(component.get("service")),
+                            features=[_text(feature) for feature in _list(component.get("features"))],
+                            icon=_text(component.get("icon")),
+                        )
+                        for component in _dicts(layer.get("components"))
+                    ],
+                )
+                for layer in _dicts(data.get("layers"))
+            ],
+            connections=[
+                DiagramConnection(
+                    source=_text(connection.get("from")),
+                    target=_text(connection.get("to")),
+                    protocol=_text(connection.get("protocol")),
+                )
+                for connection in _dicts(data.get("connections"))
+            ],
+        )
+
+    @property
+    def declarative(self):
+        """이미지 대신 layers/connections로 그리는지 (image_path를 지정하면 이미지 우선)"""
+        return not self.image_path and any(layer.components for layer in self.layers)
+
+    @property
+    def source_path(self):
+        """이미지로 그릴 때 읽을 파일 경로 (image_path가 없으면 docgen/의 기본 다이어그램)"""
+        return self.image_path or os.path.join(_BASE_DIR, DEFAULT_ARCHITECTURE_IMAGE)
+
+    def image_paths(self):
+        return [] if self.declarative else [self.source_path]
+
+
+# JSON "type" -> 요소 클래스
+ELEMENT_TYPES = {
+    cls.TYPE: cls
+    for cls in (
+        TableElement, IconBoxGrid, PainPointCards, ProcessFlow,
+        ComparisonChart, Timeline, ScreenGallery, ArchitectureDiagram,
+    )
+}
+
+
+# ==================== 슬라이드/덱 ====================
+class BodyItem(Node):
+    __slots__ = ("level", "text")
+
+
+class TocItem(Node):
+    __slots__ = ("number", "title", "pages")
+
+
+class Slide(Node):
+    """슬라이드 하나 - 플레이스홀더 텍스트와 커스텀 요소 (알 수 없는 요소 타입은 제외)"""
+
+    __slots__ = (
+        "number", "layout_id", "title", "subtitle", "main_title", "action_title",
+        "body", "toc_items", "elements",
+    )
+
+    @classmethod
+    def parse(cls, data):
+        placeholders = data.get("placeholders")
+        if not isinstance(placeholders, dict):
+            placeholders = {}
+        layout_id = data.get("layout_id", 4)
+
+        elements = []
+        for element in _dicts(data.get("custom_elements")):
+            element_cls = ELEMENT_TYPES.get(element.get("type"))
+            element_data = element.get("data", {})
+            if element_cls is not None and isinstance(element_data, dict):
+                elements.append(element_cls.parse(element_data))
+
+        return cls(
+            number=data.get("slide_number", 0),
+            layout_id=layout_id if isinstance(layout_id, int) else 4,
+            title=_text(placeholders.get("title")),
+            subtitle=_text(placeholders.get("subtitle")),
+            main_title=_text(placeholders.get("main_title")),
+            action_title=_text(placeholders.get("action_title")),
+            body=[
+                BodyItem(level=item.get("level", 1), text=_text(item.get("text")))
+                for item in _dicts(placeholders.get("body"))
+            ],
+            toc_items=[
+                TocItem(number=_text(item.get("number")), title=_text(item.get("title")), pages=_text(item.get("pages")))
+                for item in _dicts(placeholders.get("toc_items"))
+            ],
+            elements=elements,
+        )
+
+    def image_paths(self):
+        """슬라이드가 참조하는 모든 이미지 경로"""
+        return [path for element in self.elements for path in element.image_paths()]
+
+
+class Deck(Node):
+    """프레젠테이션 전체 - issues는 로드 시 한 번 실행한 content_schema 검증 결과"""
+
+    __slots__ = ("title", "author", "date", "slides", "issues")
+
+    @classmethod
+    def parse(cls, content, validate=True):
+        issues = content_schema.validate_content(content) if validate else []
+        presentation = content.get("presentation") if isinstance(content, dict) else None
+        if not isinstance(presentation, dict):
+            presentation = {}
+        return cls(
+            title=_text(presentation.get("title")),
+            author=_text(presentation.get("author")),
+            date=_text(presentation.get("date")),
+            slides=[
+                Slide.parse(slide) for slide in _dicts(presentation.get("slides"))
+            ],
+            issues=issues,
+        )
+
+    @property
+    def errors(self):
+        return [issue for issue in self.issues if issue.level == content_schema.ERROR]
+
+
+def load_deck(content_path, validate=True):
+    """콘텐츠 JSON 파일을 읽어 Deck으로 변환 (검증 결과는 deck.issues)"""
+    with open(content_path, "r", encoding="utf-8") as f:
+        return Deck.parse(json.load(f), validate=validate)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+콘텐츠 JSON 검증 (렌더링 없음)
+
+presentation_content.json 형식의 콘텐츠를 python-pptx 없이 표준 라이브러리만으로 검사합니다.
+커밋 전 훅에서 콘텐츠를 고칠 때마다 실행하므로 렌더링 모듈은 물론 pathlib도 임포트하지 않습니다.
+
+- 오류: 렌더링이 실패하는 구조 (slides가 리스트가 아님, 요소 data가 dict가 아님, 숫자 자리의 문자열,
+  타임라인 단계 수 초과 등)
+- 경고: 렌더링은 되지만 내용이 비거나 무시되는 경우 (요소/항목 키 누락, 알 수 없는 요소 타입이나
+  layout_id, 없는 이미지 파일, 표 행의 열 수 불일치 등)
+
+사용 예:
+    python docgen/content_schema.py presentation_content.json
+    python docgen/cli.py validate --strict sites/*.json
+"""
+
+import json
+import os
+import sys
+
+# 생성기가 아는 layout_id (그 외 값은 layout 4로 렌더링됨)
+LAYOUT_IDS = {1, 2, 3, 4, 5}
+
+# 요소 타입 -> {리스트 키: 리스트 항목(dict)에 있어야 하는 키}
+ELEMENT_SCHEMAS = {
+    "table": {"headers": (), "rows": ()},
+    "icon_box_grid": {"items": ("title", "desc")},
+    "pain_point_cards": {"items": ("role", "pain")},
+    "process_flow": {"steps": ("name", "actor")},
+    "comparison_chart": {"items": ("label", "as_is", "to_be")},
+    "timeline": {"phases": ("name",)},
+    "screen_gallery": {"screens": ("image_path",)},
+    "architecture_diagram": {},
+}
+
+# 요소 타입 -> 양의 정수여야 하는 data 키 (열 수로 나누므로 문자열/0이면 렌더링 실패)
+ELEMENT_INT_FIELDS = {
+    "icon_box_grid": ("columns",),
+    "pain_point_cards": ("columns",),
+}
+
+# 플레이스홀더 리스트 키 -> 항목에 있어야 하는 키
+PLACEHOLDER_SCHEMAS = {
+    "body": ("level", "text"),
+    "toc_items": ("number", "title", "pages"),
+}
+
+# 본문 항목 level 범위 (python-pptx 단락 수준 0-8 = level - 1)
+BODY_MAX_LEVEL = 9
+
+# 타임라인 단계 색상 수 (generate_pptx.add_timeline / drawingml.timeline의 phase_colors)
+TIMELINE_MAX_PHASES = 2
+
+ERROR = "error"
+WARNING = "warning"
+
+
+class Issue:
+    """검증 결과 한 건"""
+
+    __slots__ = ("level", "path", "message")
+
+    def __init__(self, level, path, message):
+        self.level = level
+        self.path = path
+        self.message = message
+
+    def __str__(self):
+        mark = "❌" if self.level == ERROR else "⚠️ "
+        return f"{mark} {self.path}: {self.message}"
+
+
+class ValidationError(ValueError):
+    """검증 오류가 있는 콘텐츠로 렌더링하려 할 때 - issues는 오류 Issue 리스트"""
+
+    def __init__(self, issues):
+        self.issues = list(issues)
+        super().__init__(f"검증 오류 {len(self.issues)}건")
+
+
+def _check_items(issues, path, items, required_keys):
+    """리스트 항목이 dict이고 required_keys를 가지는지 검사"""
+    for i, item in enumerate(items):
+        item_path = f"{path}[{i}]"
+        if not isinstance(item, dict):
+            issues.append(Issue(ERROR, item_path, "항목이 객체가 아님"))
+            continue
+        for key in required_keys:
+            if key not in item:
+                issues.append(Issue(WARNING, item_path, f"'{key}' 없음"))
+
+
+def _check_int(issues, path, value, maximum=None):
+    """value가 1 이상(maximum 이하)의 정수인지 검사 - bool은 정수로 치지 않음"""
+    if isinstance(value, bool) or not isinstance(value, int):
+        issues.append(Issue(ERROR, path, f"정수가 아님: {value!r}"))
+    elif value < 1 or (maximum is not None and value > maximum):
+        limit = f"1-{maximum}" if maximum is not None else "1 이상"
+        issues.append(Issue(ERROR, path, f"범위 밖: {value} ({limit})"))
+
+
+def _check_element(issues, path, element):
+    """custom_elements 항목 하나 검사"""
+    if not isinstance(element, dict):
+        issues.append(Issue(ERROR, path, "요소가 객체가 아님"))
+        return
+
+    elem_type = element.get("type")
+    data = element.get("data", {})
+    if elem_type not in ELEMENT_SCHEMAS:
+        issues.append(Issue(WARNING, path, f"알 수 없는 요소 타입 {elem_type!r} - 렌더링되지 않음"))
+        return
+    if not isinstance(data, dict):
+        issues.append(Issue(ERROR, f"{path}.data", "data가 객체가 아님"))
+        return
+
+    for list_key, item_keys in ELEMENT_SCHEMAS[elem_type].items():
+        list_path = f"{path}.data.{list_key}"
+        if list_key not in data:
+            issues.append(Issue(WARNING, list_path, f"없음 - {elem_type} 요소가 비어 있음"))
+            continue
+        if not isinstance(data[list_key], list):
+            issues.append(Issue(ERROR, list_path, "리스트가 아님"))
+            continue
+        if item_keys:
+            _check_items(issues, list_path, data[list_key], item_keys)
+
+    for key in ELEMENT_INT_FIELDS.get(elem_type, ()):
+        if key in data:
+            _check_int(issues, f"{path}.data.{key}", data[key])
+
+    if elem_type == "table" and isinstance(data.get("rows"), list):
+        width = len(data.get("headers") or [])
+        for i, row in enumerate(data["rows"]):
+            if not isinstance(row, list):
+                issues.append(Issue(ERROR, f"{path}.data.rows[{i}]", "행이 리스트가 아님"))
+            elif width and len(row) != width:
+                issues.append(Issue(WARNING, f"{path}.data.rows[{i}]", f"열 {len(row)}개 (헤더 {width}개)"))
+
+    elif elem_type == "timeline" and isinstance(data.get("phases"), list):
+        if len(data["phases"]) > TIMELINE_MAX_PHASES:
+            issues.append(Issue(
+                ERROR, f"{path}.data.phases",
+                f"단계 {len(data['phases'])}개 - 최대 {TIMELINE_MAX_PHASES}개"
+            ))
+
+    elif elem_type == "comparison_chart" and isinstance(data.get("items"), list):
+        for i, item in enumerate(data["items"]):
+            for key in ("as_is", "to_be"):
+                value = item.get(key, 0) if isinstance(item, dict) else 0
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    issues.append(Issue(ERROR, f"{path}.data.items[{i}].{key}", f"숫자가 아님: {value!r}"))
+
+    elif elem_type == "screen_gallery" and isinstance(data.get("screens"), list):
+        for i, screen in enumerate(data["screens"]):
+            image_path = screen.get("image_path") if isinstance(screen, dict) else None
+            # 생성기와 같이 현재 작업 디렉터리 기준으로 확인 (없으면 빈 상자로 렌더링됨)
+            if image_path and not os.path.isfile(image_path):
+                issues.append(Issue(
+                    WARNING, f"{path}.data.screens[{i}].image_path", f"이미지 파일 없음: {image_path}"
+                ))
+
+    elif elem_type == "architecture_diagram":
+        _check_architecture(issues, path, data)
+
+
+def _check_architecture(issues, path, data):
+    """architecture_diagram의 layers/connections 검사 - 둘 다 없으면 이미지로 렌더링되므로 통과"""
+    names = set()
+    layers = data.get("layers", [])
+    if not isinstance(layers, list):
+        issues.append(Issue(ERROR, f"{path}.data.layers", "리스트가 아님"))
+        layers = []
+    for i, layer in enumerate(layers):
+        layer_path = f"{path}.data.layers[{i}]"
+        if not isinstance(layer, dict):
+            issues.append(Issue(ERROR, layer_path, "항목이 객체가 아님"))
+            continue
+        components = layer.get("components", [])
+        if not isinstance(components, list):
+            issues.append(Issue(ERROR, f"{layer_path}.components", "리스트가 아님"))
+            continue
+        _check_items(issues, f"{layer_path}.components", components, ("name",))
+        names.update(component.get("name") for component in components if isinstance(component, dict))
+
+    connections = data.get("connections", [])
+    if not isinstance(connections, list):
+        issues.append(Issue(ERROR, f"{path}.data.connections", "리스트가 아님"))
+        return
+    _check_items(issues, f"{path}.data.connections", connections, ("from", "to"))
+    for i, connection in enumerate(connections):
+        if not isinstance(connection, dict):
+            continue
+        for key in ("from", "to"):
+            if key in connection and connection[key] not in names:
+                issues.append(Issue(
+                    WARNING, f"{path}.data.connections[{i}].{key}",
+                    f"layers에 없는 구성요소 {connection[key]!r} - 연결선 생략"
+                ))
+
+
+def validate_content(content):
+    """콘텐츠 dict 검증 - Issue 리스트 반환 (문제가 없으면 빈 리스트)"""
+    issues = []
+    presentation = content.get("presentation") if isinstance(content, dict) else None
+    if not isinstance(presentation, dict):
+        return [Issue(ERROR, "presentation", "없거나 객체가 아님")]
+    slides = presentation.get("slides")
+    if not isinstance(slides, list):
+        return [Issue(ERROR, "presentation.slides", "없거나 리스트가 아님")]
+
+    for i, slide in enumerate(slides):
+        if not isinstance(slide, dict):
+            issues.append(Issue(ERROR, f"slides[{i}]", "슬라이드가 객체가 아님"))
+            continue
+        path = f"slides[{i}] (슬라이드 {slide.get('slide_number', i + 1)})"
+
+        layout_id = slide.get("layout_id")
+        if layout_id is None:
+            issues.append(Issue(WARNING, path, "layout_id 없음 - layout 4로 렌더링"))
+        elif isinstance(layout_id, bool) or not isinstance(layout_id, int):
+            issues.append(Issue(ERROR, f"{path}.layout_id", f"정수가 아님: {layout_id!r}"))
+        elif layout_id not in LAYOUT_IDS:
+            issues.append(Issue(WARNING, f"{path}.layout_id", f"알 수 없는 값 {layout_id} - layout 4로 렌더링"))
+
+        placeholders = slide.get("placeholders", {})
+        if not isinstance(placeholders, dict):
+            issues.append(Issue(ERROR, f"{path}.placeholders", "객체가 아님"))
+        else:
+            for key, item_keys in PLACEHOLDER_SCHEMAS.items():
+                if key not in placeholders:
+                    continue
+                if not isinstance(placeholders[key], list):
+                    issues.append(Issue(ERROR, f"{path}.placeholders.{key}", "리스트가 아님"))
+                else:
+                    _check_items(issues, f"{path}.placeholders.{key}", placeholders[key], item_keys)
+            if isinstance(placeholders.get("body"), list):
+                for j, item in enumerate(placeholders["body"]):
+                    if isinstance(item, dict) and "level" in item:
+                        _check_int(issues, f"{path}.placeholders.body[{j}].level", item["level"], BODY_MAX_LEVEL)
+
+        elements = slide.get("custom_elements", [])
+        if not isinstance(elements, list):
+            issues.append(Issue(ERROR, f"{path}.custom_elements", "리스트가 아님"))
+            continue
+        for j, element in enumerate(elements):
+            _check_element(issues, f"{path}.custom_elements[{j}]", element)
+
+    return issues
+
+
+def validate_file(content_path):
+    """콘텐츠 JSON 파일 검증 - JSON 구문 오류도 Issue로 보고"""
+    try:
+        with open(content_path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+    except (OSError, ValueError) as e:
+        return [Issue(ERROR, str(content_path), f"읽을 수 없음: {e}")]
+    return validate_content(content)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="콘텐츠 JSON 검증 (렌더링 없음)")
+    parser.add_argument("contents", nargs="+", help="검증할 콘텐츠 JSON")
+    parser.add_argument("--strict", action="store_true", help="경고도 실패로 처리")
+    parser.add_argument("-q", "--quiet", action="store_true", help="경고는 출력하지 않음")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for content_path in args.contents:
+        issues = validate_file(content_path)
+        errors = sum(1 for issue in issues if issue.level == ERROR)
+        warnings = len(issues) - errors
+        for issue in issues:
+            if issue.level == ERROR or not args.quiet:
+                print(f"{content_path}: {issue}")
+        if errors or (args.strict and warnings):
+            failed = True
+        if not args.quiet or errors:
+            print(f"{content_path}: 오류 {errors}, 경고 {warnings}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
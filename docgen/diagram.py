@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+선언형 시스템 구성도 엔진
+
+architecture_diagram 요소의 layers/connections를 자동 배치해 장면(Scene) 하나를 만들고, 같은 장면에서
+SVG, PNG(Pillow), PPTX 네이티브 도형(drawingml)을 출력합니다. 좌표를 형식마다 손으로 적지 않으므로
+세 출력이 서로 어긋나지 않습니다.
+
+배치는 레이어를 열로 두는 계층형입니다.
+- 노드 크기는 글자 폭 추정치로 정합니다 (글꼴 파일을 열지 않음).
+- 한 레이어의 노드가 많으면 여러 하위 열로 나눕니다 (전체가 16:9에 가깝도록 행 수를 고름).
+- 레이어 안 노드 순서는 연결된 노드의 평균 위치(barycenter)로 좌우 왕복 정렬해 교차를 줄입니다.
+- 연결선은 레이어 사이 통로에서 꺾이는 직교 꺾은선이며, 통로 안에서 선마다 다른 세로 차선을 씁니다.
+정렬과 선형 순회만 쓰므로 노드 수백 개도 수 밀리초 안에 배치됩니다.
+
+사용 예:
+    scene = diagram.layout(element)  # content_model.ArchitectureDiagram
+    svg = diagram.to_svg(scene)
+    diagram.to_png(scene, "system_architecture.png", width=1920)
+    diagram.to_pptx(slide, scene, left, top, width, height)
+"""
+
+import math
+import os
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+# 색상 (generate_pptx.COLORS와 같은 팔레트, hex 문자열)
+NAVY = "002452"
+GRAY = "666666"
+LIGHT_GRAY = "999999"
+WHITE = "FFFFFF"
+PANEL_FILL = "F5F7FA"
+PANEL_LINE = "DDE3EA"
+EDGE_COLOR = "8A94A6"
+# 레이어 순서대로 돌려 쓰는 노드 강조색 (blue, navy, green, orange, red)
+LAYER_COLORS = ("1976D2", "002452", "2E7D32", "F57C00", "C51F2A")
+
+# 배치 치수 (장면 단위 px)
+MARGIN = 32
+PANEL_PAD = 24
+PANEL_HEADER = 48
+NODE_GAP = 20
+SUBCOLUMN_GAP = 24
+CHANNEL_WIDTH = 180  # 레이어 사이 연결선 통로 폭
+NODE_PAD_X = 18
+NODE_PAD_Y = 14
+MIN_NODE_WIDTH = 180
+NODE_RADIUS = 10
+PANEL_RADIUS = 16
+LINE_HEIGHT = 1.45
+
+# 글자 크기 (px)
+LAYER_TITLE_SIZE = 18
+NAME_SIZE = 18
+DETAIL_SIZE = 14
+FEATURE_SIZE = 13
+LABEL_SIZE = 13
+
+EDGE_WIDTH = 2
+ARROW_SIZE = 10
+MIN_ROWS = 8  # 하위 열 하나에 쌓는 노드 수의 하한 (그보다 큰 레이어만 여러 하위 열로 나눔)
+TARGET_ASPECT = 16 / 9  # 노드가 많을 때 하위 열 행 수를 고르는 목표 가로세로비
+
+# 독립 SVG 파일의 글꼴 (HTML에 인라인할 때는 페이지 글꼴을 상속)
+SVG_FONT_FAMILY = "Pretendard, 'Noto Sans KR', 'Malgun Gothic', sans-serif"
+
+EMU_PER_PT = 12700
+# python-pptx 텍스트박스 기본 여백 (좌우 0.1in, 상하 0.05in)
+_TEXTBOX_INSET_X = 91440
+_TEXTBOX_INSET_Y = 45720
+
+
+# ==================== 장면 ====================
+class Rect:
+    """둥근 사각형 - stroke=None은 테두리 없음"""
+
+    __slots__ = ("x", "y", "w", "h", "fill", "stroke", "radius")
+
+    def __init__(self, x, y, w, h, fill, stroke=None, radius=0):
+        self.x, self.y, self.w, self.h = x, y, w, h
+        self.fill, self.stroke, self.radius = fill, stroke, radius
+
+
+class Text:
+    """한 줄 텍스트 - (x, y)는 anchor("middle"/"start") 기준점, y는 줄의 세로 중심"""
+
+    __slots__ = ("x", "y", "text", "size", "color", "bold", "anchor")
+
+    def __init__(self, x, y, text, size, color, bold=False, anchor="middle"):
+        self.x, self.y, self.text, self.size = x, y, text, size
+        self.color, self.bold, self.anchor = color, bold, anchor
+
+
+class Polyline:
+    """연결선 - arrow=True면 마지막 점에 화살촉"""
+
+    __slots__ = ("points", "color", "width", "arrow")
+
+    def __init__(self, points, color, width=EDGE_WIDTH, arrow=True):
+        self.points, self.color, self.width, self.arrow = points, color, width, arrow
+
+
+class Scene:
+    """배치가 끝난 그림 - items는 그리는 순서 (패널, 연결선, 노드, 라벨)"""
+
+    __slots__ = ("width", "height", "items")
+
+    def __init__(self, width, height, items):
+        self.width, self.height, self.items = width, height, items
+
+
+# ==================== 배치 ====================
+def _is_wide(ch):
+    code = ord(ch)
+    return (
+        0x1100 <= code <= 0x11FF or 0x2E80 <= code <= 0xA4CF or 0xAC00 <= code <= 0xD7A3
+        or 0xF900 <= code <= 0xFAFF or 0xFF00 <= code <= 0xFF60
+    )
+
+
+@lru_cache(maxsize=4096)
+def text_width(text, size, bold=False):
+    """글자 폭 추정치 (px) - 한글/한자는 전각, 대문자/숫자는 0.62, 그 외 0.52 em (같은 문자열은 캐시)"""
+    units = 0.0
+    for ch in text:
+        if ch == " ":
+            units += 0.3
+        elif _is_wide(ch):
+            units += 1.0
+        elif ch.isupper() or ch.isdigit():
+            units += 0.62
+        else:
+            units += 0.52
+    return units * size * (1.06 if bold else 1.0)
+
+
+class _Node:
+    """배치 중인 노드 - lines는 (텍스트, 크기, 색상, 굵게) 목록"""
+
+    __slots__ = ("name", "layer", "order", "lines", "color", "x", "y", "w", "h", "ports")
+
+    def __init__(self, name, layer, lines, color):
+        self.name, self.layer, self.lines, self.color = name, layer, lines, color
+        self.order = 0.0
+        self.x = self.y = 0
+        self.w = max(MIN_NODE_WIDTH, max(text_width(text, size, bold) for text, size, _, bold in lines) + 2 * NODE_PAD_X)
+        self.h = 2 * NODE_PAD_Y + sum(size * LINE_HEIGHT for _, size, _, _ in lines)
+        self.ports = {}  # (side, edge 번호) -> y
+
+    @property
+    def cy(self):
+        return self.y + self.h / 2
+
+
+def _node_lines(component, color):
+    lines = [(component.name, NAME_SIZE, color, True)]
+    detail = " / ".join(part for part in (component.tech, component.was) if part) or component.service
+    if detail:
+        lines.append((detail, DETAIL_SIZE, GRAY, False))
+    lines.extend((f"· {feature}", FEATURE_SIZE, LIGHT_GRAY, False) for feature in component.features)
+    return lines
+
+
+def _order_layers(columns, neighbors, sweeps=2):
+    """레이어 안 노드 순서를 barycenter로 좌우 왕복 정렬 (동률이면 기존 순서 유지)"""
+    def reorder(column, side):
+        for node in column:
+            adjacent = [other.order for other in neighbors[node.name] if side(other.layer, node.layer)]
+            node.order = sum(adjacent) / len(adjacent) if adjacent else node.order
+        column.sort(key=lambda node: node.order)
+        for i, node in enumerate(column):
+            node.order = (i + 0.5) / len(column)
+
+    for column in columns:
+        for i, node in enumerate(column):
+            node.order = (i + 0.5) / len(column)
+    for _ in range(sweeps):
+        for column in columns[1:]:
+            reorder(column, lambda other, own: other < own)
+        for column in reversed(columns[:-1]):
+            reorder(column, lambda other, own: other > own)
+
+
+def _rows_per_column(columns):
+    """하위 열 하나의 행 수 - 레이어가 MIN_ROWS 이하면 나누지 않고, 크면 예상 가로세로비가
+    TARGET_ASPECT에 가장 가까운 값"""
+    largest = max(len(column) for column in columns)
+    if largest <= MIN_ROWS:
+        return largest
+    node_width = max(node.w for column in columns for node in column) + SUBCOLUMN_GAP
+    node_height = max(node.h for column in columns for node in column) + NODE_GAP
+    fixed_width = len(columns) * (2 * PANEL_PAD + CHANNEL_WIDTH)
+
+    def aspect_error(rows):
+        subcolumns = sum(-(-len(column) // rows) for column in columns)
+        return abs(math.log((fixed_width + subcolumns * node_width) / (rows * node_height) / TARGET_ASPECT))
+
+    return min(range(MIN_ROWS, largest + 1), key=aspect_error)
+
+
+def layout(element, max_rows=None):
+    """ArchitectureDiagram(layers/connections) -> Scene
+
+    max_rows는 하위 열 하나에 쌓는 최대 노드 수 (None이면 _rows_per_column()이 고름).
+    같은 이름의 구성요소는 처음 것만 쓰고, 알 수 없는 이름을 잇는 연결은 건너뜁니다
+    (content_schema가 경고로 보고).
+    """
+    nodes = {}
+    columns = []
+    titles = []
+    for layer in element.layers:
+        color = LAYER_COLORS[len(columns) % len(LAYER_COLORS)]
+        column = []
+        for component in layer.components:
+            if component.name and component.name not in nodes:
+                node = _Node(component.name, len(columns), _node_lines(component, color), color)
+                nodes[node.name] = node
+                column.append(node)
+        if column:
+            columns.append(column)
+            titles.append(layer.name)
+
+    edges = []
+    neighbors = {name: [] for name in nodes}
+    for connection in element.connections:
+        source, target = nodes.get(connection.source), nodes.get(connection.target)
+        if source is None or target is None or source is target:
+            continue
+        edges.append((source, target, connection.protocol))
+        neighbors[source.name].append(target)
+        neighbors[target.name].append(source)
+
+    _order_layers(columns, neighbors)
+
+    # 레이어(패널)와 노드 위치 - 하위 열 단위로 쌓고 패널 높이는 가장 높은 하위 열에 맞춤
+    stacks = []
+    max_rows = max_rows or (_rows_per_column(columns) if columns else 1)
+    for column in columns:
+        rows = min(max_rows, len(column))
+        stacks.append([column[i:i + rows] for i in range(0, len(column), rows)])
+    stack_height = max(
+        sum(node.h for node in stack) + NODE_GAP * (len(stack) - 1)
+        for layer_stacks in stacks for stack in layer_stacks
+    ) if stacks else 0
+    panel_top = MARGIN
+    panel_height = PANEL_HEADER + stack_height + PANEL_PAD
+    body_top = panel_top + PANEL_HEADER
+
+    items = []
+    panels = []  # 레이어별 (left, right)
+    cursor = MARGIN
+    for title, column, layer_stacks in zip(titles, columns, stacks):
+        node_width = max(node.w for node in column)
+        panel_width = 2 * PANEL_PAD + len(layer_stacks) * node_width + (len(layer_stacks) - 1) * SUBCOLUMN_GAP
+        items.append(Rect(cursor, panel_top, panel_width, panel_height, PANEL_FILL, PANEL_LINE, PANEL_RADIUS))
+        items.append(Text(cursor + panel_width / 2, panel_top + PANEL_HEADER / 2, title, LAYER_TITLE_SIZE, NAVY, True))
+        for s, stack in enumerate(layer_stacks):
+            x = cursor + PANEL_PAD + s * (node_width + SUBCOLUMN_GAP)
+            y = body_top + (stack_height - sum(node.h for node in stack) - NODE_GAP * (len(stack) - 1)) / 2
+            for node in stack:
+                node.x, node.y, node.w = x, y, node_width
+                y += node.h + NODE_GAP
+        panels.append((cursor, cursor + panel_width))
+        cursor += panel_width + CHANNEL_WIDTH
+
+    # 연결선 - 포트(노드 변 위 출입점)와 통로 차선을 선마다 고르게 나눔
+    routes = []
+    ports = {}  # (노드 이름, 변) -> [(상대편 y, 선 번호)]
+    channels = {}  # 통로 왼쪽 x -> [(출발 y, 선 번호)]
+    for i, (source, target, _) in enumerate(edges):
+        if source.layer < target.layer:
+            exit_side, entry_side, channel = "right", "left", panels[source.layer][1]
+        elif source.layer > target.layer:
+            exit_side, entry_side, channel = "left", "right", panels[source.layer][0] - CHANNEL_WIDTH
+        else:
+            exit_side, entry_side, channel = "right", "right", panels[source.layer][1]
+        ports.setdefault((source.name, exit_side), []).append((target.cy, i))
+        ports.setdefault((target.name, entry_side), []).append((source.cy, i))
+        channels.setdefault(channel, []).append((source.cy, i))
+        routes.append((exit_side, entry_side, channel))
+
+    for (name, side), users in ports.items():
+        node = nodes[name]
+        users.sort()
+        for k, (_, i) in enumerate(users):
+            node.ports[side, i] = node.y + node.h * (k + 1) / (len(users) + 1)
+    lanes = {}
+    for channel, users in channels.items():
+        users.sort()
+        for k, (_, i) in enumerate(users):
+            lanes[i] = channel + CHANNEL_WIDTH * (k + 1) / (len(users) + 1)
+
+    labels = []
+    for i, ((source, target, protocol), (exit_side, entry_side, _)) in enumerate(zip(edges, routes)):
+        sx = source.x + source.w if exit_side == "right" else source.x
+        tx = target.x + target.w if entry_side == "right" else target.x
+        sy, ty, lane = source.ports[exit_side, i], target.ports[entry_side, i], lanes[i]
+        if sy == ty and exit_side != entry_side:
+            points = [(sx, sy), (tx, ty)]
+        else:
+            points = [(sx, sy), (lane, sy), (lane, ty), (tx, ty)]
+        items.append(Polyline(points, EDGE_COLOR))
+        if protocol:
+            # 가장 긴 가로 구간 위에 라벨
+            (x1, y1), (x2, _) = max(
+                ((points[j], points[j + 1]) for j in range(len(points) - 1) if points[j][1] == points[j + 1][1]),
+                key=lambda segment: abs(segment[1][0] - segment[0][0]),
+            )
+            labels.append(Text((x1 + x2) / 2, y1 - LABEL_SIZE * 0.9, protocol, LABEL_SIZE, GRAY))
+
+    for node in nodes.values():
+        items.append(Rect(node.x, node.y, node.w, node.h, WHITE, node.color, NODE_RADIUS))
+        y = node.y + NODE_PAD_Y
+        for text, size, color, bold in node.lines:
+            items.append(Text(node.x + node.w / 2, y + size * LINE_HEIGHT / 2, text, size, color, bold))
+            y += size * LINE_HEIGHT
+    items.extend(labels)
+
+    return _fit(items)
+
+
+def _bounds(item):
+    if isinstance(item, Rect):
+        return item.x, item.y, item.x + item.w, item.y + item.h
+    if isinstance(item, Text):
+        width = text_width(item.text, item.size, item.bold)
+        left = item.x - width / 2 if item.anchor == "middle" else item.x
+        return left, item.y - item.size, left + width, item.y + item.size
+    xs = [x for x, _ in item.points]
+    ys = [y for _, y in item.points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _fit(items):
+    """모든 항목이 MARGIN 안쪽에 오도록 평행 이동한 Scene (되돌아가는 연결선이 왼쪽으로 나갈 수 있음)"""
+    if not items:
+        return Scene(2 * MARGIN, 2 * MARGIN, [])
+    boxes = [_bounds(item) for item in items]
+    left = min(box[0] for box in boxes)
+    top = min(box[1] for box in boxes)
+    dx, dy = MARGIN - left, MARGIN - top
+    for item in items:
+        if isinstance(item, Polyline):
+            item.points = [(round(x + dx, 1), round(y + dy, 1)) for x, y in item.points]
+        else:
+            item.x = round(item.x + dx, 1)
+            item.y = round(item.y + dy, 1)
+    width = math.ceil(max(box[2] for box in boxes) + dx + MARGIN)
+    height = math.ceil(max(box[3] for box in boxes) + dy + MARGIN)
+    return Scene(width, height, items)
+
+
+def deck_scene(deck):
+    """덱에서 layers로 그리는 첫 architecture_diagram 요소의 Scene (없으면 None)"""
+    for slide in deck.slides:
+        for element in slide.elements:
+            if element.TYPE == "architecture_diagram" and element.declarative:
+                return layout(element)
+    return None
+
+
+# ==================== SVG ====================
+def _num(value):
+    return f"{value:g}"
+
+
+def to_svg(scene, font_family=SVG_FONT_FAMILY, css_class=None):
+    """Scene -> SVG 문자열
+
+    css_class를 주면 width/height 속성 없이 viewBox만 두어 CSS로 크기를 정합니다 (HTML 인라인용).
+    font_family=None이면 글꼴을 지정하지 않고 상속합니다.
+    """
+    attrs = f'viewBox="0 0 {scene.width} {scene.height}"'
+    if css_class:
+        attrs += f' class="{css_class}"'
+    else:
+        attrs += f' width="{scene.width}" height="{scene.height}"'
+    if font_family:
+        attrs += f' font-family="{escape(font_family)}"'
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" {attrs}>']
+
+    colors = sorted({item.color for item in scene.items if isinstance(item, Polyline) and item.arrow})
+    if colors:
+        parts.append("<defs>")
+        for color in colors:
+            parts.append(
+                f'<marker id="diagram-arrow-{color}" viewBox="0 0 10 10" refX="9" refY="5" '
+                f'markerWidth="{ARROW_SIZE / EDGE_WIDTH:g}" markerHeight="{ARROW_SIZE / EDGE_WIDTH:g}" '
+                f'orient="auto-start-reverse"><path d="M0,0 L10,5 L0,10 Z" fill="#{color}"/></marker>'
+            )
+        parts.append("</defs>")
+
+    for item in scene.items:
+        if isinstance(item, Rect):
+            stroke = f' stroke="#{item.stroke}" stroke-width="1.5"' if item.stroke else ""
+            parts.append(
+                f'<rect x="{_num(item.x)}" y="{_num(item.y)}" width="{_num(item.w)}" height="{_num(item.h)}" '
+                f'rx="{item.radius}" fill="#{item.fill}"{stroke}/>'
+            )
+        elif isinstance(item, Text):
+            weight = ' font-weight="700"' if item.bold else ""
+            parts.append(
+                f'<text x="{_num(item.x)}" y="{_num(item.y)}" font-size="{item.size}" fill="#{item.color}"{weight} '
+                f'text-anchor="{item.anchor}" dominant-baseline="central">{escape(item.text)}</text>'
+            )
+        else:
+            points = " ".join(f"{_num(x)},{_num(y)}" for x, y in item.points)
+            marker = f' marker-end="url(#diagram-arrow-{item.color})"' if item.arrow else ""
+            parts.append(
+                f'<polyline points="{points}" fill="none" stroke="#{item.color}" stroke-width="{item.width}" '
+                f'stroke-linejoin="round"{marker}/>'
+            )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+# ==================== PNG ====================
+def _arrow_head(points, size):
+    """마지막 구간 방향의 화살촉 삼각형 꼭짓점"""
+    (x1, y1), (x2, y2) = points[-2], points[-1]
+    length = math.hypot(x2 - x1, y2 - y1) or 1.0
+    ux, uy = (x2 - x1) / length, (y2 - y1) / length
+    bx, by = x2 - ux * size, y2 - uy * size
+    return [(x2, y2), (bx - uy * size / 2, by + ux * size / 2), (bx + uy * size / 2, by - ux * size / 2)]
+
+
+def to_png(scene, png_path, width=None):
+    """Scene -> PNG 파일 (width를 주면 그 폭에 맞게 확대/축소, 글자는 fonts의 한글 글꼴과 글리프 캐시)"""
+    from PIL import Image, ImageDraw
+
+    import fonts
+
+    scale = width / scene.width if width else 1.0
+    image = Image.new("RGB", (math.ceil(scene.width * scale), math.ceil(scene.height * scale)), "#" + WHITE)
+    draw = ImageDraw.Draw(image)
+
+    for item in scene.items:
+        if isinstance(item, Rect):
+            draw.rounded_rectangle(
+                [item.x * scale, item.y * scale, (item.x + item.w) * scale, (item.y + item.h) * scale],
+                radius=item.radius * scale, fill="#" + item.fill,
+                outline="#" + item.stroke if item.stroke else None, width=max(1, round(1.5 * scale)),
+            )
+        elif isinstance(item, Text):
+            fonts.draw_text(
+                image, (item.x * scale, item.y * scale), item.text, max(1, round(item.size * scale)),
+                "#" + item.color, bold=item.bold, anchor="mm" if item.anchor == "middle" else "lm",
+            )
+        else:
+            points = [(x * scale, y * scale) for x, y in item.points]
+            if item.arrow:
+                head = _arrow_head(points, ARROW_SIZE * scale)
+                # 선 끝이 화살촉 밖으로 삐져나오지 않도록 촉 밑변까지만 그림
+                points[-1] = ((head[1][0] + head[2][0]) / 2, (head[1][1] + head[2][1]) / 2)
+            draw.line(points, fill="#" + item.color, width=max(1, round(item.width * scale)), joint="curve")
+            if item.arrow:
+                draw.polygon(head, fill="#" + item.color)
+
+    os.makedirs(os.path.dirname(png_path) or ".", exist_ok=True)
+    image.save(png_path)
+
+
+# ==================== PPTX ====================
+def to_pptx(slide, scene, left, top, width, height):
+    """Scene -> 슬라이드 네이티브 도형 (left/top/width/height EMU 상자에 비율 유지로 맞추고 가로 가운데 정렬)
+
+    노드와 패널은 도형, 글자는 텍스트박스, 연결선은 화살표 끝이 있는 자유형 꺾은선이므로
+    PowerPoint에서 그대로 편집할 수 있습니다.
+    """
+    import drawingml
+
+    scale = min(int(width) / scene.width, int(height) / scene.height)
+    origin_x = int(left) + (int(width) - scene.width * scale) / 2
+    origin_y = int(top)
+
+    def emu_x(x):
+        return origin_x + x * scale
+
+    def emu_y(y):
+        return origin_y + y * scale
+
+    builder = drawingml.ShapeTreeBuilder(slide)
+    for item in scene.items:
+        if isinstance(item, Rect):
+            builder.add_shape(
+                "round_rect" if item.radius else "rect",
+                emu_x(item.x), emu_y(item.y), item.w * scale, item.h * scale,
+                fill=item.fill, line=item.stroke,
+            )
+        elif isinstance(item, Text):
+            size_pt = round(item.size * scale / EMU_PER_PT, 1)
+            box_width = text_width(item.text, item.size, item.bold) * scale + 2 * _TEXTBOX_INSET_X
+            box_height = size_pt * 1.2 * EMU_PER_PT + 2 * _TEXTBOX_INSET_Y
+            x = emu_x(item.x) - (box_width / 2 if item.anchor == "middle" else _TEXTBOX_INSET_X)
+            builder.add_textbox(
+                x, emu_y(item.y) - box_height / 2, box_width, box_height, item.text,
+                size=size_pt, color=item.color, bold=item.bold,
+                align="ctr" if item.anchor == "middle" else None,
+            )
+        else:
+            builder.add_polyline(
+                [(emu_x(x), emu_y(y)) for x, y in item.points], item.color,
+                width=max(EMU_PER_PT // 2, item.width * scale), arrow=item.arrow,
+            )
+    builder.flush()
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+DrawingML 직접 생성 백엔드 - 커스텀 요소용
+
+python-pptx 객체 API는 도형마다 프록시 객체를 만들고 글꼴/색상 속성 하나하나를 별도의 XML 조작으로
+반영하기 때문에, 도형이 수십 개인 커스텀 요소에서는 이 오버헤드가 렌더링 시간의 대부분을 차지합니다.
+이 모듈은 python-pptx가 만드는 것과 같은 XML을 미리 만들어 둔 문자열 프로토타입에 값과 shape ID만
+채워 조각 하나로 만든 뒤, 슬라이드 spTree에 한 번에 삽입합니다.
+
+요소별 렌더러(icon_box_grid, pain_point_cards, process_flow, timeline)는 generate_pptx의
+add_* 함수와 같은 배치 계산을 따르며, 결과 슬라이드 XML이 바이트 단위로 같아야 합니다.
+"""
+
+import re
+from xml.sax.saxutils import escape
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+# ==================== XML 프로토타입 ====================
+# python-pptx의 add_shape()/add_textbox() 결과와 같은 요소/속성 순서
+
+_AUTOSHAPE = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name} {name_no}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="{prst}"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>{line}</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>'
+    '<a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+
+_LINE_SOLID = '<a:ln><a:solidFill><a:srgbClr val="{}"/></a:solidFill></a:ln>'
+_LINE_NONE = '<a:ln><a:noFill/></a:ln>'
+
+# 자유형 꺾은선 (선만 있고 채우기 없음, tailEnd는 화살표 끝)
+_POLYLINE = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Freeform {name_no}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:custGeom><a:avLst/><a:gdLst/><a:ahLst/><a:cxnLst/><a:rect l="0" t="0" r="r" b="b"/>'
+    '<a:pathLst><a:path w="{cx}" h="{cy}" fill="none">{path}</a:path></a:pathLst></a:custGeom>'
+    '<a:noFill/><a:ln w="{width}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>{tail}</a:ln>'
+    '</p:spPr></p:sp>'
+)
+
+_TEXTBOX = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {name_no}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="{wrap}"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p>{ppr}{runs}</a:p></p:txBody></p:sp>'
+)
+
+# paragraph.font.size/bold/color.rgb + alignment 설정 결과
+_PARAGRAPH_PROPS = (
+    '<a:pPr{algn}><a:defRPr sz="{sz}"{bold}><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '</a:defRPr></a:pPr>'
+)
+
+# shapes.add_table() 결과 (표 스타일 GUID는 python-pptx 기본값)
+_TABLE = (
+    '<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{id}" name="Table {name_no}"/>'
+    '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/>'
+    '</p:nvGraphicFramePr>'
+    '<p:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></p:xfrm>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table"><a:tbl>'
+    '<a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}}'
+    '</a:tableStyleId></a:tblPr><a:tblGrid>{grid}</a:tblGrid>{rows}</a:tbl></a:graphicData></a:graphic>'
+    '</p:graphicFrame>'
+)
+
+_TABLE_CELL = '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</a:txBody>{tc_pr}</a:tc>'
+_EMPTY_TABLE_CELL = _TABLE_CELL.format(paragraphs="<a:p/>", tc_pr="<a:tcPr/>")
+
+_FRAGMENT = '<p:spTree %s>{}</p:spTree>' % nsdecls("p", "a", "r")
+
+# MSO_SHAPE 대신 쓰는 도형 종류 -> (prstGeom, python-pptx 기본 이름)
+SHAPES = {
+    "rect": ("rect", "Rectangle"),
+    "round_rect": ("roundRect", "Rounded Rectangle"),
+    "oval": ("ellipse", "Oval"),
+    "right_arrow": ("rightArrow", "Right Arrow"),
+}
+
+# python-pptx와 같이 XML에 쓸 수 없는 제어 문자는 _xHHHH_ 형식으로 이스케이프
+_CTRL_CHARS = re.compile("[\x00-\x08\x0b-\x1f]")
+_LINE_BREAKS = re.compile("[\n\v]")
+
+
+def _runs_xml(text):
+    """문단 텍스트 -> <a:r>/<a:br/> 목록 (python-pptx의 paragraph.text 설정과 동일)"""
+    parts = []
+    for i, line in enumerate(_LINE_BREAKS.split(text)):
+        if i:
+            parts.append("<a:br/>")
+        if line:
+            line = _CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group()), line)
+            parts.append("<a:r><a:t>%s</a:t></a:r>" % escape(line))
+    return "".join(parts)
+
+
+def _paragraph_props(size, color, bold=False, align=None):
+    """문단 기본 글꼴 속성 <a:pPr> - size는 pt, align은 None/"l"/"ctr"/"r" """
+    return _PARAGRAPH_PROPS.format(
+        algn=' algn="%s"' % align if align else "",
+        sz=int(size * 100),
+        bold=' b="1"' if bold else "",
+        color=color,
+    )
+
+
+def _cell_xml(text, ppr, tc_pr="<a:tcPr/>"):
+    """표 셀 - cell.text 설정처럼 줄바꿈마다 문단을 나누고 첫 문단에만 글꼴 속성 적용"""
+    paragraphs = []
+    for i, line in enumerate(text.split("\n")):
+        paragraphs.append("<a:p>%s%s</a:p>" % (ppr if i == 0 else "", _runs_xml(line)))
+    return _TABLE_CELL.format(paragraphs="".join(paragraphs), tc_pr=tc_pr)
+
+
+class ShapeTreeBuilder:
+    """슬라이드에 추가할 도형 XML을 모아 spTree에 한 번에 삽입
+
+        builder = ShapeTreeBuilder(slide)
+        builder.add_shape("rect", x, y, cx, cy, fill="FFFFFF", line="E0E0E0")
+        builder.add_textbox(x, y, cx, cy, "제목", size=14, bold=True, color="002452")
+        builder.flush()
+
+    색상은 RGBColor 또는 "RRGGBB" 문자열, line=None은 테두리 없음입니다.
+    """
+
+    def __init__(self, slide):
+        self._spTree = slide.shapes._spTree
+        self._next_id = self._spTree.max_shape_id + 1
+        self._parts = []
+
+    def _take_id(self):
+        shape_id = self._next_id
+        self._next_id += 1
+        return shape_id
+
+    def add_shape(self, kind, x, y, cx, cy, fill, line=None):
+        """단색 채우기 도형 추가"""
+        prst, name = SHAPES[kind]
+        shape_id = self._take_id()
+        self._parts.append(_AUTOSHAPE.format(
+            id=shape_id, name=name, name_no=shape_id - 1,
+            x=int(x), y=int(y), cx=int(cx), cy=int(cy),
+            prst=prst, fill=fill,
+            line=_LINE_NONE if line is None else _LINE_SOLID.format(line),
+        ))
+
+    def add_textbox(self, x, y, cx, cy, text, size, color, bold=False, align=None, word_wrap=False):
+        """단일 문단 텍스트박스 추가 - size는 pt, align은 None/"ctr"/"r" """
+        shape_id = self._take_id()
+        self._parts.append(_TEXTBOX.format(
+            id=shape_id, name_no=shape_id - 1,
+            x=int(x), y=int(y), cx=int(cx), cy=int(cy),
+            wrap="square" if word_wrap else "none",
+            ppr=_paragraph_props(size, color, bold, align),
+            runs=_runs_xml(text),
+        ))
+
+    def add_polyline(self, points, color, width, arrow=False):
+        """(x, y) EMU 점을 잇는 꺾은선 추가 - width는 선 굵기 EMU, arrow=True면 끝점에 화살촉"""
+        points = [(int(x), int(y)) for x, y in points]
+        left = min(x for x, _ in points)
+        top = min(y for _, y in points)
+        cx = max(1, max(x for x, _ in points) - left)
+        cy = max(1, max(y for _, y in points) - top)
+        path = "".join(
+            '<a:%s><a:pt x="%d" y="%d"/></a:%s>' % (tag, x - left, y - top, tag)
+            for tag, (x, y) in zip(["moveTo"] + ["lnTo"] * (len(points) - 1), points)
+        )
+        shape_id = self._take_id()
+        self._parts.append(_POLYLINE.format(
+            id=shape_id, name_no=shape_id - 1,
+            x=left, y=top, cx=cx, cy=cy, path=path,
+            width=int(width), color=color,
+            tail='<a:tailEnd type="triangle"/>' if arrow else "",
+        ))
+
+    def add_table(self, x, y, cx, row_height, header_cells, body_rows):
+        """표 추가 - header_cells/body_rows는 _cell_xml() 조각 목록 (열 수는 header_cells 기준)
+
+        열 너비는 python-pptx와 같이 균등 분할하고 나머지는 마지막 열에 더합니다.
+        """
+        cols = len(header_cells)
+        col_width = int(cx) // cols
+        last_width = int(cx) - (cols - 1) * col_width
+        grid = '<a:gridCol w="%d"/>' % col_width * (cols - 1) + '<a:gridCol w="%d"/>' % last_width
+
+        tr_open = '<a:tr h="%d">' % int(row_height)
+        rows = [tr_open + "".join(header_cells) + "</a:tr>"]
+        for cells in body_rows:
+            cells = cells[:cols] + [_EMPTY_TABLE_CELL] * (cols - len(cells))
+            rows.append(tr_open + "".join(cells) + "</a:tr>")
+
+        shape_id = self._take_id()
+        self._parts.append(_TABLE.format(
+            id=shape_id, name_no=shape_id - 1,
+            x=int(x), y=int(y), cx=int(cx), cy=int(row_height) * len(rows),
+            grid=grid, rows="".join(rows),
+        ))
+
+    def flush(self):
+        """모은 도형을 spTree 끝(extLst 앞)에 삽입"""
+        if not self._parts:
+            return
+        fragment = parse_xml(_FRAGMENT.format("".join(self._parts)))
+        self._parts = []
+
+        ext_lst = self._spTree.find("{%s}extLst" % self._spTree.nsmap["p"])
+        for sp in list(fragment):
+            if ext_lst is None:
+                self._spTree.append(sp)
+            else:
+                ext_lst.addprevious(sp)
+
+
+# ==================== 요소별 렌더러 ====================
+# generate_pptx.add_* 함수와 같은 배치/색상 (색상은 hex 문자열)
+
+NAVY = "002452"
+RED = "C51F2A"
+GRAY = "666666"
+LIGHT_GRAY = "999999"
+WHITE = "FFFFFF"
+GREEN = "2E7D32"
+ORANGE = "F57C00"
+BLUE = "1976D2"
+BORDER = "E0E0E0"
+
+
+def icon_box_grid(slide, element, left, top, width):
+    """아이콘 박스 그리드"""
+    items = element.items
+    columns = element.columns
+
+    if not items:
+        return
+
+    box_width = 2000000
+    box_height = 1800000
+    gap = 200000
+
+    accent_colors = [NAVY, RED, GRAY, ORANGE]
+
+    builder = ShapeTreeBuilder(slide)
+    for i, item in enumerate(items):
+        col = i % columns
+        row = i // columns
+
+        x = left + (box_width + gap) * col
+        y = top + (box_height + gap) * row
+
+        builder.add_shape("rect", x, y, box_width, box_height, fill=WHITE, line=BORDER)
+        builder.add_shape("rect", x, y, 50000, box_height,
+                          fill=accent_colors[i % len(accent_colors)])
+        builder.add_textbox(x + 150000, y + 800000, box_width - 200000, 300000,
+                            item.title, size=14, bold=True, color=NAVY,
+                            word_wrap=True)
+        builder.add_textbox(x + 150000, y + 1100000, box_width - 200000, 600000,
+                            item.desc, size=11, color=GRAY,
+                            word_wrap=True)
+    builder.flush()
+
+
+def pain_point_cards(slide, element, left, top, width):
+    """Pain Point 카드"""
+    items = element.items
+    columns = element.columns
+
+    if not items:
+        return
+
+    box_width = 2000000
+    box_height = 2200000
+    gap = 150000
+
+    role_colors = [BLUE, GREEN, ORANGE, "7B1FA2"]
+
+    builder = ShapeTreeBuilder(slide)
+    for i, item in enumerate(items):
+        col = i % columns
+        x = left + (box_width + gap) * col
+        y = top
+
+        builder.add_shape("round_rect", x, y, box_width, box_height, fill="F8F9FA", line=BORDER)
+        builder.add_textbox(x + 100000, y + 700000, box_width - 200000, 300000,
+                            item.role, size=14, bold=True,
+                            color=role_colors[i % len(role_colors)], align="ctr")
+        builder.add_shape("rect", x + 100000, y + 1100000, box_width - 200000, 900000,
+                          fill="FFF5F5")
+        builder.add_textbox(x + 200000, y + 1200000, box_width - 400000, 700000,
+                            item.pain, size=11, color=RED,
+                            word_wrap=True)
+    builder.flush()
+
+
+def process_flow(slide, element, left, top, width):
+    """프로세스 플로우"""
+    steps = element.steps
+
+    if not steps:
+        return
+
+    circle_size = 900000
+    gap = 300000
+    arrow_width = 400000
+
+    total_width = len(steps) * circle_size + (len(steps) - 1) * (gap + arrow_width)
+    start_x = left + (width - total_width) // 2
+
+    builder = ShapeTreeBuilder(slide)
+    for i, step in enumerate(steps):
+        x = start_x + i * (circle_size + gap + arrow_width)
+        y = top + 300000
+
+        if "내부" in step.actor:
+            color = NAVY
+        elif "승인" in step.name:
+            color = GREEN
+        else:
+            color = ORANGE
+
+        builder.add_shape("oval", x, y, circle_size, circle_size, fill=color)
+        builder.add_textbox(x, y + 300000, circle_size, 400000,
+                            step.code, size=18, bold=True, color=WHITE, align="ctr")
+        builder.add_textbox(x - 200000, y + circle_size + 100000, circle_size + 400000, 300000,
+                            step.name, size=12, bold=True, color=color, align="ctr")
+        builder.add_textbox(x - 200000, y + circle_size + 350000, circle_size + 400000, 250000,
+                            step.actor, size=10, color=LIGHT_GRAY, align="ctr")
+
+        if i < len(steps) - 1:
+            builder.add_shape("right_arrow", x + circle_size + 50000,
+                              y + circle_size // 2 - 100000, arrow_width, 200000, fill=BORDER)
+    builder.flush()
+
+
+def timeline(slide, element, left, top, width):
+    """타임라인"""
+    phases = element.phases
+
+    if not phases:
+        return
+
+    timeline_width = 7000000
+    timeline_left = left + (width - timeline_width) // 2
+
+    week_width = timeline_width // 12
+    header_height = 300000
+
+    builder = ShapeTreeBuilder(slide)
+    for week in range(12):
+        x = timeline_left + week_width * week
+        builder.add_textbox(x, top, week_width, header_height,
+                            f"{week + 1}주", size=9, color=LIGHT_GRAY, align="ctr")
+
+    bar_height = 350000
+    label_width = 900000
+    phase_colors = [NAVY, RED]
+
+    for i, phase in enumerate(phases):
+        y = top + header_height + 150000 + (bar_height + 250000) * i
+
+        builder.add_shape("round_rect", timeline_left - label_width - 100000, y,
+                          label_width, bar_height, fill=phase_colors[i])
+        builder.add_textbox(timeline_left - label_width - 80000, y + 80000,
+                            label_width - 40000, 200000,
+                            phase.name.split(" - ")[0],
+                            size=10, bold=True, color=WHITE, align="ctr")
+
+        if i == 0:
+            bar_start = timeline_left
+            bar_width = week_width * 8
+        else:
+            bar_start = timeline_left + week_width * 8
+            bar_width = week_width * 4
+
+        builder.add_shape("round_rect", bar_start, y, bar_width, bar_height, fill=phase_colors[i])
+    builder.flush()
+
+
+# 심각도 열 강조 (마지막 열 값 -> 글자색)
+SEVERITY_COLORS = {
+    "높음": RED,
+    "중간": ORANGE,
+}
+
+
+def table(slide, headers, rows, left, top, width, row_height):
+    """표 - 셀 XML을 한 번에 만들어 graphicFrame 하나로 삽입 (헤더 강조, 심각도 색상 유지)"""
+    header_ppr = _paragraph_props(14, WHITE, bold=True, align="l")
+    header_tc_pr = '<a:tcPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr>' % NAVY
+    body_ppr = _paragraph_props(13, "333333")
+    severity_pprs = {
+        value: _paragraph_props(13, color, bold=True) for value, color in SEVERITY_COLORS.items()
+    }
+
+    header_cells = [_cell_xml(str(header), header_ppr, header_tc_pr) for header in headers]
+    body_rows = []
+    for row_data in rows:
+        last = len(row_data) - 1
+        body_rows.append([
+            _cell_xml(
+                str(cell_text),
+                severity_pprs.get(cell_text, body_ppr)
+                if col_idx == last and isinstance(cell_text, str) else body_ppr,
+            )
+            for col_idx, cell_text in enumerate(row_data)
+        ])
+
+    builder = ShapeTreeBuilder(slide)
+    builder.add_table(left, top, width, row_height, header_cells, body_rows)
+    builder.flush()
+
+
+# 요소 타입 -> DrawingML 렌더러
+RENDERERS = {
+    "icon_box_grid": icon_box_grid,
+    "pain_point_cards": pain_point_cards,
+    "process_flow": process_flow,
+    "timeline": timeline,
+}
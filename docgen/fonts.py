@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+래스터 글꼴 서비스 (Pillow)
+
+PNG를 그리는 docgen 코드(diagram.to_png, svg_raster)가 함께 쓰는 한글 글꼴과 글리프 캐시입니다.
+- 글꼴 찾기: DOCGEN_FONT 환경 변수, html_bundle.find_font()(--font/DOCGEN_HTML_FONT/assets/fonts)의 TTF/OTF,
+  시스템 한글 글꼴(Pretendard, 본고딕(Noto Sans CJK/Source Han Sans), 맑은 고딕, 나눔고딕, Apple SD 산돌고딕)
+  순으로 찾고 없으면 Pillow 기본 글꼴 (한글은 빈 상자로 나올 수 있음)
+- 굵게: 같은 이름의 Bold 파일(NotoSansCJK-Bold, malgunbd 등)이 있으면 그것, 없으면 외곽선으로 흉내
+- 캐시: 글꼴 파일/크기별 FreeTypeFont는 프로세스당 한 번만 열고, 글자별 글리프 마스크(1/4 px 위치별)와
+  글자 쌍별 advance 폭은 LRU에 둡니다. 라벨 수백 개를 그려도 FreeType 래스터화는 서로 다른 글자 수만큼만
+  일어나고, measure()/wrap()은 캐시된 advance의 합이라 글자를 그리지 않습니다.
+
+글자 배치는 Pillow 기본 레이아웃과 같은 advance(쌍별 커닝 포함)를 쓰므로 draw.text()와 거의 같게 그려집니다.
+"""
+
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+
+FONT_ENV = "DOCGEN_FONT"
+
+# 시스템 한글 글꼴 후보 (일반 굵기 파일, TTC 안의 글꼴 번호) - 굵게는 _bold_sibling()으로 찾음
+SYSTEM_FONTS = (
+    ("/usr/share/fonts/opentype/pretendard/Pretendard-Regular.otf", 0),
+    ("/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc", 1),  # 1: KR
+    ("/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc", 1),
+    ("/usr/share/fonts/adobe-source-han-sans/SourceHanSans-Regular.ttc", 1),
+    ("C:/Windows/Fonts/malgun.ttf", 0),
+    ("/usr/share/fonts/truetype/nanum/NanumGothic.ttf", 0),
+    ("/System/Library/Fonts/AppleSDGothicNeo.ttc", 0),
+    ("~/Library/Fonts/Pretendard-Regular.otf", 0),
+)
+
+# Pillow(FreeType)로 열 수 있는 형식 (woff2는 HTML 서브셋 전용)
+RASTER_SUFFIXES = (".ttf", ".otf", ".ttc")
+
+# 글리프 가로 위치 단계 (1/SUBPIXEL px) - 작은 글자의 자간이 반올림으로 들쭉날쭉해지지 않게 함
+SUBPIXEL = 4
+GLYPH_CACHE_SIZE = 8192
+ADVANCE_CACHE_SIZE = 16384
+
+
+def _bold_sibling(path):
+    """path와 같은 계열의 Bold 파일 (없으면 None)"""
+    path = Path(path)
+    stem = path.stem
+    for name in (stem.replace("Regular", "Bold"), f"{stem}-Bold", f"{stem}Bold", f"{stem}bd"):
+        if name == stem:
+            continue
+        for suffix in dict.fromkeys((path.suffix, *RASTER_SUFFIXES)):
+            candidate = path.with_name(name + suffix)
+            if candidate.exists():
+                return candidate
+    return None
+
+
+@lru_cache(maxsize=None)
+def find_faces():
+    """(일반 (경로, 번호), 굵게 (경로, 번호) 또는 None) - 한글 글꼴이 없으면 (None, None)"""
+    import html_bundle
+
+    candidates = []
+    if os.environ.get(FONT_ENV):
+        candidates.append((os.environ[FONT_ENV], 0))
+    found = html_bundle.find_font()
+    if found and found.suffix.lower() in RASTER_SUFFIXES:
+        candidates.append((str(found), 0))
+    candidates.extend((os.path.expanduser(path), index) for path, index in SYSTEM_FONTS)
+
+    for path, index in candidates:
+        if os.path.exists(path):
+            bold = _bold_sibling(path)
+            return (path, index), ((str(bold), index) if bold else None)
+    return None, None
+
+
+class Face:
+    """글꼴 하나의 크기 하나 - stroke는 굵은 글꼴 파일이 없을 때 굵게 흉내 낼 외곽선 두께"""
+
+    __slots__ = ("font", "size", "stroke", "ascent", "descent")
+
+    def __init__(self, font, size, stroke=0):
+        self.font, self.size, self.stroke = font, size, stroke
+        self.ascent, self.descent = font.getmetrics()
+
+
+@lru_cache(maxsize=None)
+def face(size, bold=False):
+    """size px 글꼴의 Face (글꼴 파일은 크기마다 한 번만 열림)"""
+    from PIL import ImageFont
+
+    regular, bold_face = find_faces()
+    for spec, stroke in ((bold_face, 0), (regular, max(1, size // 24))) if bold else ((regular, 0),):
+        if spec is None:
+            continue
+        try:
+            return Face(ImageFont.truetype(spec[0], size, index=spec[1]), size, stroke)
+        except OSError:
+            continue
+    return Face(ImageFont.load_default(size), size, max(1, size // 24) if bold else 0)
+
+
+@lru_cache(maxsize=GLYPH_CACHE_SIZE)
+def _glyph(face, ch, phase):
+    """글자 하나의 마스크와 기준선 왼쪽 끝 기준 (left, top) - 빈 글자(공백)는 마스크 None"""
+    from PIL import Image, ImageDraw
+
+    offset = phase / SUBPIXEL
+    left, top, right, bottom = face.font.getbbox(ch, anchor="ls", stroke_width=face.stroke)
+    width, height = math.ceil(right + offset) - left, bottom - top
+    if width <= 0 or height <= 0:
+        return None, 0, 0
+    mask = Image.new("L", (width, height), 0)
+    ImageDraw.Draw(mask).text(
+        (offset - left, -top), ch, fill=255, font=face.font, anchor="ls",
+        stroke_width=face.stroke, stroke_fill=255,
+    )
+    return mask, left, top
+
+
+@lru_cache(maxsize=ADVANCE_CACHE_SIZE)
+def _advance(face, ch, following):
+    """ch 다음 글자까지의 펜 이동 거리 (following과의 커닝 포함, 마지막 글자면 following=None)"""
+    if following is None:
+        return face.font.getlength(ch)
+    return face.font.getlength(ch + following) - face.font.getlength(following)
+
+
+def _advances(face, text):
+    return [_advance(face, ch, text[i + 1] if i + 1 < len(text) else None) for i, ch in enumerate(text)]
+
+
+def measure(text, size, bold=False):
+    """text의 폭 (px) - 가운데 정렬/줄바꿈용, 글자를 그리지 않음"""
+    return sum(_advances(face(size, bold), text))
+
+
+def wrap(text, size, max_width, bold=False):
+    """max_width 안에 들어가게 나눈 줄 리스트 - 공백에서 나누고, 한 단어가 넘치면 글자 단위로 나눔"""
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if measure(candidate, size, bold) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            line = ""
+            for ch in word:
+                if line and measure(line + ch, size, bold) > max_width:
+                    lines.append(line)
+                    line = ""
+                line += ch
+        lines.append(line)
+    return lines
+
+
+def _baseline_offset(face, vertical):
+    """세로 기준 문자(Pillow anchor 두 번째 글자)에서 기준선까지 거리"""
+    if vertical in ("a", "t"):
+        return face.ascent
+    if vertical == "m":
+        return (face.ascent - face.descent) / 2
+    if vertical in ("d", "b"):
+        return -face.descent
+    return 0
+
+
+def text_mask(text, size, bold=False, anchor="ls", x=0.0, y=0.0):
+    """(x, y)에 anchor로 놓은 text의 커버리지 마스크("L")와 그 왼쪽 위 픽셀 좌표 (left, top)
+
+    anchor는 Pillow와 같은 두 글자 (가로 l/m/r, 세로 a/t/m/s/d/b)이고, 그릴 글자가 없으면 (None, x, y)입니다.
+    """
+    from PIL import Image
+
+    font_face = face(size, bold)
+    advances = _advances(font_face, text)
+    pen = x - {"m": sum(advances) / 2, "r": sum(advances)}.get(anchor[0], 0)
+    baseline = round(y + _baseline_offset(font_face, anchor[1]))
+
+    placed = []
+    for ch, advance in zip(text, advances):
+        column = math.floor(pen)
+        phase = round((pen - column) * SUBPIXEL)
+        if phase == SUBPIXEL:
+            column, phase = column + 1, 0
+        mask, left, top = _glyph(font_face, ch, phase)
+        if mask is not None:
+            placed.append((mask, column + left, baseline + top))
+        pen += advance
+    if not placed:
+        return None, math.floor(x), math.floor(y)
+
+    left = min(px for _, px, _ in placed)
+    top = min(py for _, _, py in placed)
+    right = max(px + mask.width for mask, px, _ in placed)
+    bottom = max(py + mask.height for mask, _, py in placed)
+    out = Image.new("L", (right - left, bottom - top), 0)
+    for mask, px, py in placed:
+        # 255를 마스크로 붙이면 겹친 가장자리의 커버리지가 합집합(screen)이 됨
+        out.paste(255, (px - left, py - top, px - left + mask.width, py - top + mask.height), mask)
+    return out, left, top
+
+
+def draw_text(image, xy, text, size, fill, bold=False, anchor="ls"):
+    """image에 text를 fill 색으로 그림 (ImageDraw.text 대신 - 글리프 캐시 사용)"""
+    from PIL import ImageColor
+
+    mask, left, top = text_mask(text, size, bold, anchor, *xy)
+    if mask is None:
+        return
+    color = ImageColor.getcolor(fill, image.mode) if isinstance(fill, str) else fill
+    image.paste(color, (left, top, left + mask.width, top + mask.height), mask)
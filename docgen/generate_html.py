@@ -1,8 +1,18 @@
-import json
 import os
+import sys
+
+import content_model
+import diagram
+from content_model import DEFAULT_ARCHITECTURE_IMAGE
 
 JSON_PATH = 'docgen/presentation_content2.json'
 OUTPUT_HTML = 'docgen/professional_presentation.html'
+WRITE_BUFFER_SIZE = 1 << 16
+# image variants directory next to the HTML file
+IMAGES_DIR = 'img'
+# .slide is 1600px wide with 5rem padding on each side; gallery columns are gap-8 apart
+SLIDE_CONTENT_WIDTH = 1440
+GALLERY_GAP = 32
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -160,37 +170,47 @@ HTML_TEMPLATE = """
     </style>
 </head>
 <body>
-    <div class="slide-container">
-        <div id="presentation">
-            {{slides_html}}
-        </div>
-    </div>
-
-    <div class="nav-controls">
-        <button class="nav-btn" onclick="prevSlide()"><i class="fas fa-chevron-left"></i></button>
-        <button class="nav-btn" onclick="nextSlide()"><i class="fas fa-chevron-right"></i></button>
-    </div>
-
     <script>
+        // Slides arrive as inert <script type="text/html" class="slide-src"> payloads; only the current
+        // slide and WINDOW neighbours on each side are turned into DOM (which also starts loading the
+        // next slide's images), and slides further away are removed again.
+        const WINDOW = 1;
+        const sources = document.getElementsByClassName('slide-src');
+        const live = new Map();
         let currentSlide = 0;
-        const slides = document.querySelectorAll('.slide');
+
+        function materialize(index) {
+            if (index < 0 || index >= sources.length) return;
+            if (live.has(index)) return;
+            const holder = document.createElement('div');
+            holder.innerHTML = sources[index].textContent.split('<\\\\/script').join('<' + '/script');
+            const slide = holder.firstElementChild;
+            document.getElementById('presentation').appendChild(slide);
+            live.set(index, slide);
+        }
 
         function showSlide(index) {
-            slides.forEach(s => s.classList.remove('active'));
-            slides[index].classList.add('active');
+            currentSlide = index;
+            for (let i = index - WINDOW; i <= index + WINDOW; i++) materialize(i);
+            for (const [i, slide] of live) {
+                if (Math.abs(i - index) > WINDOW) {
+                    slide.remove();
+                    live.delete(i);
+                } else {
+                    slide.classList.toggle('active', i === index);
+                }
+            }
         }
 
         function nextSlide() {
-            if (currentSlide < slides.length - 1) {
-                currentSlide++;
-                showSlide(currentSlide);
+            if (currentSlide < sources.length - 1) {
+                showSlide(currentSlide + 1);
             }
         }
 
         function prevSlide() {
             if (currentSlide > 0) {
-                currentSlide--;
-                showSlide(currentSlide);
+                showSlide(currentSlide - 1);
             }
         }
 
@@ -199,100 +219,274 @@ HTML_TEMPLATE = """
             if (e.key === 'ArrowLeft') prevSlide();
         });
 
-        showSlide(currentSlide);
+        // neighbours of the first slide once every payload has been parsed
+        document.addEventListener('DOMContentLoaded', () => showSlide(currentSlide));
     </script>
+
+    <div class="slide-container">
+        <div id="presentation">
+            {{slides_html}}
+        </div>
+    </div>
+
+    <div class="nav-controls">
+        <button class="nav-btn" onclick="prevSlide()"><i class="fas fa-chevron-left"></i></button>
+        <button class="nav-btn" onclick="nextSlide()"><i class="fas fa-chevron-right"></i></button>
+    </div>
 </body>
 </html>
 """
 
-def generate_slides_html(data):
-    html = ""
-    for i, slide in enumerate(data['presentation']['slides']):
-        layout_id = slide['layout_id']
-        ph = slide['placeholders']
-        custom = slide.get('custom_elements', [])
+def _asset_src(path, base_dir):
+    """image path as referenced from the HTML file (relative paths are rebased onto base_dir when given)"""
+    if base_dir is None or os.path.isabs(path):
+        return path
+    return os.path.relpath(os.path.abspath(path), os.path.abspath(base_dir or '.'))
+
+class ResponsiveImages:
+    """image stage for the HTML deck: <picture> markup with 1x/2x WebP and PNG/JPEG variants
+
+    Variants are written to <output_dir>/<subdir>/ under content-hash names (cacheable forever) and
+    reused from the image_pipeline cache when they already exist. files lists the paths written so far.
+    """
+
+    def __init__(self, output_dir, subdir=IMAGES_DIR):
+        self.output_dir = output_dir
+        self.subdir = subdir
+        self.files = []
+        self._pictures = {}
+
+    def picture(self, path, box_width, box_height, css_class):
+        """markup for path fitted into box_width x box_height CSS px, or None to keep the original <img>"""
+        key = (os.path.abspath(path), box_width, box_height, css_class)
+        if key not in self._pictures:
+            self._pictures[key] = self._render(path, box_width, box_height, css_class)
+        return self._pictures[key]
+
+    def _render(self, path, box_width, box_height, css_class):
+        import image_pipeline
+
+        try:
+            width, height = image_pipeline.probe_size(path)
+        except OSError:
+            return None
+        display_width = max(1, min(box_width, round(box_height * width / height)))
+        variants = image_pipeline.html_image_variants(path, display_width, os.path.join(self.output_dir, self.subdir))
+        if variants is None:
+            return None
+        for name, _ in variants['webp'] + variants['fallback']:
+            path = os.path.join(self.output_dir, self.subdir, name)
+            if path not in self.files:
+                self.files.append(path)
+
+        def srcset(items):
+            return ", ".join(f"{self.subdir}/{name} {w}w" for name, w in items)
+
+        sizes = f"{variants['width']}px"
+        return (
+            f"<picture><source type='image/webp' srcset='{srcset(variants['webp'])}' sizes='{sizes}'>"
+            f"<img src='{self.subdir}/{variants['fallback'][0][0]}' srcset='{srcset(variants['fallback'])}' sizes='{sizes}' "
+            f"width='{variants['width']}' height='{variants['height']}' decoding='async' class='{css_class}'></picture>"
+        )
+
+def _bar_percent(value, item, max_value):
+    # same scaling as the PPTX comparison chart: % values are absolute, others relative to the larger one
+    if item.unit == '%':
+        return max(0, min(100, value))
+    return value / max_value * 100
+
+def iter_slide_html(i, slide, base_dir=None, images=None):
+    """markup fragments of one slide, in document order"""
+    if slide.layout_id == 1:
+        yield f"<div class='slide slide-title bg-slate-50' id='slide-{i+1}'>"
+        yield f"<div class='animate__animated animate__zoomIn'><h1 class='mb-6'>{slide.title}</h1><p class='text-3xl text-slate-400 font-medium'>{slide.subtitle}</p></div>"
+    else:
+        yield f"<div class='slide' id='slide-{i+1}'>"
+        yield f"<div class='slide-header animate__animated animate__fadeInDown'><h2>{slide.main_title}</h2>"
+        if slide.action_title:
+            yield f"<div class='action-title'>{slide.action_title}</div></div>"
+        else:
+            yield "</div>"
         
-        slide_class = "slide"
-        content = ""
+        yield "<div class='flex-grow overflow-hidden pt-4 animate__animated animate__fadeInUp' style='animation-delay: 0.3s;'>"
         
-        if layout_id == 1:
-            slide_class += " slide-title bg-slate-50"
-            content = f"<div class='animate__animated animate__zoomIn'><h1 class='mb-6'>{ph.get('title', '')}</h1><p class='text-3xl text-slate-400 font-medium'>{ph.get('subtitle', '')}</p></div>"
-        else:
-            main_title = ph.get('main_title', '')
-            action_title = ph.get('action_title', '')
-            
-            content = f"<div class='slide-header animate__animated animate__fadeInDown'><h2>{main_title}</h2>"
-            if action_title:
-                content += f"<div class='action-title'>{action_title}</div></div>"
-            else:
-                content += "</div>"
-            
-            content += "<div class='flex-grow overflow-hidden pt-4 animate__animated animate__fadeInUp' style='animation-delay: 0.3s;'>"
-            
-            if 'body' in ph:
-                content += "<ul class='space-y-6 text-2xl font-medium text-slate-600'>"
-                for item in ph['body']:
-                    indent = f"ml-{(item['level']-1)*12}"
-                    content += f"<li class='{indent} flex items-start'><span class='text-red-500 mr-4 font-bold'>→</span>{item['text']}</li>"
-                content += "</ul>"
+        if slide.body:
+            yield "<ul class='space-y-6 text-2xl font-medium text-slate-600'>"
+            for item in slide.body:
+                indent = f"ml-{(item.level-1)*12}"
+                yield f"<li class='{indent} flex items-start'><span class='text-red-500 mr-4 font-bold'>→</span>{item.text}</li>"
+            yield "</ul>"
+        
+        if slide.toc_items:
+            yield "<div class='grid grid-cols-1 gap-6 max-w-5xl'>"
+            for item in slide.toc_items:
+                yield f"<div class='glass-card p-8 flex justify-between items-center'><span class='text-2xl'><b class='badge-navy mr-6'>{item.number}</b> <span class='font-bold text-slate-800'>{item.title}</span></span><span class='text-slate-400 font-bold'>{item.pages}</span></div>"
+            yield "</div>"
+
+        for el in slide.elements:
+            if el.TYPE == 'icon_box_grid':
+                yield f"<div class='grid grid-cols-{el.columns} gap-8 h-full items-center'>"
+                for item in el.items:
+                    yield f"<div class='glass-card h-full flex flex-col items-center text-center'><div class='grid-icon'><i class='fas fa-circle-nodes'></i></div><h3 class='text-2xl font-bold mb-4 text-slate-800'>{item.title}</h3><p class='text-lg leading-relaxed text-slate-500 font-medium whitespace-pre-line'>{item.desc}</p></div>"
+                yield "</div>"
+
+            elif el.TYPE == 'pain_point_cards':
+                yield f"<div class='grid grid-cols-{el.columns} gap-8 h-full items-center'>"
+                for item in el.items:
+                    yield f"<div class='glass-card h-full flex flex-col items-center text-center border-t-4 border-red-500'><div class='grid-icon'><i class='fas fa-triangle-exclamation'></i></div><h3 class='text-2xl font-bold mb-4 text-slate-800'>{item.role}</h3><p class='text-lg leading-relaxed text-red-600 font-medium whitespace-pre-line'>{item.pain}</p></div>"
+                yield "</div>"
             
-            if 'toc_items' in ph:
-                content += "<div class='grid grid-cols-1 gap-6 max-w-5xl'>"
-                for item in ph['toc_items']:
-                    content += f"<div class='glass-card p-8 flex justify-between items-center'><span class='text-2xl'><b class='badge-navy mr-6'>{item['number']}</b> <span class='font-bold text-slate-800'>{item['title']}</span></span><span class='text-slate-400 font-bold'>{item['pages']}</span></div>"
-                content += "</div>"
-
-            for el in custom:
-                if el['type'] == 'icon_box_grid':
-                    cols = el['data'].get('columns', 4)
-                    content += f"<div class='grid grid-cols-{cols} gap-8 h-full items-center'>"
-                    for item in el['data']['items']:
-                        content += f"<div class='glass-card h-full flex flex-col items-center text-center'><div class='grid-icon'><i class='fas fa-circle-nodes'></i></div><h3 class='text-2xl font-bold mb-4 text-slate-800'>{item['title']}</h3><p class='text-lg leading-relaxed text-slate-500 font-medium'>{item['desc']}</p></div>"
-                    content += "</div>"
-                
-                elif el['type'] == 'table':
-                    content += "<table class='custom-table mt-8 text-xl'>"
-                    content += "<thead><tr>" + "".join([f"<th class='p-6 uppercase tracking-wider'>{h}</th>" for h in el['data']['headers']]) + "</tr></thead>"
-                    content += "<tbody>"
-                    for row in el['data']['rows']:
-                        content += "<tr>" + "".join([f"<td class='p-6 font-medium text-slate-700'>{v}</td>" for v in row]) + "</tr>"
-                    content += "</tbody></table>"
-
-                elif el['type'] == 'process_flow':
-                    content += "<div class='flex justify-between items-center mt-20 px-10'>"
-                    for j, step in enumerate(el['data']['steps']):
-                        content += f"<div class='relative flex flex-col items-center group'><div class='w-24 h-24 rounded-full bg-slate-900 text-white flex items-center justify-center text-3xl font-bold shadow-xl group-hover:bg-red-600 transition-colors mb-6'>{j+1}</div><div class='text-2xl font-bold text-slate-800'>{step['name']}</div><div class='text-lg font-bold text-red-500'>{step['actor']}</div></div>"
-                        if j < len(el['data']['steps']) - 1:
-                            content += "<div class='flex-grow h-1 bg-slate-200 mx-6 mb-8'></div>"
-                    content += "</div>"
-                
-                elif el['type'] == 'architecture_diagram':
-                    content += "<div class='mt-10 flex justify-center'>"
-                    content += "<img src='system_architecture_premium.png' class='max-h-[600px] rounded-3xl shadow-2xl animate__animated animate__zoomIn'>"
-                    content += "</div>"
+            elif el.TYPE == 'table':
+                yield "<table class='custom-table mt-8 text-xl'>"
+                yield "<thead><tr>" + "".join([f"<th class='p-6 uppercase tracking-wider'>{h}</th>" for h in el.headers]) + "</tr></thead>"
+                yield "<tbody>"
+                for row in el.rows:
+                    yield "<tr>" + "".join([f"<td class='p-6 font-medium text-slate-700'>{v}</td>" for v in row]) + "</tr>"
+                yield "</tbody></table>"
+
+            elif el.TYPE == 'process_flow':
+                yield "<div class='flex justify-between items-center mt-20 px-10'>"
+                for j, step in enumerate(el.steps):
+                    yield f"<div class='relative flex flex-col items-center group'><div class='w-24 h-24 rounded-full bg-slate-900 text-white flex items-center justify-center text-3xl font-bold shadow-xl group-hover:bg-red-600 transition-colors mb-6'>{j+1}</div><div class='text-2xl font-bold text-slate-800'>{step.name}</div><div class='text-lg font-bold text-red-500'>{step.actor}</div></div>"
+                    if j < len(el.steps) - 1:
+                        yield "<div class='flex-grow h-1 bg-slate-200 mx-6 mb-8'></div>"
+                yield "</div>"
+
+            elif el.TYPE == 'comparison_chart':
+                yield "<div class='glass-card mt-4 space-y-6'>"
+                if el.title:
+                    yield f"<h3 class='text-2xl font-bold text-slate-800'>{el.title}</h3>"
+                for item in el.items:
+                    max_value = max(item.as_is, item.to_be, 1)
+                    to_be_color = 'bg-green-600' if '+' in item.change else 'bg-slate-900'
+                    yield f"<div class='grid grid-cols-12 gap-6 items-center text-xl'><div class='col-span-3 font-bold text-slate-700'>{item.label}</div><div class='col-span-7 space-y-2'>"
+                    yield f"<div class='h-6 rounded-full bg-slate-300' style='width: {_bar_percent(item.as_is, item, max_value):.0f}%'></div>"
+                    yield f"<div class='h-6 rounded-full {to_be_color}' style='width: {_bar_percent(item.to_be, item, max_value):.0f}%'></div>"
+                    yield f"</div><div class='col-span-2 text-right text-2xl font-bold text-red-500'>{item.change}</div></div>"
+                yield "</div>"
+
+            elif el.TYPE == 'timeline':
+                yield "<div class='flex gap-8 mt-10'>"
+                for j, phase in enumerate(el.phases):
+                    name, _, detail = phase.name.partition(' - ')
+                    badge = 'bg-slate-900' if j == 0 else 'bg-red-600'
+                    yield f"<div class='glass-card flex-1'><span class='{badge} text-white rounded-xl px-5 py-2 text-xl font-bold'>{name}</span><p class='mt-6 text-xl font-medium text-slate-600'>{detail}</p></div>"
+                yield "</div>"
+
+            elif el.TYPE == 'screen_gallery':
+                columns = max(1, len(el.screens))
+                column_width = (SLIDE_CONTENT_WIDTH - GALLERY_GAP * (columns - 1)) // columns
+                yield f"<div class='grid grid-cols-{columns} gap-8 items-start'>"
+                for screen in el.screens:
+                    yield "<div class='flex flex-col items-center text-center'>"
+                    if screen.image_path:
+                        css_class = 'max-h-[480px] rounded-3xl shadow-2xl'
+                        picture = images and images.picture(screen.image_path, column_width, 480, css_class)
+                        yield picture or f"<img src='{_asset_src(screen.image_path, base_dir)}' class='{css_class}'>"
+                    yield f"<div class='mt-6 text-2xl font-bold text-slate-800'>{screen.label}</div><p class='text-lg text-slate-500 font-medium whitespace-pre-line'>{screen.description}</p></div>"
+                yield "</div>"
             
-            content += "</div>"
-
-        html += f"<div class='{slide_class}' id='slide-{i+1}'>{content}</div>\n"
-    return html
-
-def main():
-    if not os.path.exists(JSON_PATH):
-        print(f"Error: {JSON_PATH} not found.")
-        return
+            elif el.TYPE == 'architecture_diagram' and el.declarative:
+                yield "<div class='mt-10 flex justify-center animate__animated animate__zoomIn'>"
+                yield diagram.to_svg(diagram.layout(el), font_family=None, css_class='w-full h-auto max-h-[600px]')
+                yield "</div>"
+
+            elif el.TYPE == 'architecture_diagram':
+                if el.image_path:
+                    src = _asset_src(el.image_path, base_dir)
+                elif base_dir is not None:
+                    src = os.path.relpath(el.source_path, os.path.abspath(base_dir or '.'))
+                else:
+                    src = DEFAULT_ARCHITECTURE_IMAGE
+                css_class = 'max-h-[600px] rounded-3xl shadow-2xl animate__animated animate__zoomIn'
+                picture = images and images.picture(el.source_path, SLIDE_CONTENT_WIDTH, 600, css_class)
+                yield "<div class='mt-10 flex justify-center'>"
+                yield picture or f"<img src='{src}' class='{css_class}'>"
+                yield "</div>"
         
-    with open(JSON_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    slides_html = generate_slides_html(data)
-    final_html = HTML_TEMPLATE.replace('{{title}}', data['presentation']['title'])
-    final_html = final_html.replace('{{slides_html}}', slides_html)
-    
-    with open(OUTPUT_HTML, 'w', encoding='utf-8') as f:
-        f.write(final_html)
+        yield "</div>"
+
+    yield "</div>\n"
+
+def iter_slides_html(deck, base_dir=None, images=None):
+    """slides as inert per-slide payloads, hydrated on demand by the deck script"""
+    for i, slide in enumerate(deck.slides):
+        yield "<script type='text/html' class='slide-src'>"
+        for fragment in iter_slide_html(i, slide, base_dir, images):
+            # a literal </script in slide text would end the payload early
+            yield fragment.replace('</script', '<\\/script')
+        yield "</script>\n"
+        if i == 0:
+            # paint the first slide while the rest of the deck is still being parsed
+            yield "<script>showSlide(0)</script>\n"
+
+def generate_slides_html(deck, base_dir=None, images=None):
+    return "".join(iter_slides_html(deck, base_dir, images))
+
+# template halves around the slides, split once instead of str.replace over the whole document
+_TEMPLATE_HEAD, _TEMPLATE_TAIL = HTML_TEMPLATE.split('{{slides_html}}')
+
+def iter_html(deck, base_dir=None, images=None):
+    """the whole document as a stream of fragments (head, slides, tail)"""
+    yield _TEMPLATE_HEAD.replace('{{title}}', deck.title)
+    yield from iter_slides_html(deck, base_dir, images)
+    yield _TEMPLATE_TAIL.replace('{{title}}', deck.title)
+
+def render_html(deck, base_dir=None, images=None):
+    return "".join(iter_html(deck, base_dir, images))
+
+def write_html(deck, output_html, base_dir=None, images=None):
+    """stream the document straight to output_html - memory stays flat regardless of slide count"""
+    os.makedirs(os.path.dirname(output_html) or '.', exist_ok=True)
+    with open(output_html, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(iter_html(deck, base_dir, images))
+
+def main(json_path=JSON_PATH, output_html=OUTPUT_HTML, bundle=None, font=None, responsive_images=True):
+    """generate the HTML deck - returns the exit code (1 when the content is missing or fails validation)"""
+    if not os.path.exists(json_path):
+        print(f"Error: {json_path} not found.")
+        return 1
+        
+    deck = content_model.load_deck(json_path)
+    if deck.errors:
+        # the renderers assume validated content (numbers in charts, lists in tables)
+        for issue in deck.errors:
+            print(f"{json_path}: {issue}")
+        print(f"Error: {len(deck.errors)} validation error(s) - HTML not written")
+        return 1
+    images = ResponsiveImages(os.path.dirname(output_html) or '.') if responsive_images else None
+    if bundle:
+        import html_bundle
+
+        summary = html_bundle.write_bundle(deck, output_html, os.path.dirname(output_html), mode=bundle, font_path=font, images=images)
+        font_note = f"font subset {summary['font_bytes']:,} bytes ({summary['glyphs']} glyphs)" if summary['font'] else "system fonts (no font file or fontTools)"
+        print(f"Offline bundle ({bundle}): css {summary['css_bytes']:,} bytes, {font_note}")
+        for name in summary['files']:
+            print(f"  wrote {name}")
+        if summary['unknown_classes']:
+            print(f"  Warning: no bundled CSS for classes: {', '.join(summary['unknown_classes'])}")
+        if summary['missing_icons']:
+            print(f"  Warning: no bundled SVG for icons: {', '.join(summary['missing_icons'])}")
+    else:
+        write_html(deck, output_html, os.path.dirname(output_html), images)
     
-    print(f"Professional HTML presentation saved to {OUTPUT_HTML}")
+    print(f"Professional HTML presentation saved to {output_html}")
+    return 0
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the HTML presentation from presentation content JSON")
+    parser.add_argument("-c", "--content", default=JSON_PATH, help=f"content JSON path (default: {JSON_PATH})")
+    parser.add_argument("-o", "--output", default=OUTPUT_HTML, help=f"output HTML path (default: {OUTPUT_HTML})")
+    parser.add_argument("--bundle", nargs="?", const="inline", default=None, choices=("inline", "files"),
+                        help="offline deck without CDN assets: purged CSS, inline SVG icons, Hangul font subset "
+                             "(inline: single file, files: hashed sibling files)")
+    parser.add_argument("--font", default=None, help="font file to subset for --bundle (needs fontTools)")
+    parser.add_argument("--original-images", dest="responsive_images", action="store_false",
+                        help=f"reference images as-is instead of resized WebP/PNG variants in {IMAGES_DIR}/")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    sys.exit(main(args.content, args.output, args.bundle, args.font, args.responsive_images))
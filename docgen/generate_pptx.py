@@ -11,22 +11,38 @@ PPT기본양식.pptx 템플릿을 기반으로 presentation_content.json 내용
 - Layout 2: 내지 (Action title 사용) - layout_id: 3
 - Layout 3: 내지 (Action title, Body삭제) - layout_id: 4
 - Layout 4: 내지 (Action Title 미사용) - layout_id: 5
+(실제 레이아웃 순번은 LAYOUT_SIGNATURES의 플레이스홀더 조합으로 템플릿에서 찾음)
 """
 
+import copy
+import hashlib
+import itertools
 import json
+import os
+import sys
+import weakref
+from io import BytesIO
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.shapes import MSO_SHAPE, PP_PLACEHOLDER
 from pptx.oxml.ns import nsmap
 
+import content_model
+import content_schema
+import render_profile
+
 # ==================== 경로 설정 ====================
 BASE_DIR = Path(__file__).parent
 TEMPLATE_PATH = BASE_DIR / "PPT기본양식.pptx"
 CONTENT_PATH = BASE_DIR / "presentation_content.json"
 OUTPUT_PATH = BASE_DIR / "공조설비_정보관리시스템_사전설명회.pptx"
+CACHE_DIR = BASE_DIR / ".cache"
+
+# 컴파일된 템플릿 형식이 바뀌면 올려서 기존 스냅샷을 무효화
+TEMPLATE_SNAPSHOT_VERSION = 1
 
 # ==================== 색상 정의 ====================
 COLORS = {
@@ -40,30 +56,130 @@ COLORS = {
     "blue": RGBColor(0x19, 0x76, 0xD2),
 }
 
+# 커스텀 요소 콘텐츠 영역 시작 위치 (약 4cm)
+CONTENT_TOP = Emu(1431130)
+
 # ==================== 레이아웃 인덱스 매핑 ====================
-# PPT기본양식.pptx의 실제 레이아웃 순서
-LAYOUT_MAP = {
-    1: 0,  # 표지 (White_Big K)
-    2: 1,  # 목차 (간지 1)
-    3: 2,  # 내지 (Action title 사용)
-    4: 3,  # 내지 (Action title, Body삭제)
-    5: 4,  # 내지 (Action Title 미사용)
+# layout_id -> 레이아웃이 새 슬라이드에 복제하는 플레이스홀더 idx 조합
+# (실제 레이아웃 순번은 템플릿에서 이 조합을 가진 레이아웃을 찾아 정함 - template_index())
+LAYOUT_SIGNATURES = {
+    1: {0, 13},  # 표지 (White_Big K)
+    2: {13, 14, 17},  # 목차 (간지 1)
+    3: {0, 18, 19},  # 내지 (Action title 사용)
+    4: {0, 19},  # 내지 (Action title, Body삭제)
+    5: {18, 19},  # 내지 (Action Title 미사용)
 }
 
+# ==================== 커스텀 요소 백엔드 ====================
+# 요소 타입별 렌더링 백엔드: "pptx" (python-pptx 객체 API, 기본값) 또는
+# "drawingml" (drawingml.py의 XML 프로토타입 - 같은 결과를 훨씬 빠르게 생성)
+ELEMENT_BACKENDS = {}
+
+
+def set_element_backends(fast_elements):
+    """DrawingML 백엔드로 렌더링할 요소 타입 지정 ("all" 또는 타입 목록, 나머지는 python-pptx)"""
+    import drawingml
+
+    if fast_elements in ("all", ["all"]):
+        fast_elements = list(drawingml.RENDERERS)
+    unknown = set(fast_elements) - set(drawingml.RENDERERS)
+    if unknown:
+        raise ValueError(f"DrawingML 백엔드가 없는 요소 타입: {', '.join(sorted(unknown))}")
+
+    ELEMENT_BACKENDS.clear()
+    ELEMENT_BACKENDS.update({elem_type: "drawingml" for elem_type in fast_elements})
+
 
-def load_content():
+def load_content(content_path=CONTENT_PATH):
     """JSON 콘텐츠 파일 로드"""
-    with open(CONTENT_PATH, "r", encoding="utf-8") as f:
+    with open(content_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def get_placeholder_by_idx(slide, idx):
-    """플레이스홀더 인덱스로 shape 찾기"""
-    for shape in slide.shapes:
-        if shape.is_placeholder:
-            if shape.placeholder_format.idx == idx:
-                return shape
-    return None
+class LayoutPlaceholders:
+    """레이아웃 하나가 새 슬라이드에 복제하는 플레이스홀더 인덱스 (idx/type -> 복제 순서상 위치)
+
+    add_slide()는 레이아웃의 복제 대상 플레이스홀더를 이 순서대로 spTree 끝에 붙이므로, 새 슬라이드에서는
+    위치만으로 플레이스홀더 요소를 바로 찾을 수 있습니다.
+    """
+
+    __slots__ = ("layout_index", "name", "by_idx", "by_type", "count")
+
+    def __init__(self, layout_index, layout):
+        self.layout_index = layout_index
+        self.name = layout.name
+        self.by_idx = {}
+        self.by_type = {}
+        for position, placeholder in enumerate(layout.iter_cloneable_placeholders()):
+            ph_format = placeholder.placeholder_format
+            self.by_idx[ph_format.idx] = position
+            self.by_type.setdefault(ph_format.type, position)
+        self.count = len(self.by_idx)
+
+
+class TemplateIndex:
+    """템플릿 레이아웃/플레이스홀더 인덱스와 layout_id -> 레이아웃 순번 매핑"""
+
+    def __init__(self, prs):
+        self.layouts = [
+            LayoutPlaceholders(i, layout) for i, layout in enumerate(prs.slide_layouts)
+        ]
+        self.layout_map = {}
+        for layout_id, signature in LAYOUT_SIGNATURES.items():
+            for layout in self.layouts:
+                if set(layout.by_idx) == signature:
+                    self.layout_map[layout_id] = layout.layout_index
+                    break
+            else:
+                raise ValueError(
+                    f"템플릿에 layout_id {layout_id}용 레이아웃이 없습니다 "
+                    f"(플레이스홀더 idx {sorted(signature)})"
+                )
+
+
+class SlidePlaceholders:
+    """새 슬라이드의 플레이스홀더 조회 - 레이아웃 인덱스로 위치를 찾아 O(1)"""
+
+    __slots__ = ("_slide", "_layout", "_elements")
+
+    def __init__(self, slide, layout):
+        sp_tree = slide.shapes._spTree
+        self._slide = slide
+        self._layout = layout
+        self._elements = sp_tree[len(sp_tree) - layout.count:]
+
+    def _shape(self, position):
+        if position is None:
+            return None
+        return self._slide.shapes._shape_factory(self._elements[position])
+
+    def get(self, idx):
+        """플레이스홀더 idx로 shape 찾기 (없으면 None)"""
+        return self._shape(self._layout.by_idx.get(idx))
+
+    def by_type(self, ph_type):
+        """플레이스홀더 유형(PP_PLACEHOLDER)으로 첫 shape 찾기 (없으면 None)"""
+        return self._shape(self._layout.by_type.get(ph_type))
+
+
+# Presentation -> TemplateIndex (Presentation당 한 번 계산)
+_template_indexes = weakref.WeakKeyDictionary()
+
+
+def template_index(prs):
+    """prs 템플릿의 레이아웃/플레이스홀더 인덱스"""
+    index = _template_indexes.get(prs.part)
+    if index is None:
+        index = _template_indexes[prs.part] = TemplateIndex(prs)
+    return index
+
+
+def add_layout_slide(prs, layout_id):
+    """layout_id 레이아웃으로 슬라이드를 추가하고 (slide, 플레이스홀더 조회 객체) 반환"""
+    index = template_index(prs)
+    layout_index = index.layout_map[layout_id]
+    slide = prs.slides.add_slide(prs.slide_layouts[layout_index])
+    return slide, SlidePlaceholders(slide, index.layouts[layout_index])
 
 
 def set_text_frame_content(text_frame, text, font_size=None, bold=False, color=None):
@@ -82,53 +198,42 @@ def set_text_frame_content(text_frame, text, font_size=None, bold=False, color=N
 
 def add_title_slide(prs, slide_data):
     """슬라이드 1: 표지 추가"""
-    layout = prs.slide_layouts[LAYOUT_MAP[1]]
-    slide = prs.slides.add_slide(layout)
-
-    placeholders = slide_data.get("placeholders", {})
-
-    # 제목 설정 (idx=15 또는 title placeholder)
-    for shape in slide.shapes:
-        if shape.is_placeholder:
-            ph_type = shape.placeholder_format.type
-            idx = shape.placeholder_format.idx
-
-            # 제목 플레이스홀더
-            if idx == 15 or ph_type == 1:  # title type
-                if shape.has_text_frame:
-                    set_text_frame_content(
-                        shape.text_frame,
-                        placeholders.get("title", ""),
-                        font_size=32,
-                        bold=True,
-                        color=COLORS["navy"]
-                    )
+    slide, phs = add_layout_slide(prs, 1)
 
-            # 부제목 플레이스홀더 (idx=13 또는 27)
-            elif idx in [13, 27]:
-                if shape.has_text_frame:
-                    set_text_frame_content(
-                        shape.text_frame,
-                        placeholders.get("subtitle", ""),
-                        font_size=14,
-                        color=COLORS["gray"]
-                    )
+    # 제목 플레이스홀더 (idx=15 또는 title placeholder)
+    title_ph = phs.get(15) or phs.by_type(PP_PLACEHOLDER.TITLE)
+    if title_ph and title_ph.has_text_frame:
+        set_text_frame_content(
+            title_ph.text_frame,
+            slide_data.title,
+            font_size=32,
+            bold=True,
+            color=COLORS["navy"]
+        )
+
+    # 부제목 플레이스홀더 (idx=13 또는 27)
+    subtitle_ph = phs.get(13) or phs.get(27)
+    if subtitle_ph and subtitle_ph.has_text_frame:
+        set_text_frame_content(
+            subtitle_ph.text_frame,
+            slide_data.subtitle,
+            font_size=14,
+            color=COLORS["gray"]
+        )
 
     return slide
 
 
 def add_toc_slide(prs, slide_data):
     """슬라이드 2: 목차 추가"""
-    layout = prs.slide_layouts[LAYOUT_MAP[2]]
-    slide = prs.slides.add_slide(layout)
+    slide, phs = add_layout_slide(prs, 2)
 
-    placeholders = slide_data.get("placeholders", {})
-    toc_items = placeholders.get("toc_items", [])
+    toc_items = slide_data.toc_items
 
     # 목차 플레이스홀더들 찾기 (idx=17: 번호, idx=13: 제목, idx=14: 페이지)
-    number_ph = get_placeholder_by_idx(slide, 17)
-    title_ph = get_placeholder_by_idx(slide, 13)
-    page_ph = get_placeholder_by_idx(slide, 14)
+    number_ph = phs.get(17)
+    title_ph = phs.get(13)
+    page_ph = phs.get(14)
 
     # 번호 열
     if number_ph and number_ph.has_text_frame:
@@ -136,7 +241,7 @@ def add_toc_slide(prs, slide_data):
         tf.clear()
         for i, item in enumerate(toc_items):
             p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-            p.text = item.get("number", "")
+            p.text = item.number
             p.font.size = Pt(16)
             p.font.bold = True
             p.alignment = PP_ALIGN.RIGHT
@@ -147,7 +252,7 @@ def add_toc_slide(prs, slide_data):
         tf.clear()
         for i, item in enumerate(toc_items):
             p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-            p.text = item.get("title", "")
+            p.text = item.title
             p.font.size = Pt(16)
 
     # 페이지 열
@@ -156,166 +261,179 @@ def add_toc_slide(prs, slide_data):
         tf.clear()
         for i, item in enumerate(toc_items):
             p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-            p.text = item.get("pages", "")
+            p.text = item.pages
             p.font.size = Pt(16)
             p.font.color.rgb = COLORS["light_gray"]
 
     return slide
 
 
-def add_content_slide_layout4(prs, slide_data):
-    """Layout 4: 내지 (Action title, Body삭제) - 자유 콘텐츠용"""
-    layout = prs.slide_layouts[LAYOUT_MAP[4]]
-    slide = prs.slides.add_slide(layout)
-
-    placeholders = slide_data.get("placeholders", {})
+def add_content_slide_layout4(prs, slide_data, images=None):
+    """Layout 4: 내지 (Action title, Body삭제) - 자유 콘텐츠용 (images: 덱의 image_pipeline.ImagePlan)"""
+    slide, phs = add_layout_slide(prs, 4)
 
     # Main Title (idx=19)
-    main_title_ph = get_placeholder_by_idx(slide, 19)
+    main_title_ph = phs.get(19)
     if main_title_ph and main_title_ph.has_text_frame:
         set_text_frame_content(
             main_title_ph.text_frame,
-            placeholders.get("main_title", ""),
+            slide_data.main_title,
             font_size=19,
             bold=False,
             color=COLORS["navy"]
         )
 
     # Action Title (title placeholder)
-    for shape in slide.shapes:
-        if shape.is_placeholder:
-            if shape.placeholder_format.type == 1:  # title
-                if shape.has_text_frame:
-                    set_text_frame_content(
-                        shape.text_frame,
-                        placeholders.get("action_title", ""),
-                        font_size=17,
-                        color=COLORS["gray"]
-                    )
-                break
+    action_title_ph = phs.by_type(PP_PLACEHOLDER.TITLE)
+    if action_title_ph and action_title_ph.has_text_frame:
+        set_text_frame_content(
+            action_title_ph.text_frame,
+            slide_data.action_title,
+            font_size=17,
+            color=COLORS["gray"]
+        )
 
     # custom_elements 처리는 별도 함수에서
-    custom_elements = slide_data.get("custom_elements", [])
-    add_custom_elements(slide, custom_elements)
+    add_custom_elements(slide, slide_data.elements, images)
 
     return slide
 
 
 def add_content_slide_layout5(prs, slide_data):
     """Layout 5: 내지 (Action Title 미사용) - 넓은 본문용"""
-    layout = prs.slide_layouts[LAYOUT_MAP[5]]
-    slide = prs.slides.add_slide(layout)
-
-    placeholders = slide_data.get("placeholders", {})
+    slide, phs = add_layout_slide(prs, 5)
 
     # Main Title (idx=19)
-    main_title_ph = get_placeholder_by_idx(slide, 19)
+    main_title_ph = phs.get(19)
     if main_title_ph and main_title_ph.has_text_frame:
         set_text_frame_content(
             main_title_ph.text_frame,
-            placeholders.get("main_title", ""),
+            slide_data.main_title,
             font_size=19,
             bold=False,
             color=COLORS["navy"]
         )
 
     # Body (idx=18)
-    body_ph = get_placeholder_by_idx(slide, 18)
+    body_ph = phs.get(18)
     if body_ph and body_ph.has_text_frame:
-        body_items = placeholders.get("body", [])
         tf = body_ph.text_frame
         tf.clear()
 
-        for i, item in enumerate(body_items):
+        for i, item in enumerate(slide_data.body):
             p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-            p.text = item.get("text", "")
+            p.text = item.text
             p.font.size = Pt(16)
-            p.level = item.get("level", 1) - 1
+            p.level = item.level - 1
 
     return slide
 
 
-def add_custom_elements(slide, elements):
-    """커스텀 요소들 추가 (표, 차트, 다이어그램 등)"""
+def add_custom_elements(slide, elements, images=None):
+    """커스텀 요소들 추가 (표, 차트, 다이어그램 등) - elements는 content_model 요소 객체
+
+    images(image_pipeline.ImagePlan)는 이미지 요소가 덱 전체 기준 축소본을 고르는 데 씁니다.
+    """
     # 콘텐츠 영역 시작 위치
-    content_top = Emu(1431130)  # 약 4cm
+    content_top = CONTENT_TOP
     content_left = Emu(270064)  # 약 0.75cm
     content_width = Emu(9360550)  # 약 26cm
 
     for element in elements:
-        elem_type = element.get("type", "")
-        data = element.get("data", {})
-
-        if elem_type == "table":
-            add_table_element(slide, data, content_left, content_top, content_width)
-        elif elem_type == "icon_box_grid":
-            add_icon_box_grid(slide, data, content_left, content_top, content_width)
-        elif elem_type == "pain_point_cards":
-            add_pain_point_cards(slide, data, content_left, content_top, content_width)
-        elif elem_type == "process_flow":
-            add_process_flow(slide, data, content_left, content_top, content_width)
-        elif elem_type == "comparison_chart":
-            add_comparison_chart(slide, data, content_left, content_top, content_width)
-        elif elem_type == "timeline":
-            add_timeline(slide, data, content_left, content_top, content_width)
-        elif elem_type == "screen_gallery":
-            add_screen_gallery(slide, data, content_left, content_top, content_width)
-        # architecture_diagram은 복잡하므로 placeholder로 처리
-
-
-def add_table_element(slide, data, left, top, width):
-    """테이블 요소 추가"""
-    headers = data.get("headers", [])
-    rows = data.get("rows", [])
+        elem_type = element.TYPE
+
+        with render_profile.span(elem_type, "element"):
+            if ELEMENT_BACKENDS.get(elem_type) == "drawingml":
+                import drawingml
+                drawingml.RENDERERS[elem_type](slide, element, content_left, content_top, content_width)
+            elif elem_type == "table":
+                add_table_element(slide, element, content_left, content_top, content_width)
+            elif elem_type == "icon_box_grid":
+                add_icon_box_grid(slide, element, content_left, content_top, content_width)
+            elif elem_type == "pain_point_cards":
+                add_pain_point_cards(slide, element, content_left, content_top, content_width)
+            elif elem_type == "process_flow":
+                add_process_flow(slide, element, content_left, content_top, content_width)
+            elif elem_type == "comparison_chart":
+                add_comparison_chart(slide, element, content_left, content_top, content_width)
+            elif elem_type == "timeline":
+                add_timeline(slide, element, content_left, content_top, content_width)
+            elif elem_type == "screen_gallery":
+                add_screen_gallery(slide, element, content_left, content_top, content_width, images)
+            elif elem_type == "architecture_diagram":
+                add_architecture_diagram(slide, element, content_left, content_top, content_width, images)
+
+
+# 표 행 높이와 표가 차지할 수 있는 하단 한계 (푸터/슬라이드 번호 위)
+TABLE_ROW_HEIGHT = Emu(500000)  # 행당 약 1.4cm
+TABLE_BOTTOM = Emu(6500000)
+
+# 이어지는 슬라이드 제목 표시
+CONTINUED_SUFFIX = " (계속)"
+
+# 구성도 이미지 최대 폭 (콘텐츠 영역 폭, 약 26cm)
+ARCHITECTURE_MAX_WIDTH = Emu(9360550)
+
+
+def table_rows_per_slide():
+    """슬라이드 한 장에 들어가는 데이터 행 수 (헤더 제외)"""
+    return max(1, (TABLE_BOTTOM - CONTENT_TOP) // TABLE_ROW_HEIGHT - 1)
+
+
+def paginate_tables(slides_data):
+    """한 슬라이드에 넘치는 표를 이어지는 슬라이드로 나눈 슬라이드 리스트 반환
+
+    첫 슬라이드에는 원래 요소와 표의 앞부분이 남고, 이어지는 슬라이드는 같은 레이아웃/제목
+    (CONTINUED_SUFFIX 추가)에 헤더를 반복한 표만 담습니다. 넘치는 표가 없으면 그대로 반환합니다.
+    """
+    per_slide = table_rows_per_slide()
+    paginated = []
+    for slide_data in slides_data:
+        elements = slide_data.elements
+        overflowing = [
+            i for i, element in enumerate(elements)
+            if element.TYPE == "table" and len(element.rows) > per_slide
+        ]
+        if not overflowing:
+            paginated.append(slide_data)
+            continue
+
+        first_elements = list(elements)
+        continuations = []
+        for i in overflowing:
+            rows = elements[i].rows
+            first_elements[i] = elements[i].replace(rows=rows[:per_slide])
+            for start in range(per_slide, len(rows), per_slide):
+                continuations.append(elements[i].replace(rows=rows[start:start + per_slide]))
+
+        title_key = "action_title" if slide_data.action_title else "main_title"
+        continued = slide_data.replace(body=[])
+        if getattr(slide_data, title_key):
+            continued = continued.replace(**{title_key: getattr(slide_data, title_key) + CONTINUED_SUFFIX})
+
+        paginated.append(slide_data.replace(elements=first_elements))
+        for element in continuations:
+            paginated.append(continued.replace(elements=[element]))
+    return paginated
+
+
+def add_table_element(slide, element, left, top, width):
+    """테이블 요소 추가 - 표 XML을 한 번에 생성 (넘치는 행은 paginate_tables()가 미리 분할)"""
+    import drawingml
+
+    headers = element.headers
+    rows = element.rows
 
     if not headers or not rows:
         return
 
-    cols = len(headers)
-    row_count = len(rows) + 1  # 헤더 포함
-
-    # 테이블 크기 계산
-    table_height = Emu(row_count * 500000)  # 행당 약 1.4cm
-
-    table = slide.shapes.add_table(row_count, cols, left, top, width, table_height).table
+    drawingml.table(slide, headers, rows, left, top, width, TABLE_ROW_HEIGHT)
 
-    # 헤더 행 스타일
-    for i, header in enumerate(headers):
-        cell = table.cell(0, i)
-        cell.text = header
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = COLORS["navy"]
 
-        para = cell.text_frame.paragraphs[0]
-        para.font.size = Pt(14)
-        para.font.bold = True
-        para.font.color.rgb = COLORS["white"]
-        para.alignment = PP_ALIGN.LEFT
-
-    # 데이터 행
-    for row_idx, row_data in enumerate(rows):
-        for col_idx, cell_text in enumerate(row_data):
-            cell = table.cell(row_idx + 1, col_idx)
-            cell.text = str(cell_text)
-
-            para = cell.text_frame.paragraphs[0]
-            para.font.size = Pt(13)
-            para.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-
-            # 심각도 열 특별 처리
-            if col_idx == len(row_data) - 1 and cell_text in ["높음", "중간", "낮음"]:
-                if cell_text == "높음":
-                    para.font.bold = True
-                    para.font.color.rgb = COLORS["red"]
-                elif cell_text == "중간":
-                    para.font.bold = True
-                    para.font.color.rgb = COLORS["orange"]
-
-
-def add_icon_box_grid(slide, data, left, top, width):
+def add_icon_box_grid(slide, element, left, top, width):
     """아이콘 박스 그리드 추가"""
-    items = data.get("items", [])
-    columns = data.get("columns", 4)
+    items = element.items
+    columns = element.columns
 
     if not items:
         return
@@ -359,7 +477,7 @@ def add_icon_box_grid(slide, data, left, top, width):
         tf = title_box.text_frame
         tf.word_wrap = True
         p = tf.paragraphs[0]
-        p.text = item.get("title", "")
+        p.text = item.title
         p.font.size = Pt(14)
         p.font.bold = True
         p.font.color.rgb = COLORS["navy"]
@@ -372,15 +490,15 @@ def add_icon_box_grid(slide, data, left, top, width):
         tf = desc_box.text_frame
         tf.word_wrap = True
         p = tf.paragraphs[0]
-        p.text = item.get("desc", "").replace("\\n", "\n")
+        p.text = item.desc
         p.font.size = Pt(11)
         p.font.color.rgb = COLORS["gray"]
 
 
-def add_pain_point_cards(slide, data, left, top, width):
+def add_pain_point_cards(slide, element, left, top, width):
     """Pain Point 카드 추가"""
-    items = data.get("items", [])
-    columns = data.get("columns", 4)
+    items = element.items
+    columns = element.columns
 
     if not items:
         return
@@ -417,7 +535,7 @@ def add_pain_point_cards(slide, data, left, top, width):
         )
         tf = role_box.text_frame
         p = tf.paragraphs[0]
-        p.text = item.get("role", "")
+        p.text = item.role
         p.font.size = Pt(14)
         p.font.bold = True
         p.font.color.rgb = role_colors[i % len(role_colors)]
@@ -441,14 +559,14 @@ def add_pain_point_cards(slide, data, left, top, width):
         tf = pain_box.text_frame
         tf.word_wrap = True
         p = tf.paragraphs[0]
-        p.text = item.get("pain", "").replace("\\n", "\n")
+        p.text = item.pain
         p.font.size = Pt(11)
         p.font.color.rgb = COLORS["red"]
 
 
-def add_process_flow(slide, data, left, top, width):
+def add_process_flow(slide, element, left, top, width):
     """프로세스 플로우 추가"""
-    steps = data.get("steps", [])
+    steps = element.steps
 
     if not steps:
         return
@@ -472,9 +590,9 @@ def add_process_flow(slide, data, left, top, width):
 
         # 원형 노드
         color_key = "navy"
-        if "내부" in step.get("actor", ""):
+        if "내부" in step.actor:
             color_key = "navy"
-        elif "승인" in step.get("name", ""):
+        elif "승인" in step.name:
             color_key = "green"
         else:
             color_key = "orange"
@@ -494,7 +612,7 @@ def add_process_flow(slide, data, left, top, width):
         )
         tf = code_box.text_frame
         p = tf.paragraphs[0]
-        p.text = step.get("code", "")
+        p.text = step.code
         p.font.size = Pt(18)
         p.font.bold = True
         p.font.color.rgb = COLORS["white"]
@@ -507,7 +625,7 @@ def add_process_flow(slide, data, left, top, width):
         )
         tf = name_box.text_frame
         p = tf.paragraphs[0]
-        p.text = step.get("name", "")
+        p.text = step.name
         p.font.size = Pt(12)
         p.font.bold = True
         p.font.color.rgb = step_colors[color_key]
@@ -520,7 +638,7 @@ def add_process_flow(slide, data, left, top, width):
         )
         tf = actor_box.text_frame
         p = tf.paragraphs[0]
-        p.text = step.get("actor", "")
+        p.text = step.actor
         p.font.size = Pt(10)
         p.font.color.rgb = COLORS["light_gray"]
         p.alignment = PP_ALIGN.CENTER
@@ -538,9 +656,9 @@ def add_process_flow(slide, data, left, top, width):
             arrow.line.fill.background()
 
 
-def add_comparison_chart(slide, data, left, top, width):
+def add_comparison_chart(slide, element, left, top, width):
     """비교 차트 추가"""
-    items = data.get("items", [])
+    items = element.items
 
     if not items:
         return
@@ -560,15 +678,15 @@ def add_comparison_chart(slide, data, left, top, width):
         )
         tf = label_box.text_frame
         p = tf.paragraphs[0]
-        p.text = item.get("label", "")
+        p.text = item.label
         p.font.size = Pt(13)
         p.font.bold = True
         p.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
 
         # As-Is 바
-        as_is_value = item.get("as_is", 0)
-        max_value = max(item.get("as_is", 0), item.get("to_be", 0), 1)
-        as_is_width = int(bar_area_width * (as_is_value / 100)) if item.get("unit") == "%" else int(bar_area_width * (as_is_value / max_value / 1.2))
+        as_is_value = item.as_is
+        max_value = max(item.as_is, item.to_be, 1)
+        as_is_width = int(bar_area_width * (as_is_value / 100)) if item.unit == "%" else int(bar_area_width * (as_is_value / max_value / 1.2))
 
         bar_x = left + label_width + Emu(200000)
         as_is_bar = slide.shapes.add_shape(
@@ -581,10 +699,10 @@ def add_comparison_chart(slide, data, left, top, width):
         as_is_bar.line.fill.background()
 
         # To-Be 바
-        to_be_value = item.get("to_be", 0)
-        to_be_width = int(bar_area_width * (to_be_value / 100)) if item.get("unit") == "%" else int(bar_area_width * (to_be_value / max_value / 1.2))
+        to_be_value = item.to_be
+        to_be_width = int(bar_area_width * (to_be_value / 100)) if item.unit == "%" else int(bar_area_width * (to_be_value / max_value / 1.2))
 
-        to_be_color = COLORS["green"] if "+" in item.get("change", "") else COLORS["navy"]
+        to_be_color = COLORS["green"] if "+" in item.change else COLORS["navy"]
         to_be_bar = slide.shapes.add_shape(
             MSO_SHAPE.ROUNDED_RECTANGLE,
             bar_x, y + Emu(300000),
@@ -601,7 +719,7 @@ def add_comparison_chart(slide, data, left, top, width):
         )
         tf = change_box.text_frame
         p = tf.paragraphs[0]
-        change_text = item.get("change", "")
+        change_text = item.change
         p.text = f"▼{change_text[1:]}" if change_text.startswith("-") else f"▲{change_text[1:]}"
         p.font.size = Pt(12)
         p.font.bold = True
@@ -609,9 +727,9 @@ def add_comparison_chart(slide, data, left, top, width):
         p.alignment = PP_ALIGN.RIGHT
 
 
-def add_timeline(slide, data, left, top, width):
+def add_timeline(slide, element, left, top, width):
     """타임라인 추가 - 슬라이드에 맞게 축소"""
-    phases = data.get("phases", [])
+    phases = element.phases
 
     if not phases:
         return
@@ -661,7 +779,7 @@ def add_timeline(slide, data, left, top, width):
         )
         tf = label_text.text_frame
         p = tf.paragraphs[0]
-        p.text = phase.get("name", "").split(" - ")[0]
+        p.text = phase.name.split(" - ")[0]
         p.font.size = Pt(10)
         p.font.bold = True
         p.font.color.rgb = COLORS["white"]
@@ -685,18 +803,12 @@ def add_timeline(slide, data, left, top, width):
         phase_bar.line.fill.background()
 
 
-def add_screen_gallery(slide, data, left, top, width):
-    """스크린샷 갤러리 추가 (모바일/웹 화면 이미지) - 원본 비율 유지"""
-    from pathlib import Path
-    from PIL import Image
-
-    screens = data.get("screens", [])
-    layout_type = data.get("layout", "horizontal_3")
-
-    if not screens:
-        return
+def screen_gallery_image_infos(element, warn=True):
+    """스크린샷 갤러리의 각 이미지 경로와 슬라이드 위 크기(EMU) 계산 - 원본 비율 유지"""
+    import image_pipeline
 
-    num_screens = len(screens)
+    screens = element.screens
+    layout_type = element.layout
     is_wide = "wide" in layout_type.lower()
 
     # 최대 높이 제한 (슬라이드 영역 고려)
@@ -705,37 +817,35 @@ def add_screen_gallery(slide, data, left, top, width):
     else:
         max_height = Emu(3000000)  # 모바일: 약 8.3cm
 
-    gap = Emu(200000)  # 이미지 간격
-
-    # 먼저 각 이미지의 실제 크기를 계산
+    # 각 이미지의 실제 크기를 계산
     image_infos = []
     for screen in screens:
-        image_path = screen.get("image_path", "")
+        image_path = screen.image_path
         if image_path and Path(image_path).exists():
             try:
-                with Image.open(image_path) as img:
-                    orig_width, orig_height = img.size
-                    # 높이 기준으로 비율 계산
-                    scale = int(max_height) / orig_height
-                    new_width = Emu(int(orig_width * scale))
-                    new_height = max_height
-                    image_infos.append({
-                        "path": image_path,
-                        "width": new_width,
-                        "height": new_height,
-                        "label": screen.get("label", ""),
-                        "description": screen.get("description", "").replace("\\n", "\n")
-                    })
+                orig_width, orig_height = image_pipeline.probe_size(image_path)
+                # 높이 기준으로 비율 계산
+                scale = int(max_height) / orig_height
+                new_width = Emu(int(orig_width * scale))
+                new_height = max_height
+                image_infos.append({
+                    "path": image_path,
+                    "width": new_width,
+                    "height": new_height,
+                    "label": screen.label,
+                    "description": screen.description
+                })
             except Exception as e:
-                print(f"    ⚠️  이미지 정보 로드 실패: {image_path} - {e}")
+                if warn:
+                    print(f"    ⚠️  이미지 정보 로드 실패: {image_path} - {e}")
                 # 기본 크기 사용
                 default_width = Emu(2000000) if is_wide else Emu(1600000)
                 image_infos.append({
                     "path": image_path,
                     "width": default_width,
                     "height": max_height,
-                    "label": screen.get("label", ""),
-                    "description": screen.get("description", "").replace("\\n", "\n")
+                    "label": screen.label,
+                    "description": screen.description
                 })
         else:
             default_width = Emu(2800000) if is_wide else Emu(1600000)
@@ -743,10 +853,52 @@ def add_screen_gallery(slide, data, left, top, width):
                 "path": None,
                 "width": default_width,
                 "height": max_height,
-                "label": screen.get("label", ""),
-                "description": screen.get("description", "").replace("\\n", "\n")
+                "label": screen.label,
+                "description": screen.description
             })
 
+    return image_infos
+
+
+def plan_deck_images(slides_data):
+    """덱 전체 스크린샷의 크기를 미리 조회하고 이미지별 최대 표시 크기를 등록한 ImagePlan 반환
+
+    같은 이미지가 여러 슬라이드에 다른 크기로 쓰여도 가장 큰 크기의 축소본 하나만 만들어
+    하나의 미디어 파트로 공유되도록 합니다. 계획은 빌드마다 새로 만들어 렌더링에 넘깁니다.
+    """
+    import image_pipeline
+
+    plan = image_pipeline.ImagePlan()
+
+    with render_profile.span("image.probe", "image"):
+        image_pipeline.prefetch_images(
+            path for slide_data in slides_data for path in slide_data.image_paths()
+        )
+    with render_profile.span("image.plan", "image"):
+        for slide_data in slides_data:
+            for element in slide_data.elements:
+                if element.TYPE == "screen_gallery":
+                    for info in screen_gallery_image_infos(element, warn=False):
+                        if info["path"] and Path(info["path"]).exists():
+                            plan.add(info["path"], info["width"], info["height"])
+                elif element.TYPE == "architecture_diagram" and not element.declarative:
+                    box = architecture_image_box(element)
+                    if box is not None:
+                        plan.add(element.source_path, box[0], box[1])
+    return plan
+
+
+def add_screen_gallery(slide, element, left, top, width, images=None):
+    """스크린샷 갤러리 추가 (모바일/웹 화면 이미지) - 원본 비율 유지"""
+    import image_pipeline
+
+    if not element.screens:
+        return
+
+    image_infos = screen_gallery_image_infos(element)
+    num_screens = len(image_infos)
+    gap = Emu(200000)  # 이미지 간격
+
     # 전체 너비 계산 및 시작 위치 중앙 정렬
     total_width = sum(info["width"] for info in image_infos) + (num_screens - 1) * gap
     start_x = left + (width - total_width) // 2
@@ -760,12 +912,17 @@ def add_screen_gallery(slide, data, left, top, width):
 
         if info["path"] and Path(info["path"]).exists():
             try:
-                pic = slide.shapes.add_picture(
-                    info["path"],
-                    x, y,
-                    width=img_width,
-                    height=img_height
-                )
+                # 박스 크기에 맞게 축소된(필요 시) 이미지 사용, 대체 텍스트는 원본 파일명 유지
+                with render_profile.span("image.prepare", "image"):
+                    image_path = image_pipeline.prepare_image(info["path"], img_width, img_height, images)
+                with render_profile.span("image.embed", "image"):
+                    pic = slide.shapes.add_picture(
+                        image_path,
+                        x, y,
+                        width=img_width,
+                        height=img_height
+                    )
+                pic._element.nvPicPr.cNvPr.set("descr", Path(info["path"]).name)
                 pic.line.color.rgb = RGBColor(0xE0, 0xE0, 0xE0)
                 pic.line.width = Pt(1)
             except Exception as e:
@@ -817,54 +974,514 @@ def add_screen_gallery(slide, data, left, top, width):
         current_x += img_width + gap
 
 
-def generate_presentation():
-    """메인 프레젠테이션 생성 함수"""
-    print("=" * 50)
-    print("PPTX 생성 시작")
-    print("=" * 50)
+def architecture_image_box(element):
+    """구성도 이미지의 슬라이드 위 크기 (width, height) EMU - 콘텐츠 영역에 비율 유지로 맞춤
+
+    이미지를 읽을 수 없으면 None.
+    """
+    import image_pipeline
+
+    image_path = element.source_path
+    if not Path(image_path).exists():
+        return None
+    try:
+        orig_width, orig_height = image_pipeline.probe_size(image_path)
+    except Exception:
+        return None
+
+    scale = min(int(ARCHITECTURE_MAX_WIDTH) / orig_width, int(TABLE_BOTTOM - CONTENT_TOP) / orig_height)
+    return Emu(int(orig_width * scale)), Emu(int(orig_height * scale))
+
+
+def add_architecture_diagram(slide, element, left, top, width, images=None):
+    """시스템 구성도 추가
+
+    layers/connections가 있으면 diagram 엔진의 배치를 네이티브 도형으로 그리고 (HTML/PNG와 같은 장면),
+    그 외에는 다이어그램 이미지를 콘텐츠 영역 가운데에 배치합니다 (HTML과 같은 이미지).
+    """
+    import image_pipeline
+
+    if element.declarative:
+        import diagram
+
+        diagram.to_pptx(slide, diagram.layout(element), left, top, min(width, ARCHITECTURE_MAX_WIDTH), TABLE_BOTTOM - top)
+        return
+
+    box = architecture_image_box(element)
+    if box is None:
+        print(f"    ⚠️  구성도 이미지 없음: {element.source_path}")
+        return
+
+    img_width, img_height = box
+    with render_profile.span("image.prepare", "image"):
+        image_path = image_pipeline.prepare_image(element.source_path, img_width, img_height, images)
+    with render_profile.span("image.embed", "image"):
+        pic = slide.shapes.add_picture(
+            image_path,
+            left + (width - img_width) // 2, top,
+            width=img_width,
+            height=img_height
+        )
+    pic._element.nvPicPr.cNvPr.set("descr", Path(element.source_path).name)
+
+
+# ==================== 템플릿 스냅샷 ====================
+# (템플릿 경로, mtime, 크기) -> 컴파일된 템플릿 바이트. 같은 프로세스에서 반복 빌드 시 디스크 I/O 생략
+_compiled_templates = {}
+# (템플릿 경로, mtime, 크기) -> 스냅샷을 파싱한 원본 Presentation (load_template()이 복사해서 내줌)
+_parsed_templates = {}
 
-    # 템플릿 로드
-    print(f"템플릿 로드: {TEMPLATE_PATH}")
-    prs = Presentation(str(TEMPLATE_PATH))
 
-    # 기존 슬라이드 삭제 (템플릿 샘플 슬라이드)
+def _template_key(template_path):
+    stat = template_path.stat()
+    return (str(template_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _purge_sample_slides(prs):
+    """템플릿 샘플 슬라이드 제거"""
     while len(prs.slides) > 0:
         rId = prs.slides._sldIdLst[0].rId
         prs.part.drop_rel(rId)
         del prs.slides._sldIdLst[0]
 
-    # 콘텐츠 로드
-    print(f"콘텐츠 로드: {CONTENT_PATH}")
-    content = load_content()
 
-    slides_data = content.get("presentation", {}).get("slides", [])
+def compile_template(template_path=None):
+    """샘플 슬라이드를 제거한 템플릿 스냅샷(.pptx 바이트) 반환
 
-    # 슬라이드 생성
-    for slide_data in slides_data:
-        slide_num = slide_data.get("slide_number", 0)
-        layout_id = slide_data.get("layout_id", 4)
+    스냅샷은 템플릿 내용의 SHA-256으로 키를 잡아 CACHE_DIR/templates 아래에 저장되며,
+    템플릿이 바뀌지 않는 한 샘플 슬라이드와 그 노트/미디어를 다시 파싱하지 않습니다.
+    """
+    template_path = Path(template_path or TEMPLATE_PATH)
+    memo_key = _template_key(template_path)
+    if memo_key in _compiled_templates:
+        return _compiled_templates[memo_key]
 
-        print(f"  슬라이드 {slide_num} 생성 (layout_id: {layout_id})")
+    template_bytes = template_path.read_bytes()
+    digest = hashlib.sha256(template_bytes)
+    digest.update(f"v{TEMPLATE_SNAPSHOT_VERSION}".encode())
+    snapshot_path = CACHE_DIR / "templates" / f"{digest.hexdigest()[:32]}.pptx"
 
+    if snapshot_path.exists():
+        compiled = snapshot_path.read_bytes()
+    else:
+        print(f"템플릿 스냅샷 생성: {snapshot_path.name}")
+        prs = Presentation(BytesIO(template_bytes))
+        _purge_sample_slides(prs)
+        buffer = BytesIO()
+        prs.save(buffer)
+        compiled = buffer.getvalue()
+
+        # 동시에 실행된 빌드가 반쯤 쓰인 파일을 읽지 않도록 임시 파일 후 교체
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(compiled)
+        os.replace(tmp_path, snapshot_path)
+
+    _compiled_templates[memo_key] = compiled
+    return compiled
+
+
+def load_template():
+    """샘플 슬라이드가 제거된 템플릿 Presentation 로드
+
+    스냅샷은 프로세스당 한 번만 파싱해 두고, 호출마다 그 객체 그래프(파트 XML 트리 포함)를 deepcopy해
+    돌려줍니다. lxml 트리 복사는 zip 해제 + XML 재파싱보다 훨씬 싸서, 감시 모드/일괄 생성 워커/빌드
+    그래프처럼 한 프로세스에서 반복 빌드할 때 템플릿 로드가 약 15ms(원본 로드 + 샘플 슬라이드 제거)에서
+    4ms로 줄어듭니다. 한 번만 빌드하는 실행은 스냅샷 파싱(약 13ms)에 복사 한 번(약 4ms)이 더해집니다.
+    """
+    template_path = Path(TEMPLATE_PATH)
+    memo_key = _template_key(template_path)
+    parsed = _parsed_templates.get(memo_key)
+    if parsed is None:
+        parsed = _parsed_templates[memo_key] = Presentation(BytesIO(compile_template(template_path)))
+    return copy.deepcopy(parsed)
+
+
+def render_slide(prs, slide_data, images=None):
+    """slide_data(content_model.Slide)의 layout_id에 맞는 슬라이드를 prs에 추가
+
+    images는 plan_deck_images()가 만든 덱의 이미지 계획 (없으면 이미지는 자기 박스 기준으로 축소)
+    """
+    slide_num = slide_data.number
+    layout_id = slide_data.layout_id
+
+    print(f"  슬라이드 {slide_num} 생성 (layout_id: {layout_id})")
+
+    with render_profile.span(f"slide {slide_num}", "slide", slide_number=slide_num, layout_id=layout_id):
         if layout_id == 1:
-            add_title_slide(prs, slide_data)
+            return add_title_slide(prs, slide_data)
         elif layout_id == 2:
-            add_toc_slide(prs, slide_data)
+            return add_toc_slide(prs, slide_data)
         elif layout_id == 4:
-            add_content_slide_layout4(prs, slide_data)
+            return add_content_slide_layout4(prs, slide_data, images)
         elif layout_id == 5:
-            add_content_slide_layout5(prs, slide_data)
+            return add_content_slide_layout5(prs, slide_data)
         else:
             # 기본적으로 layout 4 사용
-            add_content_slide_layout4(prs, slide_data)
+            return add_content_slide_layout4(prs, slide_data, images)
+
+
+# ==================== 병렬 렌더링 ====================
+# 워커에 한 번에 넘기는 슬라이드 수 상한 (작은 덱은 워커 수 * 4개 묶음으로 나눔)
+PARALLEL_CHUNK_SLIDES = 16
+
+_worker_prs = None
+_worker_images = None
+
+
+def _init_render_worker(element_backends, images):
+    """워커 프로세스 초기화 - 템플릿은 워커당 한 번만 로드, 이미지 계획은 빌드의 것을 그대로 받음"""
+    global _worker_prs, _worker_images
+    _worker_prs = load_template()
+    _worker_images = images
+    ELEMENT_BACKENDS.clear()
+    ELEMENT_BACKENDS.update(element_backends)
+
+
+def _render_chunk(slides_chunk):
+    """워커: 슬라이드 묶음을 렌더링해 독립 슬라이드 파트 레코드로 반환"""
+    from slide_parts import detach_last_slide, export_slide
+
+    prs = _worker_prs
+    records = []
+    for slide_data in slides_chunk:
+        slide = render_slide(prs, slide_data, _worker_images)
+        records.append(export_slide(prs, slide))
+
+        # 워커의 Presentation은 재사용하므로 방금 만든 슬라이드는 바로 떼어냄
+        detach_last_slide(prs)
+    return records
+
+
+def _submit_bounded(pool, fn, items, limit):
+    """items를 fn으로 pool에 제출하되 결과를 기다리는 작업은 limit개까지만 두고, 결과를 제출 순서대로 내보내는 제너레이터
+
+    Executor.map()은 모든 작업을 한꺼번에 제출하므로 소비가 느리면 끝난 결과가 future에 쌓입니다.
+    """
+    from collections import deque
+
+    items = iter(items)
+    pending = deque(pool.submit(fn, item) for item in itertools.islice(items, limit))
+    while pending:
+        result = pending.popleft().result()
+        # 결과를 내보내기 전에 다음 작업을 제출해 워커가 쉬지 않게 함
+        for item in itertools.islice(items, 1):
+            pending.append(pool.submit(fn, item))
+        yield result
+
+
+def render_slides_parallel(slides_data, jobs, images=None):
+    """슬라이드를 jobs개 프로세스에서 렌더링해 원래 순서대로 슬라이드 파트 레코드를 내보내는 제너레이터
+
+    실행 중이거나 끝나고 소비를 기다리는 묶음은 jobs * 2개까지만 두므로, 스트리밍 저장(--stream)과 함께
+    쓰면 메모리에 있는 슬라이드 레코드가 덱 크기와 무관하게 jobs * 2 * PARALLEL_CHUNK_SLIDES장 이하입니다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    # 워커 간 부하 분산을 위해 워커 수보다 잘게 나누고, 큰 덱에서도 묶음 하나가 커지지 않게 제한
+    chunk_size = max(1, min(-(-len(slides_data) // (jobs * 4)), PARALLEL_CHUNK_SLIDES))
+    chunks = [slides_data[i:i + chunk_size] for i in range(0, len(slides_data), chunk_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_render_worker, initargs=(dict(ELEMENT_BACKENDS), images)
+    ) as pool:
+        for chunk_records in _submit_bounded(pool, _render_chunk, chunks, jobs * 2):
+            yield from chunk_records
+
+
+# ==================== 증분 빌드 ====================
+# 슬라이드 렌더링 결과를 좌우하는 모듈 (generator_version에 해시로 들어감)
+GENERATOR_SOURCES = ("generate_pptx.py", "content_model.py", "slide_parts.py", "image_pipeline.py", "drawingml.py")
+
+# (소스/템플릿 파일 stat 서명, 버전) - 같은 프로세스에서 파일이 바뀌면(감시 모드) 다시 계산
+_generator_version = None
+
+
+def generator_version():
+    """생성기 코드 버전 - 렌더링 코드나 템플릿이 바뀌면 모든 슬라이드 지문이 달라지도록 소스 해시 사용"""
+    global _generator_version
+    paths = [BASE_DIR / module_name for module_name in GENERATOR_SOURCES] + [Path(TEMPLATE_PATH)]
+    signature = tuple((str(path), stat.st_size, stat.st_mtime_ns) for path, stat in ((p, p.stat()) for p in paths))
+    if _generator_version is None or _generator_version[0] != signature:
+        digest = hashlib.sha256()
+        for module_path in paths[:-1]:
+            digest.update(module_path.read_bytes())
+        digest.update(compile_template())
+        _generator_version = (signature, digest.hexdigest())
+    return _generator_version[1]
+
+
+def slide_fingerprint(slide_data, images=None):
+    """슬라이드 지문: slide_data + 참조 이미지 파일 상태 + 생성기 버전
+
+    images(ImagePlan)를 주면 이미지별 계획된 박스도 넣습니다. 다른 슬라이드가 같은 이미지를 더 크게
+    쓰게 되면 축소본이 바뀌므로, 이 슬라이드도 다시 렌더링되어 전체 빌드와 같은 바이트가 됩니다.
+    """
+    import image_pipeline
+
+    digest = hashlib.sha256(generator_version().encode())
+    digest.update(json.dumps(slide_data.to_plain(), sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    for image_path in slide_data.image_paths():
+        try:
+            stat = os.stat(image_path)
+            digest.update(f"{image_path}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+            if images is not None:
+                digest.update(repr(images.box(image_pipeline.probe_image(image_path)["sha1"])).encode("utf-8"))
+        except OSError:
+            digest.update(f"{image_path}:missing".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _manifest_path(output_path):
+    """출력 파일별 증분 빌드 매니페스트 경로"""
+    key = hashlib.sha256(str(Path(output_path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / "incremental" / f"{key}.json"
+
+
+def load_reusable_slides(output_path, fingerprints, layout_partnames=None):
+    """이전 출력에서 지문이 같은 슬라이드 레코드를 찾아 {새 슬라이드 순번: 레코드} 반환
+
+    재사용할 슬라이드의 파트와 미디어만 읽으므로 몇 장만 재사용할 때 이전 덱 전체를 메모리에 올리지 않습니다.
+    이전 출력이 매니페스트 기록 이후 바뀌었거나 없으면 빈 dict를 반환해 전체 빌드로 돌아갑니다.
+    """
+    from slide_parts import iter_slide_records
+
+    manifest_path = _manifest_path(output_path)
+    if not manifest_path.exists() or not Path(output_path).exists():
+        return {}
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    stat = Path(output_path).stat()
+    if manifest.get("output") != {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}:
+        print("  이전 출력이 매니페스트와 다름 - 전체 빌드")
+        return {}
+
+    previous = {fp: i for i, fp in enumerate(manifest.get("slides", []))}
+    wanted = {i: previous[fp] for i, fp in enumerate(fingerprints) if fp in previous}
+    if not wanted:
+        return {}
+
+    records = dict(iter_slide_records(output_path, layout_partnames, indices=set(wanted.values())))
+    return {i: records[old_i] for i, old_i in wanted.items()}
+
+
+def save_manifest(output_path, fingerprints):
+    """증분 빌드 매니페스트 저장"""
+    stat = Path(output_path).stat()
+    manifest_path = _manifest_path(output_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "output_path": str(output_path),
+            "output": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+            "slides": fingerprints,
+        }, f, indent=2)
+
+
+def generate_presentation(content_path=None, output_path=None, jobs=1, incremental=False, stream=False,
+                          fast_elements=None, profile=None, optimize=None, deck=None):
+    """메인 프레젠테이션 생성 함수
+
+    stream=True이면 완성된 슬라이드를 바로 zip에 기록하고 버려(pptx_stream) 슬라이드 수와 무관하게
+    메모리 사용량이 거의 일정합니다. fast_elements로 지정한 요소 타입은 DrawingML 백엔드로
+    렌더링합니다. profile에 경로를 주면 구간별 시간/할당량을 Chrome trace JSON으로 저장하고
+    요약 표와 zip 바이트 기여도를 출력합니다. optimize에 deflate 압축 수준(0-9)을 주면 저장 후
+    pptx_optimize로 템플릿 부속물(OLE, 노트/유인물 마스터, 썸네일, 미사용 레이아웃)을 제거합니다.
+    이미 읽은 content_model.Deck을 deck으로 주면 content_path를 다시 읽지 않습니다.
+    생성한 슬라이드 수를 반환합니다.
+    """
+    if fast_elements is not None:
+        set_element_backends(fast_elements)
+
+    content_path = Path(content_path or CONTENT_PATH)
+    output_path = Path(output_path or OUTPUT_PATH)
+
+    if not profile:
+        return _build_presentation(content_path, output_path, jobs, incremental, stream, optimize, deck)
+
+    if jobs > 1:
+        # 워커 프로세스 안의 구간은 기록되지 않으므로 프로파일링은 직렬로 실행
+        print("프로파일링: 직렬 렌더링으로 실행 (--jobs 무시)")
+    profiler = render_profile.RenderProfiler()
+    render_profile.activate(profiler)
+    try:
+        with render_profile.span("generate_presentation", "total"):
+            slide_count = _build_presentation(content_path, output_path, 1, incremental, stream, optimize, deck)
+    finally:
+        render_profile.deactivate()
+
+    profiler.write_trace(profile)
+    print(f"\n프로파일 trace: {profile}")
+    print(profiler.format_summary())
+    print()
+    print(render_profile.format_zip_contributions(output_path))
+    return slide_count
+
+
+def _build_presentation(content_path, output_path, jobs, incremental, stream, optimize=None, deck=None):
+    """generate_presentation() 본체 - 생성한 슬라이드 수 반환"""
+    from slide_parts import detach_last_slide, export_slide, import_slide
+
+    print("=" * 50)
+    print("PPTX 생성 시작")
+    print("=" * 50)
+
+    # 템플릿 로드
+    print(f"템플릿 로드: {TEMPLATE_PATH}")
+    with render_profile.span("template.load", "io"):
+        prs = load_template()
+
+    # 콘텐츠 로드
+    if deck is None:
+        print(f"콘텐츠 로드: {content_path}")
+        with render_profile.span("content.load", "io"):
+            deck = content_model.load_deck(content_path)
+    errors = deck.errors
+    if errors:
+        # 숫자 자리의 문자열 등은 렌더링 도중 TypeError로 끝나므로 슬라이드를 만들기 전에 중단
+        for issue in errors:
+            print(f"{content_path}: {issue}")
+        print(f"❌ 검증 오류 {len(errors)}건 - PPTX를 만들지 않음")
+        raise content_schema.ValidationError(errors)
+    if deck.issues:
+        print(f"콘텐츠 검증: 경고 {len(deck.issues)} (자세히: cli.py validate)")
+
+    slides_data = deck.slides
+
+    # 넘치는 표는 이어지는 슬라이드로 분할
+    paginated = paginate_tables(slides_data)
+    if len(paginated) != len(slides_data):
+        print(f"표 분할: 이어지는 슬라이드 {len(paginated) - len(slides_data)}장 추가")
+        slides_data = paginated
+
+    # 이미지 크기 병렬 조회 및 이 덱의 축소본 크기 계획 (렌더링과 워커에 그대로 넘김)
+    images = plan_deck_images(slides_data)
+
+    # 증분 빌드: 지문이 같은 슬라이드는 이전 출력에서 그대로 복사
+    fingerprints = None
+    reused = {}
+    if incremental:
+        with render_profile.span("incremental.lookup", "io"):
+            fingerprints = [slide_fingerprint(slide_data, images) for slide_data in slides_data]
+            # 이전 출력은 미사용 레이아웃이 제거(--optimize)되었을 수 있으므로 템플릿 partname 기준으로 매칭
+            layout_partnames = [layout.part.partname for layout in prs.slide_layouts]
+            reused = load_reusable_slides(output_path, fingerprints, layout_partnames)
+        print(f"증분 빌드: {len(reused)}/{len(slides_data)} 슬라이드 재사용")
+
+    dirty = [i for i in range(len(slides_data)) if i not in reused]
+
+    # 병렬 렌더링 결과는 슬라이드 순서대로 소비 (dirty는 오름차순)
+    rendered = None
+    if jobs > 1 and len(dirty) > 1:
+        print(f"병렬 렌더링: 워커 {jobs}개")
+        rendered = render_slides_parallel([slides_data[i] for i in dirty], jobs, images)
+
+    writer = None
+    if stream:
+        from pptx_stream import StreamingPptxWriter
+        print(f"스트리밍 저장: {output_path}")
+        writer = StreamingPptxWriter(str(output_path), prs)
+
+    # 슬라이드 생성
+    for i, slide_data in enumerate(slides_data):
+        if i in reused:
+            record = reused.pop(i)
+        elif rendered is not None:
+            record = next(rendered)
+        elif writer is not None:
+            slide = render_slide(prs, slide_data, images)
+            record = export_slide(prs, slide)
+            detach_last_slide(prs)
+        else:
+            render_slide(prs, slide_data, images)
+            continue
+
+        with render_profile.span("slide.write" if writer is not None else "slide.import", "io"):
+            if writer is not None:
+                writer.add_slide(record)
+            else:
+                import_slide(prs, record)
 
     # 저장
-    print(f"\n저장: {OUTPUT_PATH}")
-    prs.save(str(OUTPUT_PATH))
+    with render_profile.span("save", "io"):
+        if writer is not None:
+            writer.close()
+        else:
+            print(f"\n저장: {output_path}")
+            prs.save(str(output_path))
+    if optimize is not None:
+        from pptx_optimize import format_report, optimize_pptx
+        with render_profile.span("optimize", "io"):
+            report = optimize_pptx(output_path, compresslevel=optimize)
+        print(format_report(report))
+    if fingerprints is not None:
+        save_manifest(output_path, fingerprints)
     print("=" * 50)
     print("PPTX 생성 완료!")
     print("=" * 50)
+    return len(slides_data)
+
+
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="공조설비 정보관리 시스템 사전 설명회 PPTX 생성기")
+    parser.add_argument(
+        "-c", "--content", type=Path, default=CONTENT_PATH,
+        help=f"콘텐츠 JSON 경로 (기본값: {CONTENT_PATH.name})"
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=OUTPUT_PATH,
+        help=f"출력 PPTX 경로 (기본값: {OUTPUT_PATH.name})"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="슬라이드 렌더링 워커 프로세스 수 (기본값: 1, 직렬)"
+    )
+    parser.add_argument(
+        "-i", "--incremental", action="store_true",
+        help="내용이 바뀐 슬라이드만 다시 렌더링하고 나머지는 이전 출력에서 복사"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="슬라이드를 완성되는 대로 파일에 기록 (대용량 덱의 메모리 사용량 제한)"
+    )
+    parser.add_argument(
+        "--fast-elements", metavar="TYPES", default=None,
+        type=lambda value: [item.strip() for item in value.split(",") if item.strip()],
+        help="DrawingML 백엔드로 렌더링할 요소 타입 (쉼표 구분 또는 all, "
+             "예: icon_box_grid,timeline)"
+    )
+    parser.add_argument(
+        "--profile", metavar="TRACE_JSON", nargs="?", type=Path, default=None,
+        const=Path("render_profile.trace.json"),
+        help="구간별 시간/할당량을 Chrome trace JSON으로 저장하고 요약 표와 zip 바이트 기여도 출력 "
+             "(기본 경로: render_profile.trace.json)"
+    )
+    parser.add_argument(
+        "--optimize", metavar="LEVEL", nargs="?", type=int, default=None, const=9, choices=range(0, 10),
+        help="저장 후 템플릿 부속물(OLE, 노트/유인물 마스터, 썸네일, 미사용 레이아웃)을 제거하고 "
+             "중복 미디어를 합쳐 다시 압축 (LEVEL: deflate 수준 0-9, 기본값 9)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """명령행 실행 - 콘텐츠에 검증 오류가 있으면 PPTX를 만들지 않고 1 반환"""
+    args = parse_args(argv)
+    try:
+        generate_presentation(
+            args.content, args.output,
+            jobs=args.jobs, incremental=args.incremental, stream=args.stream,
+            fast_elements=args.fast_elements, profile=args.profile, optimize=args.optimize
+        )
+    except content_schema.ValidationError:
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    generate_presentation()
+    sys.exit(main())
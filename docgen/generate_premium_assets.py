@@ -94,11 +94,28 @@ SVG_CONTENT = """
 </svg>
 """
 
-def main():
-    os.makedirs('docgen', exist_ok=True)
-    with open('docgen/system_architecture_premium.svg', 'w', encoding='utf-8') as f:
+SVG_PATH = os.path.join('docgen', 'system_architecture_premium.svg')
+PNG_PATH = os.path.join('docgen', 'system_architecture_premium.png')
+PNG_SCALES = (1, 2, 4)  # PNG_PATH, name@2x.png, name@4x.png
+
+def main(svg_path=SVG_PATH, png_path=PNG_PATH, scales=PNG_SCALES):
+    os.makedirs(os.path.dirname(svg_path) or '.', exist_ok=True)
+    with open(svg_path, 'w', encoding='utf-8') as f:
         f.write(SVG_CONTENT)
     print("Premium Architecture SVG generated.")
+    written = [svg_path]
+    if not png_path:
+        return written
+
+    # Gradients and blur shadows need the numpy rasterizer; without numpy only the SVG is written.
+    try:
+        import svg_raster
+    except ImportError:
+        print("numpy not installed - skipped premium PNG rasterization.")
+        return written
+    written += svg_raster.render_pngs(SVG_CONTENT, png_path, scales)
+    print(f"Premium Architecture PNG generated at {', '.join(map(str, written[1:]))}")
+    return written
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+오프라인 HTML 번들 (generate_html.py --bundle)
+
+기본 HTML은 Tailwind JIT 런타임, Google Fonts, Font Awesome, animate.css를 CDN에서 받아 오므로
+네트워크가 없으면 렌더링되지 않고, 현장 태블릿에서는 JIT 컴파일 때문에 느립니다. 번들 모드는
+문서를 두 번 스트리밍합니다. 첫 번째는 실제로 쓰인 클래스/아이콘/글자만 수집하고, 두 번째는
+CDN 참조를 빼고 그 결과로 만든 스타일시트를 넣어 기록합니다.
+
+- CSS: 쓰인 Tailwind 유틸리티만 직접 생성 (UTILITY_RULES, 생성기가 쓰는 클래스 범위)하고,
+  preflight와 animate.css 키프레임도 쓰인 것만 포함
+- 아이콘: Font Awesome <i> 태그를 쓰인 아이콘의 인라인 SVG로 교체 (ICONS)
+- 글꼴: 한글 글꼴 파일(--font, DOCGEN_HTML_FONT, docgen/assets/fonts/)이 있고 fontTools가 설치되어
+  있으면 덱에 쓰인 글자만 남긴 서브셋을 포함. 없으면 설치된 시스템 글꼴을 사용
+- mode="inline"이면 한 파일에 모두 인라인, "files"면 내용 해시가 붙은 형제 파일(.css, .woff2)로 기록
+
+슬라이드 이미지는 원래대로 로컬 파일을 참조합니다.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import re
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+FONT_DIRS = (BASE_DIR / "assets" / "fonts",)
+FONT_ENV = "DOCGEN_HTML_FONT"
+FONT_FAMILY = "Pretendard"
+# 서브셋 글꼴이 없을 때 쓰는 한글 시스템 글꼴 순서
+FALLBACK_FONT_STACK = (
+    "'Pretendard', 'Inter', 'Apple SD Gothic Neo', 'Malgun Gothic', 'Noto Sans KR', 'Noto Sans CJK KR', sans-serif"
+)
+
+BUNDLE_MODES = ("inline", "files")
+
+# CDN 참조 줄 (번들에서는 제거)
+_CDN_LINE = re.compile(r"^[ \t]*<(?:script|link)[^>]*(?:cdn\.tailwindcss\.com|fonts\.googleapis\.com|cdnjs\.cloudflare\.com)[^>]*>(?:</script>)?[ \t]*\n", re.M)
+_CLASS_ATTR = re.compile(r"""class=(['"])(.*?)\1""")
+_ICON_TAG = re.compile(r"""<i class=(['"])fas fa-([a-z0-9-]+)\1></i>""")
+_TAG = re.compile(r"<[^>]*>")
+
+# ==================== Tailwind 유틸리티 ====================
+_COLORS = {
+    "white": "#ffffff",
+    "slate-50": "#f8fafc", "slate-100": "#f1f5f9", "slate-200": "#e2e8f0", "slate-300": "#cbd5e1",
+    "slate-400": "#94a3b8", "slate-500": "#64748b", "slate-600": "#475569", "slate-700": "#334155",
+    "slate-800": "#1e293b", "slate-900": "#0f172a",
+    "red-500": "#ef4444", "red-600": "#dc2626",
+    "green-600": "#16a34a",
+}
+_COLOR_PROPS = {"text": "color", "bg": "background-color", "border": "border-color"}
+
+_SPACING_PROPS = {
+    "p": ("padding",), "px": ("padding-left", "padding-right"), "py": ("padding-top", "padding-bottom"),
+    "pt": ("padding-top",), "pr": ("padding-right",), "pb": ("padding-bottom",), "pl": ("padding-left",),
+    "m": ("margin",), "mx": ("margin-left", "margin-right"), "my": ("margin-top", "margin-bottom"),
+    "mt": ("margin-top",), "mr": ("margin-right",), "mb": ("margin-bottom",), "ml": ("margin-left",),
+    "gap": ("gap",), "w": ("width",), "h": ("height",),
+}
+
+_FONT_SIZES = {
+    "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+    "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"),
+}
+
+_TRANSITION = "transition-timing-function:cubic-bezier(.4,0,.2,1);transition-duration:150ms"
+
+# 고정 클래스 -> 선언
+UTILITY_RULES = {
+    "flex": "display:flex",
+    "grid": "display:grid",
+    "relative": "position:relative",
+    "flex-col": "flex-direction:column",
+    "flex-grow": "flex-grow:1",
+    "flex-1": "flex:1 1 0%",
+    "items-center": "align-items:center",
+    "items-start": "align-items:flex-start",
+    "justify-center": "justify-content:center",
+    "justify-between": "justify-content:space-between",
+    "overflow-hidden": "overflow:hidden",
+    "h-full": "height:100%",
+    "h-auto": "height:auto",
+    "w-full": "width:100%",
+    "max-w-5xl": "max-width:64rem",
+    "text-left": "text-align:left",
+    "text-center": "text-align:center",
+    "text-right": "text-align:right",
+    "font-medium": "font-weight:500",
+    "font-bold": "font-weight:700",
+    "uppercase": "text-transform:uppercase",
+    "tracking-wider": "letter-spacing:.05em",
+    "leading-relaxed": "line-height:1.625",
+    "whitespace-pre-line": "white-space:pre-line",
+    "rounded-xl": "border-radius:.75rem",
+    "rounded-3xl": "border-radius:1.5rem",
+    "rounded-full": "border-radius:9999px",
+    "border-t-4": "border-top-width:4px",
+    "shadow-xl": "box-shadow:0 20px 25px -5px rgb(0 0 0/.1),0 8px 10px -6px rgb(0 0 0/.1)",
+    "shadow-2xl": "box-shadow:0 25px 50px -12px rgb(0 0 0/.25)",
+    "transition-colors": (
+        "transition-property:color,background-color,border-color,text-decoration-color,fill,stroke;" + _TRANSITION
+    ),
+}
+
+# 스타일 없이 구조/선택자용으로만 쓰는 클래스
+MARKER_CLASSES = {"group", "slide-title", "slide-src"}
+
+
+def _escape_class(name):
+    return re.sub(r"([^a-zA-Z0-9_-])", r"\\\1", name)
+
+
+def _utility_declarations(name):
+    """유틸리티 클래스 하나의 (선택자 접미사, 선언) - 모르는 클래스면 None"""
+    if name in UTILITY_RULES:
+        return "", UTILITY_RULES[name]
+
+    match = re.fullmatch(r"(p|px|py|pt|pr|pb|pl|m|mx|my|mt|mr|mb|ml|gap|w|h)-(\d+(?:\.5)?)", name)
+    if match:
+        size = float(match.group(2)) * 0.25
+        value = f"{size:g}rem" if size else "0px"
+        return "", ";".join(f"{prop}:{value}" for prop in _SPACING_PROPS[match.group(1)])
+
+    match = re.fullmatch(r"space-y-(\d+)", name)
+    if match:
+        return " > :not([hidden]) ~ :not([hidden])", f"margin-top:{int(match.group(1)) * 0.25:g}rem"
+
+    match = re.fullmatch(r"grid-cols-(\d+)", name)
+    if match:
+        return "", f"grid-template-columns:repeat({match.group(1)},minmax(0,1fr))"
+
+    match = re.fullmatch(r"col-span-(\d+)", name)
+    if match:
+        return "", f"grid-column:span {match.group(1)}/span {match.group(1)}"
+
+    match = re.fullmatch(r"max-h-\[(\d+px)\]", name)
+    if match:
+        return "", f"max-height:{match.group(1)}"
+
+    match = re.fullmatch(r"text-(lg|xl|[2-4]xl)", name)
+    if match:
+        size, line_height = _FONT_SIZES[match.group(1)]
+        return "", f"font-size:{size};line-height:{line_height}"
+
+    match = re.fullmatch(r"(text|bg|border)-(white|[a-z]+-\d+)", name)
+    if match and match.group(2) in _COLORS:
+        return "", f"{_COLOR_PROPS[match.group(1)]}:{_COLORS[match.group(2)]}"
+    return None
+
+
+def utility_css(classes):
+    """쓰인 클래스 중 Tailwind 유틸리티의 CSS와 모르는 클래스 집합 반환"""
+    rules = []
+    unknown = set()
+    for name in sorted(classes - MARKER_CLASSES):
+        selector_prefix = ""
+        utility = name
+        if name.startswith("group-hover:"):
+            selector_prefix = ".group:hover "
+            utility = name[len("group-hover:"):]
+        result = _utility_declarations(utility)
+        if result is None:
+            unknown.add(name)
+            continue
+        suffix, declarations = result
+        rules.append(f"{selector_prefix}.{_escape_class(name)}{suffix}{{{declarations}}}")
+    return "\n".join(rules), unknown
+
+
+# Tailwind preflight 중 슬라이드 마크업에 영향을 주는 부분 - :where()로 명시도 0이라 템플릿 스타일이 항상 우선
+PREFLIGHT_CSS = """\
+:where(*,::before,::after){box-sizing:border-box;border:0 solid #e5e7eb}
+:where(html){line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4}
+:where(body){margin:0;line-height:inherit}
+:where(h1,h2,h3,h4,h5,h6){font-size:inherit;font-weight:inherit}
+:where(h1,h2,h3,h4,h5,h6,p,ul,ol,figure){margin:0}
+:where(ul,ol){list-style:none;padding:0}
+:where(b,strong){font-weight:bolder}
+:where(table){text-indent:0;border-color:inherit;border-collapse:collapse}
+:where(button){font-family:inherit;font-size:100%;line-height:inherit;color:inherit;margin:0;padding:0;background-color:transparent;cursor:pointer}
+:where(img,svg){display:block;vertical-align:middle}
+:where(img){max-width:100%;height:auto}"""
+
+# ==================== animate.css ====================
+ANIMATE_BASE_CSS = ".animate__animated{animation-duration:1s;animation-fill-mode:both}"
+ANIMATIONS = {
+    "zoomIn": "from{opacity:0;transform:scale3d(.3,.3,.3)}50%{opacity:1}",
+    "fadeIn": "from{opacity:0}to{opacity:1}",
+    "fadeInDown": "from{opacity:0;transform:translate3d(0,-100%,0)}to{opacity:1;transform:translate3d(0,0,0)}",
+    "fadeInUp": "from{opacity:0;transform:translate3d(0,100%,0)}to{opacity:1;transform:translate3d(0,0,0)}",
+}
+
+
+def animation_css(classes):
+    """쓰인 animate__* 클래스의 CSS와 모르는 애니메이션 집합 반환"""
+    used = sorted(name[len("animate__"):] for name in classes if name.startswith("animate__"))
+    if not used:
+        return "", set()
+    rules = [ANIMATE_BASE_CSS]
+    unknown = set()
+    for name in used:
+        if name == "animated":
+            continue
+        if name not in ANIMATIONS:
+            unknown.add(f"animate__{name}")
+            continue
+        rules.append(f"@keyframes {name}{{{ANIMATIONS[name]}}}.animate__{name}{{animation-name:{name}}}")
+    return "\n".join(rules), unknown
+
+
+# ==================== 아이콘 ====================
+_SVG_OPEN = (
+    '<svg class="icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" '
+    'stroke-linecap="round" stroke-linejoin="round" aria-hidden="true">'
+)
+# Font Awesome 아이콘 이름 -> SVG 내용 (24x24, 선 아이콘)
+ICONS = {
+    "chevron-left": '<polyline points="15 18 9 12 15 6"/>',
+    "chevron-right": '<polyline points="9 18 15 12 9 6"/>',
+    "circle-nodes": (
+        '<circle cx="12" cy="5" r="3"/><circle cx="5" cy="19" r="3"/><circle cx="19" cy="19" r="3"/>'
+        '<path d="M10.6 7.7 6.4 16.3M13.4 7.7l4.2 8.6M8 19h8"/>'
+    ),
+    "triangle-exclamation": '<path d="M10.3 3.9 1.8 18a2 2 0 0 0 1.7 3h17a2 2 0 0 0 1.7-3L13.7 3.9a2 2 0 0 0-3.4 0z"/><path d="M12 9v4M12 17h.01"/>',
+}
+ICON_CSS = ".icon{display:inline-block;width:1em;height:1em;vertical-align:-.125em}\n.grid-icon .icon{color:#0ea5e9}"
+
+
+def _replace_icons(fragment):
+    def replace(match):
+        body = ICONS.get(match.group(2))
+        return match.group(0) if body is None else f"{_SVG_OPEN}{body}</svg>"
+    return _ICON_TAG.sub(replace, fragment)
+
+
+# ==================== 글꼴 서브셋 ====================
+def find_font(font_path=None):
+    """서브셋할 한글 글꼴 파일 - 인자, 환경 변수, docgen/assets/fonts/ 순으로 찾고 없으면 None"""
+    if font_path:
+        return Path(font_path)
+    if os.environ.get(FONT_ENV):
+        return Path(os.environ[FONT_ENV])
+    for font_dir in FONT_DIRS:
+        if font_dir.is_dir():
+            for pattern in ("*.woff2", "*.otf", "*.ttf"):
+                matches = sorted(font_dir.glob(pattern))
+                if matches:
+                    return matches[0]
+    return None
+
+
+def subset_font(font_path, text):
+    """text에 쓰인 글자만 남긴 글꼴 바이트와 형식("woff2"/"woff") 반환 - fontTools가 없으면 None"""
+    try:
+        from fontTools import subset
+    except ImportError:
+        return None
+
+    try:
+        import brotli  # noqa: F401 - fontTools의 woff2 압축에 필요
+        flavor = "woff2"
+    except ImportError:
+        flavor = "woff"
+
+    options = subset.Options()
+    options.flavor = flavor
+    options.layout_features = ["*"]
+    font = subset.load_font(str(font_path), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    subset.save_font(font, buffer, options)
+    return buffer.getvalue(), flavor
+
+
+def font_face_css(src):
+    return (
+        f"@font-face{{font-family:'{FONT_FAMILY}';src:{src};font-weight:100 900;font-display:swap}}"
+    )
+
+
+# ==================== 번들 작성 ====================
+class _Usage:
+    """첫 번째 스트리밍 패스에서 수집한 클래스/아이콘/글자"""
+
+    __slots__ = ("classes", "icons", "chars")
+
+    def __init__(self):
+        self.classes = set()
+        self.icons = set()
+        self.chars = set()
+
+    def scan(self, fragment):
+        for match in _CLASS_ATTR.finditer(fragment):
+            self.classes.update(match.group(2).split())
+        self.icons.update(match.group(2) for match in _ICON_TAG.finditer(fragment))
+        self.chars.update(_TAG.sub("", fragment))
+
+
+def _hashed_name(output_path, suffix, data):
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    return f"{output_path.stem}.{digest}{suffix}"
+
+
+def write_bundle(deck, output_html, base_dir=None, mode="inline", font_path=None, images=None):
+    """CDN 없이 열리는 HTML 작성 - 요약 dict 반환 (css/font 크기, 모르는 클래스, 추가로 쓴 파일)"""
+    import generate_html
+
+    if mode not in BUNDLE_MODES:
+        raise ValueError(f"알 수 없는 번들 모드: {mode} ({', '.join(BUNDLE_MODES)})")
+    output_html = Path(output_html)
+    output_html.parent.mkdir(parents=True, exist_ok=True)
+
+    usage = _Usage()
+    for fragment in generate_html.iter_html(deck, base_dir, images):
+        usage.scan(fragment)
+
+    # FA 아이콘 클래스(fas, fa-*)는 SVG로 바뀌므로 CSS 대상에서 제외
+    classes = {name for name in usage.classes if name != "fas" and not name.startswith("fa-")}
+    # 템플릿 <style>에 정의된 클래스 (slide, glass-card 등)
+    template_classes = {
+        name for name in classes if re.search(rf"\.{re.escape(name)}(?![\w-])", generate_html.HTML_TEMPLATE)
+    }
+    utilities, unknown = utility_css(classes - template_classes)
+    animations, unknown_animations = animation_css(classes)
+    unknown = (unknown - {name for name in classes if name.startswith("animate__")}) | unknown_animations
+    missing_icons = sorted(usage.icons - set(ICONS))
+
+    extra_files = []
+    css_parts = [PREFLIGHT_CSS]
+    font_bytes = 0
+    font_file = find_font(font_path)
+    subset = subset_font(font_file, "".join(sorted(usage.chars))) if font_file and font_file.exists() else None
+    if subset is not None:
+        data, flavor = subset
+        font_bytes = len(data)
+        if mode == "inline":
+            src = f"url(data:font/{flavor};base64,{base64.b64encode(data).decode('ascii')}) format('{flavor}')"
+        else:
+            font_name = _hashed_name(output_html, f".{flavor}", data)
+            (output_html.parent / font_name).write_bytes(data)
+            extra_files.append(font_name)
+            src = f"url('{font_name}') format('{flavor}')"
+        css_parts.append(font_face_css(src))
+    css_parts.append(f"body{{font-family:{FALLBACK_FONT_STACK}}}")
+    css_parts.extend(part for part in (ICON_CSS if usage.icons else "", animations, utilities) if part)
+    css = "\n".join(css_parts) + "\n"
+
+    if mode == "inline":
+        style_tag = f"<style>\n{css}</style>"
+    else:
+        css_name = _hashed_name(output_html, ".css", css.encode("utf-8"))
+        (output_html.parent / css_name).write_text(css, encoding="utf-8")
+        extra_files.append(css_name)
+        style_tag = f'<link rel="stylesheet" href="{css_name}">'
+
+    with open(output_html, "w", encoding="utf-8", buffering=generate_html.WRITE_BUFFER_SIZE) as f:
+        for i, fragment in enumerate(generate_html.iter_html(deck, base_dir, images)):
+            if i == 0:
+                # 첫 조각은 템플릿 head - CDN 참조를 빼고 번들 스타일을 템플릿 스타일 뒤에 넣음
+                fragment = _CDN_LINE.sub("", fragment).replace("</head>", f"    {style_tag}\n</head>", 1)
+            f.write(_replace_icons(fragment))
+
+    return {
+        "css_bytes": len(css.encode("utf-8")),
+        "font": str(font_file) if subset is not None else None,
+        "font_bytes": font_bytes,
+        "glyphs": len(usage.chars),
+        "unknown_classes": sorted(unknown),
+        "missing_icons": missing_icons,
+        "files": extra_files,
+    }
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+스크린샷 이미지 파이프라인
+
+add_screen_gallery() 앞단에서 다음을 처리합니다.
+- 크기 조회: 덱 전체 이미지의 헤더만 읽어 크기를 병렬로 조회하고 디스크에 캐시
+- 리샘플링: 슬라이드 위 EMU 박스에 필요한 픽셀 밀도(IMAGE_TARGET_DPI)까지만 축소
+- 중복 제거: 덱에서 필요한 최대 크기로 원본 내용 해시당 축소본 하나만 만들어 같은 이미지는 같은
+  바이트가 되도록 함 (python-pptx는 같은 바이트의 이미지를 SHA1로 묶어 하나의 미디어 파트로 저장)
+  최대 크기는 빌드마다 새로 만드는 ImagePlan에 모으므로, 같은 프로세스에서 앞서 빌드한 덱
+  (일괄 생성, 감시 모드)의 크기가 다음 덱의 축소본에 섞이지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+IMAGE_CACHE_DIR = BASE_DIR / ".cache" / "images"
+PROBE_CACHE_PATH = IMAGE_CACHE_DIR / "probes.json"
+
+# 슬라이드에 배치된 크기 기준 목표 해상도 (프로젝터/모니터 표시에 충분한 밀도)
+IMAGE_TARGET_DPI = 200
+EMU_PER_INCH = 914400
+
+# 리샘플링 결과 형식 (원본 확장자 -> PIL 저장 형식)
+_SAVE_FORMATS = {
+    ".png": "PNG",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+}
+
+# (경로, 크기, mtime) -> {"size": [w, h], "sha1": ...}
+_probe_cache = None
+
+
+def _stat_key(image_path):
+    """캐시 키: 파일 내용이 바뀌면 달라지는 stat 서명"""
+    stat = os.stat(image_path)
+    return f"{os.path.abspath(image_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _load_probe_cache():
+    """디스크 캐시 로드 (프로세스당 한 번)"""
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = {}
+        if PROBE_CACHE_PATH.exists():
+            try:
+                with open(PROBE_CACHE_PATH, "r", encoding="utf-8") as f:
+                    _probe_cache = json.load(f)
+            except (OSError, ValueError):
+                _probe_cache = {}
+    return _probe_cache
+
+
+def _save_probe_cache():
+    """디스크 캐시 저장 (임시 파일 후 교체)"""
+    IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = PROBE_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_probe_cache, f)
+    os.replace(tmp_path, PROBE_CACHE_PATH)
+
+
+def _probe(image_path):
+    """이미지 헤더만 읽어 크기와 내용 해시 계산"""
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        size = list(img.size)
+
+    digest = hashlib.sha1()
+    with open(image_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return {"size": size, "sha1": digest.hexdigest()}
+
+
+def probe_image(image_path):
+    """이미지 정보 {"size": [w, h], "sha1": ...} 반환 (캐시 우선)"""
+    cache = _load_probe_cache()
+    key = _stat_key(image_path)
+    if key not in cache:
+        cache[key] = _probe(image_path)
+    return cache[key]
+
+
+def probe_size(image_path):
+    """이미지 픽셀 크기 (width, height)"""
+    width, height = probe_image(image_path)["size"]
+    return width, height
+
+
+def prefetch_images(image_paths, max_workers=8):
+    """덱에 쓰이는 이미지 크기를 병렬로 미리 조회해 캐시에 채움
+
+    존재하지 않거나 읽을 수 없는 파일은 건너뛰며, 실제 오류 처리는 사용하는 쪽에 맡깁니다.
+    """
+    cache = _load_probe_cache()
+
+    pending = {}
+    for image_path in set(image_paths):
+        try:
+            key = _stat_key(image_path)
+        except OSError:
+            continue
+        if key not in cache:
+            pending[key] = image_path
+
+    if not pending:
+        return
+
+    def probe_or_none(item):
+        key, image_path = item
+        try:
+            return key, _probe(image_path)
+        except Exception:
+            return key, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for key, info in pool.map(probe_or_none, pending.items()):
+            if info is not None:
+                cache[key] = info
+
+    _save_probe_cache()
+
+
+def target_pixels(width_emu, height_emu, dpi=IMAGE_TARGET_DPI):
+    """EMU 박스를 dpi로 채우는 데 필요한 픽셀 크기"""
+    return (
+        max(1, round(int(width_emu) / EMU_PER_INCH * dpi)),
+        max(1, round(int(height_emu) / EMU_PER_INCH * dpi)),
+    )
+
+
+class ImagePlan:
+    """덱 하나의 이미지별 최대 표시 크기 - 원본 내용 해시 -> EMU 박스 (width, height)
+
+    워커 프로세스로 넘길 수 있도록 dict 하나만 가집니다.
+    """
+
+    __slots__ = ("boxes",)
+
+    def __init__(self):
+        self.boxes = {}
+
+    def add(self, image_path, width_emu, height_emu):
+        """이미지가 덱에서 쓰일 표시 크기 등록 - prepare_image()는 등록된 최대 크기로 축소본을 만듦"""
+        sha1 = probe_image(image_path)["sha1"]
+        planned = self.boxes.get(sha1, (0, 0))
+        self.boxes[sha1] = (max(planned[0], int(width_emu)), max(planned[1], int(height_emu)))
+
+    def box(self, sha1):
+        """등록된 최대 박스 (없으면 (0, 0))"""
+        return self.boxes.get(sha1, (0, 0))
+
+
+def prepare_image(image_path, width_emu, height_emu, plan=None, dpi=IMAGE_TARGET_DPI):
+    """슬라이드에 넣을 이미지 경로 반환
+
+    원본이 목표 픽셀보다 크면 내용 해시와 목표 크기로 이름 붙인 축소본을 캐시에 만들어 반환하고,
+    이미 충분히 작거나 지원하지 않는 형식이면 원본 경로를 그대로 반환합니다. plan(ImagePlan)이 있으면
+    이 박스 대신 덱 전체에서 등록된 최대 박스를 기준으로 합니다.
+    """
+    suffix = Path(image_path).suffix.lower()
+    save_format = _SAVE_FORMATS.get(suffix)
+    if save_format is None:
+        return image_path
+
+    info = probe_image(image_path)
+    orig_width, orig_height = info["size"]
+
+    # 같은 이미지는 덱 전체에서 하나의 축소본(최대 표시 크기 기준)을 공유
+    planned_width, planned_height = plan.box(info["sha1"]) if plan is not None else (0, 0)
+    width, height = target_pixels(
+        max(int(width_emu), planned_width), max(int(height_emu), planned_height), dpi
+    )
+    if width >= orig_width or height >= orig_height:
+        return image_path
+
+    variant_path = IMAGE_CACHE_DIR / f"{info['sha1'][:20]}_{width}x{height}{suffix}"
+    if not variant_path.exists():
+        from PIL import Image
+
+        with Image.open(image_path) as img:
+            if save_format == "JPEG" and img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            resized = img.resize((width, height), Image.LANCZOS)
+
+        IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = variant_path.with_name(f"{variant_path.stem}.{os.getpid()}.tmp{suffix}")
+        if save_format == "JPEG":
+            resized.save(tmp_path, save_format, quality=88, optimize=True)
+        else:
+            resized.save(tmp_path, save_format, optimize=True)
+        os.replace(tmp_path, variant_path)
+
+    return str(variant_path)
+
+
+# ==================== HTML 이미지 변형 ====================
+# HTML 덱용 배율 (1x/2x) - 표시 크기(CSS px) 기준
+HTML_DENSITIES = (1, 2)
+HTML_CACHE_DIR = IMAGE_CACHE_DIR / "html"
+
+# 원본 확장자 -> WebP를 지원하지 않는 브라우저용 대체 형식
+_HTML_FALLBACK_FORMATS = {
+    ".png": ("png", "PNG"),
+    ".jpg": ("jpg", "JPEG"),
+    ".jpeg": ("jpg", "JPEG"),
+}
+
+
+def _html_variant(image_path, info, width, extension, save_format):
+    """원본을 width 폭으로 줄인 변형의 캐시 경로 - 원본 해시/폭/형식이 같으면 다시 만들지 않음"""
+    variant_path = HTML_CACHE_DIR / f"{info['sha1'][:20]}_{width}w.{extension}"
+    if variant_path.exists():
+        return variant_path
+
+    from PIL import Image
+
+    orig_width, orig_height = info["size"]
+    height = max(1, round(orig_height * width / orig_width))
+    with Image.open(image_path) as img:
+        if save_format == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        elif save_format == "WEBP" and img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+        resized = img if (width, height) == img.size else img.resize((width, height), Image.LANCZOS)
+
+        HTML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = variant_path.with_name(f"{variant_path.stem}.{os.getpid()}.tmp.{extension}")
+        if save_format == "WEBP":
+            resized.save(tmp_path, save_format, quality=82, method=6)
+        elif save_format == "JPEG":
+            resized.save(tmp_path, save_format, quality=85, optimize=True, progressive=True)
+        else:
+            resized.save(tmp_path, save_format, optimize=True)
+    os.replace(tmp_path, variant_path)
+    return variant_path
+
+
+def _publish(variant_path, output_dir):
+    """변형을 내용 해시 이름으로 output_dir에 복사 (같은 이름이 있으면 그대로 둠) - 파일 이름 반환"""
+    import shutil
+
+    digest = hashlib.sha256(variant_path.read_bytes()).hexdigest()[:16]
+    name = f"{digest}{variant_path.suffix}"
+    target = Path(output_dir) / name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{name}.{os.getpid()}.tmp")
+        shutil.copyfile(variant_path, tmp_path)
+        os.replace(tmp_path, target)
+    return name
+
+
+def html_image_variants(image_path, display_width, output_dir):
+    """HTML에서 display_width(CSS px)로 표시할 이미지의 배율별 WebP/대체 형식 변형 생성
+
+    변형은 원본보다 크게 만들지 않으며(같은 폭이 되는 배율은 하나로 합침), 캐시(HTML_CACHE_DIR)에
+    만든 뒤 내용 해시 이름으로 output_dir에 복사합니다. 지원하지 않는 형식이거나 읽을 수 없으면 None,
+    아니면 {"width", "height", "webp": [(파일 이름, 폭)], "fallback": [(파일 이름, 폭)]}을 반환합니다.
+    """
+    fallback = _HTML_FALLBACK_FORMATS.get(Path(image_path).suffix.lower())
+    if fallback is None:
+        return None
+    try:
+        info = probe_image(image_path)
+    except (OSError, ValueError):
+        return None
+
+    orig_width, orig_height = info["size"]
+    display_width = max(1, min(int(display_width), orig_width))
+    widths = sorted({min(orig_width, display_width * density) for density in HTML_DENSITIES})
+
+    variants = {"webp": [], "fallback": []}
+    for width in widths:
+        for key, (extension, save_format) in (("webp", ("webp", "WEBP")), ("fallback", fallback)):
+            variant_path = _html_variant(image_path, info, width, extension, save_format)
+            variants[key].append((_publish(variant_path, output_dir), width))
+
+    variants["width"] = display_width
+    variants["height"] = max(1, round(orig_height * display_width / orig_width))
+    return variants
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+PPTX 출력 크기 최적화
+
+생성된 덱은 PPT기본양식.pptx의 부속물을 그대로 싣고 있습니다. think-cell OLE 개체
+(embeddings/oleObject*.bin, drawings/vmlDrawing*.vml, 대체 이미지), 노트/유인물 마스터와 그 테마,
+docProps/thumbnail.jpeg, 어떤 슬라이드도 쓰지 않는 레이아웃 등입니다. optimize_pptx()는 저장된
+.pptx를 python-pptx 로드 없이 zip 수준에서 다시 써서 이를 제거합니다.
+
+- 썸네일, 유인물 마스터, (노트 슬라이드가 없으면) 노트 마스터 관계 제거
+- 슬라이드가 쓰지 않는 레이아웃과, 남은 레이아웃이 없는 마스터 제거
+- 마스터/레이아웃의 숨겨진 OLE 개체(graphicFrame)와 더 이상 참조되지 않는 관계 제거
+- 패키지 루트에서 관계로 도달할 수 없는 파트 제거
+- 바이트가 같은 미디어를 하나로 합침
+- XML/.rels를 지정한 압축 수준으로 다시 압축 (미디어는 원본 압축 방식 그대로)
+
+파트 이름은 바꾸지 않으므로 남은 슬라이드/레이아웃 경로는 원본과 같습니다.
+
+사용 예:
+    python docgen/pptx_optimize.py 덱.pptx
+    python docgen/pptx_optimize.py 덱.pptx -o 덱_최적화.pptx --level 6 --keep-layouts
+"""
+
+import argparse
+import hashlib
+import os
+import posixpath
+import sys
+import zipfile
+from pathlib import Path
+
+from lxml import etree
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+_OFFICE_RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+RT_THUMBNAIL = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail"
+RT_SLIDE_MASTER = _OFFICE_RT + "slideMaster"
+RT_SLIDE_LAYOUT = _OFFICE_RT + "slideLayout"
+RT_NOTES_SLIDE = _OFFICE_RT + "notesSlide"
+RT_NOTES_MASTER = _OFFICE_RT + "notesMaster"
+RT_HANDOUT_MASTER = _OFFICE_RT + "handoutMaster"
+
+# XML에서 r:id로 참조되지 않으면 떼어내도 되는 관계 유형 (테마/마스터처럼 암묵적으로 쓰이는 관계는 제외)
+DROPPABLE_WHEN_UNREFERENCED = {
+    _OFFICE_RT + "oleObject",
+    _OFFICE_RT + "vmlDrawing",
+    _OFFICE_RT + "tags",
+    _OFFICE_RT + "image",
+    _OFFICE_RT + "package",
+}
+
+OLE_GRAPHIC_URI = "http://schemas.openxmlformats.org/presentationml/2006/ole"
+
+CONTENT_TYPES_NAME = "[Content_Types].xml"
+ROOT_RELS_NAME = "_rels/.rels"
+DEFAULT_COMPRESSLEVEL = 9
+
+# 압축 수준을 적용해 다시 압축하는 텍스트 파트 - 미디어(PNG/JPEG 등은 이미 압축됨)는 원본 압축 방식 유지
+TEXT_PART_SUFFIXES = (".xml", ".rels", ".vml")
+
+
+def _rels_name(partname):
+    """파트의 .rels 멤버 이름 (패키지 루트는 partname "")"""
+    if not partname:
+        return ROOT_RELS_NAME
+    base_dir, filename = posixpath.split(partname)
+    return posixpath.join(base_dir, "_rels", filename + ".rels")
+
+
+def _resolve(partname, target):
+    """관계 Target(상대 경로)을 zip 멤버 이름으로 변환"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(partname), target))
+
+
+def _serialize(root):
+    return etree.tostring(root, encoding="UTF-8", xml_declaration=True, standalone=True)
+
+
+class _Package:
+    """zip 멤버 바이트와, 고쳐 쓴 XML/.rels 트리를 함께 들고 있는 작업용 패키지"""
+
+    def __init__(self, zf):
+        self.infos = zf.infolist()
+        self.blobs = {info.filename: zf.read(info.filename) for info in self.infos}
+        self.trees = {}
+
+    def xml(self, name):
+        """멤버를 파싱한 트리 (한 번 꺼낸 트리는 수정 대상으로 보고 저장 시 다시 직렬화)"""
+        if name not in self.trees:
+            self.trees[name] = etree.fromstring(self.blobs[name])
+        return self.trees[name]
+
+    def rels(self, partname):
+        """partname의 <Relationship> 요소 목록 (.rels가 없으면 빈 리스트)"""
+        rels_name = _rels_name(partname)
+        if rels_name not in self.blobs:
+            return []
+        return list(self.xml(rels_name).iter("{%s}Relationship" % PKG_REL_NS))
+
+    def targets(self, partname, reltype=None):
+        """{rId: 대상 멤버 이름} (외부 관계 제외, reltype을 주면 해당 유형만)"""
+        return {
+            rel.get("Id"): _resolve(partname, rel.get("Target"))
+            for rel in self.rels(partname)
+            if rel.get("TargetMode") != "External" and (reltype is None or rel.get("Type") == reltype)
+        }
+
+    def drop_rel(self, partname, rId):
+        for rel in self.rels(partname):
+            if rel.get("Id") == rId:
+                rel.getparent().remove(rel)
+
+    def drop_rels_of_type(self, partname, reltype):
+        for rel in self.rels(partname):
+            if rel.get("Type") == reltype:
+                rel.getparent().remove(rel)
+
+    def reachable(self):
+        """패키지 루트에서 관계를 따라 도달 가능한 파트 이름 집합"""
+        seen = set()
+        stack = [""]
+        while stack:
+            partname = stack.pop()
+            for target in self.targets(partname).values():
+                if target not in seen and target in self.blobs:
+                    seen.add(target)
+                    stack.append(target)
+        return seen
+
+
+def _remove_ole_frames(pkg, partname):
+    """마스터/레이아웃의 OLE graphicFrame 제거 후, 참조가 사라진 부속 관계 정리 - 제거한 개체 수 반환"""
+    root = pkg.xml(partname)
+    frames = [
+        graphic_data.getparent().getparent()
+        for graphic_data in root.iter("{%s}graphicData" % A_NS)
+        if graphic_data.get("uri") == OLE_GRAPHIC_URI
+    ]
+    for frame in frames:
+        frame.getparent().remove(frame)
+
+    referenced = {
+        value for elm in root.iter() for attr, value in elm.attrib.items()
+        if attr.startswith("{%s}" % R_NS)
+    }
+    for rel in pkg.rels(partname):
+        if rel.get("Type") in DROPPABLE_WHEN_UNREFERENCED and rel.get("Id") not in referenced:
+            rel.getparent().remove(rel)
+    return len(frames)
+
+
+def _prune_layouts(pkg, pres_name, masters):
+    """슬라이드가 쓰지 않는 레이아웃(과 빈 마스터)을 목록/관계에서 제거 - 제거한 레이아웃 이름 목록 반환"""
+    pres = pkg.xml(pres_name)
+    used = set()
+    for slide_name in pkg.targets(pres_name, _OFFICE_RT + "slide").values():
+        used.update(pkg.targets(slide_name, RT_SLIDE_LAYOUT).values())
+    if not used:
+        return []
+
+    removed = []
+    for rId, master_name in masters.items():
+        master = pkg.xml(master_name)
+        layout_targets = pkg.targets(master_name, RT_SLIDE_LAYOUT)
+        kept = 0
+        for layout_id in list(master.iter("{%s}sldLayoutId" % P_NS)):
+            layout_rId = layout_id.get("{%s}id" % R_NS)
+            if layout_targets.get(layout_rId) in used:
+                kept += 1
+                continue
+            layout_id.getparent().remove(layout_id)
+            pkg.drop_rel(master_name, layout_rId)
+            removed.append(layout_targets.get(layout_rId))
+
+        master_ids = pres.findall("{%s}sldMasterIdLst/{%s}sldMasterId" % (P_NS, P_NS))
+        if kept == 0 and len(master_ids) > 1:
+            for master_id in master_ids:
+                if master_id.get("{%s}id" % R_NS) == rId:
+                    master_id.getparent().remove(master_id)
+            pkg.drop_rel(pres_name, rId)
+    return removed
+
+
+def _dedupe_media(pkg, reachable):
+    """바이트가 같은 미디어를 첫 파트로 합침 - {제거된 파트: 남긴 파트} 반환"""
+    canonical = {}
+    duplicates = {}
+    for name in sorted(reachable):
+        if not name.startswith("ppt/media/"):
+            continue
+        digest = hashlib.sha1(pkg.blobs[name]).hexdigest()
+        if digest in canonical:
+            duplicates[name] = canonical[digest]
+        else:
+            canonical[digest] = name
+    if not duplicates:
+        return duplicates
+
+    for partname in reachable | {""}:
+        for rel in pkg.rels(partname):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = _resolve(partname, rel.get("Target"))
+            if target in duplicates:
+                rel.set("Target", posixpath.relpath(duplicates[target], posixpath.dirname(partname) or "."))
+    return duplicates
+
+
+def optimize_pptx(input_path, output_path=None, compresslevel=DEFAULT_COMPRESSLEVEL, keep_layouts=False):
+    """input_path의 템플릿 부속물을 제거해 output_path(기본값: 제자리)에 저장
+
+    반환값은 결과 보고 dict입니다.
+        {"input_bytes", "output_bytes", "removed": [(파트, 원래 압축 바이트)],
+         "layouts_removed": [...], "ole_objects": 개수, "deduped": {파트: 남긴 파트}}
+    """
+    input_path = Path(input_path)
+    output_path = Path(output_path or input_path)
+    input_bytes = input_path.stat().st_size
+
+    with zipfile.ZipFile(input_path) as zf:
+        pkg = _Package(zf)
+
+    # 썸네일
+    pkg.drop_rels_of_type("", RT_THUMBNAIL)
+
+    pres_name = next(iter(pkg.targets("", _OFFICE_RT + "officeDocument").values()))
+    pres = pkg.xml(pres_name)
+
+    # 유인물 마스터, (노트 슬라이드가 하나도 없으면) 노트 마스터
+    slides = pkg.targets(pres_name, _OFFICE_RT + "slide").values()
+    has_notes = any(pkg.targets(slide_name, RT_NOTES_SLIDE) for slide_name in slides)
+    master_lists = [("handoutMasterIdLst", RT_HANDOUT_MASTER)]
+    if not has_notes:
+        master_lists.append(("notesMasterIdLst", RT_NOTES_MASTER))
+    for tag, reltype in master_lists:
+        for elm in pres.findall("{%s}%s" % (P_NS, tag)):
+            pres.remove(elm)
+        pkg.drop_rels_of_type(pres_name, reltype)
+
+    # 쓰지 않는 레이아웃/마스터
+    masters = pkg.targets(pres_name, RT_SLIDE_MASTER)
+    layouts_removed = [] if keep_layouts else _prune_layouts(pkg, pres_name, masters)
+
+    # 남은 마스터/레이아웃의 OLE 개체
+    ole_objects = 0
+    for rId, master_name in pkg.targets(pres_name, RT_SLIDE_MASTER).items():
+        ole_objects += _remove_ole_frames(pkg, master_name)
+        for layout_name in pkg.targets(master_name, RT_SLIDE_LAYOUT).values():
+            ole_objects += _remove_ole_frames(pkg, layout_name)
+
+    # 도달할 수 없는 파트와 중복 미디어
+    reachable = pkg.reachable()
+    deduped = _dedupe_media(pkg, reachable)
+    keep = (reachable - set(deduped)) | {CONTENT_TYPES_NAME}
+    keep |= {_rels_name(partname) for partname in keep | {""}}
+    removed = [
+        (info.filename, info.compress_size) for info in pkg.infos if info.filename not in keep
+    ]
+
+    content_types = pkg.xml(CONTENT_TYPES_NAME)
+    for override in list(content_types.iter("{%s}Override" % CT_NS)):
+        if override.get("PartName").lstrip("/") not in keep:
+            content_types.remove(override)
+
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with zipfile.ZipFile(tmp_path, "w") as out:
+            for info in pkg.infos:
+                name = info.filename
+                if name not in keep:
+                    continue
+                blob = _serialize(pkg.trees[name]) if name in pkg.trees else pkg.blobs[name]
+                if name.endswith(TEXT_PART_SUFFIXES):
+                    out.writestr(name, blob, compress_type=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+                else:
+                    out.writestr(name, blob, compress_type=info.compress_type)
+            written = {info.filename: info.compress_size for info in out.infolist()}
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return {
+        "input_bytes": input_bytes,
+        "output_bytes": output_path.stat().st_size,
+        "removed": removed,
+        # 남긴 파트의 압축 크기 변화 (재압축과 XML 정리, 양수면 절감)
+        "recompressed": sum(info.compress_size for info in pkg.infos if info.filename in written)
+        - sum(written.values()),
+        "layouts_removed": layouts_removed,
+        "ole_objects": ole_objects,
+        "deduped": deduped,
+    }
+
+
+def _change(saved):
+    return f"{saved:,} bytes 절감" if saved >= 0 else f"{-saved:,} bytes 증가"
+
+
+def format_report(report):
+    """최적화 결과 요약 문자열 (제거 종류별 바이트, 재압축 효과)"""
+    saved = report["input_bytes"] - report["output_bytes"]
+    lines = [
+        f"최적화: {report['input_bytes']:,} -> {report['output_bytes']:,} bytes "
+        f"({saved:,} bytes, {saved / report['input_bytes']:.1%} 절감)",
+    ]
+
+    by_directory = {}
+    for name, compressed in report["removed"]:
+        row = by_directory.setdefault(posixpath.dirname(name).replace("/_rels", "") or "(root)", [0, 0])
+        row[0] += 1
+        row[1] += compressed
+    for directory, (count, compressed) in sorted(by_directory.items(), key=lambda kv: -kv[1][1]):
+        lines.append(f"  제거 {directory:<28} {count:>4}개 {compressed:>12,} bytes")
+
+    if report["layouts_removed"]:
+        lines.append(f"  미사용 레이아웃 {len(report['layouts_removed'])}개: "
+                     + ", ".join(posixpath.basename(name) for name in report["layouts_removed"]))
+    if report["ole_objects"]:
+        lines.append(f"  OLE 개체 {report['ole_objects']}개 제거")
+    if report["deduped"]:
+        lines.append(f"  중복 미디어 {len(report['deduped'])}개 병합")
+
+    removed_bytes = sum(compressed for _, compressed in report["removed"])
+    lines.append(f"  재압축/XML 정리 {_change(report['recompressed'])}")
+    # 나머지는 제거한 항목의 zip 헤더와 중앙 디렉터리 레코드
+    lines.append(f"  zip 항목 헤더 {_change(saved - removed_bytes - report['recompressed'])}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PPTX 출력 크기 최적화 (템플릿 부속물 제거, 중복 미디어 병합)")
+    parser.add_argument("inputs", nargs="+", type=Path, help="최적화할 .pptx 파일")
+    parser.add_argument("-o", "--output", type=Path, default=None,
+                        help="출력 경로 (입력이 하나일 때만, 기본값: 제자리 덮어쓰기)")
+    parser.add_argument("--level", type=int, default=DEFAULT_COMPRESSLEVEL, choices=range(0, 10),
+                        metavar="0-9", help=f"deflate 압축 수준 (기본값: {DEFAULT_COMPRESSLEVEL})")
+    parser.add_argument("--keep-layouts", action="store_true",
+                        help="슬라이드가 쓰지 않는 레이아웃도 유지 (덱을 받아 계속 편집할 때)")
+    args = parser.parse_args(argv)
+
+    if args.output and len(args.inputs) > 1:
+        parser.error("-o/--output은 입력 파일이 하나일 때만 사용할 수 있습니다.")
+
+    for input_path in args.inputs:
+        print(f"{input_path}")
+        report = optimize_pptx(input_path, args.output, compresslevel=args.level, keep_layouts=args.keep_layouts)
+        print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
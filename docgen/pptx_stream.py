@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+스트리밍 PPTX 작성기
+
+python-pptx는 prs.save() 전까지 모든 슬라이드 파트와 이미지를 메모리에 들고 있어 슬라이드 수에
+비례해 메모리가 늘어납니다. StreamingPptxWriter는 슬라이드 파트 레코드(slide_parts 형식)를 받는
+즉시 슬라이드 XML, .rels, 미디어를 zip에 기록하고 버리며, 템플릿 파트와 presentation.xml,
+[Content_Types].xml은 마지막에 기록합니다. 메모리에 남는 것은 슬라이드/미디어당 이름 몇 개뿐입니다.
+"""
+
+import hashlib
+import posixpath
+import zipfile
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+from pptx.opc.packuri import PACKAGE_URI, CONTENT_TYPES_URI, PackURI
+from pptx.opc.serialized import _ContentTypesItem
+
+XML_DECLARATION = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+# 슬라이드 미디어 확장자 -> 콘텐츠 유형
+MEDIA_CONTENT_TYPES = {
+    "png": CT.PNG,
+    "jpg": CT.JPEG,
+    "jpeg": CT.JPEG,
+    "gif": CT.GIF,
+    "bmp": CT.BMP,
+    "tif": CT.TIFF,
+    "tiff": CT.TIFF,
+    "emf": CT.X_EMF,
+    "wmf": CT.X_WMF,
+}
+
+
+def _rid_number(rId):
+    return int(rId[3:]) if rId.startswith("rId") and rId[3:].isdigit() else 0
+
+
+def _next_rId(rIds):
+    """python-pptx(_Relationships._next_rId)와 같은 규칙으로 다음 rId - len + 1부터 내려가며 첫 빈 번호"""
+    for n in range(len(rIds) + 1, 0, -1):
+        if f"rId{n}" not in rIds:
+            return f"rId{n}"
+    raise ValueError("rId를 더 부여할 수 없음")
+
+
+class _StreamedPart:
+    """이미 zip에 기록된 파트의 대리 객체 - 관계/콘텐츠 유형 기록에 필요한 이름만 보관"""
+
+    __slots__ = ("partname", "content_type")
+
+    def __init__(self, partname, content_type):
+        self.partname = PackURI(partname)
+        self.content_type = content_type
+
+
+class StreamingPptxWriter:
+    """슬라이드 레코드를 받는 대로 zip에 기록하는 PPTX 작성기
+
+    prs는 슬라이드가 없는 템플릿 Presentation이어야 하며(load_template()), close() 시점에
+    레이아웃/마스터/테마 등 템플릿 파트와 함께 기록됩니다.
+
+        with StreamingPptxWriter(output_path, prs) as writer:
+            for record in records:
+                writer.add_slide(record)
+    """
+
+    def __init__(self, output_path, prs, compresslevel=None):
+        self._prs = prs
+        self._zip = zipfile.ZipFile(
+            output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+        )
+        self._layout_partnames = [layout.part.partname for layout in prs.slide_layouts]
+        self._slide_parts = []
+        self._media_parts = {}
+
+        # 템플릿 미디어와 이름이 겹치지 않도록 다음 이미지 번호 계산
+        image_numbers = [0]
+        for part in prs.part.package.iter_parts():
+            name = posixpath.basename(str(part.partname))
+            if str(part.partname).startswith("/ppt/media/image"):
+                digits = "".join(ch for ch in posixpath.splitext(name)[0] if ch.isdigit())
+                if digits:
+                    image_numbers.append(int(digits))
+        self._next_image_number = max(image_numbers) + 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._zip.close()
+
+    @property
+    def slide_count(self):
+        return len(self._slide_parts)
+
+    def _write(self, partname, blob):
+        self._zip.writestr(PackURI(partname).membername, blob)
+
+    def _media_partname(self, blob, ext):
+        """미디어를 (처음 보는 내용이면) 기록하고 partname 반환 - 같은 바이트는 한 파트로 공유"""
+        sha1 = hashlib.sha1(blob).hexdigest()
+        part = self._media_parts.get(sha1)
+        if part is None:
+            ext = (ext or "bin").lower()
+            partname = f"/ppt/media/image{self._next_image_number}.{ext}"
+            self._next_image_number += 1
+            self._write(partname, blob)
+            part = _StreamedPart(partname, MEDIA_CONTENT_TYPES.get(ext, "application/octet-stream"))
+            self._media_parts[sha1] = part
+        return part.partname
+
+    def add_slide(self, record):
+        """slide_parts 레코드 하나를 슬라이드 파트로 기록"""
+        slide_partname = PackURI(f"/ppt/slides/slide{len(self._slide_parts) + 1}.xml")
+        base_uri = slide_partname.baseURI
+
+        rels = CT_Relationships.new()
+        used_rIds = {rel["rId"] for rel in record["rels"]}
+        layout_rId = next(
+            f"rId{n}" for n in range(1, len(used_rIds) + 2) if f"rId{n}" not in used_rIds
+        )
+        layout_partname = self._layout_partnames[record["layout_index"]]
+        rels.add_rel(layout_rId, RT.SLIDE_LAYOUT, layout_partname.relative_ref(base_uri), False)
+
+        for rel in record["rels"]:
+            if rel["is_external"]:
+                rels.add_rel(rel["rId"], rel["reltype"], rel["target_ref"], True)
+            else:
+                media_partname = self._media_partname(rel["blob"], rel["ext"])
+                rels.add_rel(rel["rId"], rel["reltype"], media_partname.relative_ref(base_uri), False)
+
+        xml = record["xml"]
+        if not xml.startswith(b"<?xml"):
+            xml = XML_DECLARATION + xml
+
+        self._write(slide_partname, xml)
+        self._write(slide_partname.rels_uri, rels.xml_file_bytes)
+        self._slide_parts.append(_StreamedPart(slide_partname, CT.PML_SLIDE))
+
+    def close(self):
+        """템플릿 파트, presentation.xml, [Content_Types].xml, 패키지 .rels를 기록하고 닫음"""
+        prs = self._prs
+        package = prs.part.package
+
+        template_parts = list(package.iter_parts())
+
+        # 프레젠테이션 관계: 템플릿 관계 + 스트리밍된 슬라이드 (python-pptx 관계 객체는 실제 Part만 허용)
+        # rId 부여와 기록 순서를 python-pptx와 맞춰 prs.save()와 같은 presentation.xml/.rels를 만듦
+        rels = {rId: (rel.reltype, rel.target_ref, rel.is_external) for rId, rel in prs.part.rels.items()}
+        base_uri = prs.part.partname.baseURI
+        for slide_part in self._slide_parts:
+            rId = _next_rId(rels)
+            rels[rId] = (RT.SLIDE, slide_part.partname.relative_ref(base_uri), False)
+            prs.slides._sldIdLst.add_sldId(rId)
+
+        pres_rels = CT_Relationships.new()
+        for rId in sorted(rels, key=lambda rId: (_rid_number(rId), rId)):
+            pres_rels.add_rel(rId, *rels[rId])
+
+        # presentation.xml은 슬라이드 목록이 확정된 뒤 마지막에 기록
+        template_parts.sort(key=lambda part: part is prs.part)
+        for part in template_parts:
+            self._write(part.partname, part.blob)
+            if part is prs.part:
+                self._write(part.partname.rels_uri, pres_rels.xml_file_bytes)
+            elif part._rels:
+                self._write(part.partname.rels_uri, part.rels.xml)
+
+        all_parts = template_parts + self._slide_parts + list(self._media_parts.values())
+        self._write(
+            CONTENT_TYPES_URI,
+            serialize_part_xml(_ContentTypesItem.xml_for(all_parts)),
+        )
+        self._write(PACKAGE_URI.rels_uri, package._rels.xml)
+        self._zip.close()
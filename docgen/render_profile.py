@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+렌더링 프로파일러 (--profile)
+
+generate_presentation()의 구간(템플릿 로드, 슬라이드, 커스텀 요소 타입, 이미지 조회/삽입, 저장)별
+경과 시간과 메모리 할당 변화량(tracemalloc)을 기록해 다음을 만듭니다.
+- Chrome trace-event JSON: chrome://tracing 또는 https://ui.perfetto.dev 에서 열어 타임라인으로 확인
+- 요약 표: 구간별 횟수/합계/평균/최대 시간과 할당량, 가장 느린 슬라이드 목록
+- 출력 zip의 파트별/종류별 압축 바이트 기여도
+
+프로파일링이 꺼져 있으면 span()은 재사용 가능한 빈 컨텍스트를 돌려주므로 비용이 거의 없습니다.
+"""
+
+import json
+import os
+import posixpath
+import threading
+import time
+import tracemalloc
+import zipfile
+from contextlib import contextmanager, nullcontext
+
+_NULL_SPAN = nullcontext()
+
+# 현재 활성화된 프로파일러 (없으면 span()은 아무것도 기록하지 않음)
+_active = None
+
+
+class RenderProfiler:
+    """구간 기록기 - span() 블록마다 경과 시간과 할당 변화량을 trace 이벤트로 남김"""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.events = []
+        self._started_tracemalloc = False
+        self._t0 = None
+
+    def start(self):
+        """기록 시작 (필요하면 tracemalloc도 시작)"""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._t0 = time.perf_counter_ns()
+
+    def stop(self):
+        """기록 종료 - start()에서 켠 tracemalloc만 끔"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, name, cat, **args):
+        """name/cat 구간 하나를 기록 (중첩 가능, args는 trace 이벤트에 그대로 남음)"""
+        mem_before = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter_ns()
+            if self.trace_memory:
+                args["alloc_bytes"] = tracemalloc.get_traced_memory()[0] - mem_before
+            self.events.append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (started - self._t0) / 1000,
+                "dur": (ended - started) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def write_trace(self, trace_path):
+        """Chrome trace-event JSON 저장"""
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+
+    def summary_rows(self):
+        """(cat, name)별 [횟수, 합계 ms, 최대 ms, 할당 바이트 합계] - 합계 시간 내림차순
+
+        슬라이드 구간은 이름(slide N)과 관계없이 "slide" 한 줄로 모읍니다.
+        """
+        totals = {}
+        for event in self.events:
+            name = "slide" if event["cat"] == "slide" else event["name"]
+            row = totals.setdefault((event["cat"], name), [0, 0.0, 0.0, 0])
+            dur_ms = event["dur"] / 1000
+            row[0] += 1
+            row[1] += dur_ms
+            row[2] = max(row[2], dur_ms)
+            row[3] += event["args"].get("alloc_bytes", 0)
+        return sorted(totals.items(), key=lambda item: -item[1][1])
+
+    def format_summary(self, slowest=10):
+        """요약 표 문자열 (구간별 집계 + 가장 느린 슬라이드)"""
+        lines = [
+            f"{'구간':<36} {'횟수':>6} {'합계(ms)':>10} {'평균(ms)':>9} {'최대(ms)':>9} {'할당(KB)':>10}",
+            "-" * 86,
+        ]
+        for (cat, name), (count, total_ms, max_ms, alloc) in self.summary_rows():
+            label = f"{cat}:{name}" if cat != name else name
+            lines.append(
+                f"{label:<36} {count:>6} {total_ms:>10.1f} {total_ms / count:>9.2f} "
+                f"{max_ms:>9.2f} {alloc / 1024:>10.1f}"
+            )
+
+        slides = [event for event in self.events if event["cat"] == "slide"]
+        if slides:
+            lines.append("")
+            lines.append(f"가장 느린 슬라이드 (상위 {min(slowest, len(slides))}개)")
+            for event in sorted(slides, key=lambda e: -e["dur"])[:slowest]:
+                args = event["args"]
+                lines.append(
+                    f"  {event['name']:<20} layout_id={args.get('layout_id')} "
+                    f"{event['dur'] / 1000:>8.2f} ms  {args.get('alloc_bytes', 0) / 1024:>8.1f} KB"
+                )
+        return "\n".join(lines)
+
+
+def _part_category(member_name):
+    """zip 멤버 이름 -> 기여도 집계용 종류"""
+    if member_name.startswith("ppt/slides/"):
+        return "slides"
+    if member_name.startswith("ppt/media/"):
+        return "media"
+    directory = posixpath.dirname(member_name)
+    return directory.replace("/_rels", "") or "(root)"
+
+
+def zip_contributions(pptx_path):
+    """출력 zip의 파트별 (이름, 압축 바이트, 원본 바이트) - 압축 바이트 내림차순"""
+    with zipfile.ZipFile(pptx_path) as zf:
+        parts = [(info.filename, info.compress_size, info.file_size) for info in zf.infolist()]
+    return sorted(parts, key=lambda part: -part[1])
+
+
+def format_zip_contributions(pptx_path, top=15):
+    """zip 바이트 기여도 표 문자열 (종류별 합계 + 상위 파트)"""
+    parts = zip_contributions(pptx_path)
+    total = os.path.getsize(pptx_path)
+
+    by_category = {}
+    for name, compressed, uncompressed in parts:
+        row = by_category.setdefault(_part_category(name), [0, 0, 0])
+        row[0] += 1
+        row[1] += compressed
+        row[2] += uncompressed
+
+    lines = [
+        f"출력 파일 {total:,} bytes",
+        f"{'종류':<28} {'파트':>6} {'압축(bytes)':>14} {'비율':>7} {'원본(bytes)':>14}",
+        "-" * 73,
+    ]
+    for category, (count, compressed, uncompressed) in sorted(by_category.items(), key=lambda kv: -kv[1][1]):
+        lines.append(
+            f"{category:<28} {count:>6} {compressed:>14,} {compressed / total:>7.1%} {uncompressed:>14,}"
+        )
+
+    lines.append("")
+    lines.append(f"상위 {min(top, len(parts))}개 파트")
+    for name, compressed, uncompressed in parts[:top]:
+        lines.append(f"  {name:<40} {compressed:>12,} {compressed / total:>7.1%}")
+    return "\n".join(lines)
+
+
+def activate(profiler):
+    """profiler를 활성화하고 기록 시작"""
+    global _active
+    _active = profiler
+    profiler.start()
+
+
+def deactivate():
+    """활성 프로파일러 기록 종료 후 반환"""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def span(name, cat=None, **args):
+    """활성 프로파일러에 구간 기록 (비활성이면 빈 컨텍스트)"""
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, cat or name, **args)
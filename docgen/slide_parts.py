@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+슬라이드 파트 내보내기/가져오기
+
+python-pptx로 렌더링된 슬라이드를 레이아웃 번호, 슬라이드 XML, 미디어 관계(바이너리 포함)로
+구성된 독립적인 레코드로 내보내고, 다른 Presentation에 같은 순서로 다시 붙여 넣습니다.
+병렬 렌더링(--jobs) 시 워커 프로세스와 부모 프로세스 사이에서 슬라이드를 주고받는 형식입니다.
+"""
+
+import posixpath
+import zipfile
+from io import BytesIO
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _rid_number(rId):
+    """rId 정렬용 숫자 추출 (rId12 -> 12)"""
+    digits = "".join(ch for ch in rId if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def export_slide(prs, slide):
+    """슬라이드를 피클 가능한 dict 레코드로 변환
+
+    반환 형식:
+        {
+            "layout_index": 템플릿 내 레이아웃 순번,
+            "xml": 슬라이드 XML (bytes),
+            "rels": [{"rId", "reltype", "blob", "ext", "target_ref", "is_external"}, ...]
+        }
+    """
+    layout_index = list(prs.slide_layouts).index(slide.slide_layout)
+
+    rels = []
+    for rId, rel in sorted(slide.part.rels.items(), key=lambda kv: _rid_number(kv[0])):
+        if rel.reltype == RT.SLIDE_LAYOUT:
+            continue
+        if rel.is_external:
+            rels.append({
+                "rId": rId,
+                "reltype": rel.reltype,
+                "blob": None,
+                "ext": None,
+                "target_ref": rel.target_ref,
+                "is_external": True,
+            })
+        elif rel.reltype == RT.IMAGE:
+            image_part = rel.target_part
+            rels.append({
+                "rId": rId,
+                "reltype": rel.reltype,
+                "blob": image_part.blob,
+                "ext": image_part.ext,
+                "target_ref": None,
+                "is_external": False,
+            })
+        else:
+            raise ValueError(f"지원하지 않는 슬라이드 관계 유형: {rel.reltype}")
+
+    return {
+        "layout_index": layout_index,
+        "xml": serialize_part_xml(slide._element),
+        "rels": rels,
+    }
+
+
+def detach_last_slide(prs):
+    """prs의 마지막 슬라이드를 목록과 관계에서 떼어냄 (내보낸 뒤 메모리 해제용)"""
+    sldId = prs.slides._sldIdLst[-1]
+    prs.part.drop_rel(sldId.rId)
+    prs.slides._sldIdLst.remove(sldId)
+
+
+def import_slide(prs, record):
+    """export_slide() 레코드를 prs 끝에 슬라이드로 추가
+
+    미디어는 패키지의 SHA1 중복 제거를 거쳐 추가되며, 새로 부여된 rId로 XML 참조를 바꿔 씁니다.
+    """
+    layout = prs.slide_layouts[record["layout_index"]]
+    slide = prs.slides.add_slide(layout)
+    part = slide.part
+
+    rId_map = {}
+    for rel in record["rels"]:
+        if rel["is_external"]:
+            new_rId = part.relate_to(rel["target_ref"], rel["reltype"], is_external=True)
+        else:
+            _, new_rId = part.get_or_add_image_part(BytesIO(rel["blob"]))
+        rId_map[rel["rId"]] = new_rId
+
+    new_root = parse_xml(record["xml"])
+    if rId_map:
+        for elm in new_root.iter():
+            for attr, value in elm.attrib.items():
+                if attr.startswith("{%s}" % R_NS) and value in rId_map:
+                    elm.set(attr, rId_map[value])
+
+    # add_slide()가 만든 <p:sld> 요소를 유지한 채 내용만 교체 (Slide 객체 캐시 보존)
+    old_root = slide._element
+    for child in list(old_root):
+        old_root.remove(child)
+    for attr, value in new_root.attrib.items():
+        old_root.set(attr, value)
+    for child in list(new_root):
+        old_root.append(child)
+
+    return slide
+
+
+def _read_rels(zf, partname):
+    """파트의 .rels를 읽어 {rId: (reltype, 절대 partname 또는 외부 URL, is_external)} 반환"""
+    base_dir, filename = posixpath.split(partname)
+    rels_name = posixpath.join(base_dir, "_rels", filename + ".rels")
+    if rels_name not in zf.namelist():
+        return {}
+
+    rels = {}
+    for rel in etree.fromstring(zf.read(rels_name)).iter("{%s}Relationship" % PKG_REL_NS):
+        is_external = rel.get("TargetMode") == "External"
+        target = rel.get("Target")
+        if not is_external:
+            target = posixpath.normpath(posixpath.join(base_dir, target))
+        rels[rel.get("Id")] = (rel.get("Type"), target, is_external)
+    return rels
+
+
+def iter_slide_records(pptx_path, layout_partnames=None, indices=None):
+    """저장된 .pptx에서 python-pptx 로드 없이 (슬라이드 순번, 레코드)를 순서대로 내보내는 제너레이터
+
+    레코드는 export_slide()와 같은 형식이므로 import_slide()로 바로 재사용할 수 있습니다.
+    레이아웃 순번은 python-pptx의 prs.slide_layouts와 같이 첫 번째 마스터 기준입니다.
+    layout_partnames(템플릿 레이아웃 partname 목록)를 주면 그 순서를 기준으로 삼으므로, 미사용
+    레이아웃을 제거한 출력(pptx_optimize)에서도 템플릿 기준 순번을 얻습니다.
+    indices(순번 집합)를 주면 그 슬라이드만 읽고, 나머지 슬라이드의 XML과 미디어는 읽지 않습니다.
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        pres_name = "ppt/presentation.xml"
+        pres_rels = _read_rels(zf, pres_name)
+        pres = etree.fromstring(zf.read(pres_name))
+
+        master_id = pres.find("{%s}sldMasterIdLst/{%s}sldMasterId" % (P_NS, P_NS))
+        master_name = pres_rels[master_id.get("{%s}id" % R_NS)][1]
+        master_rels = _read_rels(zf, master_name)
+        master = etree.fromstring(zf.read(master_name))
+        layout_order = [
+            master_rels[elm.get("{%s}id" % R_NS)][1]
+            for elm in master.iter("{%s}sldLayoutId" % P_NS)
+        ]
+        if layout_partnames is not None:
+            layout_order = [partname.lstrip("/") for partname in layout_partnames]
+
+        for index, sld_id in enumerate(pres.iter("{%s}sldId" % P_NS)):
+            if indices is not None and index not in indices:
+                continue
+            slide_name = pres_rels[sld_id.get("{%s}id" % R_NS)][1]
+            layout_index = None
+            rels = []
+            for rId, (reltype, target, is_external) in sorted(
+                _read_rels(zf, slide_name).items(), key=lambda kv: _rid_number(kv[0])
+            ):
+                if reltype == RT.SLIDE_LAYOUT:
+                    layout_index = layout_order.index(target)
+                elif is_external:
+                    rels.append({
+                        "rId": rId,
+                        "reltype": reltype,
+                        "blob": None,
+                        "ext": None,
+                        "target_ref": target,
+                        "is_external": True,
+                    })
+                elif reltype == RT.IMAGE:
+                    rels.append({
+                        "rId": rId,
+                        "reltype": reltype,
+                        "blob": zf.read(target),
+                        "ext": posixpath.splitext(target)[1].lstrip("."),
+                        "target_ref": None,
+                        "is_external": False,
+                    })
+                else:
+                    raise ValueError(f"지원하지 않는 슬라이드 관계 유형: {reltype}")
+
+            yield index, {
+                "layout_index": layout_index,
+                "xml": zf.read(slide_name),
+                "rels": rels,
+            }
+
+
+def read_slide_records(pptx_path, layout_partnames=None):
+    """저장된 .pptx의 모든 슬라이드 레코드 리스트 (iter_slide_records() 참고)"""
+    return [record for _, record in iter_slide_records(pptx_path, layout_partnames)]
@@ -0,0 +1,1039 @@
+#!/usr/bin/env python3
+"""
+SVG 래스터라이저 (NumPy)
+
+docgen이 만드는 SVG 부분집합을 PNG로 그립니다. 대상은 generate_premium_assets의
+system_architecture_premium.svg(그라데이션, 흐린 그림자 필터)와 diagram.to_svg() 출력입니다.
+
+- 도형: rect(rx/ry), circle, ellipse, line, polyline, polygon, path(M/L/H/V/C/S/Q/T/A/Z), text
+- 칠하기: 단색, none, fill/stroke/opacity, linearGradient (objectBoundingBox/userSpaceOnUse, pad)
+- 그룹: transform(translate/scale/rotate/matrix), opacity, filter
+- 필터: feGaussianBlur, feOffset, feFlood, feComponentTransfer(feFuncA linear), feMerge
+- marker-end (orient auto/auto-start-reverse/각도)
+
+도형 가장자리는 부호 있는 거리장(SDF)에서 1px 안티에일리어싱 커버리지로, 그라데이션은 픽셀 격자 전체의
+보간으로, 가우시안 흐림은 누적합 상자 흐림 3회로 모두 배열 연산으로 계산합니다. 캔버스는 가로 띠(BAND_PIXELS)
+단위로 그리므로 8K에서도 작업 메모리는 띠 크기로 제한되고 (4K까지는 띠 하나), 배율(1x/2x/4x)별 출력은 워커 프로세스에서
+동시에 그립니다. 글자는 Pillow로 글리프 마스크를 만들어 합성합니다 (글꼴과 글리프 캐시는 fonts).
+
+1 CPU 기준으로 system_architecture_premium.svg 2x(3840x2160)를 그리는 데 약 0.7s가 걸리고, PNG 저장(zlib 압축)에
+약 0.35s가 더 듭니다. 시간은 대부분 전체 캔버스를 훑는 배열 연산(배경 칠하기, 그림자 흐림, RGBA8 변환)이라
+메모리 대역폭을 따라갑니다.
+
+numpy가 필요합니다 (선택 의존성 - 없으면 generate_premium_assets가 PNG를 건너뜀).
+
+사용 예:
+    python docgen/svg_raster.py docgen/system_architecture_premium.svg --scales 1,2,4
+"""
+
+import argparse
+import math
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# 배율별 출력 (1은 원본 크기, 그 외는 <이름>@<배율>x.png)
+DEFAULT_SCALES = (1, 2, 4)
+BAND_PIXELS = 3840 * 2160  # 한 번에 그리는 띠의 최대 픽셀 수 - 4K 한 장 (float32 RGBA로 약 133MB)
+CURVE_SEGMENTS = 16  # 베지어 곡선 하나를 나누는 선분 수
+
+NAMED_COLORS = {
+    "black": (0, 0, 0), "white": (255, 255, 255), "gray": (128, 128, 128), "grey": (128, 128, 128),
+    "lightgray": (211, 211, 211), "lightgrey": (211, 211, 211), "darkgray": (169, 169, 169),
+    "red": (255, 0, 0), "green": (0, 128, 0), "blue": (0, 0, 255), "yellow": (255, 255, 0),
+    "orange": (255, 165, 0), "navy": (0, 0, 128),
+}
+
+# 자식에게 상속되는 표시 속성과 기본값
+DEFAULT_STYLE = {
+    "fill": "black", "fill-opacity": "1", "stroke": "none", "stroke-width": "1", "stroke-opacity": "1",
+    "font-size": "16", "font-weight": "400", "text-anchor": "start", "dominant-baseline": "auto",
+    "marker-end": "none",
+}
+
+# 그리지 않는 요소 (참조로만 쓰이는 정의 포함)
+_SKIPPED_TAGS = {
+    "defs", "marker", "linearGradient", "radialGradient", "filter", "title", "desc", "style",
+    "clipPath", "mask", "symbol", "metadata",
+}
+_NUMBER = re.compile(r"[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+_PATH_TOKEN = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+_TRANSFORM = re.compile(r"(matrix|translate|scale|rotate)\s*\(([^)]*)\)")
+_URL = re.compile(r"url\(\s*#([^)\s]+)\s*\)")
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+# ==================== 속성 해석 ====================
+def _tag(element):
+    return element.tag.rsplit("}", 1)[-1]
+
+
+def _length(value, reference=0.0, default=0.0):
+    """길이 값 (px 단위 숫자, 퍼센트는 reference 기준)"""
+    if value is None:
+        return default
+    value = value.strip()
+    if value.endswith("%"):
+        return float(value[:-1]) * reference / 100
+    match = _NUMBER.match(value)
+    return float(match.group()) if match else default
+
+
+def _fraction(value, default):
+    """그라데이션 좌표/오프셋 (퍼센트 또는 0-1 숫자)"""
+    if value is None:
+        return default
+    value = value.strip()
+    return float(value[:-1]) / 100 if value.endswith("%") else float(value)
+
+
+def _color(value):
+    """색상 문자열 -> (r, g, b) 0-1 또는 None"""
+    if not value:
+        return None
+    value = value.strip().lower()
+    if value in ("none", "transparent"):
+        return None
+    if value.startswith("#"):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = "".join(ch * 2 for ch in digits)
+        return tuple(int(digits[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    if value.startswith("rgb"):
+        parts = _NUMBER.findall(value)[:3]
+        return tuple(float(part) / 255 for part in parts)
+    rgb = NAMED_COLORS.get(value)
+    return tuple(channel / 255 for channel in rgb) if rgb else None
+
+
+def _url(value):
+    match = _URL.search(value or "")
+    return match.group(1) if match else None
+
+
+def _declarations(element):
+    """style="a: b; c: d" 선언 dict"""
+    declarations = {}
+    for item in (element.get("style") or "").split(";"):
+        if ":" in item:
+            key, value = item.split(":", 1)
+            declarations[key.strip()] = value.strip()
+    return declarations
+
+
+def _style(element, parent):
+    """상속 표시 속성 - 부모 값에 요소의 속성과 style 선언을 덮어씀"""
+    style = dict(parent)
+    declarations = _declarations(element)
+    for key in DEFAULT_STYLE:
+        value = declarations.get(key, element.get(key))
+        if value is not None:
+            style[key] = value
+    return style
+
+
+def _font_weight(value):
+    if value == "bold":
+        return 700
+    if value == "normal":
+        return 400
+    return int(_length(value, default=400))
+
+
+# ==================== 변환 행렬 ====================
+# SVG matrix(a, b, c, d, e, f): x' = a x + c y + e, y' = b x + d y + f
+def _multiply(m, n):
+    """m ∘ n (n을 먼저 적용)"""
+    a, b, c, d, e, f = m
+    p, q, r, s, t, u = n
+    return (a * p + c * q, b * p + d * q, a * r + c * s, b * r + d * s, a * t + c * u + e, b * t + d * u + f)
+
+
+def _invert(m):
+    a, b, c, d, e, f = m
+    det = a * d - b * c
+    return (d / det, -b / det, -c / det, a / det, (c * f - d * e) / det, (b * e - a * f) / det)
+
+
+def _apply(m, x, y):
+    """점 변환 - 축 정렬 변환이면 (1, w)/(h, 1) 격자를 그대로 유지해 브로드캐스트 계산을 줄임"""
+    a, b, c, d, e, f = m
+    return (a * x + c * y + e if c else a * x + e), (b * x + d * y + f if b else d * y + f)
+
+
+def _unit(m):
+    """변환의 평균 배율 (선 굵기, 거리, 흐림 반경 환산용)"""
+    return math.sqrt(abs(m[0] * m[3] - m[1] * m[2]))
+
+
+def _parse_transform(value):
+    matrix = _IDENTITY
+    for name, args in _TRANSFORM.findall(value or ""):
+        numbers = [float(number) for number in _NUMBER.findall(args)]
+        if name == "matrix" and len(numbers) == 6:
+            step = tuple(numbers)
+        elif name == "translate":
+            step = (1, 0, 0, 1, numbers[0], numbers[1] if len(numbers) > 1 else 0)
+        elif name == "scale":
+            step = (numbers[0], 0, 0, numbers[1] if len(numbers) > 1 else numbers[0], 0, 0)
+        elif name == "rotate":
+            angle = math.radians(numbers[0])
+            cos, sin = math.cos(angle), math.sin(angle)
+            step = (cos, sin, -sin, cos, 0, 0)
+            if len(numbers) == 3:
+                cx, cy = numbers[1], numbers[2]
+                step = _multiply(_multiply((1, 0, 0, 1, cx, cy), step), (1, 0, 0, 1, -cx, -cy))
+        else:
+            continue
+        matrix = _multiply(matrix, step)
+    return matrix
+
+
+# ==================== 경로 ====================
+def _arc_points(x1, y1, rx, ry, rotation, large_arc, sweep, x2, y2):
+    """타원호(A 명령)를 선분 점들로 (시작점 제외) - SVG 명세의 끝점 -> 중심 매개변수 변환"""
+    if rx == 0 or ry == 0 or (x1 == x2 and y1 == y2):
+        return [(x2, y2)]
+    rx, ry = abs(rx), abs(ry)
+    phi = math.radians(rotation)
+    cos, sin = math.cos(phi), math.sin(phi)
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p, y1p = cos * dx + sin * dy, -sin * dx + cos * dy
+    scale = x1p * x1p / (rx * rx) + y1p * y1p / (ry * ry)
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    factor = math.sqrt(max(0.0, numerator / denominator)) * (-1 if large_arc == sweep else 1)
+    cxp, cyp = factor * rx * y1p / ry, -factor * ry * x1p / rx
+    cx, cy = cos * cxp - sin * cyp + (x1 + x2) / 2, sin * cxp + cos * cyp + (y1 + y2) / 2
+
+    start = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    delta = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx) - start
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+    segments = max(4, math.ceil(abs(delta) / (math.pi / 16)))
+    points = []
+    for i in range(1, segments + 1):
+        angle = start + delta * i / segments
+        ex, ey = rx * math.cos(angle), ry * math.sin(angle)
+        points.append((cos * ex - sin * ey + cx, sin * ex + cos * ey + cy))
+    return points
+
+
+def _bezier_points(points):
+    """제어점 목록(2차/3차)의 베지어 곡선을 선분 점들로 (시작점 제외)"""
+    result = []
+    for i in range(1, CURVE_SEGMENTS + 1):
+        t = i / CURVE_SEGMENTS
+        level = points
+        while len(level) > 1:
+            level = [
+                (ax + (bx - ax) * t, ay + (by - ay) * t)
+                for (ax, ay), (bx, by) in zip(level, level[1:])
+            ]
+        result.append(level[0])
+    return result
+
+
+def parse_path(d):
+    """path d 속성 -> [(점 목록, 닫힘 여부)] 하위 경로 (곡선/호는 선분으로 평탄화)"""
+    tokens = _PATH_TOKEN.findall(d or "")
+    subpaths = []
+    points = []
+    closed = False
+    x = y = start_x = start_y = 0.0
+    control = None  # S/T 반사용 직전 제어점
+    command = None
+    i = 0
+
+    def take(count):
+        nonlocal i
+        values = [float(value) for value in tokens[i:i + count]]
+        i += count
+        return values
+
+    def flush():
+        if len(points) > 1:
+            subpaths.append((list(points), closed))
+
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            command = tokens[i]
+            i += 1
+            if command in "Zz":
+                closed = True
+                flush()
+                points, closed = [], False
+                x, y = start_x, start_y
+                control = None
+                continue
+        if command is None:
+            break
+        relative = command.islower()
+        upper = command.upper()
+        ox, oy = (x, y) if relative else (0.0, 0.0)
+        previous_control, control = control, None
+
+        if upper == "M":
+            flush()
+            nx, ny = take(2)
+            x, y = start_x, start_y = nx + ox, ny + oy
+            points, closed = [(x, y)], False
+            command = "l" if relative else "L"  # M 뒤의 좌표 쌍은 L
+            continue
+        if not points:
+            points = [(x, y)]
+        if upper == "L":
+            nx, ny = take(2)
+            x, y = nx + ox, ny + oy
+            points.append((x, y))
+        elif upper == "H":
+            x = take(1)[0] + ox
+            points.append((x, y))
+        elif upper == "V":
+            y = take(1)[0] + oy
+            points.append((x, y))
+        elif upper in "CS":
+            if upper == "C":
+                c1x, c1y, c2x, c2y, nx, ny = take(6)
+                c1 = (c1x + ox, c1y + oy)
+            else:
+                c2x, c2y, nx, ny = take(4)
+                c1 = (2 * x - previous_control[0], 2 * y - previous_control[1]) if previous_control else (x, y)
+            c2, end = (c2x + ox, c2y + oy), (nx + ox, ny + oy)
+            points.extend(_bezier_points([(x, y), c1, c2, end]))
+            control, (x, y) = c2, end
+        elif upper in "QT":
+            if upper == "Q":
+                c1x, c1y, nx, ny = take(4)
+                c1 = (c1x + ox, c1y + oy)
+            else:
+                nx, ny = take(2)
+                c1 = (2 * x - previous_control[0], 2 * y - previous_control[1]) if previous_control else (x, y)
+            end = (nx + ox, ny + oy)
+            points.extend(_bezier_points([(x, y), c1, end]))
+            control, (x, y) = c1, end
+        elif upper == "A":
+            rx, ry, rotation, large_arc, sweep, nx, ny = take(7)
+            end = (nx + ox, ny + oy)
+            points.extend(_arc_points(x, y, rx, ry, rotation, int(large_arc), int(sweep), *end))
+            x, y = end
+        else:
+            break
+    flush()
+    return subpaths
+
+
+# ==================== 거리장 ====================
+def _segment_distance(X, Y, points):
+    """점 목록을 잇는 선분들까지의 최소 거리 (X는 (1, w), Y는 (h, 1) 격자)"""
+    distance = None
+    for (ax, ay), (bx, by) in zip(points, points[1:]):
+        dx, dy = bx - ax, by - ay
+        length = dx * dx + dy * dy
+        px, py = X - ax, Y - ay
+        t = np.clip((px * dx + py * dy) / length, 0, 1) if length else 0.0
+        d = np.hypot(px - t * dx, py - t * dy)
+        distance = d if distance is None else np.minimum(distance, d)
+    return distance
+
+
+def _winding(X, Y, rings):
+    """닫힌 점 목록들의 nonzero 감김 수가 0이 아닌 픽셀"""
+    winding = np.zeros(np.broadcast_shapes(X.shape, Y.shape), np.int16)
+    for ring in rings:
+        for (ax, ay), (bx, by) in zip(ring, ring[1:] + ring[:1]):
+            if ay == by:
+                continue
+            crosses = (ay <= Y) != (by <= Y)
+            x_cross = ax + (Y - ay) * (bx - ax) / (by - ay)
+            winding += np.where(crosses & (X < x_cross), 1 if by > ay else -1, 0).astype(np.int16)
+    return winding != 0
+
+
+def _polygon_sdf(X, Y, rings):
+    """닫힌 점 목록들의 부호 있는 거리 (안쪽이 음수)"""
+    closed = [ring + ring[:1] for ring in rings]
+    distance = _segment_distance(X, Y, closed[0])
+    for ring in closed[1:]:
+        distance = np.minimum(distance, _segment_distance(X, Y, ring))
+    return np.where(_winding(X, Y, rings), -distance, distance)
+
+
+def _round_rect_sdf(u, v, x, y, w, h, rx, ry):
+    """로컬 좌표 (u, v)에서 둥근 사각형까지의 부호 있는 거리 (타원 모서리는 세로를 늘여 근사)"""
+    stretch = rx / ry if ry else 1.0
+    qx = np.abs(u - (x + w / 2)) - (w / 2 - rx)
+    qy = np.abs(v - (y + h / 2)) * stretch - (h / 2 * stretch - rx)
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    return outside + np.minimum(np.maximum(qx, qy), 0) - rx
+
+
+def _ellipse_sdf(u, v, cx, cy, rx, ry):
+    """로컬 좌표에서 타원까지의 부호 있는 거리 근사 (k0 (k0 - 1) / k1)"""
+    px, py = u - cx, v - cy
+    k0 = np.hypot(px / rx, py / ry)
+    k1 = np.maximum(np.hypot(px / (rx * rx), py / (ry * ry)), 1e-9)
+    return k0 * (k0 - 1) / k1
+
+
+# ==================== 필터 연산 ====================
+def _box_sizes(sigma, passes=3):
+    """가우시안(sigma)에 가까운 상자 흐림 passes회의 반지름 목록"""
+    ideal = math.sqrt(12 * sigma * sigma / passes + 1)
+    lower = int(ideal)
+    if lower % 2 == 0:
+        lower -= 1
+    upper = lower + 2
+    count = round((12 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes) / (-4 * lower - 4))
+    return [((lower if i < count else upper) - 1) // 2 for i in range(passes)]
+
+
+def _box_blur(array, radius, axis):
+    """축 방향 상자 흐림 (누적합, 바깥은 투명)"""
+    if radius <= 0:
+        return array
+    # total은 앞에 0 radius+1칸, 뒤에 마지막 누적합 radius칸을 붙인 누적합 (np.pad 복사 없이 바로 기록)
+    size = array.shape[axis]
+    shape = list(array.shape)
+    shape[axis] = size + 2 * radius + 1
+    total = np.empty(shape, np.float32)
+    moved = np.moveaxis(total, axis, 0)
+    moved[:radius + 1] = 0
+    np.cumsum(array, axis=axis, dtype=np.float32, out=np.moveaxis(moved[radius + 1:radius + 1 + size], 0, axis))
+    moved[radius + 1 + size:] = moved[radius + size]
+    result = np.subtract(moved[2 * radius + 1:], moved[:size])
+    result *= np.float32(1 / (2 * radius + 1))
+    return np.moveaxis(result, 0, axis)
+
+
+def _gaussian_blur(plane, sigma_x, sigma_y):
+    """2차원 배열 가우시안 흐림 (상자 흐림 3회씩 가로/세로)"""
+    for radius in _box_sizes(sigma_x) if sigma_x > 0 else ():
+        plane = _box_blur(plane, radius, 1)
+    for radius in _box_sizes(sigma_y) if sigma_y > 0 else ():
+        plane = _box_blur(plane, radius, 0)
+    return plane
+
+
+def _shift(plane, dx, dy):
+    """정수 픽셀만큼 이동 (빈 자리는 0)"""
+    result = np.zeros_like(plane)
+    h, w = plane.shape[:2]
+    if abs(dx) >= w or abs(dy) >= h:
+        return result
+    result[max(dy, 0):h + min(dy, 0), max(dx, 0):w + min(dx, 0)] = \
+        plane[max(-dy, 0):h - max(dy, 0), max(-dx, 0):w - max(dx, 0)]
+    return result
+
+
+# 필터 중간 결과는 (미리 곱한 rgb (h, w, 3) 또는 None, 알파 (h, w)) - rgb None은 검정(0)이라
+# SourceAlpha에서 시작하는 그림자 체인은 알파 평면 하나만 계산합니다.
+def _image_map(image, function):
+    rgb, alpha = image
+    return (None if rgb is None else function(rgb)), function(alpha)
+
+
+def _image_over(top, bottom):
+    """source-over"""
+    (top_rgb, top_alpha), (bottom_rgb, bottom_alpha) = top, bottom
+    keep = 1 - top_alpha
+    if bottom_rgb is None:
+        rgb = top_rgb
+    else:
+        rgb = bottom_rgb * keep[..., None]
+        if top_rgb is not None:
+            rgb += top_rgb
+    return rgb, top_alpha + bottom_alpha * keep
+
+
+def _split(bbox, interior):
+    """bbox를 [(사각형, 안쪽 여부)]로 - interior(픽셀 경계로 안쪽 맞춤)와 그 둘레의 띠 네 개"""
+    if interior is None:
+        return [(bbox, False)]
+    left, top = math.ceil(interior[0]), math.ceil(interior[1])
+    right, bottom = math.floor(interior[2]), math.floor(interior[3])
+    if right <= left or bottom <= top:
+        return [(bbox, False)]
+    return [
+        ((left, top, right, bottom), True),
+        ((bbox[0], bbox[1], bbox[2], top), False),
+        ((bbox[0], bottom, bbox[2], bbox[3]), False),
+        ((bbox[0], top, left, bottom), False),
+        ((right, top, bbox[2], bottom), False),
+    ]
+
+
+# ==================== 캔버스 ====================
+class Canvas:
+    """출력 이미지의 한 영역 (x0, y0 기준 width x height 픽셀) - 미리 곱한 알파 float32 RGBA
+
+    dirty는 지금까지 칠한 범위 (left, top, right, bottom 출력 좌표, 아무것도 없으면 None)입니다.
+    """
+
+    def __init__(self, x0, y0, width, height, pixels=None):
+        self.x0, self.y0 = x0, y0
+        self.pixels = np.zeros((height, width, 4), np.float32) if pixels is None else pixels
+        self.dirty = None
+
+    def grid(self, bbox):
+        """bbox(출력 좌표)와 겹치는 구간 -> (영역 슬라이스, 픽셀 범위, X, Y) 또는 None
+
+        X는 (1, w), Y는 (h, 1) 모양의 픽셀 중심 좌표라 브로드캐스트로 (h, w)가 됩니다.
+        """
+        height, width = self.pixels.shape[:2]
+        left = max(self.x0, math.floor(bbox[0]))
+        top = max(self.y0, math.floor(bbox[1]))
+        right = min(self.x0 + width, math.ceil(bbox[2]))
+        bottom = min(self.y0 + height, math.ceil(bbox[3]))
+        if left >= right or top >= bottom:
+            return None
+        region = (slice(top - self.y0, bottom - self.y0), slice(left - self.x0, right - self.x0))
+        X = (np.arange(left, right, dtype=np.float32) + 0.5)[None, :]
+        Y = (np.arange(top, bottom, dtype=np.float32) + 0.5)[:, None]
+        return region, (left, top, right, bottom), X, Y
+
+    def crop(self, bbox):
+        """bbox와 겹치는 부분만 보는 Canvas (픽셀은 공유) - 겹치지 않으면 None"""
+        found = self.grid(bbox)
+        if found is None:
+            return None
+        region, (left, top, _, _), _, _ = found
+        return Canvas(left, top, 0, 0, self.pixels[region])
+
+    def _mark(self, bounds):
+        if self.dirty is None:
+            self.dirty = bounds
+        else:
+            self.dirty = (
+                min(self.dirty[0], bounds[0]), min(self.dirty[1], bounds[1]),
+                max(self.dirty[2], bounds[2]), max(self.dirty[3], bounds[3]),
+            )
+
+    def paint(self, found, coverage, color, alpha):
+        """grid() 구간에 coverage((h, w) 또는 스칼라)만큼 색 color((3,) 또는 (h, w, 3))와 불투명도 alpha 합성"""
+        region, bounds = found[0], found[1]
+        target = self.pixels[region]
+        a = np.multiply(coverage, alpha, dtype=np.float32)
+        if a.min() >= 1:
+            # 불투명하게 덮는 영역 (배경, 도형 안쪽) - 단색이면 RGBA를 한 번에 기록
+            if np.ndim(color) == 1:
+                target[...] = (*color, 1.0)
+            else:
+                target[..., :3] = color
+                target[..., 3] = 1.0
+        else:
+            a = a[..., None] if a.ndim else a
+            target *= 1 - a
+            target[..., :3] += color * a
+            target[..., 3:] += a
+        self._mark(bounds)
+
+    def composite(self, layer, opacity=1.0):
+        """다른 캔버스(layer)를 겹치는 영역에 source-over"""
+        height, width = layer.pixels.shape[:2]
+        found = self.grid((layer.x0, layer.y0, layer.x0 + width, layer.y0 + height))
+        if found is None:
+            return
+        region, (left, top, right, bottom), _, _ = found
+        source = layer.pixels[top - layer.y0:bottom - layer.y0, left - layer.x0:right - layer.x0]
+        if opacity != 1.0:
+            source = source * opacity
+        # 미리 곱한 알파 source-over를 제자리에서
+        target = self.pixels[region]
+        target *= 1 - source[..., 3:4]
+        target += source
+        self._mark((left, top, right, bottom))
+
+
+# ==================== 렌더러 ====================
+class Renderer:
+    """SVG 문서 하나를 scale 배율로 그림 - render()가 (h, w, 4) uint8 RGBA 배열 반환"""
+
+    def __init__(self, svg_text, scale=1.0):
+        self.root = ET.fromstring(svg_text.strip())
+        view_box = [float(value) for value in _NUMBER.findall(self.root.get("viewBox") or "")]
+        width = self.root.get("width")
+        height = self.root.get("height")
+        if len(view_box) != 4:
+            view_box = [0.0, 0.0, _length(width, default=300), _length(height, default=150)]
+        self.view_box = view_box
+        out_width = _length(width, view_box[2], view_box[2]) if width and not width.endswith("%") else view_box[2]
+        out_height = _length(height, view_box[3], view_box[3]) if height and not height.endswith("%") else view_box[3]
+        self.width = max(1, round(out_width * scale))
+        self.height = max(1, round(out_height * scale))
+        sx, sy = self.width / view_box[2], self.height / view_box[3]
+        self.base = (sx, 0.0, 0.0, sy, -view_box[0] * sx, -view_box[1] * sy)
+        self.ids = {element.get("id"): element for element in self.root.iter() if element.get("id")}
+        self.root_style = _style(self.root, DEFAULT_STYLE)
+
+    def render(self):
+        image = np.empty((self.height, self.width, 4), np.uint8)
+        band_height = max(64, BAND_PIXELS // self.width)
+        for top in range(0, self.height, band_height):
+            canvas = Canvas(0, top, self.width, min(band_height, self.height - top))
+            for child in self.root:
+                self._render(child, canvas, self.base, self.root_style)
+            _to_rgba8(canvas.pixels, image[top:top + canvas.pixels.shape[0]])
+        return image
+
+    # ---------- 요소 ----------
+    def _render(self, element, canvas, ctm, parent_style):
+        tag = _tag(element)
+        if tag in _SKIPPED_TAGS or element.get("display") == "none":
+            return
+        style = _style(element, parent_style)
+        ctm = _multiply(ctm, _parse_transform(element.get("transform")))
+        opacity = float(element.get("opacity", 1))
+        filter_element = self.ids.get(_url(element.get("filter")))
+        if opacity <= 0:
+            return
+
+        if filter_element is None and opacity >= 1:
+            self._draw(element, tag, canvas, ctm, style)
+            return
+
+        # 필터/그룹 불투명도: 흐림이 띠 경계를 넘어오도록 여백을 둔 레이어에 따로 그리고,
+        # 실제로 칠한 범위(+여백)만 잘라 필터를 적용한 뒤 합성
+        margin = self._filter_margin(filter_element, ctm) if filter_element is not None else 0
+        height, width = canvas.pixels.shape[:2]
+        layer = Canvas(canvas.x0 - margin, canvas.y0 - margin, width + 2 * margin, height + 2 * margin)
+        self._draw(element, tag, layer, ctm, style)
+        if layer.dirty is None:
+            return
+        left, top, right, bottom = layer.dirty
+        layer = layer.crop((left - margin, top - margin, right + margin, bottom + margin))
+        if filter_element is not None:
+            layer.pixels = self._apply_filter(filter_element, layer.pixels, ctm)
+        canvas.composite(layer, min(opacity, 1.0))
+
+    def _draw(self, element, tag, canvas, ctm, style):
+        if tag in ("g", "svg", "a"):
+            for child in element:
+                self._render(child, canvas, ctm, style)
+        elif tag == "rect":
+            self._rect(element, canvas, ctm, style)
+        elif tag in ("circle", "ellipse"):
+            self._ellipse(element, tag, canvas, ctm, style)
+        elif tag in ("line", "polyline", "polygon", "path"):
+            self._path(element, tag, canvas, ctm, style)
+        elif tag == "text":
+            self._text(element, canvas, ctm, style)
+
+    def _rect(self, element, canvas, ctm, style):
+        vb_width, vb_height = self.view_box[2], self.view_box[3]
+        x = _length(element.get("x"), vb_width)
+        y = _length(element.get("y"), vb_height)
+        w = _length(element.get("width"), vb_width)
+        h = _length(element.get("height"), vb_height)
+        if w <= 0 or h <= 0:
+            return
+        rx, ry = element.get("rx"), element.get("ry")
+        rx = _length(rx if rx is not None else ry, vb_width)
+        ry = _length(ry if ry is not None else element.get("rx"), vb_height)
+        rx, ry = min(rx, w / 2), min(ry, h / 2)
+        inverse, unit = _invert(ctm), _unit(ctm)
+
+        def sdf(X, Y):
+            u, v = _apply(inverse, X, Y)
+            return _round_rect_sdf(u, v, x, y, w, h, rx, ry) * unit
+
+        corners = [_apply(ctm, cx, cy) for cx, cy in ((x, y), (x + w, y), (x, y + h), (x + w, y + h))]
+        interior = None
+        if not ctm[1] and not ctm[2]:
+            # 축 정렬이면 모서리 호에 내접하는 사각형(45도 지점, 반지름의 약 0.3배 안쪽)은 항상 안쪽
+            xs = sorted(px for px, _ in corners)
+            ys = sorted(py for _, py in corners)
+            inset = max(rx * abs(ctm[0]), ry * abs(ctm[3])) * (1 - math.sqrt(0.5)) + 1
+            interior = (xs[0] + inset, ys[0] + inset, xs[-1] - inset, ys[-1] - inset)
+        self._fill_stroke(canvas, corners, sdf, sdf, style, (x, y, w, h), ctm, interior)
+
+    def _ellipse(self, element, tag, canvas, ctm, style):
+        cx = _length(element.get("cx"), self.view_box[2])
+        cy = _length(element.get("cy"), self.view_box[3])
+        if tag == "circle":
+            rx = ry = _length(element.get("r"))
+        else:
+            rx, ry = _length(element.get("rx")), _length(element.get("ry"))
+        if rx <= 0 or ry <= 0:
+            return
+        inverse, unit = _invert(ctm), _unit(ctm)
+
+        def sdf(X, Y):
+            u, v = _apply(inverse, X, Y)
+            return _ellipse_sdf(u, v, cx, cy, rx, ry) * unit
+
+        corners = [_apply(ctm, px, py) for px, py in ((cx - rx, cy - ry), (cx + rx, cy - ry), (cx - rx, cy + ry), (cx + rx, cy + ry))]
+        self._fill_stroke(canvas, corners, sdf, sdf, style, (cx - rx, cy - ry, 2 * rx, 2 * ry), ctm)
+
+    def _path(self, element, tag, canvas, ctm, style):
+        if tag == "path":
+            subpaths = parse_path(element.get("d"))
+        elif tag == "line":
+            subpaths = [([
+                (_length(element.get("x1")), _length(element.get("y1"))),
+                (_length(element.get("x2")), _length(element.get("y2"))),
+            ], False)]
+        else:
+            numbers = [float(number) for number in _NUMBER.findall(element.get("points") or "")]
+            points = list(zip(numbers[0::2], numbers[1::2]))
+            subpaths = [(points, tag == "polygon")] if len(points) > 1 else []
+        if not subpaths:
+            return
+
+        device = [([_apply(ctm, px, py) for px, py in points], closed) for points, closed in subpaths]
+        user_points = [point for points, _ in subpaths for point in points]
+        xs = [px for px, _ in user_points]
+        ys = [py for _, py in user_points]
+        user_bbox = (min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+        rings = [points for points, _ in device if len(points) > 2] if tag != "line" else []
+        strokes = [points + points[:1] if closed else points for points, closed in device]
+
+        def fill_sdf(X, Y):
+            return _polygon_sdf(X, Y, rings)
+
+        def stroke_distance(X, Y):
+            distance = _segment_distance(X, Y, strokes[0])
+            for points in strokes[1:]:
+                distance = np.minimum(distance, _segment_distance(X, Y, points))
+            return distance
+
+        corners = [point for points, _ in device for point in points]
+        self._fill_stroke(canvas, corners, fill_sdf if rings else None, stroke_distance, style, user_bbox, ctm)
+
+        marker = self.ids.get(_url(style.get("marker-end")))
+        if marker is not None:
+            self._marker_end(marker, device[-1][0], canvas, ctm, style)
+
+    def _fill_stroke(self, canvas, corners, fill_sdf, stroke_sdf, style, user_bbox, ctm, interior=None):
+        """채우기(fill_sdf 안쪽)와 선(stroke_sdf의 |거리| <= 굵기/2)을 차례로 합성
+
+        interior는 도형 안쪽임이 보장되는 출력 좌표 사각형입니다. 주면 그 안은 거리장 없이 커버리지 1로
+        칠하고 거리장은 가장자리 띠에서만 계산합니다 (큰 패널/배경 사각형).
+        """
+        xs = [x for x, _ in corners]
+        ys = [y for _, y in corners]
+        if fill_sdf is not None:
+            bbox = (min(xs) - 1, min(ys) - 1, max(xs) + 1, max(ys) + 1)
+            for part, solid in _split(bbox, interior):
+                found = canvas.grid(part)
+                if found is None:
+                    continue
+                _, _, X, Y = found
+                paint = self._paint(style["fill"], float(style["fill-opacity"]), X, Y, user_bbox, ctm)
+                if paint is None:
+                    break
+                coverage = 1.0 if solid else np.clip(0.5 - fill_sdf(X, Y), 0, 1)
+                canvas.paint(found, coverage, *paint)
+
+        width = _length(style["stroke-width"]) * _unit(ctm)
+        if width <= 0 or (_color(style["stroke"]) is None and not _url(style["stroke"])):
+            return
+        half = width / 2 + 1
+        bbox = (min(xs) - half, min(ys) - half, max(xs) + half, max(ys) + half)
+        if interior is not None:
+            # 선이 닿지 않는 안쪽은 건너뜀
+            interior = (interior[0] + half, interior[1] + half, interior[2] - half, interior[3] - half)
+        for part, solid in _split(bbox, interior):
+            found = None if solid else canvas.grid(part)
+            if found is None:
+                continue
+            _, _, X, Y = found
+            paint = self._paint(style["stroke"], float(style["stroke-opacity"]), X, Y, user_bbox, ctm)
+            if paint is None:
+                break
+            coverage = np.clip(width / 2 + 0.5 - np.abs(stroke_sdf(X, Y)), 0, min(1.0, width))
+            canvas.paint(found, coverage, *paint)
+
+    def _marker_end(self, marker, points, canvas, ctm, style):
+        """마지막 점에 marker 내용을 선 방향으로 돌려 그림 (markerUnits="strokeWidth")"""
+        end = points[-1]
+        start = next((point for point in reversed(points[:-1]) if point != end), None)
+        if start is None:
+            return
+        orient = marker.get("orient", "0")
+        if orient.startswith("auto"):
+            angle = math.atan2(end[1] - start[1], end[0] - start[0])
+        else:
+            angle = math.radians(_length(orient))
+        scale = _unit(ctm)
+        if marker.get("markerUnits", "strokeWidth") == "strokeWidth":
+            scale *= _length(style["stroke-width"])
+        view_box = [float(value) for value in _NUMBER.findall(marker.get("viewBox") or "")]
+        sx = sy = 1.0
+        if len(view_box) == 4:
+            sx = _length(marker.get("markerWidth"), default=3) / view_box[2]
+            sy = _length(marker.get("markerHeight"), default=3) / view_box[3]
+        cos, sin = math.cos(angle), math.sin(angle)
+        matrix = (cos * scale, sin * scale, -sin * scale, cos * scale, end[0], end[1])
+        matrix = _multiply(matrix, (sx, 0, 0, sy, 0, 0))
+        matrix = _multiply(matrix, (1, 0, 0, 1, -_length(marker.get("refX")), -_length(marker.get("refY"))))
+        marker_style = _style(marker, self.root_style)
+        for child in marker:
+            self._render(child, canvas, matrix, marker_style)
+
+    def _text(self, element, canvas, ctm, style):
+        text = " ".join("".join(element.itertext()).split())
+        if not text:
+            return
+        import fonts
+
+        unit = _unit(ctm)
+        size = max(1, round(_length(style["font-size"], default=16) * unit))
+        anchor = {"middle": "m", "end": "r"}.get(style["text-anchor"], "l")
+        anchor += {"central": "m", "middle": "m", "hanging": "a"}.get(style["dominant-baseline"], "s")
+        bold = _font_weight(style["font-weight"]) >= 600
+
+        x, y = _apply(ctm, _length(element.get("x")), _length(element.get("y")))
+        mask, left, top = fonts.text_mask(text, size, bold, anchor, x, y)
+        if mask is None:
+            return
+        right, bottom = left + mask.width, top + mask.height
+        found = canvas.grid((left, top, right, bottom))
+        if found is None:
+            return
+        _, (g_left, g_top, g_right, g_bottom), X, Y = found
+        paint = self._paint(style["fill"], float(style["fill-opacity"]), X, Y, self._text_bbox(ctm, left, top, right, bottom), ctm)
+        if paint is None:
+            return
+
+        coverage = np.asarray(mask, np.float32)[g_top - top:g_bottom - top, g_left - left:g_right - left] / 255
+        canvas.paint(found, coverage, *paint)
+
+    @staticmethod
+    def _text_bbox(ctm, left, top, right, bottom):
+        inverse = _invert(ctm)
+        x0, y0 = _apply(inverse, left, top)
+        x1, y1 = _apply(inverse, right, bottom)
+        return min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0)
+
+    # ---------- 칠하기 ----------
+    def _paint(self, value, opacity, X, Y, user_bbox, ctm):
+        """칠하기 값 -> (색, 불투명도) 또는 None (none/알 수 없는 참조)"""
+        gradient = self.ids.get(_url(value))
+        if gradient is not None:
+            if _tag(gradient) != "linearGradient":
+                return None
+            return self._linear_gradient(gradient, opacity, X, Y, user_bbox, ctm)
+        color = _color(value)
+        if color is None:
+            return None
+        return np.array(color, np.float32), opacity
+
+    def _gradient_stops(self, gradient):
+        """정지점 (오프셋 배열, 색 배열 (n, 3), 불투명도 배열) - 자체 stop이 없으면 href를 따라감"""
+        stops = [child for child in gradient if _tag(child) == "stop"]
+        if not stops:
+            href = gradient.get("href") or gradient.get("{http://www.w3.org/1999/xlink}href")
+            linked = self.ids.get((href or "").lstrip("#"))
+            if linked is not None and linked is not gradient:
+                return self._gradient_stops(linked)
+        offsets, colors, alphas = [], [], []
+        for stop in stops:
+            declarations = _declarations(stop)
+            offset = min(1.0, max(_fraction(stop.get("offset"), 0.0), offsets[-1] if offsets else 0.0))
+            offsets.append(offset)
+            colors.append(_color(declarations.get("stop-color", stop.get("stop-color", "black"))) or (0, 0, 0))
+            alphas.append(float(declarations.get("stop-opacity", stop.get("stop-opacity", 1))))
+        if not offsets:
+            return None
+        return np.array(offsets, np.float32), np.array(colors, np.float32), np.array(alphas, np.float32)
+
+    def _linear_gradient(self, gradient, opacity, X, Y, user_bbox, ctm):
+        stops = self._gradient_stops(gradient)
+        if stops is None:
+            return None
+        offsets, colors, alphas = stops
+        u, v = _apply(_invert(ctm), X, Y)
+        if gradient.get("gradientUnits", "objectBoundingBox") == "objectBoundingBox":
+            bx, by, bw, bh = user_bbox
+            u = (u - bx) / (bw or 1)
+            v = (v - by) / (bh or 1)
+            x1, y1 = _fraction(gradient.get("x1"), 0.0), _fraction(gradient.get("y1"), 0.0)
+            x2, y2 = _fraction(gradient.get("x2"), 1.0), _fraction(gradient.get("y2"), 0.0)
+        else:
+            vb_width, vb_height = self.view_box[2], self.view_box[3]
+            x1, y1 = _length(gradient.get("x1"), vb_width), _length(gradient.get("y1"), vb_height)
+            x2 = _length(gradient.get("x2"), vb_width, vb_width)
+            y2 = _length(gradient.get("y2"), vb_height)
+        dx, dy = x2 - x1, y2 - y1
+        t = np.clip(((u - x1) * dx + (v - y1) * dy) / ((dx * dx + dy * dy) or 1), 0, 1)
+        if len(offsets) == 2 and offsets[0] == 0 and offsets[1] == 1:
+            rgb = colors[0] + t[..., None] * (colors[1] - colors[0])  # 정지점 두 개면 직선 보간
+        else:
+            rgb = np.stack([np.interp(t, offsets, colors[:, i]) for i in range(3)], axis=-1).astype(np.float32)
+        if (alphas == alphas[0]).all():
+            return rgb, float(alphas[0]) * opacity
+        return rgb, (np.interp(t, offsets, alphas) * opacity).astype(np.float32)
+
+    # ---------- 필터 ----------
+    def _filter_margin(self, filter_element, ctm):
+        """필터가 레이어 밖으로 번지는 최대 픽셀 수 (흐림 3σ + 이동량)"""
+        unit = _unit(ctm)
+        margin = 0.0
+        for primitive in filter_element:
+            tag = _tag(primitive)
+            if tag == "feGaussianBlur":
+                margin += 3 * max(_numbers(primitive.get("stdDeviation"))) * unit
+            elif tag == "feOffset":
+                margin += max(abs(_length(primitive.get("dx"))), abs(_length(primitive.get("dy")))) * unit
+        return math.ceil(margin) + 1
+
+    def _apply_filter(self, filter_element, source, ctm):
+        """filter 요소의 프리미티브를 차례로 적용한 RGBA 배열 반환"""
+        unit = _unit(ctm)
+        graphic = (source[..., :3], source[..., 3])
+        results = {"SourceGraphic": graphic, "SourceAlpha": (None, graphic[1])}
+        last = graphic
+
+        for primitive in filter_element:
+            tag = _tag(primitive)
+            name = primitive.get("in")
+            image = results.get(name, last) if name else last
+            if tag == "feGaussianBlur":
+                deviations = _numbers(primitive.get("stdDeviation"))
+                sigma_x = deviations[0] * unit
+                sigma_y = (deviations[1] if len(deviations) > 1 else deviations[0]) * unit
+                output = _image_map(image, lambda plane: _gaussian_blur(plane, sigma_x, sigma_y))
+            elif tag == "feOffset":
+                dx = round(_length(primitive.get("dx")) * unit)
+                dy = round(_length(primitive.get("dy")) * unit)
+                output = _image_map(image, lambda plane: _shift(plane, dx, dy))
+            elif tag == "feFlood":
+                declarations = _declarations(primitive)
+                color = _color(declarations.get("flood-color", primitive.get("flood-color", "black"))) or (0, 0, 0)
+                flood_opacity = float(declarations.get("flood-opacity", primitive.get("flood-opacity", 1)))
+                alpha = np.full(graphic[1].shape, flood_opacity, np.float32)
+                output = (alpha[..., None] * np.array(color, np.float32), alpha)
+            elif tag == "feComponentTransfer":
+                output = image
+                for function in primitive:
+                    if _tag(function) == "feFuncA" and function.get("type") == "linear":
+                        slope = float(function.get("slope", 1))
+                        intercept = float(function.get("intercept", 0))
+                        rgb, alpha = image
+                        new_alpha = np.clip(alpha * slope + intercept, 0, 1)
+                        if rgb is not None:
+                            ratio = np.divide(new_alpha, alpha, out=np.zeros_like(alpha), where=alpha > 0)
+                            rgb = rgb * ratio[..., None]
+                        output = (rgb, new_alpha)
+            elif tag == "feMerge":
+                # 첫 노드는 투명 바탕 위라 그대로 쓰고, 다음 노드부터 위에 합성
+                output = None
+                for node in primitive:
+                    node_in = node.get("in")
+                    top_image = results.get(node_in, last) if node_in else last
+                    output = top_image if output is None else _image_over(top_image, output)
+                if output is None:
+                    output = (None, np.zeros_like(graphic[1]))
+            else:
+                output = image  # 지원하지 않는 프리미티브는 입력을 그대로 통과
+            if primitive.get("result"):
+                results[primitive.get("result")] = output
+            last = output
+
+        rgb, alpha = last
+        pixels = np.empty_like(source)
+        pixels[..., :3] = 0 if rgb is None else rgb
+        pixels[..., 3] = alpha
+        return pixels
+
+
+def _numbers(value):
+    numbers = [float(number) for number in _NUMBER.findall(value or "")]
+    return numbers or [0.0]
+
+
+def _to_rgba8(pixels, out):
+    """미리 곱한 알파 float -> 일반 RGBA uint8 (out에 기록, pixels는 덮어씀)"""
+    alpha = pixels[..., 3:4]
+    if alpha.min() < 1:
+        np.divide(pixels[..., :3], alpha, out=pixels[..., :3], where=alpha > 0)
+    pixels *= 255
+    pixels += 0.5
+    np.clip(pixels, 0, 255, out=pixels)
+    out[...] = pixels
+
+
+# ==================== 출력 ====================
+def scaled_path(png_path, scale):
+    """배율별 출력 경로 - 1x는 png_path, 그 외는 <이름>@<배율>x.png"""
+    if scale == 1:
+        return png_path
+    stem, ext = os.path.splitext(png_path)
+    return f"{stem}@{scale:g}x{ext or '.png'}"
+
+
+def render_png(svg_text, png_path, scale=1):
+    """SVG 문자열을 scale 배율 PNG로 저장 (완전히 불투명하면 RGB로) - 저장한 경로 반환"""
+    from PIL import Image
+
+    pixels = Renderer(svg_text, scale).render()
+    image = Image.fromarray(pixels, "RGBA")
+    if pixels[..., 3].min() == 255:
+        image = image.convert("RGB")
+    os.makedirs(os.path.dirname(png_path) or ".", exist_ok=True)
+    image.save(png_path)
+    return png_path
+
+
+def render_pngs(svg_text, png_path, scales=DEFAULT_SCALES, jobs=None):
+    """배율별 PNG를 그려 경로 리스트(scales 순서) 반환
+
+    jobs(기본값: 배율 수와 CPU 수 중 작은 값)가 2 이상이면 배율마다 워커 프로세스에서 동시에 그리며,
+    큰 배율부터 제출해 가장 오래 걸리는 작업이 먼저 시작되게 합니다.
+    """
+    paths = [scaled_path(png_path, scale) for scale in scales]
+    if jobs is None:
+        jobs = min(len(scales), os.cpu_count() or 1)
+    if jobs <= 1 or len(scales) == 1:
+        return [render_png(svg_text, path, scale) for path, scale in zip(paths, scales)]
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        order = sorted(range(len(scales)), key=lambda i: -scales[i])
+        futures = {i: pool.submit(render_png, svg_text, paths[i], scales[i]) for i in order}
+        return [futures[i].result() for i in range(len(scales))]
+
+
+def _parse_scales(value):
+    try:
+        scales = [float(item) if "." in item else int(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"배율 목록이 아님: {value}")
+    if not scales or any(scale <= 0 for scale in scales):
+        raise argparse.ArgumentTypeError(f"배율은 양수여야 함: {value}")
+    return scales
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="docgen SVG를 배율별 PNG로 래스터화 (NumPy)")
+    parser.add_argument("svg", help="입력 SVG")
+    parser.add_argument("-o", "--output", default=None, help="1x PNG 경로 (기본값: SVG와 같은 이름의 .png)")
+    parser.add_argument(
+        "--scales", type=_parse_scales, default=list(DEFAULT_SCALES),
+        help=f"쉼표로 구분한 배율 (기본값: {','.join(map(str, DEFAULT_SCALES))})"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="워커 프로세스 수 (기본값: 배율 수와 CPU 수 중 작은 값)")
+    args = parser.parse_args(argv)
+
+    with open(args.svg, "r", encoding="utf-8") as f:
+        svg_text = f.read()
+    output = args.output or os.path.splitext(args.svg)[0] + ".png"
+
+    started = time.perf_counter()
+    for path in render_pngs(svg_text, output, args.scales, args.jobs):
+        print(f"  {path}")
+    print(f"완료: {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
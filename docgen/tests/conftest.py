@@ -0,0 +1,81 @@
+"""
+docgen 테스트 공용 설정
+
+docgen 스크립트는 패키지가 아니라 같은 디렉터리의 모듈을 서로 임포트하므로 docgen/을 sys.path에 넣고,
+템플릿 스냅샷/이미지/빌드 그래프 캐시는 테스트마다 임시 디렉터리로 돌려 작업 트리의 .cache와 섞이지
+않게 합니다.
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+DOCGEN_DIR = Path(__file__).resolve().parent.parent
+if str(DOCGEN_DIR) not in sys.path:
+    sys.path.insert(0, str(DOCGEN_DIR))
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """generate_pptx/image_pipeline/build_graph 캐시를 tmp_path/cache 아래로 옮기고 메모리 캐시 초기화"""
+    import build_graph
+    import generate_pptx
+    import image_pipeline
+
+    root = tmp_path / "cache"
+    monkeypatch.setattr(generate_pptx, "CACHE_DIR", root)
+    monkeypatch.setattr(generate_pptx, "_compiled_templates", {})
+    monkeypatch.setattr(generate_pptx, "_parsed_templates", {})
+    monkeypatch.setattr(generate_pptx, "_generator_version", None)
+    monkeypatch.setattr(image_pipeline, "IMAGE_CACHE_DIR", root / "images")
+    monkeypatch.setattr(image_pipeline, "PROBE_CACHE_PATH", root / "images" / "probes.json")
+    monkeypatch.setattr(image_pipeline, "HTML_CACHE_DIR", root / "images" / "html")
+    monkeypatch.setattr(image_pipeline, "_probe_cache", None)
+    monkeypatch.setattr(build_graph, "CACHE_DIR", root / "build")
+    monkeypatch.setattr(build_graph, "DIGESTS_PATH", root / "build" / "digests.json")
+    monkeypatch.setattr(build_graph, "OBJECTS_DIR", root / "build" / "objects")
+    monkeypatch.setattr(build_graph, "RECORDS_DIR", root / "build" / "stages")
+    return root
+
+
+@pytest.fixture
+def template_copy(tmp_path, monkeypatch):
+    """수정해도 되는 템플릿 사본을 TEMPLATE_PATH로 사용"""
+    import generate_pptx
+
+    path = tmp_path / "template.pptx"
+    shutil.copyfile(generate_pptx.TEMPLATE_PATH, path)
+    monkeypatch.setattr(generate_pptx, "TEMPLATE_PATH", path)
+    return path
+
+
+def rename_layout(template_path, index, name):
+    """템플릿의 index번 레이아웃 이름을 바꾸고 mtime을 1초 뒤로 밀어 stat 서명이 확실히 달라지게 함"""
+    from pptx import Presentation
+
+    prs = Presentation(str(template_path))
+    prs.slide_layouts[index].name = name
+    prs.save(str(template_path))
+    os.utime(template_path, ns=(0, os.stat(template_path).st_mtime_ns + 10**9))
+
+
+def content_slide(number, elements, main_title="제목", action_title="요약"):
+    """layout 4 내지 슬라이드 하나의 콘텐츠 dict"""
+    return {
+        "slide_number": number,
+        "layout_id": 4,
+        "placeholders": {"main_title": main_title, "action_title": action_title},
+        "custom_elements": elements,
+    }
+
+
+def write_content(path, slides, title="테스트 덱"):
+    """slides로 presentation_content.json 형식 파일을 쓰고 경로 반환"""
+    path = Path(path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"presentation": {"title": title, "slides": slides}}, f, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import batch_generate
+from conftest import content_slide, write_content
+
+
+def test_output_names_disambiguate_same_stem(tmp_path):
+    files = [tmp_path / "sites" / "a" / "content.json", tmp_path / "sites" / "b" / "content.json", tmp_path / "other.json"]
+    assert batch_generate.output_names(files) == ["sites_a_content.pptx", "sites_b_content.pptx", "other.pptx"]
+
+
+def test_output_names_reject_remaining_clash(tmp_path):
+    with pytest.raises(ValueError, match="겹침"):
+        batch_generate.output_names([tmp_path / "Deck.json", tmp_path / "deck.json"])
+
+
+def test_collect_skips_manifest(tmp_path):
+    write_content(tmp_path / "deck.json", [content_slide(1, [])])
+    (tmp_path / "manifest.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "runs.json").write_text("{}", encoding="utf-8")
+    collected = batch_generate.collect_content_files([str(tmp_path)], exclude=[tmp_path / "runs.json"])
+    assert [path.name for path in collected] == ["deck.json"]
+
+
+def test_batch_keeps_decks_with_same_file_name(tmp_path, cache_dir):
+    for site in ("a", "b"):
+        (tmp_path / "sites" / site).mkdir(parents=True)
+        write_content(tmp_path / "sites" / site / "content.json", [content_slide(1, [], main_title=f"사이트 {site}")])
+    output_dir = tmp_path / "out"
+
+    assert batch_generate.main([str(tmp_path / "sites" / "*" / "content.json"), "-o", str(output_dir), "-j", "1"]) == 0
+    with open(output_dir / "manifest.json", encoding="utf-8") as f:
+        decks = json.load(f)["decks"]
+    outputs = [Path(deck["output"]) for deck in decks]
+    assert [path.name for path in outputs] == ["a_content.pptx", "b_content.pptx"]
+    assert all(path.exists() for path in outputs)
+
+
+def test_batch_reports_invalid_content(tmp_path, cache_dir):
+    chart = {"type": "comparison_chart", "data": {"items": [{"label": "시간", "as_is": "8", "to_be": 4}]}}
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [chart])])
+
+    result = batch_generate._generate_deck(content, tmp_path / "deck.pptx", stream=False)
+    assert result["status"] == "invalid"
+    assert result["error"] == "검증 오류 1건"
+    assert not (tmp_path / "deck.pptx").exists()
@@ -0,0 +1,47 @@
+import sys
+
+import pytest
+
+import benchmark
+import content_schema
+
+
+@pytest.mark.parametrize("mix", sorted(benchmark.MIXES))
+def test_synthetic_content_is_valid(mix, tmp_path, monkeypatch):
+    monkeypatch.setattr(benchmark, "BENCH_DIR", tmp_path)
+    images = [str(path) for path in benchmark.make_images(2, "64x36")]
+    content = benchmark.synthesize_content(40, mix, images)
+
+    slides = content["presentation"]["slides"]
+    assert [slide["slide_number"] for slide in slides] == list(range(1, 41))
+    assert content_schema.validate_content(content) == []
+    used = {element["type"] for slide in slides for element in slide.get("custom_elements", [])}
+    assert used <= set(benchmark.MIXES[mix])
+    assert benchmark.synthesize_content(40, mix, images) == content
+
+
+def test_baseline_comparison_flags_regressions():
+    baseline = {"results": [
+        {"case": "mixed-10", "generator": "pptx", "status": "ok", "seconds": 1.0, "peak_rss_kb": 1000},
+        {"case": "mixed-10", "generator": "html", "status": "ok", "seconds": 1.0, "peak_rss_kb": 1000},
+        {"case": "mixed-10", "generator": "workspace", "status": "ok", "seconds": 1.0, "peak_rss_kb": 1000},
+    ]}
+    results = [
+        {"case": "mixed-10", "generator": "pptx", "status": "ok", "seconds": 1.2, "peak_rss_kb": 1300},
+        {"case": "mixed-10", "generator": "html", "status": "error", "seconds": 0.1, "peak_rss_kb": 10},
+        {"case": "mixed-10", "generator": "workspace", "status": "ok", "seconds": 0.5, "peak_rss_kb": 900},
+        {"case": "mixed-100", "generator": "pptx", "status": "ok", "seconds": 9.0, "peak_rss_kb": 9000},
+    ]
+    assert benchmark.compare_to_baseline(results, baseline, benchmark.DEFAULT_TOLERANCE) == [
+        ("mixed-10", "pptx", "peak_rss_kb", 1000, 1300),
+        ("mixed-10", "html", "status", "ok", "error"),
+    ]
+
+
+def test_run_once_reports_child_rss_and_exit_code():
+    # 자식이 20MB를 잡으면 그 자식의 최대 RSS에 반영됨
+    seconds, rss_kb, code, _ = benchmark.run_once([sys.executable, "-c", "b = bytearray(20 * 2**20)"], timeout=60)
+    assert code == 0 and seconds > 0 and rss_kb > 20 * 1024
+
+    _, _, code, stderr = benchmark.run_once([sys.executable, "-c", "raise SystemExit('실패')"], timeout=60)
+    assert code == 1 and "실패" in stderr
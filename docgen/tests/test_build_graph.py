@@ -0,0 +1,151 @@
+import json
+import os
+import pickle
+
+import pytest
+
+import build
+import build_graph
+import content_model
+from build_graph import Stage
+from conftest import content_slide, write_content
+
+
+# run은 워커 프로세스로 넘어가므로 모듈 수준 함수
+def _upper(src, out):
+    text = (src / "a.txt").read_text(encoding="utf-8")
+    (out / "a.txt").write_text(text.upper(), encoding="utf-8")
+    return [out / "a.txt"]
+
+
+def _length(src, out):
+    text = (out / "a.txt").read_text(encoding="utf-8")
+    (out / "length.txt").write_text(str(len(text)), encoding="utf-8")
+    return [out / "length.txt"]
+
+
+def _copy_b(src, out):
+    (out / "b.txt").write_text((src / "b.txt").read_text(encoding="utf-8"), encoding="utf-8")
+    return [out / "b.txt"]
+
+
+def _fail(src, out):
+    raise RuntimeError("단계 실패")
+
+
+def _write(path, text):
+    # 같은 크기로 바꿔도 (크기, mtime) 서명이 달라지도록 mtime을 1초 뒤로
+    mtime_ns = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(0, max(os.stat(path).st_mtime_ns, mtime_ns + 10**9)))
+
+
+@pytest.fixture
+def tree(tmp_path, cache_dir):
+    src, out = tmp_path / "src", tmp_path / "out"
+    src.mkdir()
+    out.mkdir()
+    _write(src / "a.txt", "abc")
+    _write(src / "b.txt", "bee")
+    return src, out
+
+
+def _stages(src, out, upper=_upper):
+    return [
+        Stage("upper", upper, inputs=[src / "a.txt"], outputs=[out / "a.txt"]),
+        Stage("length", _length, inputs=[out / "a.txt"], outputs=[out / "length.txt"]),
+        Stage("copy_b", _copy_b, inputs=[src / "b.txt"], outputs=[out / "b.txt"]),
+    ]
+
+
+def _run(src, out, serial=True, **kwargs):
+    results = build_graph.run_graph(_stages(src, out, **kwargs), (src, out), out, serial=serial)
+    return {name: result["status"] for name, result in results.items()}
+
+
+def test_dependencies_follow_declared_outputs(tree):
+    src, out = tree
+    assert build_graph.dependencies(_stages(src, out)) == {"upper": set(), "length": {"upper"}, "copy_b": set()}
+
+
+def test_second_run_is_cached(tree):
+    src, out = tree
+    assert _run(src, out) == {"upper": "ok", "length": "ok", "copy_b": "ok"}
+    assert _run(src, out) == {"upper": "cached", "length": "cached", "copy_b": "cached"}
+
+
+def test_changed_input_reruns_only_its_stages(tree):
+    src, out = tree
+    _run(src, out)
+
+    _write(src / "b.txt", "벌")
+    assert _run(src, out) == {"upper": "cached", "length": "cached", "copy_b": "ok"}
+    assert (out / "b.txt").read_text(encoding="utf-8") == "벌"
+
+    _write(src / "a.txt", "abcd")
+    assert _run(src, out) == {"upper": "ok", "length": "ok", "copy_b": "cached"}
+    assert (out / "length.txt").read_text(encoding="utf-8") == "4"
+
+
+def test_same_upstream_bytes_skip_downstream(tree):
+    src, out = tree
+    _run(src, out)
+
+    # 대소문자만 바뀐 입력은 upper의 출력이 같으므로 length는 실행되지 않음
+    _write(src / "a.txt", "aBc")
+    assert _run(src, out) == {"upper": "ok", "length": "cached", "copy_b": "cached"}
+
+
+def test_missing_output_is_restored(tree):
+    src, out = tree
+    _run(src, out)
+    (out / "length.txt").unlink()
+    _write(out / "b.txt", "손으로 고침")
+
+    assert _run(src, out) == {"upper": "cached", "length": "restored", "copy_b": "restored"}
+    assert (out / "length.txt").read_text(encoding="utf-8") == "3"
+    assert (out / "b.txt").read_text(encoding="utf-8") == "bee"
+
+
+def test_failed_stage_skips_downstream(tree):
+    src, out = tree
+    assert _run(src, out, upper=_fail) == {"upper": "error", "length": "skipped", "copy_b": "ok"}
+    # 실패는 기록되지 않으므로 고친 뒤에는 다시 실행됨
+    assert _run(src, out) == {"upper": "ok", "length": "ok", "copy_b": "cached"}
+
+
+def test_parallel_run_matches_serial(tree):
+    src, out = tree
+    assert _run(src, out, serial=False) == {"upper": "ok", "length": "ok", "copy_b": "ok"}
+    assert (out / "length.txt").read_text(encoding="utf-8") == "3"
+    assert _run(src, out, serial=False) == {"upper": "cached", "length": "cached", "copy_b": "cached"}
+
+
+def test_build_reruns_only_formats_whose_input_changed(tmp_path, cache_dir):
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [])])
+    output_dir = tmp_path / "out"
+
+    def statuses():
+        results = build.build(content, ["pptx", "html"], output_dir, serial=True)
+        return {result["stage"]: result["status"] for result in results}
+
+    assert set(statuses().values()) == {"ok"}
+    assert set(statuses().values()) == {"cached"}
+
+    # 작성자는 PPTX 문서 속성에만 쓰이므로 HTML 단계는 그대로
+    with open(content, encoding="utf-8") as f:
+        data = json.load(f)
+    data["presentation"]["author"] = "홍길동"
+    with open(content, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    assert statuses() == {"validate": "ok", "pptx": "ok", "images": "cached", "html": "cached"}
+
+
+def test_deck_survives_pickling_to_workers(tmp_path):
+    # 워커 단계는 Deck을 피클된 인자로 받음
+    content = write_content(tmp_path / "deck.json", [
+        content_slide(1, [{"type": "table", "data": {"headers": ["항목", "값"], "rows": [["A", "1"]]}}]),
+    ])
+    deck = content_model.load_deck(content)
+    copied = pickle.loads(pickle.dumps(deck))
+    assert [slide.to_plain() for slide in copied.slides] == [slide.to_plain() for slide in deck.slides]
@@ -0,0 +1,96 @@
+import sys
+
+import pytest
+
+import content_schema
+from conftest import DOCGEN_DIR, content_slide, write_content
+from content_schema import ERROR, WARNING
+
+
+def _issues(slides):
+    return [(issue.level, issue.path) for issue in content_schema.validate_content({"presentation": {"slides": slides}})]
+
+
+@pytest.mark.parametrize("content_path", ["presentation_content.json", "presentation_content2.json"])
+def test_shipped_content_has_no_errors(content_path):
+    issues = content_schema.validate_file(DOCGEN_DIR / content_path)
+    assert [str(issue) for issue in issues if issue.level == ERROR] == []
+
+
+def test_structure_errors():
+    assert _issues(None) == [(ERROR, "presentation.slides")]
+    assert [issue.level for issue in content_schema.validate_content([])] == [ERROR]
+    assert [issue.path for issue in content_schema.validate_content({"presentation": {}})] == ["presentation.slides"]
+
+
+def test_element_errors():
+    slides = [content_slide(1, [
+        {"type": "comparison_chart", "data": {"items": [{"label": "시간", "as_is": "8", "to_be": True}]}},
+        {"type": "timeline", "data": {"phases": [{"name": "1"}, {"name": "2"}, {"name": "3"}]}},
+        {"type": "table", "data": {"headers": ["a"], "rows": ["행"]}},
+    ])]
+    errors = [path for level, path in _issues(slides) if level == ERROR]
+    assert errors == [
+        "slides[0] (슬라이드 1).custom_elements[0].data.items[0].as_is",
+        "slides[0] (슬라이드 1).custom_elements[0].data.items[0].to_be",
+        "slides[0] (슬라이드 1).custom_elements[1].data.phases",
+        "slides[0] (슬라이드 1).custom_elements[2].data.rows[0]",
+    ]
+
+
+def test_warnings_do_not_block():
+    slide = content_slide(1, [
+        {"type": "sparkline", "data": {}},
+        {"type": "table", "data": {"headers": ["a", "b"], "rows": [["1"]]}},
+        {"type": "screen_gallery", "data": {"screens": [{"image_path": "/없는/경로.png"}]}},
+        {"type": "architecture_diagram", "data": {
+            "layers": [{"name": "앱", "components": [{"name": "웹"}]}],
+            "connections": [{"from": "웹", "to": "DB"}],
+        }},
+    ])
+    del slide["layout_id"]
+    issues = _issues([slide])
+    assert {level for level, _ in issues} == {WARNING}
+    assert len(issues) == 5
+
+
+def test_main_exit_codes(tmp_path, capsys):
+    warned = write_content(tmp_path / "warned.json", [content_slide(1, [{"type": "sparkline", "data": {}}])])
+    broken = tmp_path / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+
+    assert content_schema.main([str(warned)]) == 0
+    assert content_schema.main(["--strict", str(warned)]) == 1
+    assert content_schema.main([str(broken)]) == 1
+    assert "읽을 수 없음" in capsys.readouterr().out
+
+
+def test_validate_does_not_import_renderers(tmp_path):
+    # cli.py validate는 python-pptx/lxml/PIL 없이 끝나야 함 (커밋 전 훅용)
+    import subprocess
+
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [])])
+    code = (
+        "import sys, cli; code = cli.main(['validate', '-q', sys.argv[1]]); "
+        "assert not {'pptx', 'lxml', 'PIL'} & set(sys.modules), sorted(sys.modules); sys.exit(code)"
+    )
+    result = subprocess.run([sys.executable, "-c", code, str(content)], cwd=DOCGEN_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("elem_type", ["icon_box_grid", "pain_point_cards"])
+@pytest.mark.parametrize("columns", ["2", 0, True])
+def test_columns_must_be_positive_int(elem_type, columns):
+    slides = [content_slide(1, [{"type": elem_type, "data": {"columns": columns, "items": []}}])]
+    assert _issues(slides) == [(ERROR, "slides[0] (슬라이드 1).custom_elements[0].data.columns")]
+    slides[0]["custom_elements"][0]["data"]["columns"] = 2
+    assert _issues(slides) == []
+
+
+@pytest.mark.parametrize("level", ["1", 0, 10, 1.5])
+def test_body_level_must_be_int_in_range(level):
+    slide = content_slide(1, [])
+    slide["placeholders"]["body"] = [{"level": 1, "text": "첫 항목"}, {"level": level, "text": "둘째 항목"}]
+    assert _issues([slide]) == [(ERROR, "slides[0] (슬라이드 1).placeholders.body[1].level")]
+    slide["placeholders"]["body"][1]["level"] = 2
+    assert _issues([slide]) == []
@@ -0,0 +1,115 @@
+import xml.etree.ElementTree as ET
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+import content_model
+import diagram
+import generate_pptx
+from conftest import content_slide, write_content
+
+ARCHITECTURE = {
+    "layers": [{"name": "Client", "components": [{"name": "Web"}]}, {"name": "API", "components": [{"name": "Gateway"}]}],
+    "connections": [{"from": "Web", "to": "Gateway", "protocol": "HTTPS"}],
+}
+
+
+def _element(layers, connections):
+    return content_model.ArchitectureDiagram.parse({
+        "layers": [
+            {"name": name, "components": [{"name": component} for component in components]}
+            for name, components in layers
+        ],
+        "connections": [{"from": source, "to": target, "protocol": protocol} for source, target, protocol in connections],
+    })
+
+
+def _nodes(scene):
+    """노드 이름 -> 노드 사각형 (노드 안 글자의 첫 줄은 굵은 이름, 레이어 제목은 패널 머리에 있음)"""
+    rects = [item for item in scene.items if isinstance(item, diagram.Rect) and item.fill == diagram.WHITE]
+    names = {}
+    for item in scene.items:
+        if isinstance(item, diagram.Text) and item.bold:
+            for rect in rects:
+                if rect.x <= item.x <= rect.x + rect.w and rect.y <= item.y <= rect.y + rect.h:
+                    names[item.text] = rect
+    return names
+
+
+def _edges(scene):
+    return [item for item in scene.items if isinstance(item, diagram.Polyline)]
+
+
+def test_layers_become_columns_joined_by_orthogonal_edges():
+    scene = diagram.layout(_element(
+        [("Client", ["Web", "Mobile"]), ("API", ["Gateway", "Web"]), ("Data", ["DB"])],
+        [("Web", "Gateway", "HTTPS"), ("Mobile", "Gateway", ""), ("Gateway", "DB", "JDBC"), ("Gateway", "Nowhere", "")],
+    ))
+    nodes = _nodes(scene)
+
+    # 같은 이름은 처음 것만, 알 수 없는 이름을 잇는 연결은 건너뜀
+    assert sorted(nodes) == ["DB", "Gateway", "Mobile", "Web"]
+    assert nodes["Web"].x == nodes["Mobile"].x < nodes["Gateway"].x < nodes["DB"].x
+    panels = [item for item in scene.items if isinstance(item, diagram.Rect) and item.fill == diagram.PANEL_FILL]
+    assert len(panels) == 3
+
+    edges = _edges(scene)
+    assert len(edges) == 3
+    for edge in edges:
+        assert all(x1 == x2 or y1 == y2 for (x1, y1), (x2, y2) in zip(edge.points, edge.points[1:]))
+    https = next(edge for edge in edges if edge.points[0][0] == nodes["Web"].x + nodes["Web"].w)
+    assert https.points[-1][0] == nodes["Gateway"].x
+    labels = [item.text for item in scene.items if isinstance(item, diagram.Text) and item.size == diagram.LABEL_SIZE]
+    assert sorted(labels) == ["HTTPS", "JDBC"]
+
+    for item in scene.items:
+        left, top, right, bottom = diagram._bounds(item)
+        assert left >= 0 and top >= 0 and right <= scene.width and bottom <= scene.height
+
+
+def test_crossing_edges_are_reordered():
+    scene = diagram.layout(_element(
+        [("A", ["a1", "a2"]), ("B", ["b1", "b2"])],
+        [("a1", "b2", ""), ("a2", "b1", "")],
+    ))
+    nodes = _nodes(scene)
+    assert nodes["a1"].y < nodes["a2"].y
+    assert nodes["b2"].y < nodes["b1"].y
+
+
+def test_large_layer_splits_into_subcolumns():
+    components = [f"svc{i}" for i in range(6)]
+    scene = diagram.layout(_element([("Services", components)], []), max_rows=2)
+    nodes = _nodes(scene)
+    assert len({rect.x for rect in nodes.values()}) == 3
+    assert len({rect.y for rect in nodes.values()}) == 2
+
+
+def test_deck_scene_and_svg():
+    plain = content_model.Deck.parse({"presentation": {"slides": [
+        content_slide(1, [{"type": "architecture_diagram", "data": {}}]),
+    ]}})
+    assert diagram.deck_scene(plain) is None
+
+    deck = content_model.Deck.parse({"presentation": {"slides": [
+        content_slide(1, [{"type": "architecture_diagram", "data": ARCHITECTURE}]),
+    ]}})
+    scene = diagram.deck_scene(deck)
+    root = ET.fromstring(diagram.to_svg(scene))
+    assert root.get("viewBox") == f"0 0 {scene.width} {scene.height}"
+    texts = [element.text for element in root.iter() if element.tag.endswith("text")]
+    assert {"Client", "API", "Web", "Gateway", "HTTPS"} <= set(texts)
+
+
+def test_pptx_draws_the_same_scene(tmp_path, cache_dir):
+    content = write_content(tmp_path / "deck.json", [
+        content_slide(1, [{"type": "architecture_diagram", "data": ARCHITECTURE}]),
+    ])
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output))
+
+    shapes = Presentation(str(output)).slides[0].shapes
+    texts = {shape.text_frame.text for shape in shapes if shape.has_text_frame}
+    assert {"Client", "API", "Web", "Gateway", "HTTPS"} <= texts
+    # 구성도 이미지가 아니라 네이티브 도형
+    assert not any(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in shapes)
@@ -0,0 +1,46 @@
+import json
+import zipfile
+
+import pytest
+
+import drawingml
+import generate_pptx
+from conftest import write_content
+
+
+def _parts(pptx_path):
+    # zip 항목 시각은 실행마다 달라지므로 항목 이름 -> 내용으로 비교
+    with zipfile.ZipFile(pptx_path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+@pytest.fixture
+def shape_deck(tmp_path):
+    """기본 콘텐츠에서 DrawingML 렌더러가 있는 요소를 쓰는 슬라이드만 모은 덱"""
+    with open(generate_pptx.CONTENT_PATH, encoding="utf-8") as f:
+        slides = json.load(f)["presentation"]["slides"]
+    selected = [
+        slide for slide in slides
+        if any(element["type"] in drawingml.RENDERERS for element in slide.get("custom_elements", []))
+    ]
+    types = {element["type"] for slide in selected for element in slide["custom_elements"]}
+    assert set(drawingml.RENDERERS) <= types
+    return write_content(tmp_path / "deck.json", selected)
+
+
+def test_drawingml_backend_matches_python_pptx(shape_deck, tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setattr(generate_pptx, "ELEMENT_BACKENDS", {})
+    baseline = tmp_path / "pptx.pptx"
+    generate_pptx.generate_presentation(str(shape_deck), str(baseline), fast_elements=[])
+    fast = tmp_path / "drawingml.pptx"
+    generate_pptx.generate_presentation(str(shape_deck), str(fast), fast_elements="all")
+
+    assert generate_pptx.ELEMENT_BACKENDS == {name: "drawingml" for name in drawingml.RENDERERS}
+    assert _parts(fast) == _parts(baseline)
+
+
+def test_unknown_fast_element_is_rejected(monkeypatch):
+    monkeypatch.setattr(generate_pptx, "ELEMENT_BACKENDS", {"timeline": "drawingml"})
+    with pytest.raises(ValueError, match="table"):
+        generate_pptx.set_element_backends(["timeline", "table"])
+    assert generate_pptx.ELEMENT_BACKENDS == {"timeline": "drawingml"}
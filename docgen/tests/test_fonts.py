@@ -0,0 +1,50 @@
+import pytest
+from PIL import Image, ImageDraw
+
+import fonts
+
+
+@pytest.fixture
+def glyph_cache():
+    fonts._glyph.cache_clear()
+    fonts._advance.cache_clear()
+    yield fonts._glyph
+    fonts._glyph.cache_clear()
+
+
+@pytest.mark.parametrize("text", ["Hello, World", "AV To Wa", "한글 라벨 123"])
+def test_measure_matches_pillow_layout(text):
+    # 글자 쌍별 advance의 합이 Pillow 레이아웃의 전체 폭과 같아야 draw.text()와 같은 자리에 그려짐
+    assert fonts.measure(text, 20) == pytest.approx(fonts.face(20).font.getlength(text), abs=0.5)
+
+
+def test_wrap_fits_width():
+    text = "모니터링 대시보드 구성 요소와 연계 시스템 AVeryLongIdentifierWithoutSpaces"
+    lines = fonts.wrap(text, 16, 120)
+    assert len(lines) > 1
+    assert all(fonts.measure(line, 16) <= 120 for line in lines)
+    assert "".join(lines).replace(" ", "") == text.replace(" ", "")
+    assert fonts.wrap("첫 줄\n둘째 줄", 16, 1000) == ["첫 줄", "둘째 줄"]
+
+
+def test_repeated_labels_reuse_glyphs(glyph_cache):
+    image = Image.new("RGB", (400, 100), "white")
+    fonts.draw_text(image, (10, 50), "ABAB", 20, "#000000")
+    first = glyph_cache.cache_info()
+    assert first.misses <= 2 * fonts.SUBPIXEL
+
+    fonts.draw_text(image, (10, 50), "ABAB", 20, "#000000")
+    second = glyph_cache.cache_info()
+    assert second.misses == first.misses
+    assert second.hits == first.hits + 4
+
+
+def test_draw_text_matches_pillow_placement():
+    font = fonts.face(24).font
+    cached = Image.new("L", (300, 80), 0)
+    fonts.draw_text(cached, (150, 40), "Label 42", 24, 255, anchor="mm")
+    direct = Image.new("L", (300, 80), 0)
+    ImageDraw.Draw(direct).text((150, 40), "Label 42", fill=255, font=font, anchor="mm")
+
+    cached_box, direct_box = cached.getbbox(), direct.getbbox()
+    assert all(abs(a - b) <= 1 for a, b in zip(cached_box, direct_box))
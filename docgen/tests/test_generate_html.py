@@ -0,0 +1,97 @@
+import re
+
+from PIL import Image
+
+import content_model
+import generate_html
+from conftest import content_slide, write_content
+
+
+def _chart(as_is):
+    return {
+        "type": "comparison_chart",
+        "data": {"title": "KPI", "items": [{"label": "수리 시간", "as_is": as_is, "to_be": 4, "unit": "시간"}]},
+    }
+
+
+def test_main_rejects_invalid_content(tmp_path, cache_dir, capsys):
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [_chart("여덟")])])
+    output = tmp_path / "deck.html"
+
+    assert generate_html.main(str(content), str(output)) == 1
+    assert not output.exists()
+    assert "validation error" in capsys.readouterr().out
+
+
+def test_main_writes_valid_content(tmp_path, cache_dir):
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [_chart(8)])])
+    output = tmp_path / "deck.html"
+
+    assert generate_html.main(str(content), str(output)) == 0
+    assert "수리 시간" in output.read_text(encoding="utf-8")
+
+
+def test_main_creates_output_directory(tmp_path, cache_dir):
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [])])
+    output = tmp_path / "new" / "dir" / "deck.html"
+
+    assert generate_html.main(str(content), str(output)) == 0
+    assert output.exists()
+
+
+def _deck(slides):
+    return content_model.Deck.parse({"presentation": {"title": "테스트 덱", "slides": slides}})
+
+
+def test_slides_are_inert_payloads():
+    deck = _deck([content_slide(1, [], main_title="a </script> b"), content_slide(2, []), content_slide(3, [])])
+    html = generate_html.render_html(deck)
+    payloads = re.findall(r"<script type='text/html' class='slide-src'>(.*?)</script>", html, re.S)
+
+    assert len(payloads) == 3
+    assert [re.search(r"id='(slide-\d+)'", payload).group(1) for payload in payloads] == ["slide-1", "slide-2", "slide-3"]
+    # 본문 속 </script는 페이로드를 끝내지 않도록 이스케이프되고, 보이는 슬라이드 DOM은 스크립트가 만듦
+    assert "a <\\/script> b" in payloads[0]
+    assert "<div class='slide'" not in re.sub(r"<script type='text/html'.*?</script>", "", html, flags=re.S)
+    # 첫 슬라이드는 나머지 페이로드를 파싱하기 전에 그림
+    assert html.index("<script>showSlide(0)</script>") < html.index("id='slide-2'")
+    assert html.count("showSlide(0)") == 1
+
+
+def _gallery(*paths):
+    return {"type": "screen_gallery", "data": {"screens": [{"image_path": str(p), "label": p.stem} for p in paths]}}
+
+
+def test_images_become_responsive_pictures(tmp_path, cache_dir):
+    large, small = tmp_path / "large.png", tmp_path / "small.png"
+    Image.new("RGB", (2400, 1350), "navy").save(large)
+    Image.new("RGB", (120, 80), "teal").save(small)
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [_gallery(large, small)])])
+    output = tmp_path / "out" / "deck.html"
+
+    assert generate_html.main(str(content), str(output)) == 0
+    html = output.read_text(encoding="utf-8")
+    pictures = re.findall(r"<picture>.*?</picture>", html)
+    assert len(pictures) == 2
+    assert all("type='image/webp'" in picture and "decoding='async'" in picture for picture in pictures)
+    assert str(large) not in html and str(small) not in html
+
+    written = sorted(path.name for path in (output.parent / generate_html.IMAGES_DIR).iterdir())
+    widths = {path: Image.open(output.parent / generate_html.IMAGES_DIR / path).width for path in written}
+    assert all(width < 2400 for width in widths.values())
+    # 원본보다 크게 만들지 않으므로 작은 이미지는 1x/2x가 한 변형으로 합쳐짐
+    assert len(re.findall(r"\d+w", pictures[1])) == 2
+    assert all(f"{generate_html.IMAGES_DIR}/{name}" in html for name in written)
+
+
+def test_original_images_keep_source_paths(tmp_path, cache_dir):
+    image = tmp_path / "screen.png"
+    Image.new("RGB", (800, 450), "navy").save(image)
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [_gallery(image)])])
+    output = tmp_path / "deck.html"
+
+    assert generate_html.main(str(content), str(output), responsive_images=False) == 0
+    html = output.read_text(encoding="utf-8")
+    assert "<picture>" not in html
+    assert "screen.png" in html
+    assert not (tmp_path / generate_html.IMAGES_DIR).exists()
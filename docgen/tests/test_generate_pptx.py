@@ -0,0 +1,70 @@
+import pytest
+from pptx import Presentation
+
+import content_model
+import content_schema
+import generate_pptx
+from conftest import content_slide, write_content
+
+
+def _chart(as_is):
+    return {
+        "type": "comparison_chart",
+        "data": {"title": "KPI", "items": [{"label": "수리 시간", "as_is": as_is, "to_be": 4, "unit": "시간"}]},
+    }
+
+
+def test_invalid_content_stops_before_rendering(tmp_path, cache_dir, capsys):
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [_chart("8")])])
+    output = tmp_path / "deck.pptx"
+
+    with pytest.raises(content_schema.ValidationError) as excinfo:
+        generate_pptx.generate_presentation(str(content), str(output))
+    paths = [issue.path for issue in excinfo.value.issues]
+    assert paths == ["slides[0] (슬라이드 1).custom_elements[0].data.items[0].as_is"]
+    assert not output.exists()
+    assert "as_is" in capsys.readouterr().out
+
+
+def test_main_exit_codes(tmp_path, cache_dir):
+    valid = write_content(tmp_path / "valid.json", [content_slide(1, [_chart(8)])])
+    invalid = write_content(tmp_path / "invalid.json", [content_slide(1, [_chart("8")])])
+
+    assert generate_pptx.main(["-c", str(valid), "-o", str(tmp_path / "valid.pptx")]) == 0
+    assert generate_pptx.main(["-c", str(invalid), "-o", str(tmp_path / "invalid.pptx")]) == 1
+    assert not (tmp_path / "invalid.pptx").exists()
+
+
+def _table(row_count):
+    rows = [[f"R{i}", str(i)] for i in range(row_count)]
+    return {"type": "table", "data": {"headers": ["항목", "값"], "rows": rows}}
+
+
+def test_long_table_continues_on_new_slides():
+    per_slide = generate_pptx.table_rows_per_slide()
+    deck = content_model.Deck.parse({"presentation": {"slides": [
+        content_slide(1, [_table(2 * per_slide + 1), _chart(8)]),
+        content_slide(2, [_table(per_slide)]),
+    ]}})
+    slides = generate_pptx.paginate_tables(deck.slides)
+
+    assert [len(slide.elements) for slide in slides] == [2, 1, 1, 1]
+    assert [len(slides[i].elements[0].rows) for i in range(4)] == [per_slide, per_slide, 1, per_slide]
+    assert slides[0].elements[1].TYPE == "comparison_chart"
+    assert slides[2].elements[0].rows == [[f"R{2 * per_slide}", str(2 * per_slide)]]
+    # 이어지는 슬라이드는 헤더를 반복하고 제목에 CONTINUED_SUFFIX를 붙임
+    assert slides[1].elements[0].headers == ["항목", "값"]
+    assert [slide.action_title for slide in slides[:3]] == ["요약", "요약 (계속)", "요약 (계속)"]
+    assert slides[3] is deck.slides[1]
+
+
+def test_paginated_tables_are_rendered(tmp_path, cache_dir):
+    per_slide = generate_pptx.table_rows_per_slide()
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [_table(per_slide + 2)])])
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output))
+
+    tables = [shape.table for slide in Presentation(str(output)).slides for shape in slide.shapes if shape.has_table]
+    assert [len(table.rows) for table in tables] == [per_slide + 1, 3]
+    assert tables[1].cell(0, 0).text == "항목"
+    assert tables[1].cell(2, 0).text == f"R{per_slide + 1}"
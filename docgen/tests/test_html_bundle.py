@@ -0,0 +1,60 @@
+import re
+
+import pytest
+
+import content_model
+import generate_pptx
+import html_bundle
+
+
+@pytest.fixture
+def deck():
+    """기본 콘텐츠 전체 (생성기가 쓰는 클래스/아이콘을 모두 포함)"""
+    return content_model.load_deck(generate_pptx.CONTENT_PATH)
+
+
+@pytest.fixture(autouse=True)
+def no_font(monkeypatch, tmp_path):
+    # 작업 트리의 글꼴 파일과 무관하게 시스템 글꼴 대체 경로로
+    monkeypatch.setattr(html_bundle, "FONT_DIRS", (tmp_path / "fonts",))
+    monkeypatch.delenv(html_bundle.FONT_ENV, raising=False)
+
+
+def test_inline_bundle_has_no_cdn_references(deck, tmp_path, cache_dir):
+    output = tmp_path / "deck.html"
+    summary = html_bundle.write_bundle(deck, output, str(tmp_path))
+    html = output.read_text(encoding="utf-8")
+
+    assert summary["unknown_classes"] == [] and summary["missing_icons"] == []
+    assert summary["files"] == [] and summary["font"] is None
+    assert not re.search(r"cdn\.tailwindcss\.com|fonts\.googleapis\.com|cdnjs\.cloudflare\.com", html)
+    assert "<i class=" not in html and '<svg class="icon"' in html
+    assert html.count("<style>") == 2
+    assert ".grid-cols-" in html and "@keyframes" in html
+
+
+def test_files_bundle_writes_hashed_stylesheet(deck, tmp_path, cache_dir):
+    output = tmp_path / "deck.html"
+    summary = html_bundle.write_bundle(deck, output, str(tmp_path), mode="files")
+
+    [css_name] = summary["files"]
+    assert re.fullmatch(r"deck\.[0-9a-f]{10}\.css", css_name)
+    css = (tmp_path / css_name).read_text(encoding="utf-8")
+    assert len(css.encode("utf-8")) == summary["css_bytes"]
+    assert f'<link rel="stylesheet" href="{css_name}">' in output.read_text(encoding="utf-8")
+
+    # 같은 덱이면 같은 파일 이름 (내용 해시)
+    assert html_bundle.write_bundle(deck, tmp_path / "deck.html", str(tmp_path), mode="files")["files"] == [css_name]
+
+
+def test_unknown_mode_is_rejected(deck, tmp_path):
+    with pytest.raises(ValueError, match="번들 모드"):
+        html_bundle.write_bundle(deck, tmp_path / "deck.html", mode="zip")
+
+
+def test_utility_css_covers_arbitrary_spacing_and_hover():
+    css, unknown = html_bundle.utility_css({"p-4", "mt-0", "group-hover:text-white", "grid-cols-3", "no-such-class"})
+    assert ".p-4{padding:1rem}" in css
+    assert ".mt-0{margin-top:0px}" in css
+    assert ".group:hover .group-hover\\:text-white{color:" in css
+    assert unknown == {"no-such-class"}
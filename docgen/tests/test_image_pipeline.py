@@ -0,0 +1,44 @@
+import zipfile
+
+from PIL import Image
+
+import generate_pptx
+import image_pipeline
+from conftest import content_slide, write_content
+
+
+def _gallery(layout, image_path):
+    return {"type": "screen_gallery", "data": {"layout": layout, "screens": [{"image_path": str(image_path), "label": "화면"}]}}
+
+
+def _media(pptx_path):
+    with zipfile.ZipFile(pptx_path) as zf:
+        return sorted(zf.read(name) for name in zf.namelist() if name.startswith("ppt/media/"))
+
+
+def test_plan_keeps_largest_box_per_image(tmp_path, cache_dir):
+    image_path = tmp_path / "screen.png"
+    Image.new("RGB", (400, 1600), "white").save(image_path)
+
+    plan = image_pipeline.ImagePlan()
+    plan.add(image_path, 1000, 2000)
+    plan.add(image_path, 800, 3000)
+    sha1 = image_pipeline.probe_image(image_path)["sha1"]
+    assert plan.box(sha1) == (1000, 3000)
+    assert image_pipeline.ImagePlan().box(sha1) == (0, 0)
+
+
+def test_plan_is_scoped_to_one_deck(tmp_path, cache_dir):
+    # 같은 스크린샷을 A는 모바일(큰 박스), B는 웹(작은 박스) 갤러리로 사용
+    image_path = tmp_path / "screen.png"
+    Image.new("RGB", (400, 1600), (40, 90, 160)).save(image_path)
+    deck_a = write_content(tmp_path / "a.json", [content_slide(1, [_gallery("horizontal_1", image_path)])])
+    deck_b = write_content(tmp_path / "b.json", [content_slide(1, [_gallery("horizontal_1_wide", image_path)])])
+
+    generate_pptx.generate_presentation(deck_b, tmp_path / "b_alone.pptx")
+    generate_pptx.generate_presentation(deck_a, tmp_path / "a.pptx")
+    generate_pptx.generate_presentation(deck_b, tmp_path / "b_after_a.pptx")
+
+    alone = _media(tmp_path / "b_alone.pptx")
+    assert alone and alone == _media(tmp_path / "b_after_a.pptx")
+    assert alone != _media(tmp_path / "a.pptx")
@@ -0,0 +1,114 @@
+import shutil
+import zipfile
+
+import content_schema
+import generate_pptx
+import slide_parts
+from conftest import content_slide, rename_layout, write_content
+
+
+def _deck(title_of_second="둘째"):
+    return [
+        content_slide(1, [{"type": "table", "data": {"headers": ["항목", "값"], "rows": [["A", "1"], ["B", "2"]]}}]),
+        content_slide(2, [{"type": "comparison_chart", "data": {
+            "title": "KPI", "items": [{"label": "수리 시간", "as_is": 8, "to_be": 4, "unit": "시간"}],
+        }}], main_title=title_of_second),
+        content_slide(3, [{"type": "process_flow", "data": {"steps": [
+            {"code": "P1", "name": "접수", "actor": "현장"},
+            {"code": "P2", "name": "처리", "actor": "담당자"},
+        ]}}]),
+    ]
+
+
+def _parts(pptx_path):
+    # zip 항목 시각은 실행마다 달라지므로 항목 이름 -> 내용으로 비교
+    with zipfile.ZipFile(pptx_path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def test_deck_is_valid():
+    assert content_schema.validate_content({"presentation": {"slides": _deck()}}) == []
+
+
+def test_incremental_rebuild_matches_full_build(tmp_path, cache_dir, capsys):
+    content = write_content(tmp_path / "deck.json", _deck())
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+    assert "증분 빌드: 0/3" in capsys.readouterr().out
+
+    write_content(content, _deck(title_of_second="바뀐 둘째"))
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+    assert "증분 빌드: 2/3" in capsys.readouterr().out
+
+    full = tmp_path / "full.pptx"
+    generate_pptx.generate_presentation(str(content), str(full))
+    assert _parts(output) == _parts(full)
+
+
+def test_edited_output_falls_back_to_full_build(tmp_path, cache_dir, capsys):
+    content = write_content(tmp_path / "deck.json", _deck())
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+
+    # 사용자가 출력 파일을 덮어쓰면 매니페스트와 맞지 않으므로 재사용하지 않음
+    generate_pptx.generate_presentation(str(content), str(tmp_path / "other.pptx"))
+    shutil.copyfile(tmp_path / "other.pptx", output)
+    capsys.readouterr()
+
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+    assert "증분 빌드: 0/3" in capsys.readouterr().out
+
+
+def test_template_change_invalidates_every_slide(tmp_path, cache_dir, template_copy, capsys):
+    content = write_content(tmp_path / "deck.json", _deck())
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+    assert "증분 빌드: 3/3" in capsys.readouterr().out
+
+    rename_layout(template_copy, 3, "바뀐 내지")
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+    assert "증분 빌드: 0/3" in capsys.readouterr().out
+
+
+def test_generator_version_tracks_sources_and_template(tmp_path, cache_dir, template_copy, monkeypatch):
+    sources = tmp_path / "src"
+    sources.mkdir()
+    for module_name in generate_pptx.GENERATOR_SOURCES:
+        shutil.copyfile(generate_pptx.BASE_DIR / module_name, sources / module_name)
+    monkeypatch.setattr(generate_pptx, "BASE_DIR", sources)
+
+    original = generate_pptx.generator_version()
+    assert generate_pptx.generator_version() == original
+
+    with open(sources / "slide_parts.py", "a", encoding="utf-8") as f:
+        f.write("\n# 렌더링 코드 변경\n")
+    changed_source = generate_pptx.generator_version()
+    assert changed_source != original
+
+    rename_layout(template_copy, 3, "바뀐 내지")
+    assert generate_pptx.generator_version() not in (original, changed_source)
+
+
+def test_only_reused_slides_are_read(tmp_path, cache_dir, monkeypatch, capsys):
+    content = write_content(tmp_path / "deck.json", _deck())
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+
+    read = []
+    real_read = zipfile.ZipFile.read
+
+    def spy(zf, name, *args, **kwargs):
+        read.append(getattr(name, "filename", name))
+        return real_read(zf, name, *args, **kwargs)
+
+    monkeypatch.setattr(slide_parts.zipfile.ZipFile, "read", spy)
+    slides = _deck()
+    slides[0]["placeholders"]["main_title"] = "바뀐 첫째"
+    slides[2]["placeholders"]["main_title"] = "바뀐 셋째"
+    write_content(content, slides)
+    generate_pptx.generate_presentation(str(content), str(output), incremental=True)
+
+    assert "증분 빌드: 1/3" in capsys.readouterr().out
+    slide_xml = [name for name in read if name.startswith("ppt/slides/slide")]
+    assert slide_xml == ["ppt/slides/slide2.xml"]
@@ -0,0 +1,67 @@
+import zipfile
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+
+import generate_pptx
+import pptx_optimize
+from conftest import content_slide, write_content
+
+
+@pytest.fixture
+def deck(tmp_path, cache_dir):
+    screen = tmp_path / "screen.png"
+    Image.effect_noise((320, 200), 64).convert("RGB").save(screen)
+    gallery = {"type": "screen_gallery", "data": {"screens": [{"image_path": str(screen), "label": "화면"}]}}
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [gallery]), content_slide(2, [])])
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output))
+    return output
+
+
+def _infos(pptx_path):
+    with zipfile.ZipFile(pptx_path) as zf:
+        return {info.filename: info for info in zf.infolist()}
+
+
+def test_optimizer_strips_template_dead_weight(deck, tmp_path):
+    output = tmp_path / "optimized.pptx"
+    report = pptx_optimize.optimize_pptx(deck, output)
+
+    removed = {name for name, _ in report["removed"]}
+    assert "docProps/thumbnail.jpeg" in removed
+    assert any(name.startswith("ppt/embeddings/") for name in removed)
+    assert report["layouts_removed"]
+    assert report["output_bytes"] < report["input_bytes"]
+    assert not removed & set(_infos(output))
+
+    prs = Presentation(str(output))
+    assert len(prs.slides) == 2
+    assert [slide.slide_layout.name for slide in prs.slides] == [
+        slide.slide_layout.name for slide in Presentation(str(deck)).slides
+    ]
+    with zipfile.ZipFile(output) as zf:
+        assert zf.testzip() is None
+
+
+def test_media_is_not_recompressed(deck, tmp_path):
+    output = tmp_path / "optimized.pptx"
+    pptx_optimize.optimize_pptx(deck, output, compresslevel=0)
+    before, after = _infos(deck), _infos(output)
+
+    media = [name for name in after if name.startswith("ppt/media/")]
+    assert media
+    for name in media:
+        assert after[name].compress_type == before[name].compress_type
+        assert after[name].compress_size <= before[name].compress_size
+    # 압축 수준(0: 압축 안 함)은 XML/.rels에만 적용
+    assert after["ppt/presentation.xml"].compress_size >= after["ppt/presentation.xml"].file_size
+
+
+def test_keep_layouts(deck, tmp_path):
+    output = tmp_path / "optimized.pptx"
+    report = pptx_optimize.optimize_pptx(deck, output, keep_layouts=True)
+    assert report["layouts_removed"] == []
+    assert len(Presentation(str(output)).slide_layouts) == len(Presentation(str(deck)).slide_layouts)
+    assert "재압축/XML 정리" in pptx_optimize.format_report(report)
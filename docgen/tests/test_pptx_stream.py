@@ -0,0 +1,62 @@
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+from pptx import Presentation
+
+import generate_pptx
+from conftest import content_slide, write_content
+
+
+def _parts(pptx_path):
+    # zip 항목 시각과 기록 순서는 저장 방식마다 다르므로 항목 이름 -> 내용으로 비교
+    with zipfile.ZipFile(pptx_path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def _deck(tmp_path, count):
+    screen = tmp_path / "screen.png"
+    Image.new("RGB", (640, 400), "navy").save(screen)
+    gallery = {"type": "screen_gallery", "data": {"screens": [{"image_path": str(screen), "label": "화면"}]}}
+    table = {"type": "table", "data": {"headers": ["항목", "값"], "rows": [["A", "1"]]}}
+    return write_content(tmp_path / "deck.json", [
+        content_slide(i + 1, [gallery if i % 2 else table], main_title=f"슬라이드 {i + 1}") for i in range(count)
+    ])
+
+
+def test_stream_matches_normal_save(tmp_path, cache_dir):
+    content = _deck(tmp_path, 6)
+    generate_pptx.generate_presentation(str(content), str(tmp_path / "saved.pptx"))
+    generate_pptx.generate_presentation(str(content), str(tmp_path / "streamed.pptx"), stream=True)
+
+    assert _parts(tmp_path / "streamed.pptx") == _parts(tmp_path / "saved.pptx")
+    assert len(Presentation(str(tmp_path / "streamed.pptx")).slides) == 6
+
+
+def test_parallel_stream_matches_normal_save(tmp_path, cache_dir, monkeypatch):
+    # 묶음을 작게 해 여러 묶음이 제한된 수만큼만 실행되는 경로를 탐
+    monkeypatch.setattr(generate_pptx, "PARALLEL_CHUNK_SLIDES", 1)
+    content = _deck(tmp_path, 8)
+    generate_pptx.generate_presentation(str(content), str(tmp_path / "saved.pptx"))
+    generate_pptx.generate_presentation(str(content), str(tmp_path / "streamed.pptx"), jobs=2, stream=True)
+
+    assert _parts(tmp_path / "streamed.pptx") == _parts(tmp_path / "saved.pptx")
+
+
+def test_submit_bounded_limits_pending_results():
+    lock = threading.Lock()
+    submitted = []
+
+    def work(item):
+        with lock:
+            submitted.append(item)
+        return item * 10
+
+    consumed = []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for result in generate_pptx._submit_bounded(pool, work, range(20), limit=3):
+            # 소비한 결과 + 기다리는 작업(최대 3개)보다 많이 제출되지 않음
+            assert len(submitted) <= len(consumed) + 1 + 3
+            consumed.append(result)
+    assert consumed == [item * 10 for item in range(20)]
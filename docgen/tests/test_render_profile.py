@@ -0,0 +1,46 @@
+import json
+
+import generate_pptx
+import render_profile
+from conftest import content_slide, write_content
+
+
+def test_profile_writes_trace_and_summary(tmp_path, cache_dir, capsys):
+    content = write_content(tmp_path / "deck.json", [
+        content_slide(1, [{"type": "table", "data": {"headers": ["항목", "값"], "rows": [["A", "1"]]}}]),
+        content_slide(2, []),
+    ])
+    trace = tmp_path / "trace.json"
+    generate_pptx.generate_presentation(str(content), str(tmp_path / "deck.pptx"), profile=trace)
+
+    with open(trace, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    names = {event["name"] for event in events}
+    assert {"generate_presentation", "template.load", "slide 1", "slide 2", "table", "save"} <= names
+    assert all(event["ph"] == "X" and event["dur"] >= 0 and "alloc_bytes" in event["args"] for event in events)
+    total = next(event for event in events if event["name"] == "generate_presentation")
+    for event in events:
+        assert total["ts"] <= event["ts"] and event["ts"] + event["dur"] <= total["ts"] + total["dur"] + 1
+
+    out = capsys.readouterr().out
+    assert "가장 느린 슬라이드 (상위 2개)" in out
+    # zip 기여도 표의 종류별 줄 (슬라이드 2장 = XML과 rels 4개 파트)
+    assert any(line.split()[:2] == ["slides", "4"] for line in out.splitlines())
+    # 프로파일링이 끝나면 span()은 다시 빈 컨텍스트
+    assert render_profile.span("after") is render_profile._NULL_SPAN
+
+
+def test_summary_groups_slides():
+    profiler = render_profile.RenderProfiler(trace_memory=False)
+    render_profile.activate(profiler)
+    try:
+        for number in (1, 2, 3):
+            with render_profile.span(f"slide {number}", "slide", slide_number=number, layout_id=4):
+                with render_profile.span("table", "element"):
+                    pass
+    finally:
+        render_profile.deactivate()
+
+    rows = dict(profiler.summary_rows())
+    assert rows[("slide", "slide")][0] == 3
+    assert rows[("element", "table")][0] == 3
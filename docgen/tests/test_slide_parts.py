@@ -0,0 +1,79 @@
+import zipfile
+from io import BytesIO
+
+import pytest
+from lxml import etree
+from PIL import Image
+from pptx import Presentation
+
+import generate_pptx
+import slide_parts
+from conftest import content_slide, write_content
+
+
+def _parts(pptx_path):
+    # zip 항목 시각은 실행마다 달라지므로 항목 이름 -> 내용으로 비교
+    with zipfile.ZipFile(pptx_path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def _media_count(names):
+    return len([name for name in names if name.startswith("ppt/media/")])
+
+
+def _canonical(xml):
+    return etree.tostring(etree.fromstring(xml), method="c14n")
+
+
+@pytest.fixture
+def deck(tmp_path, cache_dir):
+    """이미지(공유 1장 + 단독 1장)와 표가 든 세 장짜리 덱을 한 번 빌드"""
+    shared, single = tmp_path / "shared.png", tmp_path / "single.png"
+    Image.new("RGB", (640, 400), "navy").save(shared)
+    Image.new("RGB", (400, 640), "teal").save(single)
+
+    def gallery(*paths):
+        return {"type": "screen_gallery", "data": {"screens": [{"image_path": str(p), "label": p.stem} for p in paths]}}
+
+    content = write_content(tmp_path / "deck.json", [
+        content_slide(1, [gallery(shared)]),
+        content_slide(2, [{"type": "table", "data": {"headers": ["항목", "값"], "rows": [["A", "1"]]}}]),
+        content_slide(3, [gallery(shared, single)]),
+    ])
+    output = tmp_path / "deck.pptx"
+    generate_pptx.generate_presentation(str(content), str(output))
+    return content, output
+
+
+def test_saved_records_match_exported(deck):
+    _, output = deck
+    prs = Presentation(str(output))
+    exported = [slide_parts.export_slide(prs, slide) for slide in prs.slides]
+    saved = slide_parts.read_slide_records(output)
+
+    assert [record["layout_index"] for record in saved] == [record["layout_index"] for record in exported]
+    assert [record["rels"] for record in saved] == [record["rels"] for record in exported]
+    assert [_canonical(record["xml"]) for record in saved] == [_canonical(record["xml"]) for record in exported]
+
+
+def test_imported_records_rebuild_same_package(deck, tmp_path):
+    _, output = deck
+    prs = generate_pptx.load_template()
+    for record in slide_parts.read_slide_records(output):
+        slide_parts.import_slide(prs, record)
+    rebuilt = tmp_path / "rebuilt.pptx"
+    prs.save(str(rebuilt))
+
+    assert _parts(rebuilt) == _parts(output)
+    # 두 슬라이드가 함께 쓰는 이미지는 미디어 파트 하나로 합쳐짐 (템플릿 미디어 + 2)
+    with zipfile.ZipFile(BytesIO(generate_pptx.compile_template())) as zf:
+        template_media = _media_count(zf.namelist())
+    assert _media_count(_parts(rebuilt)) == template_media + 2
+
+
+def test_parallel_render_matches_serial(deck, tmp_path):
+    content, output = deck
+    parallel = tmp_path / "parallel.pptx"
+    generate_pptx.generate_presentation(str(content), str(parallel), jobs=2)
+
+    assert _parts(parallel) == _parts(output)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+import svg_raster
+
+SVG = """
+<svg xmlns="http://www.w3.org/2000/svg" width="40" height="30" viewBox="0 0 40 30">
+    <defs>
+        <filter id="shadow"><feGaussianBlur in="SourceAlpha" stdDeviation="2" /></filter>
+    </defs>
+    <rect width="40" height="30" fill="white" />
+    <rect x="4" y="4" width="10.5" height="10" fill="#ff0000" />
+    <rect x="20" y="10" width="10" height="10" fill="black" filter="url(#shadow)" />
+</svg>
+"""
+
+
+def _naive_box_blur(array, radius, axis):
+    padded = np.moveaxis(array, axis, 0).astype(np.float64)
+    size = padded.shape[0]
+    result = np.zeros_like(padded)
+    for i in range(size):
+        result[i] = padded[max(i - radius, 0):min(i + radius + 1, size)].sum(axis=0)
+    return np.moveaxis(result / (2 * radius + 1), 0, axis)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize("radius", [1, 3, 12])
+def test_box_blur_matches_naive(axis, radius):
+    array = np.random.default_rng(0).random((17, 23), dtype=np.float32)
+    blurred = svg_raster._box_blur(array, radius, axis)
+    assert blurred.shape == array.shape
+    np.testing.assert_allclose(blurred, _naive_box_blur(array, radius, axis), atol=1e-5)
+
+
+def test_render_fills_shapes_with_antialiased_edges():
+    pixels = svg_raster.Renderer(SVG).render()
+    assert pixels.shape == (30, 40, 4)
+    assert (pixels[..., 3] == 255).all()
+    assert tuple(pixels[8, 8]) == (255, 0, 0, 255)
+    assert tuple(pixels[1, 1]) == (255, 255, 255, 255)
+    # x=14.5에서 끝나는 가장자리 픽셀은 빨강과 흰 바탕의 중간
+    assert 100 < pixels[8, 14, 1] < 160 and pixels[8, 14, 0] == 255
+    # 흐림 필터는 도형 밖으로 번짐
+    assert pixels[15, 31, 0] < 255
+
+
+def test_bands_match_single_pass(monkeypatch):
+    # 4x는 120줄이라 띠 최소 높이(64줄)로 나누면 두 띠
+    single = svg_raster.Renderer(SVG, 4).render()
+    monkeypatch.setattr(svg_raster, "BAND_PIXELS", 1)
+    banded = svg_raster.Renderer(SVG, 4).render()
+    assert np.abs(banded.astype(int) - single).max() <= 1
+
+
+def test_render_pngs_writes_scaled_outputs(tmp_path):
+    from PIL import Image
+
+    paths = svg_raster.render_pngs(SVG, str(tmp_path / "shape.png"), scales=(1, 2), jobs=1)
+    assert paths == [str(tmp_path / "shape.png"), str(tmp_path / "shape@2x.png")]
+    assert [Image.open(path).size for path in paths] == [(40, 30), (80, 60)]
+    assert Image.open(paths[0]).mode == "RGB"
@@ -0,0 +1,58 @@
+from io import BytesIO
+
+from pptx import Presentation
+
+import generate_pptx
+from conftest import rename_layout
+
+
+def _snapshots(cache_dir):
+    return sorted(path.name for path in (cache_dir / "templates").glob("*.pptx"))
+
+
+def test_snapshot_has_no_sample_slides(cache_dir, template_copy):
+    assert len(Presentation(str(template_copy)).slides) > 0
+
+    prs = Presentation(BytesIO(generate_pptx.compile_template()))
+    assert len(prs.slides) == 0
+    assert len(prs.slide_layouts) == len(Presentation(str(template_copy)).slide_layouts)
+
+
+def test_snapshot_is_reused_from_disk(cache_dir, template_copy, monkeypatch, capsys):
+    compiled = generate_pptx.compile_template()
+    assert "템플릿 스냅샷 생성" in capsys.readouterr().out
+
+    # 새 프로세스처럼 메모리 캐시만 비우면 디스크 스냅샷을 그대로 읽음
+    monkeypatch.setattr(generate_pptx, "_compiled_templates", {})
+    assert generate_pptx.compile_template() == compiled
+    assert "템플릿 스냅샷 생성" not in capsys.readouterr().out
+    assert len(_snapshots(cache_dir)) == 1
+
+
+def test_template_change_recompiles_snapshot(cache_dir, template_copy, capsys):
+    before = generate_pptx.compile_template()
+    rename_layout(template_copy, 3, "바뀐 내지")
+    capsys.readouterr()
+
+    after = generate_pptx.compile_template()
+    assert "템플릿 스냅샷 생성" in capsys.readouterr().out
+    assert after != before
+    assert Presentation(BytesIO(after)).slide_layouts[3].name == "바뀐 내지"
+    assert len(_snapshots(cache_dir)) == 2
+
+
+def test_loaded_templates_are_independent_copies(cache_dir, template_copy):
+    first = generate_pptx.load_template()
+    first.slides.add_slide(first.slide_layouts[3])
+    first.slide_layouts[3].name = "바뀐 내지"
+
+    second = generate_pptx.load_template()
+    assert len(second.slides) == 0
+    assert second.slide_layouts[3].name != "바뀐 내지"
+    assert len(generate_pptx._parsed_templates) == 1
+
+
+def test_loaded_template_follows_template_change(cache_dir, template_copy):
+    generate_pptx.load_template()
+    rename_layout(template_copy, 3, "바뀐 내지")
+    assert generate_pptx.load_template().slide_layouts[3].name == "바뀐 내지"
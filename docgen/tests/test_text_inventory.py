@@ -0,0 +1,42 @@
+import json
+
+import generate_pptx
+import text_inventory
+from conftest import DOCGEN_DIR
+
+TEMPLATE_INVENTORY = DOCGEN_DIR / "workspace" / "template-inventory.json"
+
+
+def _without_overflow_amounts(inventory):
+    # 넘침 양은 글자 폭 추정치라 기존 인벤토리(실제 글꼴로 측정)와 다르므로 넘침 종류만 비교
+    return {
+        slide: {
+            shape: {key: sorted(value) if key == "overflow" else value for key, value in record.items()}
+            for shape, record in shapes.items()
+        }
+        for slide, shapes in inventory.items()
+    }
+
+
+def test_template_inventory_matches_existing_shape():
+    inventory = text_inventory.extract_inventory(generate_pptx.TEMPLATE_PATH, jobs=1)
+    with open(TEMPLATE_INVENTORY, encoding="utf-8") as f:
+        expected = json.load(f)
+
+    assert list(inventory) == list(expected)
+    assert [list(shapes) for shapes in inventory.values()] == [list(shapes) for shapes in expected.values()]
+    assert _without_overflow_amounts(inventory) == _without_overflow_amounts(expected)
+    title = inventory["slide-1"]["shape-0"]
+    assert list(title)[:6] == ["left", "top", "width", "height", "placeholder_type", "default_font_size"]
+
+
+def test_parallel_matches_serial():
+    serial = text_inventory.extract_inventory(generate_pptx.TEMPLATE_PATH, jobs=1)
+    assert text_inventory.extract_inventory(generate_pptx.TEMPLATE_PATH, jobs=2) == serial
+
+
+def test_main_writes_json(tmp_path):
+    output = tmp_path / "nested" / "inventory.json"
+    assert text_inventory.main([str(generate_pptx.TEMPLATE_PATH), str(output), "-j", "1"]) == 0
+    with open(output, encoding="utf-8") as f:
+        assert json.load(f) == text_inventory.extract_inventory(generate_pptx.TEMPLATE_PATH, jobs=1)
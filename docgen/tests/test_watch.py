@@ -0,0 +1,58 @@
+import os
+import zipfile
+
+from pptx import Presentation
+
+import watch
+from conftest import content_slide, rename_layout, write_content
+
+
+def _layout_names(pptx_path):
+    return [layout.name for layout in Presentation(str(pptx_path)).slide_layouts]
+
+
+def test_template_change_rerenders_all_slides(tmp_path, cache_dir, template_copy, capsys):
+    content = write_content(tmp_path / "deck.json", [content_slide(1, []), content_slide(2, [], main_title="둘")])
+    output = tmp_path / "deck.pptx"
+    watcher = watch.DeckWatcher(content, output)
+
+    assert watcher.build()
+    assert watcher.build()
+    assert "다시 렌더링 0/2" in capsys.readouterr().out
+
+    rename_layout(template_copy, 3, "바뀐 내지")
+    assert watcher.changed()
+
+    assert watcher.build()
+    assert "다시 렌더링 2/2" in capsys.readouterr().out
+    assert "바뀐 내지" in _layout_names(output)
+    with zipfile.ZipFile(output) as zf:
+        assert zf.testzip() is None
+
+
+def test_run_keeps_watching_after_build_error(tmp_path, cache_dir, monkeypatch):
+    content = write_content(tmp_path / "deck.json", [content_slide(1, [])])
+    watcher = watch.DeckWatcher(content, tmp_path / "deck.pptx")
+
+    # 첫 빌드는 PowerPoint가 파일을 잡고 있는 것처럼 교체에 실패
+    real_replace = os.replace
+    failures = iter([PermissionError("파일이 다른 프로세스에서 사용 중")])
+
+    def flaky_replace(source, target):
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        real_replace(source, target)
+
+    monkeypatch.setattr(watch.os, "replace", flaky_replace)
+    ticks = iter(range(2))
+
+    def sleep(_):
+        if next(ticks, None) is None:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+    monkeypatch.setattr(watcher, "changed", lambda: True)
+
+    watcher.run()
+    assert (tmp_path / "deck.pptx").exists()
@@ -0,0 +1,28 @@
+import importlib.util
+
+from pptx import Presentation
+
+from conftest import DOCGEN_DIR
+
+TEMPLATE_PATH = DOCGEN_DIR / "PPT기본양식.pptx"
+
+
+def _load_generate_ppt():
+    # 저장소 최상위에도 generate_ppt.py가 있으므로 경로로 로드
+    spec = importlib.util.spec_from_file_location("workspace_generate_ppt", DOCGEN_DIR / "workspace" / "generate_ppt.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_slide_index_is_per_presentation():
+    generate_ppt = _load_generate_ppt()
+    first = Presentation(str(TEMPLATE_PATH))
+    second = Presentation(str(TEMPLATE_PATH))
+    assert first.slides[0].slide_id == second.slides[0].slide_id
+
+    first_shape = generate_ppt.find_shape_by_name(first.slides[0], "")
+    second_shape = generate_ppt.find_shape_by_name(second.slides[0], "")
+    assert first_shape is not None
+    assert second_shape.part is second.slides[0].part
+    assert second_shape._element is not first_shape._element
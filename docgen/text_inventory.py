@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+텍스트 인벤토리 (스트리밍)
+
+.pptx의 슬라이드별 텍스트 도형(위치, 자리표시자 유형, 기본 글자 크기, 넘침/겹침, 문단 서식)을
+workspace/*-inventory.json과 같은 형식의 JSON으로 씁니다. python-pptx로 덱을 열지 않고
+ppt/slides/slide*.xml을 zip에서 바로 lxml iterparse로 읽으며, 도형 하나를 처리할 때마다 그 요소를
+버리므로 메모리 사용량은 슬라이드 크기와 무관하게 도형 하나 수준입니다.
+
+- 상속: 위치가 없는 자리표시자는 레이아웃 자리표시자(idx), 그다음 마스터 자리표시자(유형)의 위치를 씁니다.
+  기본 글자 크기는 레이아웃 자리표시자(유형)의 첫 defRPr, 마스터 자리표시자, 마스터 txStyles 순으로
+  찾습니다. 레이아웃/마스터는 부모 프로세스에서 파트당 한 번만 읽어 워커에 넘깁니다.
+- 병렬: 슬라이드를 묶음으로 나눠 워커 프로세스에서 처리 (워커마다 zip은 한 번만 엶)
+- 넘침(frame): 문단을 fonts.measure()의 글자 폭으로 줄바꿈해 높이를 추정 (96dpi, 줄 높이 1.2배,
+  0.05in 이하는 무시). 넘침(slide)은 슬라이드 경계, 겹침은 같은 슬라이드의 다른 도형과 비교합니다.
+- 제외: 텍스트가 없는 도형, 슬라이드 번호, 숫자뿐인 바닥글 (표/그림/연결선은 텍스트 도형이 아님)
+
+사용 예:
+    python docgen/text_inventory.py 덱.pptx workspace/text-inventory.json
+    python docgen/cli.py inventory 덱.pptx -o 덱-inventory.json -j 4
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_OFFICE_RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+RT_OFFICE_DOCUMENT = _OFFICE_RT + "officeDocument"
+RT_SLIDE_LAYOUT = _OFFICE_RT + "slideLayout"
+RT_SLIDE_MASTER = _OFFICE_RT + "slideMaster"
+
+EMU_PER_INCH = 914400
+DPI = 96  # 넘침 추정 기준 해상도 (px/in)
+LINE_HEIGHT = 1.2  # 줄 간격을 지정하지 않은 문단의 줄 높이 (글자 크기 배수)
+DEFAULT_FONT_SIZE = 18.0  # 상속 값을 찾지 못한 글상자의 글자 크기 (PowerPoint 기본값, pt)
+OVERFLOW_TOLERANCE = 0.05  # 이하의 넘침/겹침은 무시 (in)
+SLIDE_TOLERANCE = 0.01
+ROW_TOLERANCE = 0.5  # 위쪽 좌표 차이가 이 안이면 같은 줄로 보고 왼쪽부터 번호를 매김 (in)
+DEFAULT_INSETS = {"lIns": 91440, "rIns": 91440, "tIns": 45720, "bIns": 45720}
+BULLET_SYMBOLS = ("•", "●", "○")
+
+# ST_PlaceholderType -> python-pptx PP_PLACEHOLDER 이름 (기존 인벤토리의 placeholder_type 값)
+PLACEHOLDER_TYPES = {
+    "title": "TITLE", "body": "BODY", "ctrTitle": "CENTER_TITLE", "subTitle": "SUBTITLE",
+    "dt": "DATE", "sldNum": "SLIDE_NUMBER", "ftr": "FOOTER", "hdr": "HEADER", "obj": "OBJECT",
+    "chart": "CHART", "tbl": "TABLE", "clipArt": "BITMAP", "dgm": "ORG_CHART", "media": "MEDIA_CLIP",
+    "sldImg": "SLIDE_IMAGE", "pic": "PICTURE",
+}
+# 레이아웃 자리표시자 유형 -> 위치를 물려주는 마스터 자리표시자 유형 (그 외는 body)
+MASTER_PLACEHOLDER_TYPES = {"title": "title", "ctrTitle": "title", "dt": "dt", "ftr": "ftr", "sldNum": "sldNum"}
+# a:schemeClr val -> MSO_THEME_COLOR 이름
+THEME_COLORS = {
+    "accent1": "ACCENT_1", "accent2": "ACCENT_2", "accent3": "ACCENT_3", "accent4": "ACCENT_4",
+    "accent5": "ACCENT_5", "accent6": "ACCENT_6", "bg1": "BACKGROUND_1", "bg2": "BACKGROUND_2",
+    "dk1": "DARK_1", "dk2": "DARK_2", "lt1": "LIGHT_1", "lt2": "LIGHT_2", "tx1": "TEXT_1", "tx2": "TEXT_2",
+    "hlink": "HYPERLINK", "folHlink": "FOLLOWED_HYPERLINK",
+}
+ALIGNMENTS = {"ctr": "CENTER", "r": "RIGHT", "just": "JUSTIFY"}
+
+_A = f"{{{A_NS}}}"
+_P = f"{{{P_NS}}}"
+
+
+# ==================== 패키지 구조 ====================
+def _rels(zf, partname):
+    """파트의 관계 {rId: (유형, 대상 파트 이름)}"""
+    base_dir, filename = posixpath.split(partname)
+    try:
+        data = zf.read(posixpath.join(base_dir, "_rels", filename + ".rels"))
+    except KeyError:
+        return {}
+    rels = {}
+    for rel in etree.fromstring(data).iter(f"{{{PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target")
+        if rel.get("TargetMode") != "External":
+            target = posixpath.normpath(posixpath.join(base_dir, target)) if not target.startswith("/") else target[1:]
+        rels[rel.get("Id")] = (rel.get("Type"), target)
+    return rels
+
+
+def _related(zf, partname, rel_type):
+    return next((target for kind, target in _rels(zf, partname).values() if kind == rel_type), None)
+
+
+def _first_size(element):
+    """element 아래 첫 a:defRPr의 글자 크기 (pt, 없으면 None)"""
+    for defrpr in element.iter(f"{_A}defRPr"):
+        if defrpr.get("sz"):
+            return int(defrpr.get("sz")) / 100
+    return None
+
+
+def _xfrm(sppr):
+    """spPr/grpSpPr의 (x, y, cx, cy) EMU - 없는 값은 None"""
+    xfrm = sppr.find(f"{_A}xfrm") if sppr is not None else None
+    if xfrm is None:
+        return (None, None, None, None)
+    off, ext = xfrm.find(f"{_A}off"), xfrm.find(f"{_A}ext")
+    x, y = (int(off.get("x")), int(off.get("y"))) if off is not None else (None, None)
+    cx, cy = (int(ext.get("cx")), int(ext.get("cy"))) if ext is not None else (None, None)
+    return (x, y, cx, cy)
+
+
+def _placeholders(root):
+    """레이아웃/마스터 파트의 자리표시자 [(유형, idx, xfrm, 첫 defRPr 크기)] - 문서 순서"""
+    found = []
+    for sp in root.iter(f"{_P}sp"):
+        ph = sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+        if ph is not None:
+            found.append((ph.get("type", "obj"), int(ph.get("idx", "0")), _xfrm(sp.find(f"{_P}spPr")), _first_size(sp)))
+    return found
+
+
+def _master_info(root):
+    """마스터: 유형별 자리표시자 (xfrm, 크기)와 txStyles의 제목/본문/기타 기본 크기"""
+    placeholders = {}
+    for ph_type, _, xfrm, size in _placeholders(root):
+        placeholders.setdefault(ph_type, (xfrm, size))
+    styles = {}
+    tx_styles = root.find(f"{_P}txStyles")
+    for name in ("titleStyle", "bodyStyle", "otherStyle"):
+        style = tx_styles.find(f"{_P}{name}") if tx_styles is not None else None
+        styles[name] = _first_size(style) if style is not None else None
+    return {"placeholders": placeholders, "styles": styles}
+
+
+def _layout_info(layout_root, master):
+    """레이아웃 하나의 상속 값 - idx별 위치와 유형별 기본 글자 크기 (마스터 값까지 합쳐 둠)"""
+    by_idx = {}
+    sizes = {}
+    for ph_type, idx, xfrm, size in _placeholders(layout_root):
+        base_xfrm, base_size = master["placeholders"].get(MASTER_PLACEHOLDER_TYPES.get(ph_type, "body"), (None, None))
+        by_idx.setdefault(idx, tuple(own if own is not None else base for own, base in zip(xfrm, base_xfrm or xfrm)))
+        sizes.setdefault(ph_type, size if size is not None else base_size)
+    styles = master["styles"]
+    return {"by_idx": by_idx, "sizes": sizes, "title_size": styles["titleStyle"], "body_size": styles["bodyStyle"]}
+
+
+def read_structure(zf):
+    """(슬라이드 파트 이름 리스트(표시 순서), {슬라이드: 레이아웃 정보}, 슬라이드 크기 EMU, 글상자 기본 크기)"""
+    pres_name = _related(zf, "", RT_OFFICE_DOCUMENT) or "ppt/presentation.xml"
+    pres = etree.fromstring(zf.read(pres_name))
+    pres_rels = _rels(zf, pres_name)
+    slides = [
+        pres_rels[sld_id.get(f"{{{R_NS}}}id")][1]
+        for sld_id in pres.iter(f"{_P}sldId")
+    ]
+    size = pres.find(f"{_P}sldSz")
+    slide_size = (int(size.get("cx")), int(size.get("cy"))) if size is not None else (12192000, 6858000)
+    default_style = pres.find(f"{_P}defaultTextStyle")
+    text_size = (_first_size(default_style) if default_style is not None else None) or DEFAULT_FONT_SIZE
+
+    # 레이아웃과 마스터는 파트당 한 번만 읽음
+    layouts, masters, slide_layouts = {}, {}, {}
+    for slide_name in slides:
+        layout_name = _related(zf, slide_name, RT_SLIDE_LAYOUT)
+        if layout_name and layout_name not in layouts:
+            master_name = _related(zf, layout_name, RT_SLIDE_MASTER)
+            if master_name not in masters:
+                masters[master_name] = _master_info(etree.fromstring(zf.read(master_name))) if master_name else {
+                    "placeholders": {}, "styles": {"titleStyle": None, "bodyStyle": None, "otherStyle": None},
+                }
+            layouts[layout_name] = _layout_info(etree.fromstring(zf.read(layout_name)), masters[master_name])
+        slide_layouts[slide_name] = layout_name
+    return slides, {name: layouts.get(layout) for name, layout in slide_layouts.items()}, slide_size, text_size
+
+
+# ==================== 도형 ====================
+def _paragraph_text(p):
+    parts = []
+    for child in p:
+        if child.tag in (f"{_A}r", f"{_A}fld"):
+            parts.append(child.findtext(f"{_A}t") or "")
+        elif child.tag == f"{_A}br":
+            parts.append("\v")
+    return "".join(parts)
+
+
+def _paragraph_data(p, text, frame_size):
+    """문단 하나의 인벤토리 항목 (값이 있는 서식만) - 배수 줄 간격은 글자 크기(없으면 frame_size)를 곱한 pt"""
+    data = {"text": text.strip()}
+    ppr = p.find(f"{_A}pPr")
+    if ppr is not None:
+        if ppr.find(f"{_A}buChar") is not None or ppr.find(f"{_A}buAutoNum") is not None:
+            data["bullet"] = True
+            data["level"] = int(ppr.get("lvl", "0"))
+        if ppr.get("algn") in ALIGNMENTS:
+            data["alignment"] = ALIGNMENTS[ppr.get("algn")]
+        for key, tag in (("space_before", "spcBef"), ("space_after", "spcAft")):
+            points = ppr.find(f"{_A}{tag}/{_A}spcPts")
+            if points is not None and int(points.get("val")):
+                data[key] = int(points.get("val")) / 100
+
+    rpr = p.find(f"{_A}r/{_A}rPr")
+    if rpr is not None:
+        latin = rpr.find(f"{_A}latin")
+        if latin is not None and latin.get("typeface"):
+            data["font_name"] = latin.get("typeface")
+        if rpr.get("sz"):
+            data["font_size"] = int(rpr.get("sz")) / 100
+        for key in ("b", "i"):
+            if rpr.get(key) is not None:
+                data["bold" if key == "b" else "italic"] = rpr.get(key) in ("1", "true")
+        if rpr.get("u") is not None:
+            data["underline"] = rpr.get("u") != "none"
+        fill = rpr.find(f"{_A}solidFill")
+        if fill is not None:
+            rgb, scheme = fill.find(f"{_A}srgbClr"), fill.find(f"{_A}schemeClr")
+            if rgb is not None:
+                data["color"] = rgb.get("val").upper()
+            elif scheme is not None and scheme.get("val") in THEME_COLORS:
+                data["theme_color"] = THEME_COLORS[scheme.get("val")]
+
+    spacing = ppr.find(f"{_A}lnSpc") if ppr is not None else None
+    if spacing is not None:
+        percent, points = spacing.find(f"{_A}spcPct"), spacing.find(f"{_A}spcPts")
+        if percent is not None:
+            data["line_spacing"] = round(int(percent.get("val")) / 100000 * (data.get("font_size") or frame_size), 2)
+        elif points is not None:
+            data["line_spacing"] = round(int(points.get("val")) / 100, 2)
+    return data
+
+
+def _frame_overflow(paragraphs, body_pr, width_in, height_in, default_size):
+    """문단을 줄바꿈해 추정한 높이가 글상자 안쪽 높이를 넘는 양 (in, 넘지 않으면 None)"""
+    import fonts
+
+    insets = {
+        key: int(body_pr.get(key)) if body_pr is not None and body_pr.get(key) is not None else value
+        for key, value in DEFAULT_INSETS.items()
+    }
+    usable_width = (width_in - (insets["lIns"] + insets["rIns"]) / EMU_PER_INCH) * DPI
+    usable_height = (height_in - (insets["tIns"] + insets["bIns"]) / EMU_PER_INCH) * DPI
+    if usable_width <= 0 or usable_height <= 0:
+        return None
+
+    total = 0.0
+    for i, (data, text) in enumerate(paragraphs):
+        font_px = (data.get("font_size") or default_size) * DPI / 72
+        size = max(1, round(font_px))
+        lines = sum(len(fonts.wrap(line, size, usable_width, data.get("bold", False))) for line in text.split("\v"))
+        line_height = data["line_spacing"] * DPI / 72 if "line_spacing" in data else font_px * LINE_HEIGHT
+        if i > 0 and data.get("space_before"):
+            total += data["space_before"] * DPI / 72
+        total += lines * line_height + (data.get("space_after") or 0) * DPI / 72
+
+    overflow = round((total - usable_height) / DPI, 2)
+    return overflow if overflow > OVERFLOW_TOLERANCE else None
+
+
+def _shape_record(sp, transform, layout, text_size):
+    """p:sp 요소 -> (left, top, width, height, 항목 dict) - 인벤토리에 넣지 않을 도형이면 None"""
+    tx_body = sp.find(f"{_P}txBody")
+    if tx_body is None:
+        return None
+    texts = [(p, _paragraph_text(p)) for p in tx_body.iter(f"{_A}p")]
+    frame_text = "\n".join(text for _, text in texts).strip()
+    if not frame_text:
+        return None
+
+    ph = sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+    ph_type = ph.get("type", "obj") if ph is not None else None
+    if ph_type == "sldNum" or (ph_type == "ftr" and frame_text.isdigit()):
+        return None
+
+    x, y, cx, cy = _xfrm(sp.find(f"{_P}spPr"))
+    default_size = None
+    if ph is not None and layout is not None:
+        base = layout["by_idx"].get(int(ph.get("idx", "0")), (None, None, None, None))
+        x, y, cx, cy = (own if own is not None else inherited for own, inherited in zip((x, y, cx, cy), base))
+        default_size = layout["sizes"].get(ph_type)
+    ox, oy, sx, sy = transform
+    left = (ox + (x or 0) * sx) / EMU_PER_INCH
+    top = (oy + (y or 0) * sy) / EMU_PER_INCH
+    width = (cx or 0) * sx / EMU_PER_INCH
+    height = (cy or 0) * sy / EMU_PER_INCH
+
+    # 문단에 크기가 없을 때 쓸 크기: 도형의 lstStyle, 자리표시자 상속 값, 마스터 제목/본문 스타일, 글상자 기본값 순
+    own_list = tx_body.find(f"{_A}lstStyle")
+    frame_size = (own_list is not None and _first_size(own_list)) or default_size
+    if not frame_size and layout is not None and ph_type is not None:
+        frame_size = layout["title_size"] if ph_type in ("title", "ctrTitle") else layout["body_size"]
+    frame_size = frame_size or text_size
+
+    paragraphs = [(_paragraph_data(p, text, frame_size), text) for p, text in texts if text.strip()]
+    record = {"left": round(left, 2), "top": round(top, 2), "width": round(width, 2), "height": round(height, 2)}
+    if ph_type is not None:
+        record["placeholder_type"] = PLACEHOLDER_TYPES.get(ph_type, ph_type.upper())
+    if default_size:
+        record["default_font_size"] = default_size
+    overflow = _frame_overflow(paragraphs, tx_body.find(f"{_A}bodyPr"), round(width, 2), round(height, 2), frame_size)
+    if overflow is not None:
+        record["overflow"] = {"frame": {"overflow_bottom": overflow}}
+    if any(data["text"].startswith(symbol + " ") for data, _ in paragraphs for symbol in BULLET_SYMBOLS):
+        record["warnings"] = ["manual_bullet_symbol: use proper bullet formatting"]
+    record["paragraphs"] = [data for data, _ in paragraphs]
+    return record
+
+
+def _group_transform(parent, grp_sp_pr):
+    """그룹 자식 좌표 -> 슬라이드 좌표 변환 (ox, oy, sx, sy)"""
+    xfrm = grp_sp_pr.find(f"{_A}xfrm")
+    if xfrm is None:
+        return parent
+    off, ext = xfrm.find(f"{_A}off"), xfrm.find(f"{_A}ext")
+    ch_off, ch_ext = xfrm.find(f"{_A}chOff"), xfrm.find(f"{_A}chExt")
+    if None in (off, ext, ch_off, ch_ext):
+        return parent
+    sx = int(ext.get("cx")) / int(ch_ext.get("cx")) if int(ch_ext.get("cx")) else 1.0
+    sy = int(ext.get("cy")) / int(ch_ext.get("cy")) if int(ch_ext.get("cy")) else 1.0
+    ox = int(off.get("x")) - int(ch_off.get("x")) * sx
+    oy = int(off.get("y")) - int(ch_off.get("y")) * sy
+    pox, poy, psx, psy = parent
+    return (pox + ox * psx, poy + oy * psy, psx * sx, psy * sy)
+
+
+def _sorted_shapes(records):
+    """위에서 아래로, 같은 줄(ROW_TOLERANCE 이내)은 왼쪽부터"""
+    records = sorted(records, key=lambda r: (r["top"], r["left"]))
+    rows, row = [], []
+    for record in records:
+        if row and abs(record["top"] - row[0]["top"]) > ROW_TOLERANCE:
+            rows.append(row)
+            row = []
+        row.append(record)
+    if row:
+        rows.append(row)
+    return [record for row in rows for record in sorted(row, key=lambda r: r["left"])]
+
+
+def _add_slide_checks(shapes, slide_size):
+    """슬라이드 경계 넘침과 도형 겹침 항목 추가 (paragraphs가 마지막 키로 남도록 다시 배치)"""
+    slide_width, slide_height = (value / EMU_PER_INCH for value in slide_size)
+    items = list(shapes.items())
+    overlaps = {shape_id: {} for shape_id, _ in items}
+    for i, (id_a, a) in enumerate(items):
+        for id_b, b in items[i + 1:]:
+            width = min(a["left"] + a["width"], b["left"] + b["width"]) - max(a["left"], b["left"])
+            height = min(a["top"] + a["height"], b["top"] + b["height"]) - max(a["top"], b["top"])
+            if width > OVERFLOW_TOLERANCE and height > OVERFLOW_TOLERANCE:
+                overlaps[id_a][id_b] = overlaps[id_b][id_a] = round(width * height, 2)
+
+    for shape_id, record in items:
+        slide_overflow = {}
+        right, bottom = record["left"] + record["width"], record["top"] + record["height"]
+        if right > slide_width + SLIDE_TOLERANCE:
+            slide_overflow["overflow_right"] = round(right - slide_width, 2)
+        if bottom > slide_height + SLIDE_TOLERANCE:
+            slide_overflow["overflow_bottom"] = round(bottom - slide_height, 2)
+        if slide_overflow:
+            record.setdefault("overflow", {})["slide"] = slide_overflow
+        if overlaps[shape_id]:
+            record["overlap"] = {"overlapping_shapes": overlaps[shape_id]}
+
+        ordered = {key: record[key] for key in (
+            "left", "top", "width", "height", "placeholder_type", "default_font_size", "overflow", "overlap", "warnings",
+        ) if key in record}
+        ordered["paragraphs"] = record["paragraphs"]
+        shapes[shape_id] = ordered
+
+
+def inventory_slide(zf, slide_name, layout, slide_size, text_size):
+    """슬라이드 하나의 {shape-N: 항목} - 도형을 다 읽은 요소는 바로 버림"""
+    records = []
+    transforms = [(0.0, 0.0, 1.0, 1.0)]
+    shape_tags = {f"{_P}sp", f"{_P}pic", f"{_P}graphicFrame", f"{_P}cxnSp", f"{_P}contentPart"}
+    with zf.open(slide_name) as f:
+        for event, element in etree.iterparse(f, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                if tag == f"{_P}grpSp":
+                    transforms.append(transforms[-1])
+                continue
+            if tag == f"{_P}grpSpPr" and element.getparent().tag == f"{_P}grpSp":
+                transforms[-1] = _group_transform(transforms[-2], element)
+            elif tag == f"{_P}sp":
+                record = _shape_record(element, transforms[-1], layout, text_size)
+                if record is not None:
+                    records.append(record)
+            elif tag == f"{_P}grpSp":
+                transforms.pop()
+            if tag in shape_tags or tag == f"{_P}grpSp":
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+    shapes = {f"shape-{i}": record for i, record in enumerate(_sorted_shapes(records))}
+    _add_slide_checks(shapes, slide_size)
+    return shapes
+
+
+# ==================== 병렬 실행 ====================
+_worker_state = None
+
+
+def _init_worker(pptx_path, layouts, slide_size, text_size):
+    """워커: zip은 워커당 한 번만 열고 레이아웃 정보는 초기화 인자로 한 번만 받음"""
+    global _worker_state
+    _worker_state = (zipfile.ZipFile(pptx_path), layouts, slide_size, text_size)
+
+
+def _inventory_chunk(chunk):
+    zf, layouts, slide_size, text_size = _worker_state
+    return [
+        (index, inventory_slide(zf, slide_name, layouts[slide_name], slide_size, text_size))
+        for index, slide_name in chunk
+    ]
+
+
+def extract_inventory(pptx_path, jobs=None):
+    """{"slide-N": {"shape-M": 항목}} - N은 0부터의 슬라이드 순번, 텍스트 도형이 없는 슬라이드는 빠짐
+
+    jobs(기본값: CPU 수)가 2 이상이고 슬라이드가 충분히 많으면 워커 프로세스에서 나눠 처리합니다.
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        slides, layouts, slide_size, text_size = read_structure(zf)
+        indexed = list(enumerate(slides))
+        jobs = jobs or os.cpu_count() or 1
+        if jobs <= 1 or len(slides) < 2 * jobs:
+            results = [(i, inventory_slide(zf, name, layouts[name], slide_size, text_size)) for i, name in indexed]
+        else:
+            # 워커 간 부하 분산을 위해 워커 수보다 잘게 나눔
+            chunk_size = max(1, -(-len(indexed) // (jobs * 4)))
+            chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker, initargs=(str(pptx_path), layouts, slide_size, text_size)
+            ) as pool:
+                results = [item for chunk in pool.map(_inventory_chunk, chunks) for item in chunk]
+    return {f"slide-{index}": shapes for index, shapes in results if shapes}
+
+
+def write_inventory(pptx_path, output_path, jobs=None):
+    """인벤토리를 output_path에 JSON으로 저장 - 인벤토리 dict 반환"""
+    inventory = extract_inventory(pptx_path, jobs)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(inventory, f, indent=2, ensure_ascii=False)
+    return inventory
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PPTX 텍스트 인벤토리 JSON 생성 (python-pptx 없이 슬라이드 XML 스트리밍)")
+    parser.add_argument("pptx", help="입력 .pptx")
+    parser.add_argument("output", nargs="?", help="출력 JSON (기본값: <입력 이름>-inventory.json)")
+    parser.add_argument("-o", "--output", dest="output_option", help="출력 JSON (위치 인자 대신)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args(argv)
+
+    output_path = args.output_option or args.output or f"{os.path.splitext(args.pptx)[0]}-inventory.json"
+    started = time.perf_counter()
+    inventory = write_inventory(args.pptx, output_path, args.jobs)
+    shape_count = sum(len(shapes) for shapes in inventory.values())
+    issues = sum(
+        1 for shapes in inventory.values() for shape in shapes.values() if "overflow" in shape or "overlap" in shape
+    )
+    print(
+        f"인벤토리: {output_path} (슬라이드 {len(inventory)}, 도형 {shape_count}, 넘침/겹침 {issues}) "
+        f"{time.perf_counter() - started:.2f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
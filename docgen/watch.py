@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+콘텐츠 감시 모드 (watch)
+
+콘텐츠 JSON과 그 안에서 참조하는 이미지, 템플릿을 감시하다가 저장될 때마다 PPTX와 HTML을 다시
+만듭니다. 프로세스가 계속 살아 있으므로 python-pptx 임포트, 템플릿 스냅샷과 레이아웃 인덱스,
+이미지 크기 조회 캐시가 유지되고, 슬라이드는 지문(slide_fingerprint)이 바뀐 것만 다시 렌더링합니다.
+나머지 슬라이드는 메모리에 둔 슬라이드 파트 레코드를 그대로 스트리밍 작성기로 기록합니다.
+
+변경 감지는 파일 stat(크기, mtime) 폴링입니다. 감시 대상이 콘텐츠 파일과 이미지 몇 개뿐이라
+inotify 없이도 주기당 비용이 무시할 만하고, 편집기의 원자적 저장(임시 파일 후 rename)도 그대로 잡힙니다.
+
+사용 예:
+    python docgen/watch.py -c docgen/presentation_content.json -o deck.pptx --html deck.html
+    python docgen/cli.py watch -c docgen/presentation_content2.json
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import content_model
+import generate_html
+import generate_pptx
+from slide_parts import detach_last_slide, export_slide
+
+# 감시 주기(초)
+DEFAULT_INTERVAL = 0.2
+
+
+def _stat_signature(path):
+    """변경 감지용 (크기, mtime) - 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _replace_atomically(output_path, write):
+    """write(임시 경로)로 쓴 뒤 교체 - 뷰어가 반쯤 쓰인 파일을 열지 않도록 함"""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+class DeckWatcher:
+    """콘텐츠 하나에 대한 PPTX/HTML 재생성기 - 슬라이드 지문별 레코드를 빌드 사이에 유지"""
+
+    def __init__(self, content_path, pptx_path, html_path=None, optimize=None):
+        self.content_path = Path(content_path)
+        self.pptx_path = Path(pptx_path) if pptx_path else None
+        self.html_path = Path(html_path) if html_path else None
+        self.optimize = optimize
+
+        # 슬라이드를 렌더링해 레코드로 떼어내는 작업용 Presentation (템플릿이 바뀔 때만 다시 로드)
+        self._template_signature = _stat_signature(generate_pptx.TEMPLATE_PATH)
+        self._scratch = generate_pptx.load_template()
+        self._records = {}
+        self._watched = {}
+        # HTML 이미지 변형 (크기별 WebP/PNG, 이미 만든 변형은 캐시에서 재사용)
+        self._images = generate_html.ResponsiveImages(str(self.html_path.parent)) if self.html_path else None
+
+    def watched_paths(self):
+        """현재 감시 중인 파일 경로 목록"""
+        return list(self._watched)
+
+    def _snapshot(self, paths):
+        return {path: _stat_signature(path) for path in paths}
+
+    def changed(self):
+        """마지막 빌드 이후 감시 대상이 바뀌었으면 True"""
+        return any(_stat_signature(path) != signature for path, signature in self._watched.items())
+
+    def _reload_template(self):
+        """템플릿이 바뀌었으면 작업용 Presentation을 새 템플릿으로 바꾸고 이전 슬라이드 레코드를 버림
+
+        스냅샷과 generator_version()은 템플릿 파일 stat이 바뀌면 다시 계산되므로 지문도 모두 달라집니다.
+        """
+        signature = _stat_signature(generate_pptx.TEMPLATE_PATH)
+        if signature == self._template_signature:
+            return
+        self._template_signature = signature
+        self._scratch = generate_pptx.load_template()
+        self._records = {}
+
+    def _render_records(self, slides_data):
+        """슬라이드별 레코드 리스트와 새로 렌더링한 슬라이드 수 반환 (지문이 같으면 이전 레코드 재사용)"""
+        # 이미지 계획은 덱 전체 기준으로 빌드마다 새로 만듦 (지문에 계획된 박스가 들어가므로
+        # 다른 슬라이드 때문에 축소본이 바뀐 슬라이드는 다시 렌더링됨)
+        images = generate_pptx.plan_deck_images(slides_data)
+        fingerprints = [generate_pptx.slide_fingerprint(slide_data, images) for slide_data in slides_data]
+        dirty = [i for i, fp in enumerate(fingerprints) if fp not in self._records]
+
+        records = {}
+        for i, fp in enumerate(fingerprints):
+            record = self._records.get(fp) or records.get(fp)
+            if record is None:
+                # 슬라이드별 진행 로그는 감시 모드에서 생략
+                with redirect_stdout(io.StringIO()):
+                    slide = generate_pptx.render_slide(self._scratch, slides_data[i], images)
+                record = export_slide(self._scratch, slide)
+                detach_last_slide(self._scratch)
+            records[fp] = record
+
+        # 내용에서 사라진 슬라이드의 레코드는 버림
+        self._records = records
+        return [records[fp] for fp in fingerprints], len(dirty)
+
+    def _write_pptx(self, records):
+        from pptx_stream import StreamingPptxWriter
+
+        def write(tmp_path):
+            # close()가 템플릿의 슬라이드 목록을 채우므로 빌드마다 새 템플릿 사용 (파싱해 둔 스냅샷의 복사본)
+            with StreamingPptxWriter(str(tmp_path), generate_pptx.load_template()) as writer:
+                for record in records:
+                    writer.add_slide(record)
+
+        _replace_atomically(self.pptx_path, write)
+        if self.optimize is not None:
+            from pptx_optimize import optimize_pptx
+            optimize_pptx(self.pptx_path, compresslevel=self.optimize)
+
+    def _write_html(self, deck):
+        def write(tmp_path):
+            generate_html.write_html(deck, tmp_path, str(self.html_path.parent), self._images)
+
+        _replace_atomically(self.html_path, write)
+
+    def build(self):
+        """콘텐츠를 다시 읽어 출력 갱신 - 성공하면 True (JSON 오류/검증 오류면 출력은 그대로 둠)
+
+        콘텐츠는 한 번만 읽어 Deck(content_model)으로 만들고, PPTX와 HTML 모두 이 Deck에서 렌더링합니다.
+        """
+        started = time.perf_counter()
+        content_signature = _stat_signature(self.content_path)
+        self._watched = {self.content_path: content_signature, generate_pptx.TEMPLATE_PATH: None}
+
+        try:
+            deck = content_model.load_deck(self.content_path)
+        except (OSError, ValueError) as e:
+            print(f"❌ 콘텐츠를 읽을 수 없음: {e}")
+            return False
+
+        errors = deck.errors
+        if errors:
+            for issue in errors:
+                print(f"{self.content_path}: {issue}")
+            print(f"❌ 검증 오류 {len(errors)}건 - 출력을 갱신하지 않음")
+            return False
+
+        slides_data = generate_pptx.paginate_tables(deck.slides)
+        image_paths = {path for slide_data in slides_data for path in slide_data.image_paths()}
+        self._watched = self._snapshot([self.content_path, generate_pptx.TEMPLATE_PATH, *sorted(image_paths)])
+        # 읽는 도중 바뀌었으면 다음 주기에 다시 빌드되도록 읽기 전 서명을 유지
+        self._watched[self.content_path] = content_signature
+
+        outputs = []
+        if self.pptx_path:
+            self._reload_template()
+            records, rendered = self._render_records(slides_data)
+            self._write_pptx(records)
+            outputs.append(f"{self.pptx_path.name} (다시 렌더링 {rendered}/{len(records)})")
+        if self.html_path:
+            self._write_html(deck)
+            outputs.append(self.html_path.name)
+
+        print(f"✅ {time.strftime('%H:%M:%S')} {', '.join(outputs)} - {time.perf_counter() - started:.2f}s")
+        return True
+
+    def _build_logged(self):
+        """build()의 예외는 출력만 하고 False 반환 - 감시는 계속됨
+
+        예: Windows에서 PowerPoint가 PPTX를 열고 있어 교체(os.replace)가 PermissionError로 실패.
+        감시 대상 서명은 build() 시작 시 갱신되므로 다음 저장 때 다시 빌드합니다.
+        """
+        try:
+            return self.build()
+        except Exception as e:
+            traceback.print_exc()
+            print(f"❌ {time.strftime('%H:%M:%S')} 빌드 실패: {type(e).__name__}: {e} - 출력은 그대로 둠")
+            return False
+
+    def run(self, interval=DEFAULT_INTERVAL):
+        """Ctrl+C까지 감시하며 변경 시 다시 빌드"""
+        self._build_logged()
+        print(f"감시 중: {self.content_path} 외 {len(self._watched) - 1}개 (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(interval)
+                if self.changed():
+                    self._build_logged()
+        except KeyboardInterrupt:
+            print("\n감시 종료")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="콘텐츠 JSON 감시 - 저장 시 바뀐 슬라이드만 다시 렌더링")
+    parser.add_argument(
+        "-c", "--content", type=Path, default=generate_pptx.CONTENT_PATH,
+        help=f"콘텐츠 JSON 경로 (기본값: {generate_pptx.CONTENT_PATH.name})"
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=generate_pptx.OUTPUT_PATH,
+        help=f"출력 PPTX 경로 (기본값: {generate_pptx.OUTPUT_PATH.name})"
+    )
+    parser.add_argument(
+        "--html", type=Path, default=Path(generate_html.OUTPUT_HTML),
+        help=f"출력 HTML 경로 (기본값: {generate_html.OUTPUT_HTML})"
+    )
+    parser.add_argument("--no-pptx", action="store_true", help="PPTX는 만들지 않음")
+    parser.add_argument("--no-html", action="store_true", help="HTML은 만들지 않음")
+    parser.add_argument(
+        "--fast-elements", metavar="TYPES", default=None,
+        type=lambda value: [item.strip() for item in value.split(",") if item.strip()],
+        help="DrawingML 백엔드로 렌더링할 요소 타입 (쉼표 구분 또는 all)"
+    )
+    parser.add_argument(
+        "--optimize", metavar="LEVEL", nargs="?", type=int, default=None, const=9, choices=range(0, 10),
+        help="PPTX 저장 후 템플릿 부속물 제거 및 재압축 (LEVEL: deflate 수준 0-9, 기본값 9)"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL,
+        help=f"변경 확인 주기(초) (기본값: {DEFAULT_INTERVAL})"
+    )
+    parser.add_argument("--once", action="store_true", help="한 번만 빌드하고 종료 (감시하지 않음)")
+    args = parser.parse_args(argv)
+
+    if args.fast_elements is not None:
+        generate_pptx.set_element_backends(args.fast_elements)
+
+    watcher = DeckWatcher(
+        args.content,
+        None if args.no_pptx else args.output,
+        None if args.no_html else args.html,
+        optimize=args.optimize,
+    )
+    if args.once:
+        return 0 if watcher.build() else 1
+    watcher.run(args.interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
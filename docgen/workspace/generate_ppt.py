@@ -4,6 +4,7 @@ Generate PPT from presentation_content.json using template
 """
 import json
 import copy
+import weakref
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
@@ -15,18 +16,37 @@ def load_content(json_path):
     with open(json_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+# slide part -> shape index (built once per slide; this script only edits text, never adds shapes).
+# Keyed weakly on the part, not slide_id: slide ids are only unique within one Presentation.
+_slide_indexes = weakref.WeakKeyDictionary()
+
+def index_slide(slide):
+    """Index placeholders by type name and shape names in a single pass over the slide"""
+    index = _slide_indexes.get(slide.part)
+    if index is None:
+        placeholders = {}
+        names = []
+        for shape in slide.shapes:
+            if shape.is_placeholder:
+                placeholders.setdefault(shape.placeholder_format.type.name, []).append(shape)
+            names.append((shape.name.lower(), shape))
+        index = _slide_indexes[slide.part] = {'placeholders': placeholders, 'names': names}
+    return index
+
+def find_placeholders_by_type(slide, ph_type):
+    """Find all placeholders of a type name, in slide order"""
+    return index_slide(slide)['placeholders'].get(ph_type, [])
+
 def find_placeholder_by_type(slide, ph_type):
     """Find placeholder by type name"""
-    for shape in slide.shapes:
-        if shape.is_placeholder:
-            if shape.placeholder_format.type.name == ph_type:
-                return shape
-    return None
+    shapes = find_placeholders_by_type(slide, ph_type)
+    return shapes[0] if shapes else None
 
 def find_shape_by_name(slide, name_contains):
     """Find shape by partial name match"""
-    for shape in slide.shapes:
-        if name_contains.lower() in shape.name.lower():
+    name_contains = name_contains.lower()
+    for name, shape in index_slide(slide)['names']:
+        if name_contains in name:
             return shape
     return None
 
@@ -91,15 +111,8 @@ def populate_toc_slide(slide, content):
     placeholders = content.get('placeholders', {})
     toc_items = placeholders.get('toc_items', [])
 
-    # Find body placeholders
-    body_shapes = []
-    for shape in slide.shapes:
-        if shape.is_placeholder:
-            if shape.placeholder_format.type.name == 'BODY':
-                body_shapes.append(shape)
-
-    # Sort by position (left to right)
-    body_shapes.sort(key=lambda s: s.left)
+    # Find body placeholders, sorted by position (left to right)
+    body_shapes = sorted(find_placeholders_by_type(slide, 'BODY'), key=lambda s: s.left)
 
     if len(body_shapes) >= 3 and toc_items:
         # shape-0: numbers, shape-1: titles, shape-2: pages
@@ -202,12 +215,12 @@ def update_footer(slide, footer_text):
     if footer_shape and footer_shape.has_text_frame:
         footer_shape.text_frame.paragraphs[0].text = footer_text
 
-def main():
-    # Paths
-    template_path = r"c:\Project\HAVC_prd\docgen\workspace\working.pptx"
-    content_path = r"c:\Project\HAVC_prd\docgen\presentation_content.json"
-    output_path = r"c:\Project\HAVC_prd\docgen\presentation_output.pptx"
+# Default paths
+TEMPLATE_PATH = r"c:\Project\HAVC_prd\docgen\workspace\working.pptx"
+CONTENT_PATH = r"c:\Project\HAVC_prd\docgen\presentation_content.json"
+OUTPUT_PATH = r"c:\Project\HAVC_prd\docgen\presentation_output.pptx"
 
+def main(template_path=TEMPLATE_PATH, content_path=CONTENT_PATH, output_path=OUTPUT_PATH):
     # Load content
     data = load_content(content_path)
     presentation_data = data.get('presentation', {})
@@ -242,5 +255,15 @@ def main():
     print(f"\nPresentation saved to: {output_path}")
     print(f"Total slides: {len(prs.slides)}")
 
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fill a working deck's slides from presentation content JSON")
+    parser.add_argument("-t", "--template", default=TEMPLATE_PATH, help="working deck whose slides are filled in")
+    parser.add_argument("-c", "--content", default=CONTENT_PATH, help="content JSON path")
+    parser.add_argument("-o", "--output", default=OUTPUT_PATH, help="output PPTX path")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(args.template, args.content, args.output)